@@ -216,6 +216,463 @@ def test_overall_performance():
     except Exception as e:
         print(f"整体性能测试失败: {e}")
 
+def test_batch_combat():
+    """测试向量化批量战斗结算性能"""
+    print("\n=== 测试批量战斗结算性能 ===")
+    
+    try:
+        from hero.batch_combat import BatchCombatResolver, summarize_batch, np
+        if np is None:
+            print("NumPy未安装，跳过批量战斗测试")
+            return
+        
+        # 3级战士对战哥布林
+        hero = {"hp": 168, "max_hp": 168, "attack": 37, "defense": 14, "hp_regen_percent": 0.05}
+        resolver = BatchCombatResolver(seed=1)
+        start_time = time.time()
+        results = resolver.simulate(hero, "goblin", 1000000, 3)
+        end_time = time.time()
+        
+        summary = summarize_batch(results)
+        print(f"1000000场战斗结算: {(end_time - start_time) * 1000:.2f}ms")
+        print(f"胜率: {summary['win_rate']:.2f}%, 平均回合: {summary['average_rounds']:.2f}")
+        
+    except Exception as e:
+        print(f"批量战斗测试失败: {e}")
+
+def test_language_loading():
+    """测试语言文本表的加载和 LanguageSupport 构建时间"""
+    print("\n=== 测试语言文本表加载性能 ===")
+    
+    try:
+        import shutil
+        import tempfile
+        from hero import language
+        from hero.language import LanguageSupport, compile_catalog
+        
+        cache_dir = tempfile.mkdtemp()
+        try:
+            # 冷加载：每次删除缓存后解析JSON
+            start_time = time.time()
+            for _ in range(100):
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                compile_catalog("zh", cache_dir=cache_dir)
+            end_time = time.time()
+            print(f"100次解析JSON文本表: {(end_time - start_time) * 1000:.2f}ms")
+            
+            # 缓存加载：读取marshal缓存
+            start_time = time.time()
+            for _ in range(100):
+                compile_catalog("zh", cache_dir=cache_dir)
+            end_time = time.time()
+            print(f"100次读取marshal缓存: {(end_time - start_time) * 1000:.2f}ms")
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        
+        # 会话构建：文本表在进程内只加载一次
+        language.CATALOGS.clear()
+        start_time = time.time()
+        LanguageSupport("zh")
+        end_time = time.time()
+        print(f"首个LanguageSupport构建: {(end_time - start_time) * 1000000:.2f}μs")
+        
+        start_time = time.time()
+        for _ in range(10000):
+            LanguageSupport("zh")
+        end_time = time.time()
+        print(f"10000次LanguageSupport构建: {(end_time - start_time) * 1000:.2f}ms")
+        print(f"平均每次: {(end_time - start_time) * 1000000 / 10000:.2f}μs (拆分语言文件前约120μs，每次重建完整字典)")
+        print(f"已加载语言: {language.CATALOGS.loaded()}")
+        
+    except Exception as e:
+        print(f"语言加载测试失败: {e}")
+
+def test_text_templates():
+    """测试预解析模板和整行模板的格式化时间"""
+    print("\n=== 测试文本模板格式化性能 ===")
+    
+    try:
+        from hero.language import LanguageSupport
+        
+        lang = LanguageSupport("zh")
+        iterations = 100000
+        
+        # 单条文本：每次重新解析模板 vs 预解析模板
+        start_time = time.time()
+        for i in range(iterations):
+            lang.get_text("kill_monster_quest").format(target=i, current=1)
+        end_time = time.time()
+        format_time = end_time - start_time
+        print(f"{iterations}次 str.format: {format_time * 1000:.2f}ms")
+        
+        start_time = time.time()
+        for i in range(iterations):
+            lang.render("kill_monster_quest", target=i, current=1)
+        end_time = time.time()
+        template_time = end_time - start_time
+        print(f"{iterations}次预解析模板: {template_time * 1000:.2f}ms")
+        
+        # 整行：战斗一步输出的回合标题、怪物属性和奖励（经由渲染器输出）
+        from io import StringIO
+        from hero.main import HeroGame
+        from hero.renderer import NullRenderer, TerminalRenderer
+        
+        for renderer in (NullRenderer(), TerminalRenderer(stream=StringIO())):
+            game = HeroGame(language="zh", renderer=renderer)
+            text = game.lang.get_text
+            
+            start_time = time.time()
+            for i in range(iterations):
+                renderer.print(f"\n--- {text('round')} {i} ---")
+                renderer.print(f"Slime - {text('hp')}{text('item_separator')}{i}, {text('attack')}{text('item_separator')}5, {text('defense')}{text('item_separator')}2")
+                renderer.print(f"{text('got_exp')} {i} {text('exp_points')} {text('gold_coins')} {i}!")
+            end_time = time.time()
+            concat_time = end_time - start_time
+            
+            start_time = time.time()
+            for i in range(iterations):
+                renderer.line("combat_round", round=i)
+                renderer.line("monster_stats", name="Slime", hp=i, attack=5, defense=2)
+                renderer.line("battle_rewards", exp=i, gold=i)
+            end_time = time.time()
+            line_time = end_time - start_time
+            
+            name = type(renderer).__name__
+            print(f"{name} {iterations}步逐个拼接文本: {concat_time * 1000:.2f}ms, 整行模板: {line_time * 1000:.2f}ms "
+                  f"(每步减少 {(1 - line_time / concat_time) * 100:.1f}%)")
+        
+    except Exception as e:
+        print(f"文本模板测试失败: {e}")
+
+def test_equipment_sharing():
+    """测试每步显示英雄信息时的内存分配（共享装备名称库 vs 每步重建）"""
+    print("\n=== 测试装备名称库共享的每步内存分配 ===")
+    
+    try:
+        import tracemalloc
+        from hero.combat_analysis import create_leveled_game
+        from hero.equipment import EquipmentSystem, EQUIPMENT_NAMES
+        from hero.renderer import TerminalRenderer
+        
+        class DiscardStream:
+            def write(self, text):
+                pass
+            
+            def flush(self):
+                pass
+        
+        game = create_leveled_game("warrior", 5, "normal", "plains")
+        game.renderer = TerminalRenderer(game, stream=DiscardStream())
+        game.equipment["weapon"] = game.equipment_system.create_random_equipment("weapon")
+        game.equipment["armor"] = game.equipment_system.create_random_equipment("armor")
+        steps = 2000
+        
+        def rebuild_database():
+            # 旧做法：每次构建 EquipmentSystem 都重新创建整个嵌套的名称字典
+            return {item_type: {language: {rarity: list(names) for rarity, names in by_rarity.items()}
+                                for language, by_rarity in by_language.items()}
+                    for item_type, by_language in EQUIPMENT_NAMES.items()}
+        
+        def rebuilt_step():
+            equip_system = EquipmentSystem(game)
+            equip_system.equipment_database = rebuild_database()
+            game.show_hero_info()
+        
+        def shared_step():
+            game.show_hero_info()
+        
+        for label, step in (("每步重建装备系统", rebuilt_step), ("共享装备系统", shared_step)):
+            step()
+            tracemalloc.start()
+            peak_total = 0
+            start_time = time.time()
+            for _ in range(steps):
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                step()
+                peak_total += tracemalloc.get_traced_memory()[1] - baseline
+            end_time = time.time()
+            tracemalloc.stop()
+            print(f"{label}: 每步峰值分配 {peak_total / steps / 1024:.2f}KB, "
+                  f"{steps}步耗时 {(end_time - start_time) * 1000:.2f}ms")
+        
+    except Exception as e:
+        print(f"装备名称库共享测试失败: {e}")
+
+def test_item_memory():
+    """测试大背包的内存占用和属性读取耗时（Item 对象 vs 装备字典）"""
+    print("\n=== 测试紧凑装备对象的内存占用 ===")
+    
+    try:
+        import tracemalloc
+        from hero.combat_analysis import create_leveled_game
+        
+        game = create_leveled_game("warrior", 5, "normal", "plains")
+        equip_system = game.equipment_system
+        count = 10000
+        
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        items = [equip_system.create_random_equipment() for _ in range(count)]
+        item_memory = tracemalloc.get_traced_memory()[0] - baseline
+        baseline = tracemalloc.get_traced_memory()[0]
+        dicts = [item.to_dict() for item in items]
+        dict_memory = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        print(f"{count}件装备: Item {item_memory / 1024:.0f}KB, 字典 {dict_memory / 1024:.0f}KB")
+        
+        start_time = time.time()
+        for item in dicts:
+            item.get("attack", 0) + item.get("defense", 0) + item.get("hp", 0)
+        dict_time = time.time() - start_time
+        start_time = time.time()
+        for item in items:
+            item.attack + item.defense + item.hp
+        item_time = time.time() - start_time
+        print(f"读取属性: 字典.get {dict_time * 1000:.2f}ms, Item属性 {item_time * 1000:.2f}ms")
+        
+    except Exception as e:
+        print(f"装备对象内存测试失败: {e}")
+
+def test_inventory_index():
+    """测试大背包的菜单显示和筛选耗时（分页显示 vs 每次格式化全部物品）"""
+    print("\n=== 测试背包索引和分页显示 ===")
+    
+    try:
+        from hero.combat_analysis import create_leveled_game
+        from hero.inventory import Inventory
+        from hero.renderer import TerminalRenderer
+        
+        class DiscardStream:
+            def write(self, text):
+                pass
+            
+            def flush(self):
+                pass
+        
+        game = create_leveled_game("warrior", 5, "normal", "plains")
+        game.renderer = TerminalRenderer(game, stream=DiscardStream())
+        equip_system = game.equipment_system
+        hoard = [equip_system.create_random_equipment() for _ in range(500)]
+        visits = 200
+        
+        # 旧做法：背包是普通列表，每次显示全部物品
+        game.inventory = list(hoard)
+        start_time = time.time()
+        for _ in range(visits):
+            equip_system.renderer.text("inventory", prefix="\n", suffix=":")
+            for i, item in enumerate(game.inventory):
+                equip_system.renderer.print(f"  {i+1}. {item['name']} [{equip_system.get_rarity_name(item['rarity'])}]")
+            [item for item in game.inventory if item["type"] == "weapon"]
+        list_time = time.time() - start_time
+        
+        game.inventory = Inventory(hoard)
+        start_time = time.time()
+        for _ in range(visits):
+            equip_system.show_inventory(0, "power")
+            game.inventory.of_type("weapon")
+        index_time = time.time() - start_time
+        print(f"500件物品显示{visits}次: 全部显示 {list_time * 1000:.2f}ms, 分页显示 {index_time * 1000:.2f}ms")
+        
+    except Exception as e:
+        print(f"背包索引测试失败: {e}")
+
+def test_stat_engine():
+    """测试换装时的属性更新耗时（只重新计算变化的装备栏 vs 全部重新计算）"""
+    print("\n=== 测试增量属性计算 ===")
+    
+    try:
+        from hero.combat_analysis import create_leveled_game
+        from hero.renderer import NullRenderer
+        
+        game = create_leveled_game("warrior", 5, "normal", "plains")
+        game.renderer = NullRenderer()
+        equip_system = game.equipment_system
+        for slot in game.equipment:
+            game.equipment[slot] = equip_system.create_random_equipment(slot, 2)
+        weapons = [equip_system.create_random_equipment("weapon") for _ in range(2)]
+        updates = 20000
+        
+        # 旧做法：每次更新都重新计算全部来源
+        start_time = time.time()
+        for i in range(updates):
+            game.equipment["weapon"] = weapons[i % 2]
+            game.invalidate_attributes_cache()
+            game.update_attributes()
+        full_time = time.time() - start_time
+        
+        start_time = time.time()
+        for i in range(updates):
+            game.equipment["weapon"] = weapons[i % 2]
+            game.update_attributes()
+        incremental_time = time.time() - start_time
+        print(f"{updates}次换装后更新属性: 全部重新计算 {full_time * 1000:.2f}ms, 只计算变化的装备栏 {incremental_time * 1000:.2f}ms")
+        print(f"最近一次更新重新计算的来源: {', '.join(game.stat_engine.recomputed)}")
+        
+    except Exception as e:
+        print(f"增量属性计算测试失败: {e}")
+
+def test_effect_vector():
+    """测试特殊效果向量的内存占用和批量读取耗时（效果向量 vs 效果字典）"""
+    print("\n=== 测试特殊效果向量 ===")
+    
+    try:
+        import numpy as np
+        from hero.combat_analysis import create_leveled_game
+        from hero.effects import EffectVector, EFFECT_INDEX, effect_matrix
+        from hero.batch_combat import EFFECT_STAT_FIELDS
+        
+        game = create_leveled_game("assassin", 5, "normal", "plains")
+        vector = game.special_effects
+        as_dict = vector.to_dict()
+        vector_size = sys.getsizeof(vector) + sys.getsizeof(vector.values)
+        print(f"单个英雄特殊效果: 字典 {sys.getsizeof(as_dict)}B, 效果向量 {vector_size}B")
+        
+        heroes = 5000
+        vectors = [vector.copy() for _ in range(heroes)]
+        dicts = [dict(as_dict) for _ in range(heroes)]
+        
+        # 旧做法：按键逐个读取每个英雄的效果字典
+        start_time = time.time()
+        columns = {field: np.array([effects.get(field, 0) for effects in dicts]) for field in EFFECT_STAT_FIELDS}
+        dict_time = time.time() - start_time
+        
+        start_time = time.time()
+        matrix = effect_matrix(vectors)
+        columns = {field: matrix[:, EFFECT_INDEX[field]] for field in EFFECT_STAT_FIELDS}
+        vector_time = time.time() - start_time
+        print(f"{heroes}个英雄的批量战斗效果字段: 逐键读取字典 {dict_time * 1000:.2f}ms, 效果矩阵按列读取 {vector_time * 1000:.2f}ms")
+        
+    except ImportError:
+        print("未安装 NumPy，跳过特殊效果向量测试")
+    except Exception as e:
+        print(f"特殊效果向量测试失败: {e}")
+
+def test_set_index():
+    """测试套装索引下同套装换装的耗时和激活信息次数"""
+    print("\n=== 测试套装索引 ===")
+    
+    try:
+        from hero.main import HeroGame
+        from hero.renderer import RecordingRenderer
+        from hero.items import Item, ItemTemplate
+        
+        game = HeroGame(language="zh", renderer=RecordingRenderer())
+        weapons = [Item(ItemTemplate.get("weapon", "rare", "测试剑"), 10 + i % 3, 0, 0, (), "warrior_set")
+                   for i in range(2)]
+        game.equipment["armor"] = Item(ItemTemplate.get("armor", "rare", "测试甲"), 0, 5, 0, (), "warrior_set")
+        game.equipment["weapon"] = weapons[0]
+        game.update_attributes()
+        iterations = 20000
+        
+        game.renderer.clear_messages()
+        start_time = time.time()
+        for i in range(iterations):
+            game.equipment["weapon"] = weapons[i % 2]
+            game.update_attributes()
+        index_time = time.time() - start_time
+        banners = game.renderer.output().count(game.lang.get_text("set_bonus_activated"))
+        print(f"{iterations}次同套装换武器并更新属性: {index_time * 1000:.2f}ms, 平均 {index_time / iterations * 1e6:.2f}μs")
+        print(f"套装激活信息显示次数: {banners}（套装档位未变化）")
+        
+    except Exception as e:
+        print(f"套装索引测试失败: {e}")
+
+def test_combat_menu():
+    """测试战斗菜单的构建耗时（每回合重新构建 vs 按技能树版本缓存）"""
+    print("\n=== 测试战斗菜单缓存 ===")
+    
+    try:
+        from hero.combat_analysis import create_leveled_game
+        from hero.combat_menu import get_combat_menu
+        
+        game = create_leveled_game("mage", 10, "normal", "plains")
+        game.skill_points = 20
+        for skill_id in ("fireball", "fireball", "frost_armor", "meditation", "frost_armor", "frost_armor", "mana_burn"):
+            game.upgrade_skill(skill_id)
+        iterations = 20000
+        
+        # 旧做法：每回合收集已学技能、按类别排序并渲染每一行
+        def get_skill_priority(skill_id):
+            from hero.game_config import SKILL_TREES
+            category = SKILL_TREES.get(game.hero_class, {}).get(skill_id, {}).get("category", "core")
+            return {"core": 0, "combat": 1, "passive": 2}.get(category, 3)
+        
+        start_time = time.time()
+        for _ in range(iterations):
+            learned_skills = [skill_id for skill_id, level in game.skill_tree.learned_skills.items() if level > 0]
+            learned_skills.sort(key=get_skill_priority)
+            mapping = {"2": "use_potion"}
+            lines = []
+            for option, skill_id in enumerate(learned_skills, 3):
+                mapping[str(option)] = skill_id
+                lines.append(f"{option}. {game.lang.get_text(skill_id + '_skill')} (Lv.{game.skill_tree.learned_skills[skill_id]})")
+        rebuild_time = time.time() - start_time
+        
+        start_time = time.time()
+        for _ in range(iterations):
+            menu = get_combat_menu(game)
+            menu.labels
+            menu.skill_for("3")
+        cached_time = time.time() - start_time
+        print(f"{iterations}回合的战斗菜单（{len(menu.skills)}个技能）: 每回合重新构建 {rebuild_time * 1000:.2f}ms, 按技能树版本缓存 {cached_time * 1000:.2f}ms")
+        
+    except Exception as e:
+        print(f"战斗菜单测试失败: {e}")
+
+def test_server_load(sessions=500):
+    """测试单个服务器进程同时承载数百个会话（连接耗时、每轮输入的响应耗时和每会话内存）"""
+    print("\n=== 测试多会话服务器负载 ===")
+    
+    try:
+        import asyncio
+        import resource
+        from hero.server import GameServer
+        
+        async def read_until(reader, token):
+            data = b""
+            while token not in data:
+                chunk = await asyncio.wait_for(reader.read(4096), 30)
+                if not chunk:
+                    break
+                data += chunk
+            return data
+        
+        async def play(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await read_until(reader, b"(1)")
+            writer.write(b"2\r\n")
+            await read_until(reader, b"Press Enter")
+            return reader, writer
+        
+        async def scenario():
+            server = GameServer("127.0.0.1", 0, max_sessions=sessions)
+            await server.start()
+            try:
+                memory_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                start_time = time.time()
+                clients = await asyncio.gather(*(play(server.port) for _ in range(sessions)))
+                connect_time = time.time() - start_time
+                memory_per_session = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - memory_before) / sessions
+                
+                start_time = time.time()
+                for _, writer in clients:
+                    writer.write(b"\r\n")
+                await asyncio.gather(*(read_until(reader, b"(1)") for reader, _ in clients))
+                round_time = time.time() - start_time
+                
+                print(f"{server.session_count}个并发会话: 全部连接并完成语言选择 {connect_time * 1000:.2f}ms, "
+                      f"所有会话再输入一行 {round_time * 1000:.2f}ms, 每会话约 {memory_per_session:.0f}KB")
+                for _, writer in clients:
+                    writer.close()
+            finally:
+                await server.close()
+        
+        asyncio.run(scenario())
+        
+    except Exception as e:
+        print(f"服务器负载测试失败: {e}")
+
 def main():
     """主函数"""
     print("英雄无敌游戏性能优化测试")
@@ -226,6 +683,17 @@ def main():
     test_equipment_caching()
     test_attribute_update_optimization()
     test_overall_performance()
+    test_batch_combat()
+    test_language_loading()
+    test_text_templates()
+    test_equipment_sharing()
+    test_item_memory()
+    test_inventory_index()
+    test_stat_engine()
+    test_effect_vector()
+    test_set_index()
+    test_combat_menu()
+    test_server_load()
     
     print("\n=== 性能优化总结 ===")
     print("1. 文本获取使用缓存，减少重复计算")
@@ -233,6 +701,17 @@ def main():
     print("3. 装备生成使用缓存和延迟计算属性")
     print("4. 属性更新使用缓存机制减少重复计算")
     print("5. 整体性能提升，特别是在高频操作中")
+    print("6. 批量战斗使用NumPy向量化结算")
+    print("7. 语言文本表按需加载，使用marshal缓存并在进程内共享")
+    print("8. 文本模板预解析，常用整行输出一次调用完成")
+    print("9. 装备名称库等只读数据在模块级共享，各处复用游戏的装备系统")
+    print("10. 装备使用 __slots__ 的 Item 对象，类型、名称等共享只读模板")
+    print("11. 背包按类型/稀有度分桶并维护排序视图，菜单分页显示")
+    print("12. 属性引擎按来源保存加成，换装、强化、升级时只更新对应来源")
+    print("13. 特殊效果使用固定索引的 array('d') 向量，批量战斗直接按列读取效果矩阵")
+    print("14. 套装使用预先计算的索引和部件计数，只在档位变化时激活")
+    print("15. 战斗菜单按技能树版本缓存，技能效果通过技能ID分派表调用")
+    print("16. 服务器单进程承载数百个并发会话（每会话一个线程，监听队列足够长）")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
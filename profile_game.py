@@ -11,6 +11,7 @@ import io
 import time
 import sys
 import os
+import subprocess
 
 # 添加src目录到路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -27,6 +28,95 @@ except ImportError:
         sys.exit(1)
 
 
+# 启动性能回归预算（毫秒）
+IMPORT_TIME_BUDGET_MS = 60
+COLD_START_BUDGET_MS = 150
+
+# 冷启动脚本：构建游戏直到出现第一个输入提示（语言选择）后退出
+COLD_START_SCRIPT = """
+from hero.safe_input import input_provider
+from hero.main import HeroGame
+
+class FirstPrompt(Exception):
+    pass
+
+def provider(decision, prompt, options):
+    raise FirstPrompt()
+
+with input_provider(provider):
+    try:
+        HeroGame()
+    except FirstPrompt:
+        pass
+"""
+
+
+def _run_python(args, runs=1):
+    """在新的解释器中运行，返回 (每次耗时毫秒列表, 最后一次的标准错误)"""
+    env = dict(os.environ)
+    src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_path, env.get("PYTHONPATH")]))
+    env["HERO_CLOCK"] = "skip"
+    timings = []
+    stderr = ""
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        result = subprocess.run([sys.executable] + args, env=env, capture_output=True, text=True)
+        timings.append((time.perf_counter() - start_time) * 1000)
+        stderr = result.stderr
+    return timings, stderr
+
+
+def parse_importtime(output):
+    """解析 -X importtime 的输出
+
+    Returns:
+        list: [(模块名, 自身耗时微秒, 累计耗时微秒)]
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        modules.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return modules
+
+
+def profile_import_time(budget_ms=IMPORT_TIME_BUDGET_MS, top=10):
+    """分析导入 hero.main 的耗时（python -X importtime）"""
+    print("=== 分析导入耗时 ===")
+    
+    # 先运行一次生成字节码缓存，避免把编译时间计入导入时间
+    _run_python(["-c", "import hero.main"])
+    _, stderr = _run_python(["-X", "importtime", "-c", "import hero.main"])
+    modules = parse_importtime(stderr)
+    total = next((cumulative for name, _, cumulative in modules if name == "hero.main"), 0) / 1000
+    
+    print(f"导入 hero.main 总耗时: {total:.2f}毫秒")
+    print("累计耗时最多的模块:")
+    for name, own, cumulative in sorted(modules, key=lambda item: item[2], reverse=True)[:top]:
+        print(f"  {name:<30} 自身 {own / 1000:6.2f}ms  累计 {cumulative / 1000:6.2f}ms")
+    print(f"{'✅' if total <= budget_ms else '⚠️'} 导入预算: {budget_ms}毫秒")
+    return total
+
+
+def profile_cold_start(runs=5, budget_ms=COLD_START_BUDGET_MS):
+    """测量新进程从启动到第一个输入提示的时间"""
+    print("=== 分析冷启动到第一个提示的时间 ===")
+    
+    baseline, _ = _run_python(["-c", "pass"], runs)
+    timings, _ = _run_python(["-c", COLD_START_SCRIPT], runs)
+    interpreter = sorted(baseline)[len(baseline) // 2]
+    cold_start = sorted(timings)[len(timings) // 2]
+    
+    print(f"解释器启动: {interpreter:.2f}毫秒")
+    print(f"启动到第一个提示: {cold_start:.2f}毫秒（游戏部分 {cold_start - interpreter:.2f}毫秒）")
+    print(f"{'✅' if cold_start <= budget_ms else '⚠️'} 冷启动预算: {budget_ms}毫秒")
+    return cold_start
+
+
 def profile_startup(iterations=10):
     """分析游戏启动性能"""
     print("=== 分析游戏启动性能 ===")
@@ -155,10 +245,23 @@ def get_memory_usage():
 
 
 def main():
-    """主函数"""
+    """主函数
+
+    Returns:
+        int: 退出状态，导入或冷启动超出预算时为 1
+    """
     print("英雄无敌游戏性能分析工具")
     print("=" * 40)
     
+    # 分析导入和冷启动性能
+    import_time = profile_import_time()
+    
+    print("\n")
+    
+    cold_start_time = profile_cold_start()
+    
+    print("\n")
+    
     # 分析启动性能
     startup_time = profile_startup()
     
@@ -174,6 +277,8 @@ def main():
     
     print("\n")
     print("=== 性能总结 ===")
+    print(f"导入时间: {import_time:.2f}毫秒")
+    print(f"冷启动到第一个提示: {cold_start_time:.2f}毫秒")
     print(f"启动时间: {startup_time:.2f}毫秒")
     print(f"100步游戏时间: {gameplay_time:.2f}秒")
     print(f"1000步游戏时间: {large_game_time:.2f}秒")
@@ -181,6 +286,19 @@ def main():
     
     # 性能基准
     print("\n=== 性能基准 ===")
+    over_budget = False
+    if import_time > IMPORT_TIME_BUDGET_MS:
+        print(f"❌ 导入时间超出预算 (>{IMPORT_TIME_BUDGET_MS}毫秒)")
+        over_budget = True
+    else:
+        print(f"✅ 导入时间在预算内 (<{IMPORT_TIME_BUDGET_MS}毫秒)")
+    
+    if cold_start_time > COLD_START_BUDGET_MS:
+        print(f"❌ 冷启动时间超出预算 (>{COLD_START_BUDGET_MS}毫秒)")
+        over_budget = True
+    else:
+        print(f"✅ 冷启动时间在预算内 (<{COLD_START_BUDGET_MS}毫秒)")
+    
     if startup_time > 2000:
         print("⚠️ 启动时间过长 (>2秒)")
     else:
@@ -195,7 +313,9 @@ def main():
         print("⚠️ 内存增长过快 (>100MB/1000步)")
     else:
         print("✅ 内存使用正常 (<100MB/1000步)")
+    
+    return 1 if over_budget else 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
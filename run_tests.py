@@ -19,6 +19,9 @@ hero_path = os.path.join(src_path, 'hero')
 if hero_path not in sys.path:
     sys.path.insert(0, hero_path)
 
+# 测试中的停顿不做真实等待（见 hero.clock）
+os.environ.setdefault("HERO_CLOCK", "skip")
+
 
 def run_all_tests(verbosity=2, pattern='test_*.py'):
     """运行所有测试"""
@@ -18,6 +18,7 @@ setup(
     url="https://github.com/yourusername/hero",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"hero": ["locales/*.json"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -28,6 +29,7 @@ setup(
     entry_points={
         "console_scripts": [
             "hero=hero.main:main",
+            "hero-server=hero.server:main",
         ],
     },
 )
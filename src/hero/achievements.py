@@ -7,6 +7,9 @@ import json
 import os
 from datetime import datetime
 
+from .renderer import get_renderer
+from .clock import get_clock
+
 
 class AchievementSystem:
     """成就系统类"""
@@ -20,6 +23,16 @@ class AchievementSystem:
         # 加载已解锁的成就
         self._load_unlocked_achievements()
 
+    @property
+    def renderer(self):
+        """游戏的输出渲染器"""
+        return get_renderer(self.game)
+
+    @property
+    def clock(self):
+        """游戏时钟"""
+        return get_clock(self.game)
+
     def _load_achievements_config(self):
         """加载成就配置"""
         return {
@@ -295,23 +308,23 @@ class AchievementSystem:
         except json.JSONDecodeError as e:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(e, "加载成就数据", "成就数据文件已损坏。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             log_debug(f"成就数据JSON解析错误: {str(e)}")
             self.unlocked_achievements = []
         except FileNotFoundError:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(FileNotFoundError(), "加载成就数据", "成就数据文件不存在。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             self.unlocked_achievements = []
         except PermissionError:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(PermissionError(), "加载成就数据", "没有权限读取成就数据文件。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             self.unlocked_achievements = []
         except Exception as e:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(e, "加载成就数据", "加载成就数据时发生未知错误。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             log_debug(f"加载成就数据未知错误: {str(e)}")
             self.unlocked_achievements = []
 
@@ -327,12 +340,12 @@ class AchievementSystem:
         except PermissionError as e:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(e, "保存成就数据", "没有权限写入成就数据文件。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             log_debug(f"保存成就数据权限错误: {str(e)}")
         except Exception as e:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(e, "保存成就数据", "保存成就数据时发生未知错误。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             log_debug(f"保存成就数据未知错误: {str(e)}")
 
     def check_achievements(self):
@@ -374,16 +387,15 @@ class AchievementSystem:
             "legendary": ""
         }
         
-        print(f"\n{'='*50}")
-        print(f"🎉 {self.game.lang.get_text('achievement_unlocked')}! 🎉")
-        print(f"{icon} {name}")
-        print(f"📝 {description}")
-        print(f"⭐ {self.game.lang.get_text('rarity')}: {rarity}")
-        print(f"{'='*50}")
+        self.renderer.print(f"\n{'='*50}")
+        self.renderer.text("achievement_unlocked", prefix="🎉 ", suffix="! 🎉")
+        self.renderer.print(f"{icon} {name}")
+        self.renderer.print(f"📝 {description}")
+        self.renderer.print(f"⭐ {self.game.lang.get_text('rarity')}: {rarity}")
+        self.renderer.print(f"{'='*50}")
         
         # 添加一点延迟让玩家有时间阅读
-        import time
-        time.sleep(2)
+        self.clock.pause(2)
 
     def get_achievement_progress(self, achievement_id):
         """获取成就进度信息"""
@@ -412,19 +424,19 @@ class AchievementSystem:
     def show_achievements_menu(self):
         """显示成就菜单"""
         while True:
-            print(f"\n{'='*40}")
-            print(f"🏆 {self.game.lang.get_text('achievements')}")
-            print(f"{'='*40}")
+            self.renderer.print(f"\n{'='*40}")
+            self.renderer.text("achievements", prefix="🏆 ")
+            self.renderer.print(f"{'='*40}")
             
             # 显示成就统计
             total_achievements = len(self.achievements)
             unlocked_count = len(self.unlocked_achievements)
             progress_percent = (unlocked_count / total_achievements) * 100
             
-            print(f"📊 {self.game.lang.get_text('total_achievements')}: {total_achievements}")
-            print(f"✅ {self.game.lang.get_text('unlocked_achievements')}: {unlocked_count}")
-            print(f"📈 {self.game.lang.get_text('completion')}: {progress_percent:.1f}%")
-            print()
+            self.renderer.print(f"📊 {self.game.lang.get_text('total_achievements')}: {total_achievements}")
+            self.renderer.print(f"✅ {self.game.lang.get_text('unlocked_achievements')}: {unlocked_count}")
+            self.renderer.print(f"📈 {self.game.lang.get_text('completion')}: {progress_percent:.1f}%")
+            self.renderer.print()
             
             # 显示成就分类
             categories = {
@@ -437,9 +449,9 @@ class AchievementSystem:
             }
             
             for i, (category, info) in enumerate(categories.items(), 1):
-                print(f"{i}. {info['icon']} {info['name']}")
+                self.renderer.print(f"{i}. {info['icon']} {info['name']}")
             
-            print(f"{len(categories) + 1}. {self.game.lang.get_text('back_to_menu')}")
+            self.renderer.print(f"{len(categories) + 1}. {self.game.lang.get_text('back_to_menu')}")
             
             choice = input(f"\n{self.game.lang.get_text('enter_choice')}: ").strip()
             
@@ -452,9 +464,9 @@ class AchievementSystem:
                     category = list(categories.keys())[choice_num - 1]
                     self._show_category_achievements(category, list(categories.keys())[choice_num - 1])
                 else:
-                    print(f"❌ {self.game.lang.get_text('invalid_choice')}")
+                    self.renderer.text("invalid_choice", prefix="❌ ")
             except ValueError:
-                print(f"❌ {self.game.lang.get_text('invalid_choice')}")
+                self.renderer.text("invalid_choice", prefix="❌ ")
 
     def _show_category_achievements(self, category, category_name):
         """显示指定分类的成就"""
@@ -470,20 +482,20 @@ class AchievementSystem:
         
         achievements_in_category = category_mapping.get(category, [])
         
-        print(f"\n{'='*40}")
-        print(f"🏆 {self.game.lang.get_text(category + '_achievements')}")
-        print(f"{'='*40}")
+        self.renderer.print(f"\n{'='*40}")
+        self.renderer.print(f"🏆 {self.game.lang.get_text(category + '_achievements')}")
+        self.renderer.print(f"{'='*40}")
         
         for achievement_id in achievements_in_category:
             progress_info = self.get_achievement_progress(achievement_id)
             if progress_info:
                 status_icon = "✅" if progress_info["unlocked"] else "🔒"
-                print(f"{status_icon} {progress_info['icon']} {progress_info['name']}")
-                print(f"   📝 {progress_info['description']}")
-                print(f"   ⭐ {self.game.lang.get_text('rarity')}: {progress_info['rarity']}")
+                self.renderer.print(f"{status_icon} {progress_info['icon']} {progress_info['name']}")
+                self.renderer.print(f"   📝 {progress_info['description']}")
+                self.renderer.print(f"   ⭐ {self.game.lang.get_text('rarity')}: {progress_info['rarity']}")
                 if not progress_info["unlocked"]:
-                    print(f"   📊 {self.game.lang.get_text('progress')}: {progress_info['progress']}%")
-                print()
+                    self.renderer.print(f"   📊 {self.game.lang.get_text('progress')}: {progress_info['progress']}%")
+                self.renderer.print()
         
         input(f"{self.game.lang.get_text('continue_prompt')}")
 
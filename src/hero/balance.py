@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+平衡性模拟模块 - 使用进程池批量运行真实游戏（蒙特卡洛）
+
+每个任务块（chunk）在工作进程中用 SimulationDriver 运行若干局真实游戏，
+任务块的随机种子由基础种子按块序号派生，因此结果与工作进程数量和调度顺序无关。
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from hero.game_config import DIFFICULTY_SETTINGS, MAP_TYPES, CLASS_DEFINITIONS
+from hero.simulation import SimulationDriver, SimulationPolicy
+
+
+def play_games(config, num_games, seed, max_steps=10000, policy_class=SimulationPolicy):
+    """在当前进程中运行一批游戏（进程池的工作单元）
+
+    Args:
+        config: (difficulty, map_type, hero_class) 元组
+        num_games: 运行局数
+        seed: 本批次的随机种子
+        max_steps: 单局最大步数
+        policy_class: 决策策略类（需可被 pickle）
+
+    Returns:
+        tuple: (config, 结果列表)
+    """
+    difficulty, map_type, hero_class = config
+    # 每局游戏使用由批次种子派生的独立随机数流
+    game_seeds = random.Random(seed)
+    driver = SimulationDriver(policy=policy_class(), difficulty=difficulty, map_type=map_type,
+                              hero_class=hero_class, max_steps=max_steps, reuse_game=True)
+    return config, [driver.run(seed=game_seeds.getrandbits(64)) for _ in range(num_games)]
+
+
+def summarize_results(results):
+    """汇总一组游戏结果
+
+    Args:
+        results: SimulationDriver.run 返回的结果列表
+
+    Returns:
+        dict: 汇总统计
+    """
+    if not results:
+        return {"games": 0, "victory_rate": 0.0, "stalled": 0}
+
+    count = len(results)
+
+    def mean(key):
+        return sum(r[key] for r in results) / count
+
+    return {
+        "games": count,
+        "victory_rate": sum(1 for r in results if r["victory"]) / count * 100,
+        "stalled": sum(1 for r in results if r.get("stalled")),
+        "average_steps": mean("steps"),
+        "average_gold": mean("gold_earned"),
+        "average_exp": mean("exp_earned"),
+        "average_level": mean("final_level"),
+        "average_monsters_defeated": mean("monsters_defeated"),
+        "average_perceived_seconds": sum(r.get("perceived_seconds", 0) for r in results) / count
+    }
+
+
+class BalanceRunner:
+    """进程池蒙特卡洛平衡性运行器"""
+
+    def __init__(self, workers=None, chunk_size=50, max_steps=10000, seed=None,
+                 policy_class=SimulationPolicy):
+        """
+        Args:
+            workers: 工作进程数，None 表示 CPU 核心数，1 表示在当前进程内运行
+            chunk_size: 每个任务块的局数
+            max_steps: 单局最大步数
+            seed: 基础随机种子，None 表示随机
+            policy_class: 决策策略类
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.max_steps = max_steps
+        self.seed = seed
+        self.policy_class = policy_class
+
+    def make_tasks(self, configs, games_per_config):
+        """把 (配置 × 局数) 拆分为带种子的任务块
+
+        Returns:
+            list: [(config, num_games, seed), ...]
+        """
+        seed_source = random.Random(self.seed)
+        tasks = []
+        for config in configs:
+            remaining = games_per_config
+            while remaining > 0:
+                count = min(self.chunk_size, remaining)
+                tasks.append((tuple(config), count, seed_source.getrandbits(64)))
+                remaining -= count
+        return tasks
+
+    def run(self, configs, games_per_config, progress=None):
+        """运行所有配置的模拟
+
+        Args:
+            configs: (difficulty, map_type, hero_class) 元组列表
+            games_per_config: 每个配置的局数
+            progress: 可选回调 progress(完成局数, 总局数)
+
+        Returns:
+            dict: {config: 结果列表}
+        """
+        tasks = self.make_tasks(configs, games_per_config)
+        total = sum(task[1] for task in tasks)
+        # 按任务序号收集结果块，保证结果顺序与调度顺序无关
+        chunks = [None] * len(tasks)
+        done = 0
+
+        if self.workers == 1:
+            for index, (config, count, seed) in enumerate(tasks):
+                chunks[index] = play_games(config, count, seed, self.max_steps, self.policy_class)[1]
+                done += count
+                if progress:
+                    progress(done, total)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(play_games, config, count, seed, self.max_steps, self.policy_class): index
+                    for index, (config, count, seed) in enumerate(tasks)
+                }
+                for future in as_completed(futures):
+                    chunks[futures[future]] = future.result()[1]
+                    done += tasks[futures[future]][1]
+                    if progress:
+                        progress(done, total)
+
+        results = {tuple(config): [] for config in configs}
+        for (config, _, _), chunk in zip(tasks, chunks):
+            results[config].extend(chunk)
+        return results
+
+    def sweep(self, games_per_config, difficulties=None, map_types=None, hero_classes=None, progress=None):
+        """对 难度 × 地图 × 职业 的组合进行扫描
+
+        Returns:
+            dict: {config: 汇总统计}
+        """
+        configs = [
+            (difficulty, map_type, hero_class)
+            for difficulty in (difficulties or list(DIFFICULTY_SETTINGS))
+            for map_type in (map_types or list(MAP_TYPES))
+            for hero_class in (hero_classes or list(CLASS_DEFINITIONS))
+        ]
+        results = self.run(configs, games_per_config, progress)
+        return {config: summarize_results(chunk) for config, chunk in results.items()}
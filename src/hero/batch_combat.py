@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+批量战斗模块 - 使用 NumPy 向量化一次结算大量普通战斗（用于平衡性分析）
+
+结算规则与 CombatSystem.combat 中英雄始终普通攻击时的回合循环一致：
+职业被动、饰品生命恢复、首回合加成、暴击、背刺、元素伤害、火焰武器、吸血，
+怪物的闪避判定、反击、randint(atk//2, atk) - 防御、抗性和护甲减伤，以及精英 1.5 倍。
+每回合只对尚未结束的战斗计算，已结束的战斗从工作数组中移除。
+
+NumPy 为可选依赖，未安装时导入本模块不会出错，但调用结算会抛出 ImportError。
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .game_config import MONSTER_TEMPLATES, CLASS_DEFINITIONS, DIFFICULTY_SETTINGS
+from .effects import EffectVector, EFFECT_INDEX, effect_matrix
+
+
+# 英雄属性字段及默认值（标量或长度为 N 的数组）
+HERO_STAT_DEFAULTS = {
+    "hp": 100,
+    "max_hp": 100,
+    "attack": 20,
+    "defense": 5,
+    "crit_rate": 0.1,
+    "crit_damage": 0.5,
+    "dodge": 0.0,
+    "counter_attack": 0.0,
+    "lifesteal": 0.0,
+    "backstab": 0.0,
+    "bonus_damage": 0,               # 冰霜伤害 + 火焰伤害
+    "first_turn_damage": 0.0,        # 职业被动首回合加成
+    "crit_rate_per_round": 0.0,      # 刺客被动每回合累加的暴击率
+    "dodge_per_round": 0.0,          # 刺客被动每回合累加的闪避率
+    "hp_regen_percent": 0.0,         # 战士被动每回合生命恢复
+    "legendary_hp_regen_percent": 0.0,
+    "flame_damage_percent": 0.0,
+    "damage_reduction_percent": 0.0,
+    "holy_resistance": 0.0,
+    "fire_resistance": 0.0
+}
+
+
+def require_numpy():
+    """确认 NumPy 可用"""
+    if np is None:
+        raise ImportError("批量战斗结算需要安装 NumPy (pip install numpy)")
+
+
+# 直接取自英雄特殊效果的属性字段
+EFFECT_STAT_FIELDS = ("crit_rate", "crit_damage", "dodge", "counter_attack", "lifesteal", "backstab",
+                      "holy_resistance", "fire_resistance")
+
+
+def _hero_base_stats(game):
+    """英雄属性中不来自特殊效果的字段（生命、攻防、职业被动、装备传说属性）"""
+    passive_effects = CLASS_DEFINITIONS.get(game.hero_class, {}).get("passive_effects", {})
+    stats = dict(HERO_STAT_DEFAULTS)
+    stats.update({
+        "hp": game.hero_hp,
+        "max_hp": game.hero_max_hp,
+        "attack": game.hero_attack,
+        "defense": game.hero_defense,
+        "first_turn_damage": passive_effects.get("first_turn_damage", 0)
+    })
+
+    # 职业被动（与 CombatSystem.apply_class_passives 一致）
+    if game.hero_class == "warrior":
+        stats["hp_regen_percent"] = passive_effects.get("hp_regen_per_turn", 0)
+    elif game.hero_class == "assassin":
+        stats["crit_rate_per_round"] = passive_effects.get("crit_rate", 0)
+        stats["dodge_per_round"] = passive_effects.get("dodge_chance", 0)
+
+    # 装备传说属性
+    weapon = game.equipment.get("weapon")
+    if weapon and weapon.get("legendary_attribute") == "flame_damage":
+        stats["flame_damage_percent"] = weapon.get("flame_damage_percent", 0.05)
+    armor = game.equipment.get("armor")
+    if armor and armor.get("legendary_attribute") == "damage_reduction":
+        stats["damage_reduction_percent"] = armor.get("damage_reduction_percent", 0.05)
+    accessory = game.equipment.get("accessory")
+    if accessory and accessory.get("legendary_attribute") == "hp_regen":
+        stats["legendary_hp_regen_percent"] = accessory.get("hp_regen_percent", 0.01)
+    return stats
+
+
+def hero_stats_from_game(game):
+    """从游戏对象读取批量结算所需的英雄属性
+
+    Args:
+        game: 游戏对象
+
+    Returns:
+        dict: 英雄属性（标量）
+    """
+    effects = game.special_effects
+    stats = _hero_base_stats(game)
+    for field in EFFECT_STAT_FIELDS:
+        stats[field] = effects.get(field, 0)
+    stats["bonus_damage"] = effects.get("ice_damage", 0) + effects.get("fire_damage", 0)
+    return stats
+
+
+def hero_stats_from_games(games):
+    """从多个游戏对象读取英雄属性，每场战斗使用对应的英雄
+
+    特殊效果直接从各英雄效果向量合并成的矩阵中按列读取。
+
+    Args:
+        games: 游戏对象序列（长度与 resolve 的战斗数相同）
+
+    Returns:
+        dict: 英雄属性（长度为 len(games) 的数组）
+    """
+    require_numpy()
+    games = list(games)
+    rows = [_hero_base_stats(game) for game in games]
+    stats = {key: np.array([row[key] for row in rows]) for key in HERO_STAT_DEFAULTS}
+    vectors = [game.special_effects if isinstance(game.special_effects, EffectVector)
+               else EffectVector.from_mapping(game.special_effects) for game in games]
+    matrix = effect_matrix(vectors)
+    for field in EFFECT_STAT_FIELDS:
+        stats[field] = matrix[:, EFFECT_INDEX[field]]
+    stats["bonus_damage"] = (matrix[:, EFFECT_INDEX["ice_damage"]]
+                             + matrix[:, EFFECT_INDEX["fire_damage"]]).astype(np.int64)
+    return stats
+
+
+class BatchCombatResolver:
+    """向量化批量战斗结算器"""
+
+    def __init__(self, seed=None, max_rounds=500):
+        """
+        Args:
+            seed: 随机种子
+            max_rounds: 单场战斗最大回合数（超过视为未分胜负）
+        """
+        require_numpy()
+        self.rng = np.random.default_rng(seed)
+        self.max_rounds = max_rounds
+
+    def randint(self, low, high):
+        """逐元素的 randint(low, high)（包含上界）"""
+        return self.rng.integers(low, high, endpoint=True)
+
+    def roll_monsters(self, monster_keys, count, hero_level, difficulty="normal", enemy_multiplier=None):
+        """按 CombatSystem.combat 的规则生成 count 只怪物
+
+        Args:
+            monster_keys: 怪物键、键列表（均匀随机选择）或 {怪物键: 出现概率}
+            count: 怪物数量
+            hero_level: 英雄等级
+            difficulty: 难度（决定奖励倍率和默认敌人倍率）
+            enemy_multiplier: 敌人倍率，None 表示使用难度设置
+
+        Returns:
+            dict: 怪物属性数组
+        """
+        if isinstance(monster_keys, str):
+            monster_keys = [monster_keys]
+        weights = None
+        if isinstance(monster_keys, dict):
+            weights = np.array(list(monster_keys.values()), dtype=np.float64)
+            weights /= weights.sum()
+            monster_keys = list(monster_keys)
+        settings = DIFFICULTY_SETTINGS[difficulty]
+        if enemy_multiplier is None:
+            enemy_multiplier = settings["enemy_multiplier"]
+
+        templates = [MONSTER_TEMPLATES[key] for key in monster_keys]
+        if weights is None:
+            choice = self.rng.integers(0, len(templates), size=count)
+        else:
+            choice = self.rng.choice(len(templates), size=count, p=weights)
+
+        def ranges(field):
+            bounds = np.array([template[field] for template in templates], dtype=np.int64)
+            return bounds[choice, 0], bounds[choice, 1]
+
+        level_bonus = (hero_level - 1) * 2
+        monsters = {
+            "hp": ((self.randint(*ranges("base_hp")) + level_bonus * 2) * enemy_multiplier).astype(np.int64),
+            "attack": ((self.randint(*ranges("base_attack")) + level_bonus) * enemy_multiplier).astype(np.int64),
+            "defense": ((self.randint(*ranges("base_defense")) + level_bonus // 2) * enemy_multiplier).astype(np.int64),
+            "exp": ((self.randint(*ranges("exp_reward")) + hero_level * 3) * settings["exp_multiplier"]).astype(np.int64),
+            "gold": ((self.randint(*ranges("gold_reward")) + hero_level * 2) * settings["gold_multiplier"]).astype(np.int64)
+        }
+
+        # 10%概率出现精英怪物，所有属性和奖励 ×1.5
+        elite = self.rng.random(count) < 0.1
+        for field in ("hp", "attack", "defense", "exp", "gold"):
+            monsters[field] = np.where(elite, (monsters[field] * 1.5).astype(np.int64), monsters[field])
+        monsters["elite"] = elite
+
+        specials = np.array([template.get("special") or "" for template in templates])[choice]
+        monsters["poison"] = specials == "poison"
+        monsters["fire"] = specials == "fire"
+        return monsters
+
+    def resolve(self, hero, monsters):
+        """逐回合向量化结算所有战斗
+
+        Args:
+            hero: 英雄属性字典（标量或长度为 N 的数组，缺省字段使用 HERO_STAT_DEFAULTS）
+            monsters: roll_monsters 返回的怪物属性数组
+
+        Returns:
+            dict: 每场战斗的 victory、rewarded、rounds、hero_hp、monster_hp、exp、gold 数组
+        """
+        count = len(monsters["hp"])
+        stats = dict(HERO_STAT_DEFAULTS)
+        stats.update(hero)
+        h = {key: np.broadcast_to(np.asarray(value), (count,)).copy() for key, value in stats.items()}
+        for key in ("hp", "max_hp", "attack", "defense", "bonus_damage"):
+            h[key] = h[key].astype(np.int64)
+        for key in ("crit_rate", "dodge"):
+            h[key] = h[key].astype(np.float64)
+
+        # 每回合固定的生命恢复量（职业被动 + 饰品传说属性）
+        h["regen"] = ((h["max_hp"] * h["hp_regen_percent"]).astype(np.int64)
+                      + (h["max_hp"] * h["legendary_hp_regen_percent"]).astype(np.int64))
+
+        m_hp = np.asarray(monsters["hp"], dtype=np.int64).copy()
+        m_attack = np.asarray(monsters["attack"], dtype=np.int64)
+        poison = np.asarray(monsters.get("poison", np.zeros(count, dtype=bool)))
+        fire = np.asarray(monsters.get("fire", np.zeros(count, dtype=bool)))
+
+        # 输出数组
+        out_rounds = np.zeros(count, dtype=np.int64)
+        out_hero_hp = h["hp"].copy()
+        out_monster_hp = m_hp.copy()
+        rewarded = np.zeros(count, dtype=bool)
+
+        # 工作数组只保留未结束的战斗
+        idx = np.arange(count)
+        hero_hp = h["hp"].copy()
+        combat_round = 1
+        while idx.size and combat_round <= self.max_rounds:
+            max_hp = h["max_hp"][idx]
+
+            # 职业被动和装备回合效果
+            hero_hp = np.minimum(hero_hp + h["regen"][idx], max_hp)
+            h["crit_rate"][idx] += h["crit_rate_per_round"][idx]
+            h["dodge"][idx] += h["dodge_per_round"][idx]
+
+            # 英雄普通攻击
+            attack = h["attack"][idx]
+            damage = np.maximum(1, self.randint(attack // 2, attack))
+            if combat_round == 1:
+                damage += (damage * h["first_turn_damage"][idx]).astype(np.int64)
+            crit = self.rng.random(idx.size) < h["crit_rate"][idx]
+            damage = np.where(crit, (damage * (1.5 + h["crit_damage"][idx])).astype(np.int64), damage)
+            if combat_round == 1:
+                damage += (damage * h["backstab"][idx]).astype(np.int64)
+            damage += h["bonus_damage"][idx]
+            damage += (damage * h["flame_damage_percent"][idx]).astype(np.int64)
+            m_hp[idx] -= damage
+            hero_hp = np.minimum(hero_hp + (damage * h["lifesteal"][idx]).astype(np.int64), max_hp)
+
+            # 被英雄攻击击败的怪物给予奖励
+            killed = m_hp[idx] <= 0
+            rewarded[idx[killed]] = True
+
+            # 怪物反击（仅对存活的怪物）
+            dodged = self.rng.random(idx.size) < h["dodge"][idx]
+            hit = ~killed & ~dodged
+            defense = h["defense"][idx]
+            m_atk = m_attack[idx]
+            counter = hit & (self.rng.random(idx.size) < h["counter_attack"][idx])
+            counter_damage = np.maximum(1, (m_atk * 0.5).astype(np.int64) - defense)
+            m_hp[idx] -= np.where(counter, counter_damage, 0)
+
+            monster_damage = np.maximum(1, self.randint(m_atk // 2, m_atk) - defense)
+            resist = np.where(poison[idx], h["holy_resistance"][idx], 0.0) + np.where(fire[idx], h["fire_resistance"][idx], 0.0)
+            monster_damage = np.where(resist > 0, (monster_damage * (1 - resist)).astype(np.int64), monster_damage)
+            reduction = (monster_damage * h["damage_reduction_percent"][idx]).astype(np.int64)
+            monster_damage = np.where(reduction > 0, np.maximum(1, monster_damage - reduction), monster_damage)
+            hero_hp = hero_hp - np.where(hit, monster_damage, 0)
+
+            # 记录结束的战斗并压缩工作数组
+            finished = (m_hp[idx] <= 0) | (hero_hp <= 0)
+            done = idx[finished]
+            out_rounds[done] = combat_round
+            out_hero_hp[done] = hero_hp[finished]
+            out_monster_hp[done] = m_hp[done]
+            idx = idx[~finished]
+            hero_hp = hero_hp[~finished]
+            combat_round += 1
+
+        # 超过最大回合数的战斗
+        out_rounds[idx] = self.max_rounds
+        out_hero_hp[idx] = hero_hp
+        out_monster_hp[idx] = m_hp[idx]
+
+        victory = (out_monster_hp <= 0) & (out_hero_hp > 0)
+        return {
+            "victory": victory,
+            "rewarded": rewarded,
+            "rounds": out_rounds,
+            "hero_hp": out_hero_hp,
+            "monster_hp": out_monster_hp,
+            "exp": np.where(rewarded, monsters["exp"], 0),
+            "gold": np.where(rewarded, monsters["gold"], 0)
+        }
+
+    def simulate(self, hero, monster_keys, count, hero_level, difficulty="normal", enemy_multiplier=None):
+        """生成怪物并结算 count 场战斗
+
+        Returns:
+            dict: resolve 的结果
+        """
+        monsters = self.roll_monsters(monster_keys, count, hero_level, difficulty, enemy_multiplier)
+        return self.resolve(hero, monsters)
+
+
+def summarize_batch(results):
+    """汇总批量战斗结果
+
+    Args:
+        results: BatchCombatResolver.resolve 的结果
+
+    Returns:
+        dict: 汇总统计
+    """
+    count = len(results["victory"])
+    if not count:
+        return {"fights": 0, "win_rate": 0.0}
+    return {
+        "fights": count,
+        "win_rate": float(results["victory"].mean() * 100),
+        "average_rounds": float(results["rounds"].mean()),
+        "average_hero_hp": float(results["hero_hp"].mean()),
+        "average_exp": float(results["exp"].mean()),
+        "average_gold": float(results["gold"].mean())
+    }
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+游戏时钟模块 - 游戏中的所有停顿都经由 HeroGame.clock
+
+- real: 真实等待，遵循游戏设置（关闭战斗动画时跳过战斗停顿）
+- skip: 不等待也不计时，用于模拟和测试
+- virtual: 不等待，只累计玩家 "感知到的" 等待时长
+
+未指定模式时读取环境变量 HERO_CLOCK（默认 real）。
+"""
+
+import os
+import time
+
+
+CLOCK_MODES = ("real", "skip", "virtual")
+
+# 停顿类型：combat 为战斗中的回合停顿，受 combat_animations 设置控制
+PAUSE_KINDS = ("pause", "combat")
+
+
+class GameClock:
+    """游戏时钟"""
+
+    def __init__(self, game=None, mode=None, sleep=None):
+        """
+        Args:
+            game: 游戏对象（读取其 settings）
+            mode: 时钟模式，None 时读取环境变量 HERO_CLOCK
+            sleep: 真实等待函数，None 表示 time.sleep
+        """
+        mode = mode or os.environ.get("HERO_CLOCK", "real")
+        if mode not in CLOCK_MODES:
+            raise ValueError(f"未知的时钟模式: {mode}")
+        self.game = game
+        self.mode = mode
+        self.elapsed = 0.0
+        self.pause_count = 0
+        self._sleep = sleep
+
+    @property
+    def realtime(self):
+        """是否真实等待"""
+        return self.mode == "real"
+
+    def duration(self, seconds, kind="pause"):
+        """按游戏设置换算停顿时长
+
+        Args:
+            seconds: 原始停顿秒数
+            kind: 停顿类型
+
+        Returns:
+            float: 实际停顿秒数（0 表示跳过）
+        """
+        settings = getattr(self.game, "settings", None)
+        if kind == "combat" and settings is not None and not getattr(settings, "combat_animations", True):
+            return 0
+        return seconds
+
+    def pause(self, seconds, kind="pause"):
+        """停顿
+
+        Args:
+            seconds: 停顿秒数
+            kind: 停顿类型
+        """
+        if self.mode == "skip":
+            return
+        seconds = self.duration(seconds, kind)
+        if seconds <= 0:
+            return
+        self.elapsed += seconds
+        self.pause_count += 1
+        if self.mode == "real":
+            (self._sleep or time.sleep)(seconds)
+
+    def typing_delay(self, char_delay, length):
+        """逐字显示的每字符等待时间（非真实模式返回 0，虚拟模式累计总时长）
+
+        Args:
+            char_delay: 设置中的每字符延迟（秒）
+            length: 文本长度
+        """
+        if self.mode == "real":
+            self.elapsed += char_delay * length
+            return char_delay
+        if self.mode == "virtual":
+            self.elapsed += char_delay * length
+        return 0
+
+    def reset(self):
+        """清零计时"""
+        self.elapsed = 0.0
+        self.pause_count = 0
+
+
+def get_clock(game):
+    """获取游戏对象的时钟
+
+    游戏对象没有时钟（如测试中的模拟对象）时返回新的默认模式时钟。
+    """
+    clock = getattr(game, "clock", None)
+    if isinstance(clock, GameClock):
+        return clock
+    return GameClock(game)
@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+"""
+战斗分析模块 - 用马尔可夫链精确计算普通战斗的胜率
+
+状态为 (英雄生命值, 怪物生命值)，每回合的伤害分布由 randint 的均匀范围、
+暴击率、闪避率和反击率推导，规则与 CombatSystem.combat 中英雄始终普通攻击时一致
+（与 batch_combat 的向量化结算使用同一套英雄属性）。按回合做动态规划得到
+精确的胜率、期望回合数和期望生命损失，伤害分布表按属性缓存。
+
+WinProbabilityTable 预先计算 地图 × 难度 × 职业 × 等级 的查询表，
+平衡性工具和游戏内难度逻辑可以 O(1) 查询。
+"""
+
+import json
+
+from .game_config import (MONSTER_TEMPLATES, DIFFICULTY_SETTINGS, MAP_TYPES, CLASS_DEFINITIONS,
+                          LEVEL_UP_THRESHOLDS, MAP_EVENT_TABLES)
+from .batch_combat import HERO_STAT_DEFAULTS, hero_stats_from_game
+from .encounters import get_encounter_table
+
+
+# 各地图随机事件中普通战斗的敌人倍率（取自 MAP_EVENT_TABLES 的 combat 事件）
+MAP_COMBAT_MULTIPLIERS = {
+    map_type: event["multiplier"]
+    for map_type, events in MAP_EVENT_TABLES.items()
+    for event in events
+    if event["handler"] == "combat"
+}
+
+# 精英怪物出现概率和属性倍率
+ELITE_CHANCE = 0.1
+ELITE_MULTIPLIER = 1.5
+
+
+def _clamp(probability):
+    """把概率限制在 [0, 1]"""
+    return min(1.0, max(0.0, probability))
+
+
+def _uniform(low, high):
+    """randint(low, high) 的均匀分布 {值: 概率}"""
+    if high < low:
+        low, high = high, low
+    p = 1.0 / (high - low + 1)
+    return {value: p for value in range(low, high + 1)}
+
+
+class CombatAnalyzer:
+    """普通战斗的精确分析器"""
+
+    def __init__(self, max_rounds=200, epsilon=1e-12):
+        """
+        Args:
+            max_rounds: 最大分析回合数（剩余概率视为未分胜负）
+            epsilon: 忽略的最小状态概率
+        """
+        self.max_rounds = max_rounds
+        self.epsilon = epsilon
+        self._attack_tables = {}
+        self._defense_tables = {}
+        self._fight_cache = {}
+
+    def hero_attack_table(self, hero, combat_round):
+        """英雄普通攻击的 (伤害, 吸血量) 分布
+
+        Args:
+            hero: 英雄属性字典
+            combat_round: 回合数（首回合加成、背刺和刺客被动与回合有关）
+
+        Returns:
+            list: [(伤害, 吸血量, 概率), ...]
+        """
+        first_turn = combat_round == 1
+        crit_rate = _clamp(hero["crit_rate"] + hero["crit_rate_per_round"] * combat_round)
+        key = (hero["attack"], crit_rate, hero["crit_damage"], hero["first_turn_damage"] if first_turn else 0,
+               hero["backstab"] if first_turn else 0, hero["bonus_damage"], hero["flame_damage_percent"], hero["lifesteal"])
+        table = self._attack_tables.get(key)
+        if table is not None:
+            return table
+
+        attack, crit_rate, crit_damage, first_turn_damage, backstab, bonus_damage, flame_percent, lifesteal = key
+        outcomes = {}
+        for roll, p_roll in _uniform(attack // 2, attack).items():
+            base_damage = max(1, roll)
+            if first_turn_damage > 0:
+                base_damage += int(base_damage * first_turn_damage)
+            for is_crit, p_crit in ((True, crit_rate), (False, 1 - crit_rate)):
+                if p_crit <= 0:
+                    continue
+                damage = int(base_damage * (1.5 + crit_damage)) if is_crit else base_damage
+                if backstab > 0:
+                    damage += int(damage * backstab)
+                damage += bonus_damage
+                damage += int(damage * flame_percent)
+                outcome = (damage, int(damage * lifesteal))
+                outcomes[outcome] = outcomes.get(outcome, 0.0) + p_roll * p_crit
+
+        table = [(damage, heal, p) for (damage, heal), p in outcomes.items()]
+        self._attack_tables[key] = table
+        return table
+
+    def monster_attack_table(self, hero, monster_attack, special=None):
+        """怪物攻击对英雄造成的伤害分布
+
+        Returns:
+            list: [(伤害, 概率), ...]
+        """
+        resistance = 0
+        if special == "poison":
+            resistance = hero["holy_resistance"]
+        elif special == "fire":
+            resistance = hero["fire_resistance"]
+        key = (monster_attack, hero["defense"], resistance, hero["damage_reduction_percent"])
+        table = self._defense_tables.get(key)
+        if table is not None:
+            return table
+
+        outcomes = {}
+        for roll, p in _uniform(monster_attack // 2, monster_attack).items():
+            damage = max(1, roll - hero["defense"])
+            if resistance > 0:
+                damage = int(damage * (1 - resistance))
+            reduction = int(damage * hero["damage_reduction_percent"])
+            if reduction > 0:
+                damage = max(1, damage - reduction)
+            outcomes[damage] = outcomes.get(damage, 0.0) + p
+
+        table = list(outcomes.items())
+        self._defense_tables[key] = table
+        return table
+
+    def analyze_fight(self, hero, monster_hp, monster_attack, special=None):
+        """精确分析一场战斗
+
+        没有反击和吸血时英雄与怪物的生命值变化相互独立，分别做一维动态规划后
+        按回合组合；否则在 (英雄生命值, 怪物生命值) 联合状态上做动态规划。
+
+        Args:
+            hero: 英雄属性字典（缺省字段使用 HERO_STAT_DEFAULTS）
+            monster_hp: 怪物生命值，或 {生命值: 概率} 分布
+            monster_attack: 怪物攻击力
+            special: 怪物特殊能力（poison/fire 影响抗性）
+
+        Returns:
+            dict: win_probability、reward_probability、expected_rounds、expected_hp_loss、unresolved_probability
+        """
+        stats = dict(HERO_STAT_DEFAULTS)
+        stats.update(hero)
+        if not isinstance(monster_hp, dict):
+            monster_hp = {monster_hp: 1.0}
+        defense_table = self.monster_attack_table(stats, monster_attack, special)
+
+        if stats["counter_attack"] <= 0 and stats["lifesteal"] <= 0:
+            return self._analyze_independent(stats, monster_hp, defense_table)
+        counter_damage = max(1, int(monster_attack * 0.5) - stats["defense"])
+        return self._analyze_joint(stats, monster_hp, defense_table, counter_damage)
+
+    def _regen(self, stats):
+        """每回合开始时的生命恢复量（职业被动 + 饰品传说属性）"""
+        max_hp = stats["max_hp"]
+        return int(max_hp * stats["hp_regen_percent"]) + int(max_hp * stats["legendary_hp_regen_percent"])
+
+    def _analyze_independent(self, stats, monster_hp, defense_table):
+        """英雄和怪物生命值相互独立时的一维动态规划"""
+        max_hp = stats["max_hp"]
+        regen = self._regen(stats)
+        epsilon = self.epsilon
+
+        monster = dict(monster_hp)   # 怪物存活时的生命值分布
+        hero = {stats["hp"]: 1.0}    # 英雄存活时的生命值分布
+        win = expected_rounds = final_hp = 0.0
+
+        combat_round = 1
+        while monster and hero and combat_round <= self.max_rounds:
+            monster_alive = sum(monster.values())
+            # 回合开始的生命恢复
+            if regen:
+                healed = {}
+                for h, p in hero.items():
+                    h = min(h + regen, max_hp)
+                    healed[h] = healed.get(h, 0.0) + p
+                hero = healed
+            hero_alive = sum(hero.values())
+            hero_hp_mass = sum(h * p for h, p in hero.items())
+            expected_rounds += monster_alive * hero_alive
+
+            # 英雄攻击：本回合被击败的怪物概率
+            next_monster = {}
+            killed = 0.0
+            attack_table = self.hero_attack_table(stats, combat_round)
+            for m_hp, p in monster.items():
+                for damage, _, q in attack_table:
+                    m = m_hp - damage
+                    if m <= 0:
+                        killed += p * q
+                    else:
+                        next_monster[m] = next_monster.get(m, 0.0) + p * q
+            win += killed * hero_alive
+            final_hp += killed * hero_hp_mass
+
+            # 怪物回合
+            dodge = _clamp(stats["dodge"] + stats["dodge_per_round"] * combat_round)
+            next_hero = {}
+            for h_hp, p in hero.items():
+                if dodge > 0:
+                    next_hero[h_hp] = next_hero.get(h_hp, 0.0) + p * dodge
+                hit = p * (1 - dodge)
+                if hit <= epsilon:
+                    continue
+                for damage, q in defense_table:
+                    h = h_hp - damage
+                    if h > 0:
+                        next_hero[h] = next_hero.get(h, 0.0) + hit * q
+
+            monster = {m: p for m, p in next_monster.items() if p > epsilon}
+            hero = {h: p for h, p in next_hero.items() if p > epsilon}
+            combat_round += 1
+
+        unresolved = sum(monster.values()) * sum(hero.values())
+        final_hp += sum(monster.values()) * sum(h * p for h, p in hero.items())
+        return {
+            "win_probability": win,
+            "reward_probability": win,
+            "expected_rounds": expected_rounds,
+            "expected_hp_loss": stats["hp"] - final_hp,
+            "unresolved_probability": unresolved
+        }
+
+    def _analyze_joint(self, stats, monster_hp, defense_table, counter_damage):
+        """在 (英雄生命值, 怪物生命值) 联合状态上的动态规划"""
+        max_hp = stats["max_hp"]
+        regen = self._regen(stats)
+        counter = _clamp(stats["counter_attack"])
+        epsilon = self.epsilon
+
+        states = {(stats["hp"], hp): p for hp, p in monster_hp.items()}
+        win = rewarded = expected_rounds = final_hp = 0.0
+
+        combat_round = 1
+        while states and combat_round <= self.max_rounds:
+            expected_rounds += sum(states.values())
+            dodge = _clamp(stats["dodge"] + stats["dodge_per_round"] * combat_round)
+
+            # 回合开始的生命恢复和英雄攻击
+            after_attack = {}
+            attack_table = self.hero_attack_table(stats, combat_round)
+            for (hero_hp, m_hp), p in states.items():
+                if regen:
+                    hero_hp = min(hero_hp + regen, max_hp)
+                for damage, heal, q in attack_table:
+                    h = min(hero_hp + heal, max_hp) if heal else hero_hp
+                    m = m_hp - damage
+                    if m <= 0:
+                        win += p * q
+                        rewarded += p * q
+                        final_hp += p * q * h
+                    else:
+                        after_attack[(h, m)] = after_attack.get((h, m), 0.0) + p * q
+
+            # 怪物回合：闪避、反击、受到伤害
+            next_states = {}
+            for (hero_hp, m_hp), p in after_attack.items():
+                if dodge > 0:
+                    next_states[(hero_hp, m_hp)] = next_states.get((hero_hp, m_hp), 0.0) + p * dodge
+                hit = p * (1 - dodge)
+                if hit <= epsilon:
+                    continue
+                for m, p_counter in ((m_hp - counter_damage, counter), (m_hp, 1 - counter)):
+                    if p_counter <= 0:
+                        continue
+                    for damage, q in defense_table:
+                        prob = hit * p_counter * q
+                        h = hero_hp - damage
+                        if m <= 0 or h <= 0:
+                            if m <= 0 and h > 0:
+                                win += prob
+                            final_hp += prob * max(h, 0)
+                        else:
+                            next_states[(h, m)] = next_states.get((h, m), 0.0) + prob
+
+            states = {state: p for state, p in next_states.items() if p > epsilon}
+            combat_round += 1
+
+        unresolved = sum(states.values())
+        final_hp += sum(p * hero_hp for (hero_hp, _), p in states.items())
+        return {
+            "win_probability": win,
+            "reward_probability": rewarded,
+            "expected_rounds": expected_rounds,
+            "expected_hp_loss": stats["hp"] - final_hp,
+            "unresolved_probability": unresolved
+        }
+
+    def analyze_monster(self, hero, monster_key, hero_level, difficulty="normal", enemy_multiplier=None, elite=None):
+        """对一种怪物的所有属性掷骰结果求期望（规则同 CombatSystem.combat）
+
+        Args:
+            hero: 英雄属性字典
+            monster_key: 怪物键
+            hero_level: 英雄等级
+            difficulty: 难度
+            enemy_multiplier: 敌人倍率，None 表示使用难度设置
+            elite: True/False 固定是否精英，None 按 10% 概率混合
+
+        Returns:
+            dict: 胜率、期望回合、期望生命损失及期望奖励
+        """
+        settings = DIFFICULTY_SETTINGS[difficulty]
+        if enemy_multiplier is None:
+            enemy_multiplier = settings["enemy_multiplier"]
+        template = MONSTER_TEMPLATES[monster_key]
+        level_bonus = (hero_level - 1) * 2
+
+        if elite is None:
+            variants = ((False, 1 - ELITE_CHANCE), (True, ELITE_CHANCE))
+        else:
+            variants = ((bool(elite), 1.0),)
+
+        stats = dict(HERO_STAT_DEFAULTS)
+        stats.update(hero)
+        hero_key = tuple(sorted(stats.items()))
+        totals = {"win_probability": 0.0, "reward_probability": 0.0, "expected_rounds": 0.0,
+                  "expected_hp_loss": 0.0, "unresolved_probability": 0.0, "expected_exp": 0.0, "expected_gold": 0.0}
+
+        for is_elite, p_variant in variants:
+            scale = ELITE_MULTIPLIER if is_elite else 1
+
+            def scaled(value):
+                return int(value * scale) if is_elite else value
+
+            hp_distribution = {}
+            for roll, p in _uniform(*template["base_hp"]).items():
+                hp = scaled(int((roll + level_bonus * 2) * enemy_multiplier))
+                hp_distribution[hp] = hp_distribution.get(hp, 0.0) + p
+            attack_distribution = {}
+            for roll, p in _uniform(*template["base_attack"]).items():
+                attack = scaled(int((roll + level_bonus) * enemy_multiplier))
+                attack_distribution[attack] = attack_distribution.get(attack, 0.0) + p
+
+            exp_range = template["exp_reward"]
+            gold_range = template["gold_reward"]
+            exp = sum(scaled(int((roll + hero_level * 3) * settings["exp_multiplier"])) * p
+                      for roll, p in _uniform(*exp_range).items())
+            gold = sum(scaled(int((roll + hero_level * 2) * settings["gold_multiplier"])) * p
+                       for roll, p in _uniform(*gold_range).items())
+
+            for monster_attack, p_attack in attack_distribution.items():
+                cache_key = (hero_key, tuple(sorted(hp_distribution.items())), monster_attack, template.get("special"))
+                result = self._fight_cache.get(cache_key)
+                if result is None:
+                    result = self.analyze_fight(stats, hp_distribution, monster_attack, template.get("special"))
+                    self._fight_cache[cache_key] = result
+                weight = p_variant * p_attack
+                for key, value in result.items():
+                    totals[key] += value * weight
+                totals["expected_exp"] += result["reward_probability"] * exp * weight
+                totals["expected_gold"] += result["reward_probability"] * gold * weight
+        return totals
+
+    def analyze_encounter(self, hero, monster_keys, hero_level, difficulty="normal", enemy_multiplier=None):
+        """对一组怪物按出现概率求期望
+
+        Args:
+            monster_keys: 怪物键列表（均匀选择）或 {怪物键: 出现概率}
+        """
+        if not isinstance(monster_keys, dict):
+            monster_keys = {key: 1.0 / len(monster_keys) for key in monster_keys}
+        totals = {}
+        for monster_key, weight in monster_keys.items():
+            result = self.analyze_monster(hero, monster_key, hero_level, difficulty, enemy_multiplier)
+            for key, value in result.items():
+                totals[key] = totals.get(key, 0.0) + value * weight
+        return totals
+
+
+def create_leveled_game(hero_class, level, difficulty="normal", map_type="plains"):
+    """创建指定职业和等级（无装备）的游戏实例，用于分析
+
+    Args:
+        hero_class: 职业
+        level: 英雄等级
+        difficulty: 难度
+        map_type: 地图类型
+
+    Returns:
+        HeroGame: 游戏实例
+    """
+    from .simulation import SimulationDriver, headless
+    from .safe_input import input_provider
+
+    game = SimulationDriver(difficulty=difficulty, map_type=map_type, hero_class=hero_class, seed=0).create_game()
+    if level > 1:
+        with headless(), input_provider(lambda decision, prompt, options: ""):
+            game.hero_exp = LEVEL_UP_THRESHOLDS[level]
+            game.combat_system.check_level_up()
+    return game
+
+
+class WinProbabilityTable:
+    """预先计算的胜率查询表
+
+    键为 (地图, 难度, 职业, 等级)，值为该条件下一次普通战斗的期望结果。
+    """
+
+    def __init__(self, entries=None):
+        self.entries = entries or {}
+
+    @classmethod
+    def build(cls, map_types=None, difficulties=None, hero_classes=None, levels=None, analyzer=None):
+        """计算查询表
+
+        Args:
+            map_types: 地图列表，None 表示全部
+            difficulties: 难度列表，None 表示全部
+            hero_classes: 职业列表，None 表示全部
+            levels: 等级列表，None 表示 1-10
+            analyzer: CombatAnalyzer 实例（可复用缓存）
+
+        Returns:
+            WinProbabilityTable: 查询表
+        """
+        analyzer = analyzer or CombatAnalyzer()
+        entries = {}
+        for difficulty in difficulties or list(DIFFICULTY_SETTINGS):
+            settings = DIFFICULTY_SETTINGS[difficulty]
+            for hero_class in hero_classes or list(CLASS_DEFINITIONS):
+                for level in levels or range(1, 11):
+                    game = create_leveled_game(hero_class, level, difficulty)
+                    hero = hero_stats_from_game(game)
+                    for map_type in map_types or list(MAP_TYPES):
+                        monsters = get_encounter_table(map_type, level).probabilities()
+                        multiplier = settings["enemy_multiplier"] * MAP_COMBAT_MULTIPLIERS.get(map_type, 1.0)
+                        entries[(map_type, difficulty, hero_class, level)] = analyzer.analyze_encounter(
+                            hero, monsters, level, difficulty, multiplier)
+        return cls(entries)
+
+    def lookup(self, map_type, difficulty, hero_class, level):
+        """查询一次普通战斗的期望结果，不存在时返回 None"""
+        return self.entries.get((map_type, difficulty, hero_class, level))
+
+    def win_probability(self, game):
+        """查询游戏当前状态下普通战斗的胜率，不存在时返回 None"""
+        entry = self.lookup(game.map_type, game.difficulty, game.hero_class, game.hero_level)
+        return entry["win_probability"] if entry else None
+
+    def save(self, path):
+        """保存为 JSON 文件"""
+        data = [{"key": list(key), "result": result} for key, result in self.entries.items()]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        """从 JSON 文件加载"""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls({tuple(item["key"]): item["result"] for item in data})
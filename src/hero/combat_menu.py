@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+战斗菜单模块 - 按技能树版本缓存的战斗行动菜单
+
+战斗行动菜单的编号固定为：1 普通攻击，2 药剂，3 起依次是已学习的技能
+（按核心、战斗、被动、终极类别排序）。菜单在技能树版本（SkillTree.version，
+技能等级变化时递增）或语言变化时才重新编译，每回合只需输出预先渲染好的行：
+- options: 选项编号 -> 技能ID（"2" 为 use_potion）
+- labels: 技能行文本（"3. 火球术 (Lv.2)"），整块一次写出
+- choices / prompt: 输入校验的选项列表和提示文本
+
+普通战斗、Boss 战、幽灵战和新手村练习战斗共用同一份菜单。
+"""
+
+from .game_config import SKILL_TREES
+
+
+# 技能类别的显示顺序（未知类别排在最后）
+CATEGORY_ORDER = {"core": 0, "combat": 1, "passive": 2, "ultimate": 3}
+
+# 药剂选项和第一个技能选项的编号
+POTION_OPTION = "2"
+FIRST_SKILL_OPTION = 3
+
+
+def skill_name_key(skill_id):
+    """技能名称的文本键（技能ID已带 "_skill" 后缀时直接使用）"""
+    if skill_id.endswith("_skill"):
+        return skill_id
+    return f"{skill_id}_skill"
+
+
+class CombatMenu:
+    """一个技能树版本的战斗行动菜单"""
+
+    __slots__ = ("key", "skills", "options", "labels", "potion_labels", "choices", "prompt")
+
+    def __init__(self, skill_tree, hero_class, lang, key=None):
+        """
+        Args:
+            skill_tree: 技能树（None 表示没有技能）
+            hero_class: 英雄职业（用于查找技能类别）
+            lang: 语言支持对象
+            key: 缓存键（技能树版本, 语言）
+        """
+        self.key = key
+        class_skills = SKILL_TREES.get(hero_class, {})
+
+        skills = []
+        if skill_tree:
+            skills = [skill_id for skill_id, level in skill_tree.learned_skills.items() if level > 0]
+            skills.sort(key=lambda skill_id: CATEGORY_ORDER.get(
+                class_skills.get(skill_id, {}).get("category", "core"), 3))
+        self.skills = tuple(skills)
+
+        self.options = {POTION_OPTION: "use_potion"}
+        lines = []
+        for option, skill_id in enumerate(self.skills, FIRST_SKILL_OPTION):
+            self.options[str(option)] = skill_id
+            level = skill_tree.learned_skills[skill_id]
+            lines.append(f"{option}. {lang.get_text(skill_name_key(skill_id))} (Lv.{level})\n")
+        self.labels = "".join(lines)
+
+        # 药剂行：(没有药剂, 有药剂)
+        self.potion_labels = (f"{POTION_OPTION}. {lang.get_text('no_potion')}",
+                              f"{POTION_OPTION}. {lang.get_text('use_potion_short')}")
+        self.choices = [str(option) for option in range(1, FIRST_SKILL_OPTION + len(self.skills))]
+        self.prompt = f"{lang.get_text('enter_choice')} (1): "
+
+    def skill_for(self, action):
+        """选项对应的技能ID
+
+        Args:
+            action: 玩家输入的选项编号
+
+        Returns:
+            str: 技能ID（药剂为 "use_potion"），不是药剂或技能选项时为 None
+        """
+        return self.options.get(action)
+
+    def render(self, renderer, potions):
+        """输出菜单
+
+        Args:
+            renderer: 输出渲染器
+            potions: 当前药剂数量
+        """
+        renderer.text("choose_action", prefix="\n")
+        renderer.text("normal_attack", prefix="1. ")
+        renderer.print(self.potion_labels[potions > 0])
+        if self.labels:
+            renderer.write(self.labels)
+
+
+def get_combat_menu(game):
+    """获取游戏当前的战斗菜单（技能树版本和语言不变时复用缓存）
+
+    Args:
+        game: 游戏对象
+
+    Returns:
+        CombatMenu: 战斗菜单
+    """
+    skill_tree = game.skill_tree
+    lang = game.lang
+    if not skill_tree:
+        return CombatMenu(None, game.hero_class, lang)
+
+    key = (skill_tree.version, lang.language)
+    menu = skill_tree.menu_cache
+    if menu is None or menu.key != key:
+        menu = CombatMenu(skill_tree, game.hero_class, lang, key)
+        skill_tree.menu_cache = menu
+    return menu
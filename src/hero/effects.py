@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+特殊效果模块 - 固定索引的特殊效果向量
+
+EFFECT_REGISTRY 是英雄特殊效果的唯一定义（名称、初始值和顺序），每个效果有固定的整数索引。
+EffectVector 把全部效果保存在定长的 array('d') 中：
+- 复制是一次缓冲区复制，不需要逐个复制字典项
+- 可以按名称属性读写（effects.crit_rate），也可以按索引直接读写 effects.values
+- 仍实现映射接口，effects["crit_rate"]、effects.get("dodge", 0) 等原有用法不变
+- 安装 NumPy 时可以零拷贝转换为数组，批量战斗直接读取多个英雄的效果矩阵
+
+初始值为整数的效果（如冰霜伤害、法力恢复）读取时返回 int，与原来的字典一致。
+"""
+
+from array import array
+from collections.abc import Mapping, MutableMapping
+
+
+def _numpy():
+    """按需导入 NumPy（游戏启动时不导入，只有数组视图和效果矩阵需要）"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("需要安装 NumPy (pip install numpy)") from None
+    return numpy
+
+
+# 特殊效果注册表：(名称, 初始值)，顺序即索引
+EFFECT_REGISTRY = (
+    ("crit_rate", 0.0),            # 暴击率
+    ("lifesteal", 0.0),            # 吸血率
+    ("dodge", 0.0),                # 闪避率
+    ("counter_attack", 0.0),       # 反击率
+    ("ice_damage", 0),             # 冰霜伤害
+    ("fire_damage", 0),            # 火焰伤害
+    ("healing_rate", 0.0),         # 治疗效果
+    ("mana_boost", 0),             # 法力提升
+    ("backstab", 0.0),             # 背刺伤害
+    ("luck_bonus", 0.0),           # 幸运加成
+    ("wisdom_bonus", 0.0),         # 智慧加成
+    ("immortality_chance", 0.0),   # 不死概率
+    ("health_regeneration", 0),    # 生命恢复
+    ("mana_regeneration", 0),      # 法力恢复
+    ("holy_resistance", 0.0),      # 神圣抗性
+    ("fire_resistance", 0.0),      # 火焰抗性
+    ("stealth_chance", 0.0),       # 潜行概率
+    ("evasion_rate", 0.0),         # 闪避率
+    ("spell_power", 0.0),          # 法术强度
+    ("crit_damage", 0.0),          # 暴击伤害
+    # 战斗中由职业被动和技能设置的效果
+    ("damage_reduction", 0.0),     # 伤害减免
+    ("berserk_attack", 0.0),       # 狂暴攻击加成
+    ("berserk_defense", 0.0),      # 狂暴防御减少
+    ("first_turn_damage", 0.0)     # 首回合伤害加成
+)
+
+EFFECT_NAMES = tuple(name for name, _ in EFFECT_REGISTRY)
+EFFECT_INDEX = {name: index for index, name in enumerate(EFFECT_NAMES)}
+EFFECT_COUNT = len(EFFECT_REGISTRY)
+EFFECT_DEFAULTS = dict(EFFECT_REGISTRY)
+
+# 整数效果的索引
+INTEGER_EFFECTS = frozenset(index for index, (_, default) in enumerate(EFFECT_REGISTRY)
+                            if isinstance(default, int))
+
+_DEFAULT_VALUES = array("d", (default for _, default in EFFECT_REGISTRY))
+
+
+def _read(values, index):
+    """读取一个效果（整数效果的整数值返回 int）"""
+    value = values[index]
+    if index in INTEGER_EFFECTS and value.is_integer():
+        return int(value)
+    return value
+
+
+_new_vector = object.__new__
+
+
+class EffectVector(MutableMapping):
+    """定长的特殊效果向量
+
+    注册表中的效果保存在 values（array('d')）中；注册表以外的键保存在 extra 字典中。
+    """
+
+    __slots__ = ("values", "extra")
+
+    def __init__(self, values=None, extra=None):
+        """
+        Args:
+            values: 长度为 EFFECT_COUNT 的 array('d')，None 表示全部为初始值
+            extra: 注册表以外的效果
+        """
+        self.values = array("d", _DEFAULT_VALUES) if values is None else values
+        self.extra = extra
+
+    @classmethod
+    def from_mapping(cls, effects):
+        """从效果字典创建（未给出的效果使用初始值）
+
+        Args:
+            effects: 效果名 -> 数值
+
+        Returns:
+            EffectVector: 效果向量
+        """
+        vector = cls()
+        for name, value in effects.items():
+            vector[name] = value
+        return vector
+
+    # ---- 映射接口 ----
+
+    def __getitem__(self, key):
+        index = EFFECT_INDEX.get(key)
+        if index is not None:
+            value = self.values[index]
+            if index in INTEGER_EFFECTS and value.is_integer():
+                return int(value)
+            return value
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        index = EFFECT_INDEX.get(key)
+        if index is not None:
+            value = self.values[index]
+            if index in INTEGER_EFFECTS and value.is_integer():
+                return int(value)
+            return value
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __setitem__(self, key, value):
+        index = EFFECT_INDEX.get(key)
+        if index is not None:
+            self.values[index] = value
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        index = EFFECT_INDEX.get(key)
+        if index is not None:
+            # 注册表中的效果始终存在，删除即恢复初始值
+            self.values[index] = _DEFAULT_VALUES[index]
+        elif self.extra is not None and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in EFFECT_INDEX or (self.extra is not None and key in self.extra)
+
+    def __iter__(self):
+        yield from EFFECT_NAMES
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return EFFECT_COUNT + (len(self.extra) if self.extra is not None else 0)
+
+    def __eq__(self, other):
+        if isinstance(other, EffectVector):
+            return self.values == other.values and (self.extra or {}) == (other.extra or {})
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    # ---- 向量操作 ----
+
+    def copy(self):
+        """复制（一次缓冲区复制）"""
+        clone = _new_vector(EffectVector)
+        clone.values = self.values[:]
+        clone.extra = dict(self.extra) if self.extra is not None else None
+        return clone
+
+    __copy__ = copy
+
+    def add(self, other):
+        """逐项加上另一个效果向量
+
+        Args:
+            other: EffectVector
+        """
+        values = self.values
+        for index, value in enumerate(other.values):
+            if value:
+                values[index] += value
+        if other.extra:
+            for key, value in other.extra.items():
+                self[key] = self.get(key, 0) + value
+
+    def __iadd__(self, other):
+        self.add(other)
+        return self
+
+    def reset(self):
+        """全部恢复初始值"""
+        self.values[:] = _DEFAULT_VALUES
+        self.extra = None
+
+    def as_array(self):
+        """零拷贝的 NumPy 数组视图（需要 NumPy）"""
+        np = _numpy()
+        return np.frombuffer(self.values, dtype=np.float64)
+
+    def to_dict(self):
+        """转换为效果字典"""
+        return dict(self.items())
+
+    def __reduce__(self):
+        return (EffectVector, (self.values, self.extra))
+
+    def __repr__(self):
+        return f"EffectVector({self.to_dict()!r})"
+
+
+def _accessor(name, index):
+    """按名称读写效果的属性"""
+    def getter(self):
+        return _read(self.values, index)
+
+    def setter(self, value):
+        self.values[index] = value
+
+    return property(getter, setter, doc=f"{name}（索引 {index}）")
+
+
+for _index, _name in enumerate(EFFECT_NAMES):
+    setattr(EffectVector, _name, _accessor(_name, _index))
+del _index, _name
+
+
+def effect_matrix(vectors):
+    """把多个效果向量合并为 (N, EFFECT_COUNT) 的 NumPy 矩阵（需要 NumPy）
+
+    Args:
+        vectors: EffectVector 序列
+
+    Returns:
+        numpy.ndarray: 每行一个效果向量，列索引见 EFFECT_INDEX
+    """
+    np = _numpy()
+    data = b"".join(vector.values.tobytes() for vector in vectors)
+    return np.frombuffer(data, dtype=np.float64).reshape(-1, EFFECT_COUNT)
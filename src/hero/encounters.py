@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+遭遇表模块 - 导入时预先编译 (地图, 等级段) 的怪物遭遇表
+
+每张遭遇表保存怪物键、解析后的怪物模板和累积权重，遭遇时只需一次 bisect。
+地图配置中可选的 "monster_weights" 为怪物指定出现权重（未指定的怪物权重为 1，
+即与原先的均匀随机选择一致）。修改配置后调用 reload_encounter_tables() 重新编译。
+"""
+
+from bisect import bisect_left, bisect_right
+
+from .game_config import MAP_TYPES, MONSTER_TEMPLATES, BOSS_TEMPLATES
+
+
+# 通用怪物等级段：(等级上限, 怪物列表)，最后一段没有上限
+MONSTER_LEVEL_BANDS = (
+    (2, ("goblin", "slime")),
+    (5, ("skeleton", "wolf", "beast")),
+    (None, ("troll", "giant"))
+)
+
+# 鬼魂名称的文本键
+GHOST_NAME_KEYS = ("ghost_wandering", "ghost_vengeful", "ghost_soul_guardian")
+
+# 没有专属Boss的地图使用的默认Boss
+DEFAULT_BOSS_MAP = "plains"
+
+_BAND_LIMITS = [limit for limit, _ in MONSTER_LEVEL_BANDS if limit is not None]
+
+
+def level_band(hero_level):
+    """获取英雄等级所属的等级段序号"""
+    return bisect_left(_BAND_LIMITS, hero_level)
+
+
+class EncounterTable:
+    """怪物遭遇表（编译后只读，所有字段均为元组）"""
+
+    def __init__(self, monster_keys, templates, weights):
+        """
+        Args:
+            monster_keys: 怪物键序列
+            templates: 对应的怪物模板序列
+            weights: 对应的出现权重序列
+        """
+        cumulative = []
+        total = 0
+        for weight in weights:
+            total += weight
+            cumulative.append(total)
+        self.monster_keys = tuple(monster_keys)
+        self.templates = tuple(templates)
+        self.cumulative_weights = tuple(cumulative)
+        self.total_weight = total
+
+    def __len__(self):
+        return len(self.monster_keys)
+
+    def pick_index(self, rng):
+        """按权重随机选择一个怪物序号
+
+        Args:
+            rng: 随机数源（random 模块或 random.Random 实例）
+        """
+        return bisect_right(self.cumulative_weights, rng.random() * self.total_weight)
+
+    def pick(self, rng):
+        """按权重随机选择一个怪物
+
+        Returns:
+            tuple: (怪物键, 怪物模板)
+        """
+        index = self.pick_index(rng)
+        return self.monster_keys[index], self.templates[index]
+
+    def probabilities(self):
+        """每种怪物的出现概率 {怪物键: 概率}"""
+        result = {}
+        previous = 0
+        for key, cumulative in zip(self.monster_keys, self.cumulative_weights):
+            result[key] = (cumulative - previous) / self.total_weight
+            previous = cumulative
+        return result
+
+
+def compile_encounter_tables(map_types=None, monster_templates=None):
+    """编译所有 (地图, 等级段) 的遭遇表
+
+    Args:
+        map_types: 地图配置，None 表示 MAP_TYPES
+        monster_templates: 怪物模板，None 表示 MONSTER_TEMPLATES
+
+    Returns:
+        dict: {(地图, 等级段): EncounterTable}
+    """
+    map_types = MAP_TYPES if map_types is None else map_types
+    monster_templates = MONSTER_TEMPLATES if monster_templates is None else monster_templates
+    tables = {}
+    for map_type, map_info in map_types.items():
+        weights = map_info.get("monster_weights", {})
+        for band, (_, general_monsters) in enumerate(MONSTER_LEVEL_BANDS):
+            # 地图怪物在前，通用怪物去重后在后，只保留存在模板的怪物
+            keys = []
+            for monster_key in list(map_info["monsters"]) + list(general_monsters):
+                if monster_key in monster_templates and monster_key not in keys:
+                    keys.append(monster_key)
+            tables[(map_type, band)] = EncounterTable(
+                keys,
+                [monster_templates[key] for key in keys],
+                [weights.get(key, 1) for key in keys]
+            )
+    return tables
+
+
+def compile_boss_table(map_types=None, boss_templates=None):
+    """编译每张地图对应的Boss模板
+
+    Returns:
+        dict: {地图: Boss模板}
+    """
+    map_types = MAP_TYPES if map_types is None else map_types
+    boss_templates = BOSS_TEMPLATES if boss_templates is None else boss_templates
+    return {
+        map_type: boss_templates.get(map_type, boss_templates[DEFAULT_BOSS_MAP])
+        for map_type in map_types
+    }
+
+
+ENCOUNTER_TABLES = compile_encounter_tables()
+BOSS_TABLE = compile_boss_table()
+
+
+def reload_encounter_tables():
+    """配置修改后重新编译遭遇表和Boss表"""
+    global ENCOUNTER_TABLES, BOSS_TABLE
+    ENCOUNTER_TABLES = compile_encounter_tables()
+    BOSS_TABLE = compile_boss_table()
+
+
+def get_encounter_table(map_type, hero_level):
+    """获取地图和英雄等级对应的遭遇表"""
+    return ENCOUNTER_TABLES[(map_type, level_band(hero_level))]
+
+
+def get_boss_template(map_type):
+    """获取地图对应的Boss模板"""
+    template = BOSS_TABLE.get(map_type)
+    if template is None:
+        template = BOSS_TEMPLATES[DEFAULT_BOSS_MAP]
+    return template
@@ -3,11 +3,27 @@
 装备系统模块 - 处理装备相关功能
 """
 
-import random
 import copy
+from contextlib import contextmanager
+from hero.safe_input import read_input
+from hero.rng import get_stream
+from hero.renderer import get_renderer
+from hero.language import TextCatalog
+from hero.items import Item, ItemTemplate
+from hero.inventory import PAGE_SIZE, inventory_view
+
+
+def _freeze(value):
+    """把嵌套的字典和列表转换为只读结构（只读字典和元组），以便在所有游戏之间共享"""
+    if isinstance(value, dict):
+        return TextCatalog((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 # 特殊效果类型 - 使用统一的多语言键名
-SPECIAL_EFFECTS = {
+SPECIAL_EFFECTS = _freeze({
     "crit_rate": {
         "name_key": "critical_skill",
         "description_key": "crit_desc"
@@ -96,7 +112,95 @@ SPECIAL_EFFECTS = {
         "name_key": "health_regeneration_skill",
         "description_key": "health_regeneration_desc"
     }
-}
+})
+
+# 可随机生成的特殊效果（按定义顺序）
+SPECIAL_EFFECT_IDS = tuple(SPECIAL_EFFECTS)
+
+# 装备名称库：类型 -> 语言 -> 稀有度 -> 名称
+EQUIPMENT_NAMES = _freeze({
+    "weapon": {
+        "zh": {
+            "common": ["木剑", "铁剑", "铜剑"],
+            "uncommon": ["钢剑", "银剑", "精铁剑"],
+            "rare": ["魔法剑", "火焰剑", "冰霜剑"],
+            "epic": ["屠龙刀", "圣剑", "暗影之刃"],
+            "legendary": ["传说之剑", "弑神剑", "天神之剑"]
+        },
+        "en": {
+            "common": ["Wooden Sword", "Iron Sword", "Copper Sword"],
+            "uncommon": ["Steel Sword", "Silver Sword", "Refined Iron Sword"],
+            "rare": ["Magic Sword", "Flame Sword", "Frost Sword"],
+            "epic": ["Dragon Slayer", "Holy Sword", "Shadow Blade"],
+            "legendary": ["Legendary Sword", "God Slayer", "Divine Sword"]
+        }
+    },
+    "armor": {
+        "zh": {
+            "common": ["布甲", "皮甲", "铁甲"],
+            "uncommon": ["钢甲", "银甲", "精铁甲"],
+            "rare": ["魔法甲", "火焰甲", "冰霜甲"],
+            "epic": ["屠龙甲", "圣甲", "暗影甲"],
+            "legendary": ["传说之甲", "弑神甲", "天神之甲"]
+        },
+        "en": {
+            "common": ["Cloth Armor", "Leather Armor", "Iron Armor"],
+            "uncommon": ["Steel Armor", "Silver Armor", "Refined Iron Armor"],
+            "rare": ["Magic Armor", "Flame Armor", "Frost Armor"],
+            "epic": ["Dragon Armor", "Holy Armor", "Shadow Armor"],
+            "legendary": ["Legendary Armor", "God Slayer Armor", "Divine Armor"]
+        }
+    },
+    "accessory": {
+        "zh": {
+            "common": ["普通戒指", "铜戒指", "银戒指"],
+            "uncommon": ["护身符", "力量戒指", "敏捷戒指"],
+            "rare": ["魔法戒指", "火焰护符", "冰霜护符"],
+            "epic": ["屠龙护符", "圣护符", "暗影护符"],
+            "legendary": ["传说护符", "弑神护符", "天神护符"]
+        },
+        "en": {
+            "common": ["Plain Ring", "Copper Ring", "Silver Ring"],
+            "uncommon": ["Amulet", "Strength Ring", "Agility Ring"],
+            "rare": ["Magic Ring", "Flame Amulet", "Frost Amulet"],
+            "epic": ["Dragon Amulet", "Holy Amulet", "Shadow Amulet"],
+            "legendary": ["Legendary Amulet", "God Slayer Amulet", "Divine Amulet"]
+        }
+    }
+})
+
+# 稀有度对应的颜色代码
+RARITY_COLORS = _freeze({
+    "common": "\033[37m",      # 白色
+    "uncommon": "\033[32m",    # 绿色
+    "rare": "\033[34m",        # 蓝色
+    "epic": "\033[35m",        # 紫色
+    "legendary": "\033[33m"    # 金色
+})
+DEFAULT_RARITY_COLOR = RARITY_COLORS["common"]
+
+# 稀有度对应的属性倍率
+RARITY_MULTIPLIERS = _freeze({"common": 1, "uncommon": 1.5, "rare": 2, "epic": 3, "legendary": 5})
+
+# 背包的排序方式（装备管理中按 s 依次切换，None 表示获得顺序）
+INVENTORY_SORT_ORDER = (None, "power", "rarity", "enhancement")
+
+# 稀有度对应的商店价格倍率
+PRICE_MULTIPLIERS = _freeze({"common": 1, "uncommon": 2, "rare": 5, "epic": 10, "legendary": 20})
+
+# 稀有度对应的特殊效果概率和最多效果数
+EFFECT_CHANCES = _freeze({"common": 0.1, "uncommon": 0.3, "rare": 0.6, "epic": 0.8, "legendary": 1.0})
+MAX_EFFECTS = _freeze({"common": 1, "uncommon": 1, "rare": 2, "epic": 2, "legendary": 3})
+
+# 稀有装备归属套装的概率
+SET_PROBABILITIES = _freeze({"rare": 0.3, "epic": 0.6, "legendary": 0.9})
+
+# 各类型装备可能归属的套装：武器可属于任何套装，护甲只属于战士套装，饰品属于法师或刺客套装
+SET_CHOICES = _freeze({
+    "weapon": ["warrior_set", "mage_set", "assassin_set"],
+    "armor": ["warrior_set"],
+    "accessory": ["mage_set", "assassin_set"]
+})
 
 
 class EquipmentSystem:
@@ -104,74 +208,43 @@ class EquipmentSystem:
 
     def __init__(self, game):
         self.game = game
+        # 战利品随机数子流
+        self.random = get_stream(game, "loot")
         # 性能优化：添加装备缓存
         self._equipment_cache = {}
-        self.equipment_database = self.create_equipment_database()
+        self.equipment_database = EQUIPMENT_NAMES
+
+    def reset(self):
+        """新的一局：使用游戏当前的战利品随机数子流并清空装备缓存（保留装备名称库）"""
+        self.random = get_stream(self.game, "loot")
+        self._equipment_cache.clear()
+
+    @property
+    def renderer(self):
+        """游戏的输出渲染器"""
+        return get_renderer(self.game)
+
+    @contextmanager
+    def loot_batch(self):
+        """一批独立的战利品（如一次商人事件的货架）
+
+        批内使用单独的基础装备缓存，结束后恢复游戏原有的缓存，
+        使事件中生成的装备不受之前地图事件掉落的影响。
+        """
+        saved_cache = self._equipment_cache
+        self._equipment_cache = {}
+        try:
+            yield self
+        finally:
+            self._equipment_cache = saved_cache
 
     def create_equipment_database(self):
-        """创建装备数据库"""
-        database = {
-            "weapon": {
-                "zh": {
-                    "common": ["木剑", "铁剑", "铜剑"],
-                    "uncommon": ["钢剑", "银剑", "精铁剑"],
-                    "rare": ["魔法剑", "火焰剑", "冰霜剑"],
-                    "epic": ["屠龙刀", "圣剑", "暗影之刃"],
-                    "legendary": ["传说之剑", "弑神剑", "天神之剑"]
-                },
-                "en": {
-                    "common": ["Wooden Sword", "Iron Sword", "Copper Sword"],
-                    "uncommon": ["Steel Sword", "Silver Sword", "Refined Iron Sword"],
-                    "rare": ["Magic Sword", "Flame Sword", "Frost Sword"],
-                    "epic": ["Dragon Slayer", "Holy Sword", "Shadow Blade"],
-                    "legendary": ["Legendary Sword", "God Slayer", "Divine Sword"]
-                }
-            },
-            "armor": {
-                "zh": {
-                    "common": ["布甲", "皮甲", "铁甲"],
-                    "uncommon": ["钢甲", "银甲", "精铁甲"],
-                    "rare": ["魔法甲", "火焰甲", "冰霜甲"],
-                    "epic": ["屠龙甲", "圣甲", "暗影甲"],
-                    "legendary": ["传说之甲", "弑神甲", "天神之甲"]
-                },
-                "en": {
-                    "common": ["Cloth Armor", "Leather Armor", "Iron Armor"],
-                    "uncommon": ["Steel Armor", "Silver Armor", "Refined Iron Armor"],
-                    "rare": ["Magic Armor", "Flame Armor", "Frost Armor"],
-                    "epic": ["Dragon Armor", "Holy Armor", "Shadow Armor"],
-                    "legendary": ["Legendary Armor", "God Slayer Armor", "Divine Armor"]
-                }
-            },
-            "accessory": {
-                "zh": {
-                    "common": ["普通戒指", "铜戒指", "银戒指"],
-                    "uncommon": ["护身符", "力量戒指", "敏捷戒指"],
-                    "rare": ["魔法戒指", "火焰护符", "冰霜护符"],
-                    "epic": ["屠龙护符", "圣护符", "暗影护符"],
-                    "legendary": ["传说护符", "弑神护符", "天神护符"]
-                },
-                "en": {
-                    "common": ["Plain Ring", "Copper Ring", "Silver Ring"],
-                    "uncommon": ["Amulet", "Strength Ring", "Agility Ring"],
-                    "rare": ["Magic Ring", "Flame Amulet", "Frost Amulet"],
-                    "epic": ["Dragon Amulet", "Holy Amulet", "Shadow Amulet"],
-                    "legendary": ["Legendary Amulet", "God Slayer Amulet", "Divine Amulet"]
-                }
-            }
-        }
-        return database
+        """装备名称库（模块级共享的只读数据，所有装备系统共用）"""
+        return EQUIPMENT_NAMES
 
     def get_rarity_color(self, rarity):
         """获取稀有度对应的颜色代码"""
-        colors = {
-            "common": "\033[37m",      # 白色
-            "uncommon": "\033[32m",    # 绿色
-            "rare": "\033[34m",        # 蓝色
-            "epic": "\033[35m",        # 紫色
-            "legendary": "\033[33m"    # 金色
-        }
-        return colors.get(rarity, "\033[37m")
+        return RARITY_COLORS.get(rarity, DEFAULT_RARITY_COLOR)
 
     def get_rarity_name(self, rarity):
         """获取稀有度名称"""
@@ -189,21 +262,20 @@ class EquipmentSystem:
         # 性能优化：生成缓存键
         cache_key = f"{item_type}_{rarity_bonus}_{is_legendary}"
         
-        # 检查缓存（仅对基础装备进行缓存，不含随机属性）
+        # 检查缓存（仅缓存基础装备的类型和稀有度，不含随机属性）
         if cache_key in self._equipment_cache and not is_legendary:
-            base_equipment = self._equipment_cache[cache_key].copy()
             # 重新生成随机属性
-            return self._generate_random_attributes(base_equipment)
+            return self._generate_random_attributes(*self._equipment_cache[cache_key])
         
         if item_type is None:
-            item_type = random.choice(["weapon", "armor", "accessory"])
+            item_type = self.random.choice(["weapon", "armor", "accessory"])
 
         # 如果是传奇装备，直接返回传奇装备
         if is_legendary:
             return self.create_legendary_equipment(item_type)
 
         # 根据稀有度概率生成
-        rarity_roll = random.random()
+        rarity_roll = self.random.random()
         
         # 应用稀有度提升（提升后稀有概率更高）
         adjusted_roll = min(0.99, rarity_roll + rarity_bonus * 0.1)  # 每点稀有度提升10%概率
@@ -219,171 +291,155 @@ class EquipmentSystem:
         else:
             rarity = "legendary"
 
-        # 创建基础装备对象（延迟计算详细属性）
-        base_equipment = {
-            "type": item_type,
-            "rarity": rarity,
-            "enhancement_level": 0,
-            "is_legendary": False,
-            "_cached_name": None  # 延迟计算名称
-        }
-        
-        # 缓存基础装备对象
-        self._equipment_cache[cache_key] = base_equipment.copy()
+        # 缓存基础装备的类型和稀有度
+        self._equipment_cache[cache_key] = (item_type, rarity)
         
         # 生成随机属性并返回
-        return self._generate_random_attributes(base_equipment)
+        return self._generate_random_attributes(item_type, rarity)
     
-    def _generate_random_attributes(self, equipment):
-        """延迟计算装备的随机属性"""
-        item_type = equipment["type"]
-        rarity = equipment["rarity"]
-        
-        # 性能优化：延迟计算名称
-        if equipment["_cached_name"] is None:
-            equipment["name"] = self.game.lang.format_text("equipment_name", self.equipment_database, item_type, rarity)
-            equipment["_cached_name"] = equipment["name"]
-        else:
-            equipment["name"] = equipment["_cached_name"]
+    def _generate_random_attributes(self, item_type, rarity):
+        """生成装备的名称和随机属性
 
-        # 根据稀有度和类型生成属性
-        rarity_multiplier = {"common": 1, "uncommon": 1.5, "rare": 2, "epic": 3, "legendary": 5}
+        Returns:
+            Item: 装备（类型、稀有度和名称引用共享的装备模板）
+        """
+        name = self.game.lang.format_text("equipment_name", self.equipment_database, item_type, rarity, rng=self.random)
 
+        # 根据稀有度和类型生成属性
         if item_type == "weapon":
-            attack_bonus = int(random.randint(3, 8) * rarity_multiplier[rarity])
+            attack_bonus = int(self.random.randint(3, 8) * RARITY_MULTIPLIERS[rarity])
             defense_bonus = 0
             hp_bonus = 0
         elif item_type == "armor":
             attack_bonus = 0
-            defense_bonus = int(random.randint(2, 6) * rarity_multiplier[rarity])
-            hp_bonus = int(random.randint(5, 15) * rarity_multiplier[rarity])
+            defense_bonus = int(self.random.randint(2, 6) * RARITY_MULTIPLIERS[rarity])
+            hp_bonus = int(self.random.randint(5, 15) * RARITY_MULTIPLIERS[rarity])
         else:  # accessory
-            attack_bonus = int(random.randint(1, 4) * rarity_multiplier[rarity])
-            defense_bonus = int(random.randint(1, 4) * rarity_multiplier[rarity])
-            hp_bonus = int(random.randint(3, 10) * rarity_multiplier[rarity])
+            attack_bonus = int(self.random.randint(1, 4) * RARITY_MULTIPLIERS[rarity])
+            defense_bonus = int(self.random.randint(1, 4) * RARITY_MULTIPLIERS[rarity])
+            hp_bonus = int(self.random.randint(3, 10) * RARITY_MULTIPLIERS[rarity])
 
         # 添加特殊效果
         special_effects = self.generate_special_effects(rarity)
         
         # 为装备分配套装（稀有度越高，越有可能属于套装）
         set_bonus = None
-        if rarity in ["rare", "epic", "legendary"]:
-            # 根据装备类型决定可能的套装
-            if item_type == "weapon":
-                # 武器可以属于任何套装
-                possible_sets = ["warrior_set", "mage_set", "assassin_set"]
-            elif item_type == "armor":
-                # 护甲只能属于战士套装
-                possible_sets = ["warrior_set"]
-            else:  # accessory
-                # 饰品可以属于法师或刺客套装
-                possible_sets = ["mage_set", "assassin_set"]
-            
+        if rarity in SET_PROBABILITIES:
+            # 根据装备类型决定可能的套装（饰品即 accessory 以外的类型）
+            possible_sets = SET_CHOICES.get(item_type, SET_CHOICES["accessory"])
+
             # 根据稀有度决定套装概率
-            set_probability = {"rare": 0.3, "epic": 0.6, "legendary": 0.9}
-            if random.random() < set_probability.get(rarity, 0):
-                set_bonus = random.choice(possible_sets)
-
-        # 更新装备属性
-        equipment.update({
-            "attack": attack_bonus,
-            "defense": defense_bonus,
-            "hp": hp_bonus,
-            "special_effects": special_effects,
-            "set_bonus": set_bonus,  # 套装效果
-            "base_attack": attack_bonus,  # 基础攻击力，用于强化计算
-            "base_defense": defense_bonus,  # 基础防御力，用于强化计算
-            "base_hp": hp_bonus,  # 基础生命值，用于强化计算
-        })
-        
-        return equipment
+            if self.random.random() < SET_PROBABILITIES[rarity]:
+                set_bonus = self.random.choice(possible_sets)
+
+        # 基础属性（用于强化计算）与初始属性相同
+        return Item(ItemTemplate.get(item_type, rarity, name), attack_bonus, defense_bonus, hp_bonus,
+                    special_effects, set_bonus)
 
     def create_legendary_equipment(self, item_type):
         """创建传奇装备"""
         import game_config
         
         if item_type not in game_config.LEGENDARY_EQUIPMENT:
-            item_type = random.choice(list(game_config.LEGENDARY_EQUIPMENT.keys()))
+            item_type = self.random.choice(list(game_config.LEGENDARY_EQUIPMENT.keys()))
         
-        legendary_item = random.choice(game_config.LEGENDARY_EQUIPMENT[item_type])
+        legendary_item = self.random.choice(game_config.LEGENDARY_EQUIPMENT[item_type])
         
         # 使用统一的多语言系统获取名称
         name_key = legendary_item.get("name_key", "unknown_legendary_item")
         name = self.game.lang.get_text(name_key)
+        special_effects_values = {k: v for k, v in legendary_item.items() if k not in ["name_key", "attack", "defense", "hp", "special_effects"]}
         
-        return {
-            "name": name,
-            "type": item_type,
-            "rarity": "legendary",
-            "attack": legendary_item["attack"],
-            "defense": legendary_item["defense"],
-            "hp": legendary_item["hp"],
-            "special_effects": legendary_item.get("special_effects", []),
-            "special_effects_values": {k: v for k, v in legendary_item.items() if k not in ["name_key", "attack", "defense", "hp", "special_effects"]},
-            "set_bonus": None,
-            "enhancement_level": 0,  # 强化等级，初始为0
-            "base_attack": legendary_item["attack"],  # 基础攻击力，用于强化计算
-            "base_defense": legendary_item["defense"],  # 基础防御力，用于强化计算
-            "base_hp": legendary_item["hp"],  # 基础生命值，用于强化计算
-            "is_legendary": True
-        }
+        # 强化等级初始为0，基础属性（用于强化计算）与初始属性相同
+        template = ItemTemplate.get(item_type, "legendary", name, True, special_effects_values)
+        return Item(template, legendary_item["attack"], legendary_item["defense"], legendary_item["hp"],
+                    legendary_item.get("special_effects", ()))
 
     def generate_special_effects(self, rarity):
         """根据稀有度生成特殊效果"""
         effects = []
         
         # 稀有度越高，特殊效果越多
-        effect_chances = {
-            "common": 0.1,    # 10% 概率有特殊效果
-            "uncommon": 0.3,  # 30%
-            "rare": 0.6,     # 60%
-            "epic": 0.8,     # 80%
-            "legendary": 1.0 # 100%
-        }
-        
-        chance = effect_chances.get(rarity, 0)
+        chance = EFFECT_CHANCES.get(rarity, 0)
         
-        if random.random() < chance:
+        if self.random.random() < chance:
             # 根据稀有度决定效果数量
-            max_effects = {"common": 1, "uncommon": 1, "rare": 2, "epic": 2, "legendary": 3}
-            num_effects = random.randint(1, max_effects.get(rarity, 1))
+            num_effects = self.random.randint(1, MAX_EFFECTS.get(rarity, 1))
             
-            available_effects = list(SPECIAL_EFFECTS.keys())
-            effects = random.sample(available_effects, min(num_effects, len(available_effects)))
+            effects = self.random.sample(SPECIAL_EFFECT_IDS, min(num_effects, len(SPECIAL_EFFECT_IDS)))
         
         return effects
 
-    def show_inventory(self):
-        """显示背包内容"""
-        print(f"\n{self.game.lang.get_text('inventory')}:")
+    def show_inventory(self, page=0, sort_key=None):
+        """显示背包内容（每次只格式化一页）
+
+        Args:
+            page: 页码（从 0 开始，超出范围时显示最后一页）
+            sort_key: 排序方式（见 inventory.SORT_KEYS），None 表示获得顺序
+
+        Returns:
+            int: 实际显示的页码
+        """
+        self.renderer.text("inventory", prefix="\n", suffix=":")
         if not self.game.inventory:
-            print(f"  {self.game.lang.get_text('empty_inventory')}")
-        else:
-            for i, item in enumerate(self.game.inventory):
-                color = self.get_rarity_color(item["rarity"])
-                rarity_name = self.get_rarity_name(item["rarity"])
-                reset_color = "\033[0m"
-
-                stats = []
-                if item["attack"] > 0:
-                    stats.append(f"⚔️+{item['attack']}")
-                if item["defense"] > 0:
-                    stats.append(f"🛡️+{item['defense']}")
-                if item["hp"] > 0:
-                    stats.append(f"❤️+{item['hp']}")
-                    
-                # 显示强化等级
-                enhancement_level = item.get("enhancement_level", 0)
-                enhancement_text = ""
-                if enhancement_level > 0:
-                    enhancement_text = f" +{enhancement_level}"
+            self.renderer.text("empty_inventory", prefix="  ")
+            return 0
+
+        inventory = inventory_view(self.game.inventory)
+        items, page, pages = inventory.page(page, sort_key=sort_key)
+        for i, item in enumerate(items, page * PAGE_SIZE):
+            color = self.get_rarity_color(item["rarity"])
+            rarity_name = self.get_rarity_name(item["rarity"])
+            reset_color = "\033[0m"
+
+            stats = []
+            if item["attack"] > 0:
+                stats.append(f"⚔️+{item['attack']}")
+            if item["defense"] > 0:
+                stats.append(f"🛡️+{item['defense']}")
+            if item["hp"] > 0:
+                stats.append(f"❤️+{item['hp']}")
+                
+            # 显示强化等级
+            enhancement_level = item.get("enhancement_level", 0)
+            enhancement_text = ""
+            if enhancement_level > 0:
+                enhancement_text = f" +{enhancement_level}"
 
-                print(f"  {i+1}. {color}{item['name']}{enhancement_text} {reset_color}[{rarity_name}] {', '.join(stats)}")
+            self.renderer.print(f"  {i+1}. {color}{item['name']}{enhancement_text} {reset_color}[{rarity_name}] {', '.join(stats)}")
+
+        # 多页或排序时显示页码和排序方式
+        if pages > 1 or sort_key is not None:
+            page_text = self.game.lang.get_text("inventory_page", page=page + 1, pages=pages)
+            sort_text = self.game.lang.get_text("inventory_sort", sort=self.game.lang.get_text(f"sort_{sort_key or 'acquired'}"))
+            self.renderer.print(f"  {page_text} · {sort_text}")
+        return page
+
+    def inventory_index(self, number, sort_key=None):
+        """把背包显示的编号转换为背包列表中的位置
+
+        Args:
+            number: 显示的编号（从 1 开始）
+            sort_key: 显示时使用的排序方式
+
+        Returns:
+            int: 背包中的位置，编号无效时为 -1
+        """
+        if sort_key is None:
+            return number - 1
+        if number < 1:
+            return -1
+        inventory = inventory_view(self.game.inventory)
+        page, offset = divmod(number - 1, PAGE_SIZE)
+        items, shown_page, _ = inventory.page(page, sort_key=sort_key)
+        if shown_page != page or offset >= len(items):
+            return -1
+        return inventory.position(items[offset])
 
     def equip_item(self, item_index):
         """装备物品"""
         if item_index < 0 or item_index >= len(self.game.inventory):
-            print(self.game.lang.get_text("invalid_choice"))
+            self.renderer.text("invalid_choice")
             return
 
         item = self.game.inventory[item_index]
@@ -394,43 +450,43 @@ class EquipmentSystem:
             self.game.inventory.append(self.game.equipment[item_type])
             equipped_item_name = self.game.equipment[item_type]["name"]
             self.game.equipment[item_type] = None
-            print(f"{self.game.lang.get_text('unequip_success')} {equipped_item_name}")
+            self.renderer.print(f"{self.game.lang.get_text('unequip_success')} {equipped_item_name}")
 
         # 装备新物品
         self.game.equipment[item_type] = item
         self.game.inventory.pop(item_index)
 
-        # 性能优化：清除属性缓存
-        self.game.invalidate_attributes_cache()
+        # 只重新计算该装备栏和套装
         self.game.update_attributes()
-        print(f"{self.game.lang.get_text('equip_success')} {item['name']}!")
+        self.renderer.print(f"{self.game.lang.get_text('equip_success')} {item['name']}!")
 
     def unequip_item(self, item_type):
         """卸下装备"""
         if self.game.equipment[item_type] is None:
-            print(self.game.lang.get_text("no_equipment_in_slot"))
+            self.renderer.text("no_equipment_in_slot")
             return
 
         item = self.game.equipment[item_type]
         self.game.inventory.append(item)
         self.game.equipment[item_type] = None
 
-        # 性能优化：清除属性缓存
-        self.game.invalidate_attributes_cache()
+        # 只重新计算该装备栏和套装
         self.game.update_attributes()
-        print(f"{self.game.lang.get_text('unequip_success')} {item['name']}")
+        self.renderer.print(f"{self.game.lang.get_text('unequip_success')} {item['name']}")
 
     def equipment_management(self):
         """装备管理界面"""
+        page = 0
+        sort_key = None
         while True:
             self.game.clear_screen()
-            print(self.game.lang.get_text("block_separator"))
-            print(f"          {self.game.lang.get_text('equipment_management')}")
-            print(self.game.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("equipment_management", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
 
             # 显示当前装备
-            print(f"{self.game.lang.get_text('current_equipment')}:")
+            self.renderer.text("current_equipment", suffix=":")
             for slot in ["weapon", "armor", "accessory"]:
                 item = self.game.equipment[slot]
                 color = self.get_rarity_color(item["rarity"]) if item else ""
@@ -462,49 +518,65 @@ class EquipmentSystem:
                         elif item["legendary_attribute"] == "hp_regen":
                             legendary_text = " 💚"
                             
-                    print(f"  {color}{item['name']}{enhancement_text}{reset_color}[{rarity_name}] {', '.join(stats)}{legendary_text}")
+                    self.renderer.print(f"  {color}{item['name']}{enhancement_text}{reset_color}[{rarity_name}] {', '.join(stats)}{legendary_text}")
                 else:
-                    print(f"  {self.game.lang.get_text(slot)}: {self.game.lang.get_text('none')}")
+                    self.renderer.print(f"  {self.game.lang.get_text(slot)}: {self.game.lang.get_text('none')}")
 
-            print()
-            self.show_inventory()
+            self.renderer.print()
+            page = self.show_inventory(page, sort_key)
 
-            print()
-            print(f"1. {self.game.lang.get_text('equip_item')}")
-            print(f"2. {self.game.lang.get_text('unequip_item')}")
-            print(f"3. {self.game.lang.get_text('return_to_game')}")
+            self.renderer.print()
+            self.renderer.text("equip_item", prefix="1. ")
+            self.renderer.text("unequip_item", prefix="2. ")
+            self.renderer.text("return_to_game", prefix="3. ")
 
-            choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+            choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="equipment_menu", options=["1", "2", "3"]).strip()
 
             if choice == "1":
-                self.show_inventory()
+                page = self.show_inventory(page, sort_key)
                 if self.game.inventory:
-                    try:
-                        from hero.safe_input import safe_input
-                        from hero.error_handler import handle_error
-                        user_input = safe_input(f"{self.game.lang.get_text('enter_item_number')}: ")
-                        if user_input is not None:
-                            item_index = int(user_input) - 1
-                            self.equip_item(item_index)
-                    except Exception as e:
-                        from hero.error_handler import handle_error
-                        error_msg = handle_error(e, "装备物品", "装备物品时发生错误。")
-                        print(error_msg)
-                    input(f"{self.game.lang.get_text('continue_prompt')}")
+                    while True:
+                        if len(self.game.inventory) > PAGE_SIZE:
+                            self.renderer.text("inventory_page_hint", prefix="  (", suffix=")")
+                        try:
+                            from hero.safe_input import safe_input
+                            from hero.error_handler import handle_error
+                            user_input = safe_input(f"{self.game.lang.get_text('enter_item_number')}: ", decision="equip_item", renderer=self.renderer)
+                            if user_input is not None:
+                                command = user_input.strip().lower()
+                                # 翻页和切换排序后重新显示背包
+                                if command in ("n", "p", "s"):
+                                    if command == "n":
+                                        page += 1
+                                    elif command == "p":
+                                        page = max(0, page - 1)
+                                    else:
+                                        sort_key = INVENTORY_SORT_ORDER[(INVENTORY_SORT_ORDER.index(sort_key) + 1) % len(INVENTORY_SORT_ORDER)]
+                                        page = 0
+                                    page = self.show_inventory(page, sort_key)
+                                    continue
+                                item_index = self.inventory_index(int(user_input), sort_key)
+                                self.equip_item(item_index)
+                        except Exception as e:
+                            from hero.error_handler import handle_error
+                            error_msg = handle_error(e, "装备物品", "装备物品时发生错误。")
+                            self.renderer.print(error_msg)
+                        break
+                    read_input(f"{self.game.lang.get_text('continue_prompt')}")
             elif choice == "2":
-                print()
-                print(f"1. {self.game.lang.get_text('weapon')}")
-                print(f"2. {self.game.lang.get_text('armor')}")
-                print(f"3. {self.game.lang.get_text('accessory')}")
-                slot_choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+                self.renderer.print()
+                self.renderer.text("weapon", prefix="1. ")
+                self.renderer.text("armor", prefix="2. ")
+                self.renderer.text("accessory", prefix="3. ")
+                slot_choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="unequip_slot", options=["1", "2", "3"]).strip()
                 slot_map = {"1": "weapon", "2": "armor", "3": "accessory"}
                 if slot_choice in slot_map:
                     self.unequip_item(slot_map[slot_choice])
-                    input(f"{self.game.lang.get_text('continue_prompt')}")
+                    read_input(f"{self.game.lang.get_text('continue_prompt')}")
             elif choice == "3":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
 
     def enchant_equipment(self, equipment_slot, enchantment_type):
         """为装备附魔
@@ -519,31 +591,31 @@ class EquipmentSystem:
         import game_config
         
         if self.game.equipment[equipment_slot] is None:
-            print(self.game.lang.get_text("no_equipment_in_slot"))
+            self.renderer.text("no_equipment_in_slot")
             return False
             
         equipment = self.game.equipment[equipment_slot]
         
         # 检查附魔限制
         if enchantment_type not in game_config.ENCHANTMENT_RESTRICTIONS.get(equipment["type"], []):
-            print(self.game.lang.get_text("enchantment_not_allowed", type=equipment["type"]))
+            self.renderer.print(self.game.lang.get_text("enchantment_not_allowed", type=equipment["type"]))
             return False
             
         # 检查是否已经附魔
         if equipment.get("enchantment"):
-            print(self.game.lang.get_text("already_enchanted"))
+            self.renderer.text("already_enchanted")
             return False
             
         # 获取附魔配置
         enchantment_config = game_config.ENCHANTMENT_TYPES.get(enchantment_type)
         if not enchantment_config:
-            print(self.game.lang.get_text("invalid_enchantment"))
+            self.renderer.text("invalid_enchantment")
             return False
             
         # 检查金币是否足够
         enchantment_cost = enchantment_config["cost"]
         if self.game.hero_gold < enchantment_cost:
-            print(self.game.lang.get_text("not_enough_gold_enchant", cost=enchantment_cost))
+            self.renderer.print(self.game.lang.get_text("not_enough_gold_enchant", cost=enchantment_cost))
             return False
             
         # 计算成功率
@@ -553,15 +625,15 @@ class EquipmentSystem:
         
         # 确认附魔
         enchantment_name = self.game.lang.get_text(enchantment_config["name_key"])
-        print(f"\n{self.game.lang.get_text('enchantment_info')}:")
-        print(f"  {equipment['name']}")
-        print(f"  {self.game.lang.get_text('enchantment_type')}: {enchantment_name}")
-        print(f"  {self.game.lang.get_text('enchantment_cost')}: {enchantment_cost} {self.game.lang.get_text('gold')}")
-        print(f"  {self.game.lang.get_text('success_rate')}: {int(total_success_rate * 100)}%")
+        self.renderer.text("enchantment_info", prefix="\n", suffix=":")
+        self.renderer.print(f"  {equipment['name']}")
+        self.renderer.print(f"  {self.game.lang.get_text('enchantment_type')}: {enchantment_name}")
+        self.renderer.print(f"  {self.game.lang.get_text('enchantment_cost')}: {enchantment_cost} {self.game.lang.get_text('gold')}")
+        self.renderer.print(f"  {self.game.lang.get_text('success_rate')}: {int(total_success_rate * 100)}%")
         
-        confirm = input(f"\n{self.game.lang.get_text('confirm_enchantment')} (y/n): ").strip().lower()
+        confirm = read_input(f"\n{self.game.lang.get_text('confirm_enchantment')} (y/n): ", decision="enchant_confirm").strip().lower()
         if confirm not in self.game.lang.get_text("yes_options"):
-            print(self.game.lang.get_text("enchantment_cancelled"))
+            self.renderer.text("enchantment_cancelled")
             return False
             
         # 扣除金币
@@ -569,8 +641,7 @@ class EquipmentSystem:
         self.game.statistics.record_gold_spent(enchantment_cost)
         
         # 进行附魔尝试
-        import random
-        success = random.random() < total_success_rate
+        success = self.random.random() < total_success_rate
         
         if success:
             # 附魔成功
@@ -586,16 +657,19 @@ class EquipmentSystem:
                     if effect not in equipment["special_effects"]:
                         equipment["special_effects"].append(effect)
                         
-            print(f"\n✨ {self.game.lang.get_text('enchantment_success')} ✨")
-            print(f"  {equipment['name']} {self.game.lang.get_text('now_enchanted_with')} {enchantment_name}")
+            self.renderer.text("enchantment_success", prefix="\n✨ ", suffix=" ✨")
+            self.renderer.print(f"  {equipment['name']} {self.game.lang.get_text('now_enchanted_with')} {enchantment_name}")
             
+            # 更新英雄属性（附魔添加的特殊效果立即生效）
+            self.game.update_attributes()
+
             # 记录附魔成功
             self.game.statistics.record_enchantment_success()
             
         else:
             # 附魔失败
-            print(f"\n❌ {self.game.lang.get_text('enchantment_failed')}")
-            print(f"  {self.game.lang.get_text('enchantment_failed_desc')}")
+            self.renderer.text("enchantment_failed", prefix="\n❌ ")
+            self.renderer.text("enchantment_failed_desc", prefix="  ")
             
             # 记录附魔失败
             self.game.statistics.record_enchantment_failed()
@@ -608,14 +682,14 @@ class EquipmentSystem:
         
         while True:
             self.game.clear_screen()
-            print(self.game.lang.get_text("block_separator"))
-            print(f"          {self.game.lang.get_text('enchant_equipment')}")
-            print(self.game.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("enchant_equipment", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
             
-            print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
-            print()
-            print(f"{self.game.lang.get_text('current_equipment')}:")
+            self.renderer.print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
+            self.renderer.print()
+            self.renderer.text("current_equipment", suffix=":")
             
             # 显示当前装备及其可附魔选项
             equipment_list = []
@@ -640,19 +714,19 @@ class EquipmentSystem:
                         enchantment_name = self.game.lang.get_text(game_config.ENCHANTMENT_TYPES[item["enchantment"]]["name_key"])
                         enchantment_text = f" 🔮{enchantment_name}"
                     
-                    print(f"  {i+1}. {color}{item['name']} {reset_color}[{rarity_name}] {', '.join(stats)}{enchantment_text}")
+                    self.renderer.print(f"  {i+1}. {color}{item['name']} {reset_color}[{rarity_name}] {', '.join(stats)}{enchantment_text}")
                     equipment_list.append(slot)
                 else:
-                    print(f"  {i+1}. {self.game.lang.get_text(slot)}: {self.game.lang.get_text('none')}")
+                    self.renderer.print(f"  {i+1}. {self.game.lang.get_text(slot)}: {self.game.lang.get_text('none')}")
                     equipment_list.append(None)
             
-            print()
-            print(f"1. {self.game.lang.get_text('weapon')}")
-            print(f"2. {self.game.lang.get_text('armor')}")
-            print(f"3. {self.game.lang.get_text('accessory')}")
-            print(f"4. {self.game.lang.get_text('return_to_shop')}")
+            self.renderer.print()
+            self.renderer.text("weapon", prefix="1. ")
+            self.renderer.text("armor", prefix="2. ")
+            self.renderer.text("accessory", prefix="3. ")
+            self.renderer.text("return_to_shop", prefix="4. ")
             
-            choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+            choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="enchant_menu", options=["1", "2", "3", "4"]).strip()
             
             if choice in ["1", "2", "3"]:
                 slot_index = int(choice) - 1
@@ -660,13 +734,13 @@ class EquipmentSystem:
                     slot = equipment_list[slot_index]
                     self.show_enchantment_options(slot)
                 else:
-                    print(self.game.lang.get_text("no_equipment_in_slot"))
-                    input(f"{self.game.lang.get_text('continue_prompt')}")
+                    self.renderer.text("no_equipment_in_slot")
+                    read_input(f"{self.game.lang.get_text('continue_prompt')}")
             elif choice == "4":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
-                input(f"{self.game.lang.get_text('continue_prompt')}")
+                self.renderer.text("invalid_choice")
+                read_input(f"{self.game.lang.get_text('continue_prompt')}")
     
     def show_enchantment_options(self, equipment_slot):
         """显示可用的附魔选项
@@ -682,10 +756,10 @@ class EquipmentSystem:
             
         while True:
             self.game.clear_screen()
-            print(self.game.lang.get_text("block_separator"))
-            print(f"          {self.game.lang.get_text('enchantment_options')}")
-            print(self.game.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("enchantment_options", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
             
             # 显示装备信息
             color = self.get_rarity_color(equipment["rarity"])
@@ -700,10 +774,10 @@ class EquipmentSystem:
             if equipment["hp"] > 0:
                 stats.append(f"❤️+{equipment['hp']}")
             
-            print(f"{color}{equipment['name']} {reset_color}[{rarity_name}] {', '.join(stats)}")
+            self.renderer.print(f"{color}{equipment['name']} {reset_color}[{rarity_name}] {', '.join(stats)}")
             
             # 显示可用的附魔选项
-            print(f"\n{self.game.lang.get_text('available_enchantments')}:")
+            self.renderer.text("available_enchantments", prefix="\n", suffix=":")
             
             available_enchantments = []
             for i, enchant_type in enumerate(game_config.ENCHANTMENT_RESTRICTIONS.get(equipment["type"], [])):
@@ -712,29 +786,29 @@ class EquipmentSystem:
                 enchant_desc = self.game.lang.get_text(enchant_config["description_key"])
                 success_rate = enchant_config["success_rate"] + game_config.ENCHANTMENT_RARITY_BONUS.get(equipment["rarity"], 0)
                 
-                print(f"  {i+1}. {enchant_name} - {enchant_config['cost']} {self.game.lang.get_text('gold')} ({int(success_rate * 100)}%)")
-                print(f"     {enchant_desc}")
+                self.renderer.print(f"  {i+1}. {enchant_name} - {enchant_config['cost']} {self.game.lang.get_text('gold')} ({int(success_rate * 100)}%)")
+                self.renderer.print(f"     {enchant_desc}")
                 available_enchantments.append(enchant_type)
             
-            print(f"\n  {len(available_enchantments) + 1}. {self.game.lang.get_text('back')}")
+            self.renderer.print(f"\n  {len(available_enchantments) + 1}. {self.game.lang.get_text('back')}")
             
-            choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+            choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="enchant_option", options=[str(i) for i in range(1, len(available_enchantments) + 2)]).strip()
             
             if choice.isdigit():
                 choice_num = int(choice)
                 if 1 <= choice_num <= len(available_enchantments):
                     enchant_type = available_enchantments[choice_num - 1]
                     self.enchant_equipment(equipment_slot, enchant_type)
-                    input(f"{self.game.lang.get_text('continue_prompt')}")
+                    read_input(f"{self.game.lang.get_text('continue_prompt')}")
                     break
                 elif choice_num == len(available_enchantments) + 1:
                     break
                 else:
-                    print(self.game.lang.get_text("invalid_choice"))
-                    input(f"{self.game.lang.get_text('continue_prompt')}")
+                    self.renderer.text("invalid_choice")
+                    read_input(f"{self.game.lang.get_text('continue_prompt')}")
             else:
-                print(self.game.lang.get_text("invalid_choice"))
-                input(f"{self.game.lang.get_text('continue_prompt')}")
+                self.renderer.text("invalid_choice")
+                read_input(f"{self.game.lang.get_text('continue_prompt')}")
 
     def get_enchantment_display(self, equipment):
         """获取附魔装备的显示文本
@@ -763,10 +837,10 @@ class EquipmentSystem:
     def update_equipment_shop_menu(self):
         """更新装备商店菜单，添加附魔选项"""
         # 在商店菜单中添加附魔选项
-        print(f"1. {self.game.lang.get_text('buy_equipment')}")
-        print(f"2. {self.game.lang.get_text('enhance_equipment')}")
-        print(f"3. {self.game.lang.get_text('enchant_equipment')}")
-        print(f"4. {self.game.lang.get_text('exit_shop')}")
+        self.renderer.text("buy_equipment", prefix="1. ")
+        self.renderer.text("enhance_equipment", prefix="2. ")
+        self.renderer.text("enchant_equipment", prefix="3. ")
+        self.renderer.text("exit_shop", prefix="4. ")
 
     def show_shop_items(self, items):
         """显示商店物品"""
@@ -789,7 +863,7 @@ class EquipmentSystem:
             if enhancement_level > 0:
                 enhancement_text = f" +{enhancement_level}"
 
-            print(f"  {i+1}. {color}{item['name']}{enhancement_text} {reset_color}[{rarity_name}] {', '.join(stats)} - {item['price']} {self.game.lang.get_text('gold')}")
+            self.renderer.print(f"  {i+1}. {color}{item['name']}{enhancement_text} {reset_color}[{rarity_name}] {', '.join(stats)} - {item['price']} {self.game.lang.get_text('gold')}")
 
     def equipment_shop(self, gold_multiplier=1.0, rarity_bonus=0):
         """装备商店
@@ -800,12 +874,11 @@ class EquipmentSystem:
         """
         # 生成商店商品（3-5件）
         shop_items = []
-        num_items = random.randint(3, 5)
+        num_items = self.random.randint(3, 5)
         for _ in range(num_items):
             item = self.create_random_equipment(rarity_bonus=rarity_bonus)
             # 根据稀有度和属性定价
-            rarity_multiplier = {"common": 1, "uncommon": 2, "rare": 5, "epic": 10, "legendary": 20}
-            base_price = (item["attack"] * 5 + item["defense"] * 5 + item["hp"] * 2) * rarity_multiplier[item["rarity"]]
+            base_price = (item["attack"] * 5 + item["defense"] * 5 + item["hp"] * 2) * PRICE_MULTIPLIERS[item["rarity"]]
             item["price"] = int(base_price / gold_multiplier)
             shop_items.append(item)
 
@@ -814,29 +887,29 @@ class EquipmentSystem:
 
         while True:
             self.game.clear_screen()
-            print(self.game.lang.get_text("block_separator"))
-            print(f"          {self.game.lang.get_text('equipment_shop')}")
-            print(self.game.lang.get_text("block_separator"))
-            print()
-
-            print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
-            print()
-            print(f"{self.game.lang.get_text('shop_items')}:")
+            self.renderer.text("block_separator")
+            self.renderer.text("equipment_shop", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
+
+            self.renderer.print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
+            self.renderer.print()
+            self.renderer.text("shop_items", suffix=":")
             self.show_shop_items(shop_items)
 
-            print()
-            print(f"1. {self.game.lang.get_text('buy_equipment')}")
-            print(f"2. {self.game.lang.get_text('enhance_equipment')}")
-            print(f"3. {self.game.lang.get_text('enchant_equipment')}")
-            print(f"4. {self.game.lang.get_text('exit_shop')}")
+            self.renderer.print()
+            self.renderer.text("buy_equipment", prefix="1. ")
+            self.renderer.text("enhance_equipment", prefix="2. ")
+            self.renderer.text("enchant_equipment", prefix="3. ")
+            self.renderer.text("exit_shop", prefix="4. ")
 
-            choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+            choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="equipment_shop", options=["1", "2", "3", "4"]).strip()
 
             if choice == "1":
                 try:
                     from hero.safe_input import safe_input
                     from hero.error_handler import handle_error
-                    user_input = safe_input(f"{self.game.lang.get_text('enter_item_number')}: ")
+                    user_input = safe_input(f"{self.game.lang.get_text('enter_item_number')}: ", decision="shop_item", renderer=self.renderer)
                     if user_input is not None:
                         item_index = int(user_input) - 1
                         if 0 <= item_index < len(shop_items):
@@ -844,19 +917,19 @@ class EquipmentSystem:
                             if self.game.hero_gold >= item["price"]:
                                 self.game.hero_gold -= item["price"]
                                 self.game.inventory.append(item)
-                                print(f"{self.game.lang.get_text('buy_success')} {item['name']}!")
+                                self.renderer.print(f"{self.game.lang.get_text('buy_success')} {item['name']}!")
                                 # 记录购买装备和花费
                                 self.game.statistics.record_item_purchased()
                                 self.game.statistics.record_gold_spent(item["price"])
                             else:
-                                print(self.game.lang.get_text("not_enough_gold"))
+                                self.renderer.text("not_enough_gold")
                         else:
-                            print(self.game.lang.get_text("invalid_choice"))
+                            self.renderer.text("invalid_choice")
                 except Exception as e:
                     from hero.error_handler import handle_error
                     error_msg = handle_error(e, "购买装备", "购买装备时发生错误。")
-                    print(error_msg)
-                input(f"{self.game.lang.get_text('continue_prompt')}")
+                    self.renderer.print(error_msg)
+                read_input(f"{self.game.lang.get_text('continue_prompt')}")
             elif choice == "2":
                 self.enhance_equipment_menu()
             elif choice == "3":
@@ -864,7 +937,7 @@ class EquipmentSystem:
             elif choice == "4":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
 
     def find_equipment(self, rarity_bonus=0):
         """发现装备事件
@@ -893,8 +966,8 @@ class EquipmentSystem:
         if item["hp"] > 0:
             stats.append(f"❤️  +{item['hp']}")
 
-        print(f"\n✨ {self.game.lang.get_text('found_equipment')}{color}{item['name']} {reset_color}[{rarity_name}]")
-        print(f"   {self.game.lang.get_text('equipment_stats')}{', '.join(stats)}")
+        self.renderer.print(f"\n✨ {self.game.lang.get_text('found_equipment')}{color}{item['name']} {reset_color}[{rarity_name}]")
+        self.renderer.print(f"   {self.game.lang.get_text('equipment_stats')}{', '.join(stats)}")
 
         self.game.inventory.append(item)
         self.game.events_encountered.append(f"{self.game.lang.get_text('found_equipment_event')}{item['name']}")
@@ -912,7 +985,7 @@ class EquipmentSystem:
             bool: 强化是否成功
         """
         if self.game.equipment[equipment_slot] is None:
-            print(self.game.lang.get_text("no_equipment_in_slot"))
+            self.renderer.text("no_equipment_in_slot")
             return False
             
         equipment = self.game.equipment[equipment_slot]
@@ -920,7 +993,7 @@ class EquipmentSystem:
         
         # 最大强化等级为+15
         if current_level >= 15:
-            print(self.game.lang.get_text("max_enhancement_level"))
+            self.renderer.text("max_enhancement_level")
             return False
             
         # 计算强化费用：基础费用 + (当前等级 * 递增费用)
@@ -930,18 +1003,18 @@ class EquipmentSystem:
         
         # 检查金币是否足够
         if self.game.hero_gold < enhancement_cost:
-            print(self.game.lang.get_text("not_enough_gold_enhance", cost=enhancement_cost))
+            self.renderer.print(self.game.lang.get_text("not_enough_gold_enhance", cost=enhancement_cost))
             return False
             
         # 确认强化
-        print(f"\n{self.game.lang.get_text('enhancement_info')}:")
-        print(f"  {equipment['name']} (+{current_level})")
-        print(f"  {self.game.lang.get_text('enhancement_cost')}: {enhancement_cost} {self.game.lang.get_text('gold')}")
-        print(f"  {self.game.lang.get_text('next_level')}: +{current_level + 1}")
+        self.renderer.text("enhancement_info", prefix="\n", suffix=":")
+        self.renderer.print(f"  {equipment['name']} (+{current_level})")
+        self.renderer.print(f"  {self.game.lang.get_text('enhancement_cost')}: {enhancement_cost} {self.game.lang.get_text('gold')}")
+        self.renderer.print(f"  {self.game.lang.get_text('next_level')}: +{current_level + 1}")
         
-        confirm = input(f"\n{self.game.lang.get_text('confirm_enhancement')} (y/n): ").strip().lower()
+        confirm = read_input(f"\n{self.game.lang.get_text('confirm_enhancement')} (y/n): ", decision="enhance_confirm").strip().lower()
         if confirm not in self.game.lang.get_text("yes_options"):
-            print(self.game.lang.get_text("enhancement_cancelled"))
+            self.renderer.text("enhancement_cancelled")
             return False
             
         # 扣除金币
@@ -960,14 +1033,14 @@ class EquipmentSystem:
         # 检查是否达到+10，获得传说属性
         if equipment["enhancement_level"] == 10:
             self.add_legendary_attribute(equipment)
-            print(f"\n✨ {self.game.lang.get_text('legendary_attribute_unlocked')} ✨")
+            self.renderer.text("legendary_attribute_unlocked", prefix="\n✨ ", suffix=" ✨")
             
         # 更新英雄属性
         self.game.update_attributes()
         
         # 显示强化结果
-        print(f"\n{self.game.lang.get_text('enhancement_success')}")
-        print(f"  {equipment['name']} (+{equipment['enhancement_level']})")
+        self.renderer.text("enhancement_success", prefix="\n")
+        self.renderer.print(f"  {equipment['name']} (+{equipment['enhancement_level']})")
         
         return True
         
@@ -983,17 +1056,17 @@ class EquipmentSystem:
             # 武器：附加火焰伤害（攻击力+5%）
             equipment["legendary_attribute"] = "flame_damage"
             equipment["flame_damage_percent"] = 0.05
-            print(f"  {self.game.lang.get_text('flame_attribute_unlocked')}")
+            self.renderer.text("flame_attribute_unlocked", prefix="  ")
         elif item_type == "armor":
             # 防具：伤害减免（受到伤害-5%）
             equipment["legendary_attribute"] = "damage_reduction"
             equipment["damage_reduction_percent"] = 0.05
-            print(f"  {self.game.lang.get_text('damage_reduction_attribute_unlocked')}")
+            self.renderer.text("damage_reduction_attribute_unlocked", prefix="  ")
         else:  # accessory
             # 饰品：生命恢复（每回合恢复1%最大生命值）
             equipment["legendary_attribute"] = "hp_regen"
             equipment["hp_regen_percent"] = 0.01
-            print(f"  {self.game.lang.get_text('hp_regen_attribute_unlocked')}")
+            self.renderer.text("hp_regen_attribute_unlocked", prefix="  ")
             
     def get_enhanced_equipment_display(self, equipment):
         """获取强化装备的显示文本
@@ -1050,14 +1123,14 @@ class EquipmentSystem:
         """强化装备菜单"""
         while True:
             self.game.clear_screen()
-            print(self.game.lang.get_text("block_separator"))
-            print(f"          {self.game.lang.get_text('enhance_equipment')}")
-            print(self.game.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("enhance_equipment", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
             
-            print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
-            print()
-            print(f"{self.game.lang.get_text('current_equipment')}:")
+            self.renderer.print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
+            self.renderer.print()
+            self.renderer.text("current_equipment", suffix=":")
             
             # 显示当前装备及其强化费用
             equipment_list = []
@@ -1096,31 +1169,31 @@ class EquipmentSystem:
                     enhancement_cost = self.get_enhancement_cost(item)
                     cost_text = f" - {enhancement_cost} {self.game.lang.get_text('gold')}" if enhancement_cost > 0 else f" - {self.game.lang.get_text('max_enhancement')}"
                     
-                    print(f"  {i+1}. {color}{item['name']}{enhancement_text} {reset_color}[{rarity_name}] {', '.join(stats)}{legendary_text}{cost_text}")
+                    self.renderer.print(f"  {i+1}. {color}{item['name']}{enhancement_text} {reset_color}[{rarity_name}] {', '.join(stats)}{legendary_text}{cost_text}")
                     equipment_list.append(slot)
                 else:
-                    print(f"  {i+1}. {self.game.lang.get_text(slot)}: {self.game.lang.get_text('none')}")
+                    self.renderer.print(f"  {i+1}. {self.game.lang.get_text(slot)}: {self.game.lang.get_text('none')}")
                     equipment_list.append(None)
             
-            print()
-            print(f"1. {self.game.lang.get_text('weapon')}")
-            print(f"2. {self.game.lang.get_text('armor')}")
-            print(f"3. {self.game.lang.get_text('accessory')}")
-            print(f"4. {self.game.lang.get_text('return_to_shop')}")
+            self.renderer.print()
+            self.renderer.text("weapon", prefix="1. ")
+            self.renderer.text("armor", prefix="2. ")
+            self.renderer.text("accessory", prefix="3. ")
+            self.renderer.text("return_to_shop", prefix="4. ")
             
-            choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+            choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="enhance_menu", options=["1", "2", "3", "4"]).strip()
             
             if choice in ["1", "2", "3"]:
                 slot_index = int(choice) - 1
                 if equipment_list[slot_index]:
                     slot = equipment_list[slot_index]
                     self.enhance_equipment(slot)
-                    input(f"{self.game.lang.get_text('continue_prompt')}")
+                    read_input(f"{self.game.lang.get_text('continue_prompt')}")
                 else:
-                    print(self.game.lang.get_text("no_equipment_in_slot"))
-                    input(f"{self.game.lang.get_text('continue_prompt')}")
+                    self.renderer.text("no_equipment_in_slot")
+                    read_input(f"{self.game.lang.get_text('continue_prompt')}")
             elif choice == "4":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
-                input(f"{self.game.lang.get_text('continue_prompt')}")
+                self.renderer.text("invalid_choice")
+                read_input(f"{self.game.lang.get_text('continue_prompt')}")
@@ -3,8 +3,10 @@
 事件系统模块 - 处理随机事件、商人等
 """
 
-import random
 import time
+from hero.safe_input import read_input
+from hero.rng import get_stream
+from hero.renderer import get_renderer
 
 
 class EventSystem:
@@ -12,26 +14,32 @@ class EventSystem:
 
     def __init__(self, game):
         self.game = game
+        # 事件随机数子流
+        self.random = get_stream(game, "events")
 
 
 
+    @property
+    def renderer(self):
+        """游戏的输出渲染器"""
+        return get_renderer(self.game)
+
     def merchant_event(self, gold_multiplier=1.0):
         """商人事件"""
-        from hero.equipment import EquipmentSystem
-        equip_system = EquipmentSystem(self.game)
+        equip_system = self.game.equipment_system
 
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('merchant_encounter')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
-
-        print(f"{self.game.lang.get_text('merchant')}")
-        print()
-        print(self.game.lang.get_text("merchant_speak"))
-        print()
-        print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("merchant_encounter", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
+
+        self.renderer.text("merchant")
+        self.renderer.print()
+        self.renderer.text("merchant_speak")
+        self.renderer.print()
+        self.renderer.line("shop_gold", hero_gold=self.game.hero_gold)
+        self.renderer.print()
 
         # 记录访问商店
         self.game.statistics.record_shop_visit()
@@ -40,41 +48,42 @@ class EventSystem:
         potions_price = int(10 / gold_multiplier)
         skill_teach_price = int(50 / gold_multiplier)
 
-        print(f"1. {self.game.lang.get_text('buy_potion')} - {potions_price} {self.game.lang.get_text('gold')}")
-        print(f"2. {self.game.lang.get_text('buy_equipment_short')} - {self.game.lang.get_text('equipment_shop')}")
-        print(f"3. {self.game.lang.get_text('enhance_equipment_short')} - {self.game.lang.get_text('enhance_equipment')}")
-        print(f"4. {self.game.lang.get_text('leave_merchant')}")
+        self.renderer.line("shop_buy_potion", potions_price=potions_price)
+        self.renderer.line("shop_buy_equipment")
+        self.renderer.line("shop_enhance_equipment")
+        self.renderer.text("leave_merchant", prefix="4. ")
 
         while True:
-            choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+            choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="merchant", options=["1", "2", "3", "4"]).strip()
 
             if choice == "1":
                 if self.game.hero_gold >= potions_price:
                     from hero.safe_input import safe_input
                     from hero.error_handler import handle_error
-                    num = safe_input(f"{self.game.lang.get_text('how_many')}: ")
+                    num = safe_input(f"{self.game.lang.get_text('how_many')}: ", decision="quantity", renderer=self.renderer)
                     try:
                         if num is not None:
                             num = int(num)
                             if num > 0 and num * potions_price <= self.game.hero_gold:
                                 self.game.hero_gold -= num * potions_price
                                 self.game.hero_potions += num
-                                print(f"{self.game.lang.get_text('buy_success')} {num} {self.game.lang.get_text('potions')}!")
+                                self.renderer.line("shop_bought_potions", num=num)
                                 # 记录购买和花费
                                 self.game.statistics.record_item_purchased(num)
                                 self.game.statistics.record_gold_spent(num * potions_price)
                                 self.game.statistics.record_potion_found()  # 购买的药剂也计入获得
                             else:
-                                print(self.game.lang.get_text("not_enough_gold"))
+                                self.renderer.text("not_enough_gold")
                     except Exception as e:
                         error_msg = handle_error(e, "购买药剂", "购买药剂时发生错误。")
-                        print(error_msg)
+                        self.renderer.print(error_msg)
                 else:
-                    print(self.game.lang.get_text("not_enough_gold"))
-                input(f"{self.game.lang.get_text('continue_prompt')}")
+                    self.renderer.text("not_enough_gold")
+                read_input(f"{self.game.lang.get_text('continue_prompt')}")
                 break
             elif choice == "2":
-                equip_system.equipment_shop(gold_multiplier)
+                with equip_system.loot_batch():
+                    equip_system.equipment_shop(gold_multiplier)
                 break
             elif choice == "3":
                 equip_system.enhance_equipment_menu()
@@ -82,7 +91,7 @@ class EventSystem:
             elif choice == "4":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
     
     def mysterious_teleport(self):
         """神秘传送事件"""
@@ -90,19 +99,19 @@ class EventSystem:
         event_config = EVENT_TYPES["mysterious_teleport"]
         
         # 随机决定前进或后退
-        direction = random.choice(["forward", "backward"])
-        steps = random.randint(abs(event_config["min_effect"]), abs(event_config["max_effect"]))
+        direction = self.random.choice(["forward", "backward"])
+        steps = self.random.randint(abs(event_config["min_effect"]), abs(event_config["max_effect"]))
         
         if direction == "backward":
             # 后退
             new_position = max(1, self.game.hero_position - steps)
-            print(f"🌀 {self.game.lang.get_text('event_mysterious_teleport_desc')}")
-            print(f"💫 {self.game.lang.get_text('teleported_to_position', position=new_position)}")
+            self.renderer.text("event_mysterious_teleport_desc", prefix="🌀 ")
+            self.renderer.text("teleported_to_position", prefix="💫 ", position=new_position)
         else:
             # 前进
             new_position = min(self.game.map_length, self.game.hero_position + steps)
-            print(f"🌀 {self.game.lang.get_text('event_mysterious_teleport_desc')}")
-            print(f"💫 {self.game.lang.get_text('teleported_to_position', position=new_position)}")
+            self.renderer.text("event_mysterious_teleport_desc", prefix="🌀 ")
+            self.renderer.text("teleported_to_position", prefix="💫 ", position=new_position)
         
         # 记录事件
         self.game.events_encountered.append(f"{self.game.lang.get_text('event_mysterious_teleport')} - {self.game.lang.get_text('moved_to_position', position=new_position)}")
@@ -117,11 +126,11 @@ class EventSystem:
         event_config = EVENT_TYPES["sage_guidance"]
         
         # 随机获得经验值
-        exp_gained = random.randint(event_config["min_exp"], event_config["max_exp"])
+        exp_gained = self.random.randint(event_config["min_exp"], event_config["max_exp"])
         self.game.hero_exp += exp_gained
         
-        print(f"🧙 {self.game.lang.get_text('event_sage_guidance_desc')}")
-        print(f"✨ {self.game.lang.get_text('gained_exp', exp=exp_gained)}")
+        self.renderer.text("event_sage_guidance_desc", prefix="🧙 ")
+        self.renderer.text("gained_exp", prefix="✨ ", exp=exp_gained)
         
         # 记录事件
         self.game.events_encountered.append(f"{self.game.lang.get_text('event_sage_guidance')} - {self.game.lang.get_text('gained_exp', exp=exp_gained)}")
@@ -139,25 +148,25 @@ class EventSystem:
         from hero.game_config import EVENT_TYPES
         event_config = EVENT_TYPES["robber_encounter"]
         
-        print(f"🗡️ {self.game.lang.get_text('event_robber_encounter_desc')}")
-        print()
-        print(f"1. {self.game.lang.get_text('combat_option')}")
-        print(f"2. {self.game.lang.get_text('pay_gold_option')}")
+        self.renderer.text("event_robber_encounter_desc", prefix="🗡️ ")
+        self.renderer.print()
+        self.renderer.text("combat_option", prefix="1. ")
+        self.renderer.text("pay_gold_option", prefix="2. ")
         
-        choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+        choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="event_choice", options=["1", "2"]).strip()
         
         if choice == "1":  # 选择战斗
-            print(f"\n{self.game.lang.get_text('decide_to_combat')}")
+            self.renderer.text("decide_to_combat", prefix="\n")
             # 记录事件
             self.game.events_encountered.append(f"{self.game.lang.get_text('event_robber_encounter')} - {self.game.lang.get_text('chose_combat')}")
             self.game.statistics.record_event_triggered("robber_combat")
             # 与强盗战斗
             self.game.combat_system.combat(self.game.difficulty_settings[self.game.difficulty]["enemy_multiplier"])
         elif choice == "2":  # 选择交金币
-            gold_loss = random.randint(event_config["min_gold_loss"], event_config["max_gold_loss"])
+            gold_loss = self.random.randint(event_config["min_gold_loss"], event_config["max_gold_loss"])
             gold_loss = min(gold_loss, self.game.hero_gold)  # 不能失去比拥有的更多的金币
             
-            print(f"\n{self.game.lang.get_text('gave_gold_to_robber', gold=gold_loss)}")
+            self.renderer.text("gave_gold_to_robber", prefix="\n", gold=gold_loss)
             self.game.hero_gold -= gold_loss
             
             # 记录事件
@@ -165,7 +174,7 @@ class EventSystem:
             self.game.statistics.record_event_triggered("robber_pay")
             self.game.statistics.record_gold_spent(gold_loss)
         else:
-            print(self.game.lang.get_text("invalid_choice"))
+            self.renderer.text("invalid_choice")
             self.robber_encounter()  # 重新选择
     
     def mysterious_altar(self):
@@ -173,19 +182,19 @@ class EventSystem:
         from hero.game_config import EVENT_TYPES
         event_config = EVENT_TYPES["mysterious_altar"]
         
-        print(f"🪦 {self.game.lang.get_text('event_mysterious_altar_desc')}")
-        print()
-        print(f"1. {self.game.lang.get_text('sacrifice_hp_for_attack')}")
-        print(f"2. {self.game.lang.get_text('sacrifice_hp_for_defense')}")
-        print(f"3. {self.game.lang.get_text('leave_altar')}")
+        self.renderer.text("event_mysterious_altar_desc", prefix="🪦 ")
+        self.renderer.print()
+        self.renderer.text("sacrifice_hp_for_attack", prefix="1. ")
+        self.renderer.text("sacrifice_hp_for_defense", prefix="2. ")
+        self.renderer.text("leave_altar", prefix="3. ")
         
-        choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+        choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="event_choice", options=["1", "2", "3"]).strip()
         
         if choice == "1":  # 换取攻击力
             hp_cost = int(self.game.hero_max_hp * event_config["hp_cost_percent"])
             hp_cost = min(hp_cost, self.game.hero_hp - 1)  # 保留至少1点血
             
-            print(f"\n{self.game.lang.get_text('sacrificed_hp_for_attack_desc', hp=hp_cost)}")
+            self.renderer.text("sacrificed_hp_for_attack_desc", prefix="\n", hp=hp_cost)
             self.game.hero_hp -= hp_cost
             self.game.base_attack += event_config["attack_boost"]
             self.game.update_attributes()  # 重新计算属性
@@ -198,7 +207,7 @@ class EventSystem:
             hp_cost = int(self.game.hero_max_hp * event_config["hp_cost_percent"])
             hp_cost = min(hp_cost, self.game.hero_hp - 1)  # 保留至少1点血
             
-            print(f"\n{self.game.lang.get_text('sacrificed_hp_for_defense_desc', hp=hp_cost)}")
+            self.renderer.text("sacrificed_hp_for_defense_desc", prefix="\n", hp=hp_cost)
             self.game.hero_hp -= hp_cost
             self.game.base_defense += event_config["defense_boost"]
             self.game.update_attributes()  # 重新计算属性
@@ -208,11 +217,11 @@ class EventSystem:
             self.game.statistics.record_event_triggered("altar_defense")
             self.game.show_hero_info()
         elif choice == "3":  # 离开
-            print(f"\n{self.game.lang.get_text('decide_to_leave_altar')}")
+            self.renderer.text("decide_to_leave_altar", prefix="\n")
             self.game.events_encountered.append(f"{self.game.lang.get_text('event_mysterious_altar')} - {self.game.lang.get_text('chose_to_leave_altar')}")
             self.game.statistics.record_event_triggered("altar_leave")
         else:
-            print(self.game.lang.get_text("invalid_choice"))
+            self.renderer.text("invalid_choice")
             self.mysterious_altar()  # 重新选择
     
     def roadside_camp(self):
@@ -221,11 +230,11 @@ class EventSystem:
         event_config = EVENT_TYPES["roadside_camp"]
         
         # 随机恢复生命值
-        heal_amount = random.randint(event_config["min_heal"], event_config["max_heal"])
+        heal_amount = self.random.randint(event_config["min_heal"], event_config["max_heal"])
         self.game.hero_hp = min(self.game.hero_hp + heal_amount, self.game.hero_max_hp)
         
-        print(f"🏕️ {self.game.lang.get_text('event_roadside_camp_desc')}")
-        print(f"💚 {self.game.lang.get_text('rested_at_camp', heal=heal_amount)}")
+        self.renderer.text("event_roadside_camp_desc", prefix="🏕️ ")
+        self.renderer.text("rested_at_camp", prefix="💚 ", heal=heal_amount)
         
         # 记录事件
         self.game.events_encountered.append(f"{self.game.lang.get_text('event_roadside_camp')} - {self.game.lang.get_text('restored_hp', heal=heal_amount)}")
@@ -234,32 +243,32 @@ class EventSystem:
 
     def mysterious_merchant(self, gold_multiplier=1.0):
         """神秘商人事件（地牢/山脉特殊）"""
-        from hero.equipment import EquipmentSystem
-        equip_system = EquipmentSystem(self.game)
+        equip_system = self.game.equipment_system
 
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('mysterious_merchant_encounter')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("mysterious_merchant_encounter", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
-        print(f"{self.game.lang.get_text('mysterious_merchant_desc')}")
-        print()
-        print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
-        print()
+        self.renderer.text("mysterious_merchant_desc")
+        self.renderer.print()
+        self.renderer.line("shop_gold", hero_gold=self.game.hero_gold)
+        self.renderer.print()
 
         # 记录访问商店
         self.game.statistics.record_shop_visit()
 
-        print(f"1. {self.game.lang.get_text('buy_equipment_short')}")
-        print(f"2. {self.game.lang.get_text('enhance_equipment_short')}")
-        print(f"3. {self.game.lang.get_text('leave_merchant')}")
+        self.renderer.text("buy_equipment_short", prefix="1. ")
+        self.renderer.text("enhance_equipment_short", prefix="2. ")
+        self.renderer.text("leave_merchant", prefix="3. ")
 
         while True:
-            choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+            choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="mysterious_merchant", options=["1", "2", "3"]).strip()
 
             if choice == "1":
-                equip_system.equipment_shop(gold_multiplier * 1.5)  # 神秘商人价格更高
+                with equip_system.loot_batch():
+                    equip_system.equipment_shop(gold_multiplier * 1.5)  # 神秘商人价格更高
                 break
             elif choice == "2":
                 equip_system.enhance_equipment_menu()
@@ -267,48 +276,48 @@ class EventSystem:
             elif choice == "3":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
 
     def treasure_chest_with_equipment(self):
         """带有装备的宝箱"""
-        from hero.equipment import EquipmentSystem
-        equip_system = EquipmentSystem(self.game)
+        equip_system = self.game.equipment_system
 
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('treasure_chest')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("treasure_chest", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
-        print(f"{self.game.lang.get_text('treasure_chest_desc')}")
-        print()
+        self.renderer.text("treasure_chest_desc")
+        self.renderer.print()
 
         # 随机获得装备
-        equip_system.find_equipment()
-        input(f"\n{self.game.lang.get_text('continue_prompt')}")
+        with equip_system.loot_batch():
+            equip_system.find_equipment()
+        read_input(f"\n{self.game.lang.get_text('continue_prompt')}")
 
     def show_adventure_history(self):
         """显示冒险历史"""
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('adventure_history')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("adventure_history", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
         if not self.game.events_encountered:
-            print(f"{self.game.lang.get_text('no_events_yet')}")
+            self.renderer.text("no_events_yet")
         else:
             for i, event in enumerate(self.game.events_encountered[-10:], 1):
-                print(f"{i}. {event}")
+                self.renderer.print(f"{i}. {event}")
 
-        input(f"\n{self.game.lang.get_text('continue_prompt')}")
+        read_input(f"\n{self.game.lang.get_text('continue_prompt')}")
 
     def use_potion(self):
         """使用药剂"""
-        heal_amount = random.randint(20, 40)
+        heal_amount = self.random.randint(20, 40)
         self.game.hero_hp = min(self.game.hero_hp + heal_amount, self.game.hero_max_hp)
         self.game.hero_potions -= 1
-        print(f"🧪 {self.game.lang.get_text('poison')} {heal_amount}{self.game.lang.get_text('point_hp')}")
+        self.renderer.line("potion_heal", heal_amount=heal_amount)
         self.game.events_encountered.append(f"{self.game.lang.get_text('used_potion_event', heal=heal_amount)}")
         # 记录使用药剂
         self.game.statistics.record_potion_used()
@@ -316,19 +325,18 @@ class EventSystem:
 
     def swamp_merchant_event(self, gold_multiplier=1.0):
         """沼泽商人事件"""
-        from hero.equipment import EquipmentSystem
-        equip_system = EquipmentSystem(self.game)
+        equip_system = self.game.equipment_system
 
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('swamp_merchant')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("swamp_merchant", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
-        print(f"{self.game.lang.get_text('swamp_merchant_desc')}")
-        print()
-        print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
-        print()
+        self.renderer.text("swamp_merchant_desc")
+        self.renderer.print()
+        self.renderer.line("shop_gold", hero_gold=self.game.hero_gold)
+        self.renderer.print()
 
         # 记录访问商店
         self.game.statistics.record_shop_visit()
@@ -336,41 +344,42 @@ class EventSystem:
         # 商店商品 - 沼泽商人有特殊折扣
         potions_price = int(8 / gold_multiplier)  # 比普通商人便宜
 
-        print(f"1. {self.game.lang.get_text('buy_potion')} - {potions_price} {self.game.lang.get_text('gold')}")
-        print(f"2. {self.game.lang.get_text('buy_equipment_short')} - {self.game.lang.get_text('equipment_shop')}")
-        print(f"3. {self.game.lang.get_text('enhance_equipment_short')} - {self.game.lang.get_text('enhance_equipment')}")
-        print(f"4. {self.game.lang.get_text('leave_merchant')}")
+        self.renderer.line("shop_buy_potion", potions_price=potions_price)
+        self.renderer.line("shop_buy_equipment")
+        self.renderer.line("shop_enhance_equipment")
+        self.renderer.text("leave_merchant", prefix="4. ")
 
         while True:
-            choice = input(f"{self.game.lang.get_text('enter_choice')}: ").strip()
+            choice = read_input(f"{self.game.lang.get_text('enter_choice')}: ", decision="merchant", options=["1", "2", "3", "4"]).strip()
 
             if choice == "1":
                 if self.game.hero_gold >= potions_price:
                     from hero.safe_input import safe_input
                     from hero.error_handler import handle_error
-                    num = safe_input(f"{self.game.lang.get_text('how_many')}: ")
+                    num = safe_input(f"{self.game.lang.get_text('how_many')}: ", decision="quantity", renderer=self.renderer)
                     try:
                         if num is not None:
                             num = int(num)
                             if num > 0 and num * potions_price <= self.game.hero_gold:
                                 self.game.hero_gold -= num * potions_price
                                 self.game.hero_potions += num
-                                print(f"{self.game.lang.get_text('buy_success')} {num} {self.game.lang.get_text('potions')}!")
+                                self.renderer.line("shop_bought_potions", num=num)
                                 # 记录购买和花费
                                 self.game.statistics.record_item_purchased(num)
                                 self.game.statistics.record_gold_spent(num * potions_price)
                                 self.game.statistics.record_potion_found()  # 购买的药剂也计入获得
                             else:
-                                print(self.game.lang.get_text("not_enough_gold"))
+                                self.renderer.text("not_enough_gold")
                     except Exception as e:
                         error_msg = handle_error(e, "购买药剂", "购买药剂时发生错误。")
-                        print(error_msg)
+                        self.renderer.print(error_msg)
                 else:
-                    print(self.game.lang.get_text("not_enough_gold"))
-                input(f"{self.game.lang.get_text('continue_prompt')}")
+                    self.renderer.text("not_enough_gold")
+                read_input(f"{self.game.lang.get_text('continue_prompt')}")
                 break
             elif choice == "2":
-                equip_system.equipment_shop(gold_multiplier * 1.2)  # 装备有折扣但不如神秘商人
+                with equip_system.loot_batch():
+                    equip_system.equipment_shop(gold_multiplier * 1.2)  # 装备有折扣但不如神秘商人
                 break
             elif choice == "3":
                 equip_system.enhance_equipment_menu()
@@ -378,4 +387,4 @@ class EventSystem:
             elif choice == "4":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
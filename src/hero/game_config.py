@@ -519,6 +519,111 @@ MAP_TYPES = {
     }
 }
 
+# 地图随机事件表：每张地图的事件按顺序排列，weight 为整数权重（总和即随机数范围）
+# handler 为事件处理器名称（见 map_events.EVENT_HANDLERS），其余字段为处理器参数
+# 共用的纯事件（传送、贤者、强盗、祭坛、营地）使用 event_system 处理器调用 EventSystem 的同名方法
+MAP_EVENT_TABLES = {
+    "plains": [
+        {"id": "mine_trap", "weight": 3, "handler": "damage", "icon": "💥", "damage": (10, 25), "multiplier": 1.0, "defense_divisor": 1, "suffix_key": "actual_damage"},
+        {"id": "find_bun", "weight": 3, "handler": "heal", "icon": "🥢", "heal": (15, 30), "spaced": True},
+        {"id": "combat", "weight": 3, "handler": "combat", "icon": "👹", "multiplier": 1.0, "update_quest": True},
+        {"id": "find_chest", "weight": 2, "handler": "gold", "icon": "💎", "gold": (10, 30), "spaced": True, "suffix_key": "coins", "update_quest": True},
+        {"id": "merchant", "weight": 4, "handler": "event_system", "method": "merchant_event", "gold_multiplier": True},
+        {"id": "find_potion", "weight": 2, "handler": "potion"},
+        {"id": "find_equipment", "weight": 2, "handler": "equipment"},
+        {"id": "boss_combat", "weight": 2, "handler": "boss", "icon": "🐉", "multiplier": 1.5},
+        {"id": "mysterious_teleport", "weight": 2, "handler": "event_system", "method": "mysterious_teleport"},
+        {"id": "sage_guidance", "weight": 2, "handler": "event_system", "method": "sage_guidance"},
+        {"id": "robber_encounter", "weight": 2, "handler": "event_system", "method": "robber_encounter"},
+        {"id": "mysterious_altar", "weight": 2, "handler": "event_system", "method": "mysterious_altar"},
+        {"id": "roadside_camp", "weight": 2, "handler": "event_system", "method": "roadside_camp"},
+        {"id": "safe_move", "weight": 4, "handler": "safe_move"}
+    ],
+    "forest": [
+        {"id": "thorns_damage", "weight": 3, "handler": "damage", "icon": "🌿", "damage": (8, 20), "multiplier": 1.0, "defense_divisor": 2},
+        {"id": "find_herbs", "weight": 3, "handler": "heal", "icon": "🌱", "heal": (20, 35)},
+        {"id": "combat", "weight": 3, "handler": "combat", "icon": "🐺", "multiplier": 1.0},
+        {"id": "find_chest", "weight": 2, "handler": "gold", "icon": "💎", "gold": (15, 35), "spaced": True, "suffix_key": "coins"},
+        {"id": "merchant", "weight": 2, "handler": "event_system", "method": "merchant_event", "gold_multiplier": True},
+        {"id": "find_equipment", "weight": 2, "handler": "equipment"},
+        {"id": "boss_combat", "weight": 2, "handler": "boss", "icon": "🐉", "multiplier": 1.5},
+        {"id": "find_potion", "weight": 2, "handler": "potion"},
+        {"id": "mysterious_teleport", "weight": 2, "handler": "event_system", "method": "mysterious_teleport"},
+        {"id": "sage_guidance", "weight": 2, "handler": "event_system", "method": "sage_guidance"},
+        {"id": "robber_encounter", "weight": 2, "handler": "event_system", "method": "robber_encounter"},
+        {"id": "roadside_camp", "weight": 2, "handler": "event_system", "method": "roadside_camp"},
+        {"id": "safe_move", "weight": 8, "handler": "safe_move"}
+    ],
+    "desert": [
+        {"id": "dehydration", "weight": 3, "handler": "damage", "icon": "☀️", "damage": (12, 28), "multiplier": 1.2, "defense_divisor": 0},
+        {"id": "find_oasis", "weight": 3, "handler": "heal", "icon": "💧", "heal": (25, 40)},
+        {"id": "combat", "weight": 3, "handler": "combat", "icon": "🦂", "multiplier": 1.1},
+        {"id": "find_chest", "weight": 2, "handler": "gold", "icon": "💎", "gold": (20, 40), "spaced": True, "suffix_key": "coins"},
+        {"id": "merchant", "weight": 2, "handler": "event_system", "method": "merchant_event", "gold_multiplier": True},
+        {"id": "find_equipment", "weight": 2, "handler": "equipment"},
+        {"id": "boss_combat", "weight": 2, "handler": "boss", "icon": "🐉", "multiplier": 1.6},
+        {"id": "find_potion", "weight": 2, "handler": "potion"},
+        {"id": "mysterious_teleport", "weight": 2, "handler": "event_system", "method": "mysterious_teleport"},
+        {"id": "sage_guidance", "weight": 2, "handler": "event_system", "method": "sage_guidance"},
+        {"id": "robber_encounter", "weight": 2, "handler": "event_system", "method": "robber_encounter"},
+        {"id": "roadside_camp", "weight": 2, "handler": "event_system", "method": "roadside_camp"},
+        {"id": "safe_move", "weight": 8, "handler": "safe_move"}
+    ],
+    "dungeon": [
+        {"id": "dungeon_trap", "weight": 3, "handler": "damage", "icon": "🕳️", "damage": (15, 30), "multiplier": 1.3, "defense_divisor": 2},
+        {"id": "ghost_combat", "weight": 2, "handler": "ghost", "icon": "👻", "multiplier": 1.0},
+        {"id": "combat", "weight": 3, "handler": "combat", "icon": "💀", "multiplier": 1.2},
+        {"id": "find_chest", "weight": 3, "handler": "gold", "icon": "💎", "gold": (25, 50), "spaced": True, "suffix_key": "coins"},
+        {"id": "find_equipment", "weight": 2, "handler": "equipment"},
+        {"id": "mysterious_merchant", "weight": 2, "handler": "event_system", "method": "mysterious_merchant", "gold_multiplier": True},
+        {"id": "boss_combat", "weight": 2, "handler": "boss", "icon": "🐉", "multiplier": 1.7},
+        {"id": "mysterious_teleport", "weight": 2, "handler": "event_system", "method": "mysterious_teleport"},
+        {"id": "sage_guidance", "weight": 2, "handler": "event_system", "method": "sage_guidance"},
+        {"id": "robber_encounter", "weight": 2, "handler": "event_system", "method": "robber_encounter"},
+        {"id": "roadside_camp", "weight": 2, "handler": "event_system", "method": "roadside_camp"},
+        {"id": "safe_move", "weight": 10, "handler": "safe_move"}
+    ],
+    "mountain": [
+        {"id": "mountain_hazard", "weight": 3, "handler": "damage", "icon": "🪨", "damage": (18, 35), "multiplier": 1.4, "defense_divisor": 1},
+        {"id": "find_gem", "weight": 3, "handler": "gold", "icon": "💎", "gold": (40, 80), "suffix_key": "gold_coins"},
+        {"id": "combat", "weight": 3, "handler": "combat", "icon": "🐲", "multiplier": 1.3},
+        {"id": "boss_combat", "weight": 2, "handler": "boss", "icon": "🐲", "multiplier": 1.8},
+        {"id": "find_equipment", "weight": 2, "handler": "equipment"},
+        {"id": "mysterious_merchant", "weight": 2, "handler": "event_system", "method": "mysterious_merchant", "gold_multiplier": True},
+        {"id": "mysterious_teleport", "weight": 2, "handler": "event_system", "method": "mysterious_teleport"},
+        {"id": "sage_guidance", "weight": 2, "handler": "event_system", "method": "sage_guidance"},
+        {"id": "robber_encounter", "weight": 2, "handler": "event_system", "method": "robber_encounter"},
+        {"id": "roadside_camp", "weight": 2, "handler": "event_system", "method": "roadside_camp"},
+        {"id": "safe_move", "weight": 12, "handler": "safe_move"}
+    ],
+    "swamp": [
+        {"id": "poison_cloud", "weight": 3, "handler": "damage", "icon": "☠️", "damage": (10, 20), "multiplier": 1.2, "defense_divisor": 0, "status_effect": "poison"},
+        {"id": "quicksand", "weight": 3, "handler": "percent_damage", "icon": "🏖️", "percent": 0.15, "minimum": 5},
+        {"id": "combat", "weight": 3, "handler": "combat", "icon": "🐊", "multiplier": 1.1},
+        {"id": "rare_herbs", "weight": 2, "handler": "heal", "icon": "🌿", "heal": (30, 50)},
+        {"id": "find_chest", "weight": 2, "handler": "gold", "icon": "💎", "gold": (15, 35), "spaced": True, "suffix_key": "coins"},
+        {"id": "swamp_merchant", "weight": 2, "handler": "event_system", "method": "swamp_merchant_event", "gold_multiplier": True},
+        {"id": "boss_combat", "weight": 2, "handler": "boss", "icon": "🐲", "multiplier": 1.6},
+        {"id": "sage_guidance", "weight": 2, "handler": "event_system", "method": "sage_guidance"},
+        {"id": "mysterious_altar", "weight": 2, "handler": "event_system", "method": "mysterious_altar"},
+        {"id": "roadside_camp", "weight": 2, "handler": "event_system", "method": "roadside_camp"},
+        {"id": "safe_move", "weight": 12, "handler": "safe_move"}
+    ],
+    "snowfield": [
+        {"id": "frostbite", "weight": 3, "handler": "status", "icon": "❄️", "status_effect": "frostbite"},
+        {"id": "avalanche", "weight": 3, "handler": "damage", "icon": "🏔️", "damage": (20, 40), "multiplier": 1.3, "defense_divisor": 0, "loot_chance": 0.3},
+        {"id": "combat", "weight": 3, "handler": "combat", "icon": "🐺", "multiplier": 1.15},
+        {"id": "ice_cave", "weight": 2, "handler": "heal", "icon": "🧊", "heal": (40, 60)},
+        {"id": "find_chest", "weight": 2, "handler": "gold", "icon": "💎", "gold": (20, 40), "spaced": True, "suffix_key": "coins"},
+        {"id": "frost_effect", "weight": 2, "handler": "status", "icon": "❄️", "status_effect": "frost"},
+        {"id": "boss_combat", "weight": 2, "handler": "boss", "icon": "🐲", "multiplier": 1.65},
+        {"id": "mysterious_teleport", "weight": 2, "handler": "event_system", "method": "mysterious_teleport"},
+        {"id": "sage_guidance", "weight": 2, "handler": "event_system", "method": "sage_guidance"},
+        {"id": "mysterious_altar", "weight": 2, "handler": "event_system", "method": "mysterious_altar"},
+        {"id": "safe_move", "weight": 12, "handler": "safe_move"}
+    ]
+}
+
 # 怪物模板配置
 MONSTER_TEMPLATES = {
     # 普通怪物
@@ -708,6 +813,20 @@ MONSTER_TEMPLATES = {
     }
 }
 
+# 升级所需经验（达到对应等级需要的累计经验）
+LEVEL_UP_THRESHOLDS = {
+    1: 100,
+    2: 300,
+    3: 600,
+    4: 1000,
+    5: 1500,
+    6: 2500,
+    7: 4000,
+    8: 6000,
+    9: 9000,
+    10: 12000
+}
+
 # 职业定义配置
 CLASS_DEFINITIONS = {
     "warrior": {
@@ -6,16 +6,29 @@
 import time
 from datetime import datetime
 
+from .renderer import get_renderer
+
 
 class GameLog:
     """游戏日志类"""
     
-    def __init__(self, language="zh"):
-        """初始化游戏日志系统"""
+    def __init__(self, language="zh", game=None):
+        """初始化游戏日志系统
+
+        Args:
+            language: 日志语言
+            game: 游戏对象（显示日志时使用它的渲染器）
+        """
         self.language = language
+        self.game = game
         self.log_entries = []
         self.max_entries = 200  # 最多保存200条日志
     
+    @property
+    def renderer(self):
+        """游戏的输出渲染器"""
+        return get_renderer(self.game)
+    
     def log_event(self, event_type, description, details=None):
         """
         记录游戏事件
@@ -230,44 +243,46 @@ class GameLog:
         """按类型获取日志条目"""
         return [log for log in self.log_entries if log["type"] == event_type]
     
-    def show_all_logs(self):
-        """显示所有日志"""
-        logs = self.get_logs()
+    def show_logs(self, logs, empty_text):
+        """逐条显示日志
+
+        Args:
+            logs: 日志条目列表
+            empty_text: 没有日志时显示的文本
+        """
         if not logs:
-            if self.language == "zh":
-                print("暂无游戏日志记录")
-            else:
-                print("No game logs available")
+            self.renderer.print(empty_text)
             return
         
         for i, entry in enumerate(logs, 1):
-            print(f"{i}. {self.format_log_entry(entry)}")
+            self.renderer.print(f"{i}. {self.format_log_entry(entry)}")
+    
+    def show_all_logs(self):
+        """显示所有日志"""
+        self.show_logs(self.get_logs(), "暂无游戏日志记录" if self.language == "zh" else "No game logs available")
     
     def show_recent_logs(self, count=10):
         """显示最近的日志"""
-        logs = self.get_recent_logs(count)
-        if not logs:
-            if self.language == "zh":
-                print("暂无游戏日志记录")
-            else:
-                print("No game logs available")
-            return
-        
-        for i, entry in enumerate(logs, 1):
-            print(f"{i}. {self.format_log_entry(entry)}")
+        self.show_logs(self.get_recent_logs(count),
+                       "暂无游戏日志记录" if self.language == "zh" else "No game logs available")
     
     def show_logs_by_type(self, event_type):
         """按类型显示日志"""
-        logs = self.get_logs_by_type(event_type)
-        if not logs:
-            if self.language == "zh":
-                print(f"暂无{event_type}类型的日志记录")
-            else:
-                print(f"No {event_type} logs available")
-            return
-        
-        for i, entry in enumerate(logs, 1):
-            print(f"{i}. {self.format_log_entry(entry)}")
+        if self.language == "zh":
+            empty_text = f"暂无{event_type}类型的日志记录"
+        else:
+            empty_text = f"No {event_type} logs available"
+        self.show_logs(self.get_logs_by_type(event_type), empty_text)
+    
+    def show_statistics(self):
+        """显示日志统计"""
+        stats = self.get_statistics()
+        if self.language == "zh":
+            self.renderer.print(f"日志总数: {stats['total_entries']}")
+        else:
+            self.renderer.print(f"Total entries: {stats['total_entries']}")
+        for event_type, count in stats["event_types"].items():
+            self.renderer.print(f"  {event_type}: {count}")
     
     def add_log(self, event_type, description, details=None):
         """添加日志（兼容性方法）"""
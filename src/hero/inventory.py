@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""
+背包模块 - 带索引的背包容器
+
+Inventory 是 list 的子类，列表顺序仍是获得物品的顺序（菜单编号、存档和按位置装备不变），
+同时在每次增删时维护以下索引，菜单和商店不再需要扫描整个背包：
+- 按物品 ID（id(item)）查找，不需要逐个比较物品（删除时列表本身仍要移动其后的元素，与 list.pop 相同）
+- 按装备类型、稀有度分桶
+- 按战力、稀有度、强化等级排序的视图（bisect 插入，排序键在放入背包时计算）
+- 分页读取，每页的开销与背包大小无关
+
+背包中的物品在原地修改数值后，需要调用 refresh() 重新计算排序位置。
+"""
+
+from bisect import bisect_left, insort
+from itertools import islice
+
+
+# 每页显示的物品数
+PAGE_SIZE = 10
+
+# 稀有度从低到高
+RARITY_ORDER = ("common", "uncommon", "rare", "epic", "legendary")
+RARITY_RANKS = {rarity: rank for rank, rarity in enumerate(RARITY_ORDER)}
+
+
+def item_power(item):
+    """装备战力（攻击和防御按 2 倍计算）
+
+    Args:
+        item: 装备
+
+    Returns:
+        int: 战力，没有装备时为 0
+    """
+    if not item:
+        return 0
+    return item.get("attack", 0) * 2 + item.get("defense", 0) * 2 + item.get("hp", 0)
+
+
+def _power_key(item):
+    return (-item_power(item),)
+
+
+def _rarity_key(item):
+    return (-RARITY_RANKS.get(item.get("rarity"), -1), -item_power(item))
+
+
+def _enhancement_key(item):
+    return (-item.get("enhancement_level", 0), -item_power(item))
+
+
+# 排序方式 -> 排序键（越好的物品排在越前面，相同时按获得顺序）
+SORT_KEYS = {
+    "power": _power_key,
+    "rarity": _rarity_key,
+    "enhancement": _enhancement_key
+}
+
+
+def _mutator(name):
+    """包装会重排列表的 list 方法：执行后重建全部索引"""
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._reindex()
+        return result
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class Inventory(list):
+    """带类型/稀有度索引和排序视图的背包"""
+
+    def __init__(self, items=()):
+        """
+        Args:
+            items: 初始物品
+        """
+        super().__init__(items)
+        self._reindex()
+
+    # ---- 索引维护 ----
+
+    def _reindex(self):
+        """按当前列表内容重建全部索引"""
+        self._items = {}
+        self._counts = {}
+        self._entries = {}
+        self._by_type = {}
+        self._by_rarity = {}
+        self._sorted = {(key, None): [] for key in SORT_KEYS}
+        self._positions = {}
+        self._valid_positions = 0
+        self._sequence = 0
+        for position, item in enumerate(self):
+            self._add(item)
+            self._positions.setdefault(id(item), position)
+        self._valid_positions = len(self)
+
+    def _add(self, item):
+        """登记放入的物品（同一物品放入多次时只索引一次）"""
+        item_id = id(item)
+        if item_id in self._counts:
+            self._counts[item_id] += 1
+            return
+        self._counts[item_id] = 1
+        self._items[item_id] = item
+        self._index(item, self._sequence)
+        self._sequence += 1
+
+    def _discard(self, item):
+        """登记取出的物品，最后一次出现被取出时移除它的索引"""
+        item_id = id(item)
+        count = self._counts.get(item_id, 0) - 1
+        if count > 0:
+            self._counts[item_id] = count
+            return
+        if count == 0:
+            del self._counts[item_id]
+            del self._items[item_id]
+            self._positions.pop(item_id, None)
+            self._unindex(item_id)
+
+    def _index(self, item, sequence):
+        """把物品加入分桶和排序视图（排序键在此时计算）"""
+        item_id = id(item)
+        item_type = item.get("type")
+        rarity = item.get("rarity")
+        entries = []
+        for key, key_function in SORT_KEYS.items():
+            entry = (key_function(item), sequence, item_id)
+            entries.append(entry)
+            insort(self._sorted[(key, None)], entry)
+            insort(self._sorted.setdefault((key, item_type), []), entry)
+        self._entries[item_id] = (item_type, rarity, entries)
+        self._by_type.setdefault(item_type, {})[item_id] = item
+        self._by_rarity.setdefault(rarity, {})[item_id] = item
+
+    def _unindex(self, item_id):
+        """把物品从分桶和排序视图中移除（使用放入时记录的类型、稀有度和排序键）"""
+        item_type, rarity, entries = self._entries.pop(item_id)
+        for key, entry in zip(SORT_KEYS, entries):
+            for view in (self._sorted[(key, None)], self._sorted[(key, item_type)]):
+                del view[bisect_left(view, entry)]
+        del self._by_type[item_type][item_id]
+        del self._by_rarity[rarity][item_id]
+        return entries[0][1]
+
+    def refresh(self, item):
+        """物品在背包中被修改后（如强化、改变稀有度）重新计算它的分桶和排序位置
+
+        Args:
+            item: 背包中的物品
+        """
+        item_id = id(item)
+        if self._items.get(item_id) is item:
+            self._index(item, self._unindex(item_id))
+
+    # ---- list 接口 ----
+
+    def append(self, item):
+        """放入物品（末尾）"""
+        position = len(self)
+        super().append(item)
+        self._add(item)
+        if self._valid_positions == position:
+            self._positions.setdefault(id(item), position)
+            self._valid_positions = position + 1
+
+    def extend(self, items):
+        """放入多件物品"""
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def pop(self, index=-1):
+        """取出指定位置的物品"""
+        position = index + len(self) if index < 0 else index
+        item = super().pop(index)
+        self._valid_positions = min(self._valid_positions, position)
+        self._discard(item)
+        return item
+
+    def remove(self, item):
+        """移除物品（按物品本身查找，与 list.remove 相同）"""
+        position = self.position(item)
+        if position is None:
+            position = super().index(item)
+        self.pop(position)
+
+    def clear(self):
+        super().clear()
+        self._reindex()
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            super().__delitem__(index)
+            self._reindex()
+        else:
+            self.pop(index)
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    insert = _mutator("insert")
+    sort = _mutator("sort")
+    reverse = _mutator("reverse")
+    __imul__ = _mutator("__imul__")
+
+    def __reduce__(self):
+        return (Inventory, (list(self),))
+
+    def copy(self):
+        return Inventory(self)
+
+    # ---- 按 ID 查找和删除 ----
+
+    def get_item(self, item_id):
+        """按物品 ID 查找物品，不在背包中时返回 None"""
+        return self._items.get(item_id)
+
+    def position(self, item):
+        """物品在列表中的位置（同一物品出现多次时为第一次出现的位置）
+
+        Args:
+            item: 物品
+
+        Returns:
+            int: 位置，不在背包中时为 None
+        """
+        item_id = id(item)
+        if self._items.get(item_id) is not item:
+            return None
+        positions = self._positions
+        start = self._valid_positions
+        position = positions.get(item_id)
+        if position is not None and position < start:
+            return position
+        # 删除物品后，其后物品的位置在下次查找时一次性更新
+        seen = set()
+        for position in range(start, len(self)):
+            other_id = id(self[position])
+            if other_id not in seen:
+                seen.add(other_id)
+                if positions.get(other_id, start) >= start:
+                    positions[other_id] = position
+        self._valid_positions = len(self)
+        return positions.get(item_id)
+
+    def remove_id(self, item_id):
+        """按物品 ID 取出物品
+
+        查找物品和位置不扫描背包，但从列表中删除仍要移动其后的元素，
+        开销与 list.pop(position) 相同（O(n)）。
+
+        Args:
+            item_id: 物品 ID（id(item)）
+
+        Returns:
+            物品，不在背包中时为 None
+        """
+        item = self._items.get(item_id)
+        if item is None:
+            return None
+        return self.pop(self.position(item))
+
+    # ---- 分桶和排序视图 ----
+
+    def types(self):
+        """背包中现有的装备类型"""
+        return [item_type for item_type, items in self._by_type.items() if items]
+
+    def of_type(self, item_type):
+        """某类型的全部物品（按获得顺序）"""
+        return list(self._by_type.get(item_type, {}).values())
+
+    def of_rarity(self, rarity):
+        """某稀有度的全部物品（按获得顺序）"""
+        return list(self._by_rarity.get(rarity, {}).values())
+
+    def count_items(self, item_type=None, rarity=None):
+        """物品数量（按类型或稀有度统计时，同一物品放入多次只计算一件）
+
+        不覆盖 list.count，list.count(item) 仍按值统计某件物品出现的次数。
+
+        Args:
+            item_type: 只统计该类型
+            rarity: 只统计该稀有度
+        """
+        if rarity is not None:
+            items = self._by_rarity.get(rarity, {})
+            if item_type is None:
+                return len(items)
+            return sum(1 for item_id in items if self._entries[item_id][0] == item_type)
+        if item_type is not None:
+            return len(self._by_type.get(item_type, ()))
+        return len(self)
+
+    def view(self, sort_key=None, item_type=None, rarity=None):
+        """按排序方式和过滤条件遍历物品（不复制整个背包）
+
+        Args:
+            sort_key: 排序方式（见 SORT_KEYS），None 表示获得顺序
+            item_type: 只包含该类型
+            rarity: 只包含该稀有度
+
+        Returns:
+            iterator: 物品迭代器
+        """
+        if sort_key is not None:
+            lookup = self._items
+            items = (lookup[entry[2]] for entry in self._sorted.get((sort_key, item_type), ()))
+        elif rarity is not None:
+            items = self._by_rarity.get(rarity, {}).values()
+            if item_type is None:
+                return iter(items)
+        elif item_type is not None:
+            return iter(self._by_type.get(item_type, {}).values())
+        else:
+            return iter(self)
+        entries = self._entries
+        if rarity is not None:
+            items = (item for item in items if entries[id(item)][1] == rarity)
+        if sort_key is None:
+            items = (item for item in items if entries[id(item)][0] == item_type)
+        return items
+
+    def best(self, item_type, sort_key="power"):
+        """某类型中排序最靠前的物品，没有时返回 None"""
+        entries = self._sorted.get((sort_key, item_type))
+        return self._items[entries[0][2]] if entries else None
+
+    def page(self, number, page_size=PAGE_SIZE, sort_key=None, item_type=None, rarity=None):
+        """读取一页物品
+
+        Args:
+            number: 页码（从 0 开始，超出范围时取最后一页）
+            page_size: 每页物品数
+            sort_key/item_type/rarity: 同 view()
+
+        Returns:
+            tuple: (物品列表, 实际页码, 总页数)
+        """
+        entries = None
+        if sort_key is not None and rarity is None:
+            entries = self._sorted.get((sort_key, item_type), ())
+            total = len(entries)
+        else:
+            total = self.count_items(item_type, rarity)
+        pages = max(1, -(-total // page_size))
+        number = min(max(number, 0), pages - 1)
+        start = number * page_size
+        stop = start + page_size
+        if entries is not None:
+            lookup = self._items
+            items = [lookup[entry[2]] for entry in entries[start:stop]]
+        elif item_type is None and rarity is None:
+            items = self[start:stop]
+        else:
+            items = list(islice(self.view(sort_key, item_type, rarity), start, stop))
+        return items, number, pages
+
+
+def inventory_view(inventory):
+    """把背包转换为 Inventory 以使用索引（用于只读查询）
+
+    游戏的背包已经是 Inventory 时原样返回；其他列表（如测试中直接赋值的列表）
+    构建一个临时的 Inventory。
+    """
+    if isinstance(inventory, Inventory):
+        return inventory
+    return Inventory(inventory)
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+装备物品模块 - 紧凑的装备对象
+
+Item 使用 __slots__ 保存每件装备各自的数值（攻击、防御、生命、强化等级、附魔等），
+类型、稀有度、名称等同类装备共有的不可变数据放在共享的 ItemTemplate（享元）中，
+特殊效果是驻留的效果 ID 元组。
+
+为兼容旧代码和存档，Item 同时提供与原装备字典一致的映射接口：
+item["attack"]、item.get("enchantment")、item["price"] = 10、dict(item) 等用法不变，
+并记录哪些键存在，从字典转换后再转回字典得到完全相同的内容。
+热点路径（属性计算、战斗）直接读取属性，如 item.attack、item.legendary_attribute。
+"""
+
+from collections.abc import Mapping, MutableMapping
+from operator import attrgetter
+
+from .language import TextCatalog
+
+
+# 装备模板中的键（修改这些键会换用另一个模板）
+TEMPLATE_KEYS = ("name", "type", "rarity", "is_legendary", "special_effects_values")
+
+# 每件装备各自保存的键
+SLOT_KEYS = ("attack", "defense", "hp", "special_effects", "set_bonus", "enhancement_level",
+             "base_attack", "base_defense", "base_hp", "enchantment", "legendary_attribute", "price")
+
+# 映射接口的键顺序（其余键保存在 extra 字典中，排在最后）
+ITEM_KEYS = ("name", "type", "rarity", "attack", "defense", "hp", "special_effects",
+             "special_effects_values", "set_bonus", "enhancement_level", "base_attack",
+             "base_defense", "base_hp", "is_legendary", "enchantment", "legendary_attribute", "price")
+
+# 未设置时不出现在映射中的键（普通装备和传奇装备）
+OPTIONAL_KEYS = frozenset(("enchantment", "legendary_attribute", "price"))
+NORMAL_ABSENT_KEYS = OPTIONAL_KEYS | {"special_effects_values"}
+
+_GETTERS = {key: attrgetter("template." + key) for key in TEMPLATE_KEYS}
+_GETTERS.update((key, attrgetter(key)) for key in SLOT_KEYS)
+
+# 驻留的模板、效果元组和缺失键集合（同样内容的装备共用同一个对象）
+_TEMPLATES = {}
+_EFFECT_TUPLES = {}
+_ABSENT_SETS = {}
+
+
+def effect_tuple(effects):
+    """把特殊效果列表转换为驻留的效果 ID 元组
+
+    Args:
+        effects: 效果 ID 序列
+
+    Returns:
+        tuple: 效果 ID 元组
+    """
+    effects = tuple(effects or ())
+    return _EFFECT_TUPLES.setdefault(effects, effects)
+
+
+def _absent_set(keys):
+    """驻留的缺失键集合"""
+    keys = frozenset(keys)
+    return _ABSENT_SETS.setdefault(keys, keys)
+
+
+class ItemTemplate:
+    """装备模板（享元）：类型、稀有度、名称等同类装备共有的只读数据
+
+    通过 ItemTemplate.get() 获取，相同内容的模板在进程内只有一个实例。
+    """
+
+    __slots__ = ("type", "rarity", "name", "is_legendary", "special_effects_values")
+
+    def __init__(self, item_type, rarity, name, is_legendary=False, special_effects_values=None):
+        """
+        Args:
+            item_type: 装备类型（weapon/armor/accessory）
+            rarity: 稀有度
+            name: 显示名称
+            is_legendary: 是否为传奇装备
+            special_effects_values: 传奇装备的特殊效果数值，None 表示没有
+        """
+        if special_effects_values is not None:
+            special_effects_values = TextCatalog(special_effects_values)
+        object.__setattr__(self, "type", item_type)
+        object.__setattr__(self, "rarity", rarity)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "is_legendary", is_legendary)
+        object.__setattr__(self, "special_effects_values", special_effects_values)
+
+    @classmethod
+    def get(cls, item_type, rarity, name, is_legendary=False, special_effects_values=None):
+        """获取驻留的模板
+
+        Returns:
+            ItemTemplate: 共享的模板实例
+        """
+        values_key = None
+        if special_effects_values is not None:
+            values_key = tuple(sorted(special_effects_values.items()))
+        key = (item_type, rarity, name, is_legendary, values_key)
+        try:
+            template = _TEMPLATES.get(key)
+        except TypeError:
+            # 无法作为字典键的内容（如存档中的异常数据）不驻留
+            return cls(item_type, rarity, name, is_legendary, special_effects_values)
+        if template is None:
+            template = _TEMPLATES.setdefault(key, cls(item_type, rarity, name, is_legendary, special_effects_values))
+        return template
+
+    def replace(self, **changes):
+        """返回修改了部分字段的模板"""
+        fields = {key: getattr(self, key) for key in TEMPLATE_KEYS}
+        fields.update(changes)
+        return ItemTemplate.get(fields["type"], fields["rarity"], fields["name"],
+                                fields["is_legendary"], fields["special_effects_values"])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("装备模板是只读的")
+
+    def __reduce__(self):
+        return (ItemTemplate.get, (self.type, self.rarity, self.name, self.is_legendary,
+                                   None if self.special_effects_values is None else dict(self.special_effects_values)))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"ItemTemplate({self.type!r}, {self.rarity!r}, {self.name!r})"
+
+
+class Item(MutableMapping):
+    """一件装备
+
+    数值字段直接作为属性读写；同时实现可变映射接口，行为与原来的装备字典一致。
+    """
+
+    __slots__ = ("template", "attack", "defense", "hp", "special_effects", "set_bonus",
+                 "enhancement_level", "base_attack", "base_defense", "base_hp",
+                 "enchantment", "legendary_attribute", "price", "extra", "_absent")
+
+    def __init__(self, template, attack=0, defense=0, hp=0, special_effects=(), set_bonus=None,
+                 enhancement_level=0, base_attack=None, base_defense=None, base_hp=None,
+                 enchantment=None, legendary_attribute=None, price=None, extra=None, absent=None):
+        """
+        Args:
+            template: ItemTemplate
+            attack/defense/hp: 当前属性加成
+            special_effects: 特殊效果 ID 序列
+            set_bonus: 所属套装，None 表示不属于套装
+            enhancement_level: 强化等级
+            base_attack/base_defense/base_hp: 基础属性（强化计算用），None 表示与当前属性相同
+            enchantment: 附魔类型
+            legendary_attribute: +10 强化解锁的传说属性
+            price: 商店价格
+            extra: 其他键值（如附魔效果数值）
+            absent: 映射接口中不存在的键，None 表示按模板推断
+        """
+        self.template = template
+        self.attack = attack
+        self.defense = defense
+        self.hp = hp
+        self.special_effects = effect_tuple(special_effects)
+        self.set_bonus = set_bonus
+        self.enhancement_level = enhancement_level
+        self.base_attack = attack if base_attack is None else base_attack
+        self.base_defense = defense if base_defense is None else base_defense
+        self.base_hp = hp if base_hp is None else base_hp
+        self.enchantment = enchantment
+        self.legendary_attribute = legendary_attribute
+        self.price = price
+        self.extra = extra
+        if absent is None:
+            absent = (NORMAL_ABSENT_KEYS if template.special_effects_values is None else OPTIONAL_KEYS)
+            absent = absent - {key for key in OPTIONAL_KEYS if getattr(self, key) is not None}
+        self._absent = _absent_set(absent)
+
+    # ---- 模板字段 ----
+
+    @property
+    def type(self):
+        """装备类型"""
+        return self.template.type
+
+    @property
+    def rarity(self):
+        """稀有度"""
+        return self.template.rarity
+
+    @property
+    def name(self):
+        """显示名称"""
+        return self.template.name
+
+    @property
+    def is_legendary(self):
+        """是否为传奇装备"""
+        return self.template.is_legendary
+
+    @property
+    def special_effects_values(self):
+        """传奇装备的特殊效果数值（只读字典），普通装备为 None"""
+        return self.template.special_effects_values
+
+    # ---- 映射接口 ----
+
+    def __getitem__(self, key):
+        getter = _GETTERS.get(key)
+        if getter is not None:
+            if key in self._absent:
+                raise KeyError(key)
+            return getter(self)
+        extra = self.extra
+        if extra is not None and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        getter = _GETTERS.get(key)
+        if getter is not None:
+            return default if key in self._absent else getter(self)
+        extra = self.extra
+        if extra is not None:
+            return extra.get(key, default)
+        return default
+
+    def __contains__(self, key):
+        if key in _GETTERS:
+            return key not in self._absent
+        return self.extra is not None and key in self.extra
+
+    def __setitem__(self, key, value):
+        if key in TEMPLATE_KEYS:
+            self.template = self.template.replace(**{key: value})
+        elif key in _GETTERS:
+            if key == "special_effects":
+                value = effect_tuple(value)
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+            return
+        if key in self._absent:
+            self._absent = _absent_set(self._absent - {key})
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if key in _GETTERS:
+            self._absent = _absent_set(self._absent | {key})
+        else:
+            del self.extra[key]
+            if not self.extra:
+                self.extra = None
+
+    def __iter__(self):
+        absent = self._absent
+        for key in ITEM_KEYS:
+            if key not in absent:
+                yield key
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return len(ITEM_KEYS) - len(self._absent) + (len(self.extra) if self.extra is not None else 0)
+
+    def __eq__(self, other):
+        if isinstance(other, Item):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def copy(self):
+        """浅拷贝（与 dict.copy() 相同，模板共享）"""
+        return Item(self.template, self.attack, self.defense, self.hp, self.special_effects, self.set_bonus,
+                    self.enhancement_level, self.base_attack, self.base_defense, self.base_hp,
+                    self.enchantment, self.legendary_attribute, self.price,
+                    dict(self.extra) if self.extra is not None else None, self._absent)
+
+    def to_dict(self):
+        """转换为原来的装备字典格式（存档使用，特殊效果为列表）
+
+        Returns:
+            dict: 装备字典
+        """
+        data = dict(self)
+        if "special_effects" in data:
+            data["special_effects"] = list(data["special_effects"])
+        if data.get("special_effects_values") is not None:
+            data["special_effects_values"] = dict(data["special_effects_values"])
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """从装备字典（如旧存档）创建
+
+        Args:
+            data: 装备字典
+
+        Returns:
+            Item: 装备对象
+        """
+        template = ItemTemplate.get(data.get("type"), data.get("rarity"), data.get("name"),
+                                    data.get("is_legendary", False), data.get("special_effects_values"))
+        extra = {key: value for key, value in data.items() if key not in _GETTERS}
+        return cls(template, data.get("attack", 0), data.get("defense", 0), data.get("hp", 0),
+                   data.get("special_effects", ()), data.get("set_bonus"), data.get("enhancement_level", 0),
+                   data.get("base_attack", 0), data.get("base_defense", 0), data.get("base_hp", 0),
+                   data.get("enchantment"), data.get("legendary_attribute"), data.get("price"),
+                   extra or None, [key for key in ITEM_KEYS if key not in data])
+
+    def __reduce__(self):
+        return (Item.from_dict, (self.to_dict(),))
+
+    def __repr__(self):
+        return f"Item({self.to_dict()!r})"
+
+
+def as_item(value):
+    """把装备字典转换为 Item（Item、None 和其他对象原样返回）"""
+    if value is None or value.__class__ is Item:
+        return value
+    if isinstance(value, dict):
+        return Item.from_dict(value)
+    return value
+
+
+def item_to_dict(value):
+    """把 Item 转换为装备字典（存档使用，其他对象原样返回）"""
+    if value.__class__ is Item:
+        return value.to_dict()
+    return value
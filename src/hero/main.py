@@ -6,30 +6,26 @@
 版本: 3.0 (模块化重构)
 """
 
-import random
-import time
-import os
 import sys
-import argparse
 from hero.language import LanguageSupport
 from hero.game_config import DIFFICULTY_SETTINGS, MAP_TYPES, EVENT_TYPES, CLASS_DEFINITIONS
-from hero.combat import CombatSystem
-from hero.equipment import EquipmentSystem
-from hero.events import EventSystem
-from hero.newbie_village import NewbieVillage
-from hero.save_data import SaveData, SaveManager
 from hero.statistics import GameStatistics
-from hero.achievements import AchievementSystem
-from hero.quest import QuestSystem
-from hero.skill_tree import SkillTree
 from hero.settings import GameSettings
 from hero.game_log import GameLog
 from hero.error_handler import init_error_handler, handle_error, is_debug_mode, log_debug
-from hero.safe_input import safe_input
+from hero.safe_input import safe_input, read_input
+from hero.rng import GameRandom, get_stream
+from hero.items import as_item
+from hero.inventory import Inventory
+from hero.stats import StatEngine
+from hero.renderer import TerminalRenderer
+from hero.clock import GameClock
+# 战斗、装备、事件、新手村、成就、任务、技能树、存档和地图事件模块在首次使用时才导入
 
 
 def parse_arguments():
     """解析命令行参数"""
+    import argparse
     parser = argparse.ArgumentParser(description='英雄无敌 - 文字冒险游戏')
     parser.add_argument('--debug', action='store_true', help='启用调试模式')
     parser.add_argument('--log-file', default='logs/error.log', help='错误日志文件路径')
@@ -55,29 +51,130 @@ def safe_file_operation(operation_func, error_context: str, default_return=None)
         return default_return
 
 
+class GameConfig:
+    """新游戏的配置（HeroGame.from_config 和 HeroGame.reset 使用）"""
+
+    def __init__(self, language="zh", hero_class="warrior", map_type="plains", difficulty="normal",
+                 hero_name="Hero", seed=None):
+        """
+        Args:
+            language: 游戏语言
+            hero_class: 职业键名
+            map_type: 地图类型键名
+            difficulty: 难度键名
+            hero_name: 英雄名字
+            seed: 随机种子，None 表示不固定
+        """
+        self.language = language
+        self.hero_class = hero_class
+        self.map_type = map_type
+        self.difficulty = difficulty
+        self.hero_name = hero_name
+        self.seed = seed
+
+    def validate(self):
+        """检查职业、地图和难度是否存在
+
+        Raises:
+            ValueError: 配置无效
+        """
+        if self.hero_class not in CLASS_DEFINITIONS:
+            raise ValueError(f"未知的职业: {self.hero_class}")
+        if self.map_type not in MAP_TYPES:
+            raise ValueError(f"未知的地图类型: {self.map_type}")
+        if self.difficulty not in DIFFICULTY_SETTINGS:
+            raise ValueError(f"未知的难度: {self.difficulty}")
+        if not self.hero_name:
+            raise ValueError("英雄名字不能为空")
+
+    def to_dict(self):
+        """转换为字典"""
+        return {
+            "language": self.language,
+            "hero_class": self.hero_class,
+            "map_type": self.map_type,
+            "difficulty": self.difficulty,
+            "hero_name": self.hero_name,
+            "seed": self.seed
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """从字典创建配置（缺少的项使用默认值）"""
+        return cls(**data)
+
+
+class LazySubsystem:
+    """首次访问时才构建的子系统属性
+
+    构建结果保存在实例字典中，之后的访问直接读取实例属性，没有额外开销；
+    也可以像普通属性一样直接赋值替换（如测试中的模拟对象）。
+    """
+
+    def __init__(self, factory):
+        """
+        Args:
+            factory: 构建函数 (game) -> 子系统
+        """
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, game, owner=None):
+        if game is None:
+            return self
+        subsystem = self.factory(game)
+        game.__dict__[self.name] = subsystem
+        return subsystem
+
+
 class HeroGame:
     """英雄无敌游戏主类"""
 
-    def __init__(self):
-        """初始化游戏"""
-        self.language = "zh"  # 默认中文
+    # 延迟构建的子系统（只打开读档菜单等会话不会构建用不到的子系统）
+    LAZY_SUBSYSTEMS = ("combat_system", "equipment_system", "event_system",
+                       "newbie_village", "achievements", "quest_system")
+
+    def __init__(self, language=None, seed=None, rng=None, renderer=None, clock=None):
+        """初始化游戏
+
+        Args:
+            language: 游戏语言（zh/en），为 None 时由玩家交互选择
+            seed: 随机种子，指定后同一输入序列得到完全相同的游戏
+            rng: 注入的 random.Random 实例（优先于 seed）
+            renderer: 输出渲染器，None 表示交互终端
+            clock: 游戏时钟，None 表示环境变量 HERO_CLOCK 指定的模式（默认真实等待）
+        """
+        # 输出渲染器（所有界面输出都经由它）和游戏时钟（所有停顿都经由它）
+        self.attach(renderer if renderer is not None else TerminalRenderer(),
+                    clock if clock is not None else GameClock())
+
+        # 会话随机数源（战斗、战利品、事件、任务各自独立的子流）
+        self.rng = GameRandom(seed=seed, rng=rng)
+        
+        self.language = language or "zh"  # 默认中文
         self.lang = LanguageSupport(self.language)
         
         # 初始化游戏设置系统
         self.settings = GameSettings(self.language)
         
         # 初始化游戏日志系统
-        self.game_log = GameLog(self.language)
-        
-        # 性能优化：添加属性缓存
-        self._attributes_cached = False
-        self._cached_attributes = {}
+        self.game_log = GameLog(self.language, self)
 
-        # 先选择语言
-        self.select_language()
+        # 先选择语言（已指定语言时跳过交互选择）
+        if language is None:
+            self.select_language()
 
-        # 选择地图类型和难度
-        # self.select_map_and_difficulty()
+        # 初始化一局游戏的英雄状态
+        self._init_hero_state()
+
+    def _init_hero_state(self):
+        """初始化一局游戏的英雄状态（构造和 reset() 共用）"""
+        # 按来源增量累计的属性（基础属性、装备栏、套装、战斗中的临时加成）
+        self.stat_engine = StatEngine()
 
         # 初始化英雄属性
         self.hero_name = ""
@@ -114,7 +211,7 @@ class HeroGame:
             "armor": None,     # 防具
             "accessory": None  # 饰品
         }
-        self.inventory = []  # 背包存储物品
+        self.inventory = Inventory()  # 背包存储物品（带类型/稀有度索引和排序视图）
 
         # 基础属性（不包含装备加成）
         self.base_attack = 20  # 基础攻击力
@@ -131,73 +228,158 @@ class HeroGame:
             "frost": 0         # 冰霜效果剩余回合（减少防御力）
         }
         
-        # 初始化特殊效果属性
-        self.special_effects = {
-            "crit_rate": 0.0,      # 暴击率
-            "lifesteal": 0.0,      # 吸血率
-            "dodge": 0.0,          # 闪避率
-            "counter_attack": 0.0,   # 反击率
-            "ice_damage": 0,        # 冰霜伤害
-            "fire_damage": 0,       # 火焰伤害
-            "light_damage": 0,       # 光之伤害
-            "poison": 0,            # 中毒
-            "shadow_power": 0.0,     # 暗影之力
-            "fire_resistance": 0.0,  # 火焰抗性
-            "holy_resistance": 0.0,  # 神圣抗性
-            "stealth": 0.0,         # 潜行
-            "evasion": 0.0,         # 闪避
-            "wisdom": 0.0,          # 智慧
-            "mana_regeneration": 0,   # 法力恢复
-            "luck": 0.0,            # 幸运
-            "crit_damage": 0.0,      # 暴击伤害
-            "immortality": 0.0,      # 不死之身
-            "health_regeneration": 0,  # 生命恢复
-            "healing": 0.0,         # 治疗
-            "mana_boost": 0,         # 法力提升
-            "backstab": 0.0         # 背刺
-        }
-
-        # 初始化子系统
-        self.combat_system = CombatSystem(self)
-        self.equipment_system = EquipmentSystem(self)
-        self.event_system = EventSystem(self)
-        self.newbie_village = NewbieVillage(self)
-
-        # 初始化统计系统
+        # 初始化统计系统（战斗、装备、事件、新手村、成就和任务系统在首次使用时构建）
         self.statistics = GameStatistics()
         
-        # 初始化成就系统
-        self.achievements = AchievementSystem(self)
-        
-        # 初始化任务系统
-        self.quest_system = QuestSystem()
-        
         # 技能树系统将在职业选择后初始化
         self.skill_tree = None
 
+    @classmethod
+    def from_config(cls, config, renderer=None, clock=None, rng=None):
+        """按配置创建无需交互的游戏（已设置英雄名字、职业、地图和难度）
+
+        Args:
+            config: GameConfig
+            renderer: 输出渲染器
+            clock: 游戏时钟
+            rng: 注入的 random.Random 实例（优先于 config.seed）
+
+        Returns:
+            HeroGame: 游戏实例
+        """
+        config.validate()
+        game = cls(language=config.language, seed=config.seed, rng=rng, renderer=renderer, clock=clock)
+        game.apply_config(config)
+        return game
+
+    def apply_config(self, config):
+        """应用配置中的语言、英雄名字、职业、地图和难度（不涉及交互）"""
+        self.set_language(config.language)
+        self.hero_name = config.hero_name
+        self.setup_hero_class(config.hero_class)
+        self.setup_map_and_difficulty(config.difficulty, config.map_type)
+
+    def reset(self, config=None, rng=None, new_player=False):
+        """重新开始一局：只重置英雄状态
+
+        已加载的文本表、编译好的事件表、游戏设置和成就系统等子系统实例都会复用，
+        只有不保存状态的轻量子系统和任务系统在下次使用时重新构建。
+
+        Args:
+            config: GameConfig，指定时直接按配置完成英雄创建
+            rng: 注入的 random.Random 实例（优先于 config.seed）
+            new_player: 实例将交给另一个玩家（如预热池回收），同时恢复默认游戏设置
+        """
+        if config is not None:
+            config.validate()
+        seed = config.seed if config is not None else None
+        self.rng = GameRandom(rng=rng) if rng is not None else self.rng.renew(seed)
+
+        self._init_hero_state()
+        if new_player:
+            self.settings = GameSettings(self.language)
+        self.game_log = GameLog(self.language, self)
+        self.clock.reset()
+        self.reset_subsystems("combat_system", "event_system", "newbie_village", "quest_system")
+        equipment_system = self.__dict__.get("equipment_system")
+        if equipment_system is not None:
+            equipment_system.reset()
+
+        if config is not None:
+            self.apply_config(config)
+
+    def attach(self, renderer, clock):
+        """绑定输出渲染器和游戏时钟（如把预先构建的游戏交给新的会话连接）
+
+        子系统每次输出和停顿时都经由游戏对象取得渲染器和时钟，重新绑定后立即生效。
+
+        Args:
+            renderer: 输出渲染器
+            clock: 游戏时钟
+        """
+        self.renderer = renderer
+        self.renderer.game = self
+        self.clock = clock
+        self.clock.game = self
+
+    @LazySubsystem
+    def combat_system(self):
+        """战斗系统"""
+        from hero.combat import CombatSystem
+        return CombatSystem(self)
+
+    @LazySubsystem
+    def equipment_system(self):
+        """装备系统"""
+        from hero.equipment import EquipmentSystem
+        return EquipmentSystem(self)
+
+    @LazySubsystem
+    def event_system(self):
+        """事件系统"""
+        from hero.events import EventSystem
+        return EventSystem(self)
+
+    @LazySubsystem
+    def newbie_village(self):
+        """新手村"""
+        from hero.newbie_village import NewbieVillage
+        return NewbieVillage(self)
+
+    @LazySubsystem
+    def achievements(self):
+        """成就系统（构建时读取成就配置和存档文件）"""
+        from hero.achievements import AchievementSystem
+        return AchievementSystem(self)
+
+    @LazySubsystem
+    def quest_system(self):
+        """任务系统"""
+        from hero.quest import QuestSystem
+        return QuestSystem(get_stream(self, "quests"))
+
+    def reset_subsystems(self, *names):
+        """丢弃已构建的子系统，下次访问时重新构建
+
+        Args:
+            *names: 子系统属性名，为空时表示全部延迟构建的子系统
+        """
+        for name in names or self.LAZY_SUBSYSTEMS:
+            self.__dict__.pop(name, None)
+
+    def set_language(self, language):
+        """切换游戏语言
+
+        Args:
+            language: 语言代码（zh/en）
+        """
+        self.language = language
+        self.lang.set_language(language)
+        # 同步保存语言的子系统（战斗菜单等缓存按 lang.language 自动失效）
+        self.settings.language = language
+        self.game_log.language = language
+
     def select_language(self):
         """选择游戏语言"""
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('choose_language')}")
-        print(self.lang.get_text("block_separator"))
-        print()
-        print(f"1. {self.lang.get_text('chinese')}")
-        print(f"2. {self.lang.get_text('english')}")
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("choose_language", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
+        self.renderer.text("chinese", prefix="1. ")
+        self.renderer.text("english", prefix="2. ")
+        self.renderer.print()
 
         while True:
-            choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=["", "1", "2"], allow_empty=True)
+            choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=["", "1", "2"], allow_empty=True, renderer=self.renderer)
             if choice is None:
                 # 用户中断，退出游戏
                 sys.exit(0)
             elif choice == "" or choice == "1":
-                self.language = "zh"
-                self.lang.set_language("zh")
+                self.set_language("zh")
                 break
             elif choice == "2":
-                self.language = "en"
-                self.lang.set_language("en")
+                self.set_language("en")
                 break
 
     def select_map_and_difficulty(self):
@@ -206,20 +388,20 @@ class HeroGame:
         self.map_types = MAP_TYPES
 
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('select_map_difficulty')}")
-        print(self.lang.get_text("block_separator"))
-        print()
-
-        print(self.lang.get_text("select_difficulty"))
-        print(f"1. {self.lang.get_text('difficulty_easy')}")
-        print(f"2. {self.lang.get_text('difficulty_normal')}")
-        print(f"3. {self.lang.get_text('difficulty_hard')}")
-        print(f"4. {self.lang.get_text('difficulty_nightmare')}")
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("select_map_difficulty", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
+
+        self.renderer.text("select_difficulty")
+        self.renderer.text("difficulty_easy", prefix="1. ")
+        self.renderer.text("difficulty_normal", prefix="2. ")
+        self.renderer.text("difficulty_hard", prefix="3. ")
+        self.renderer.text("difficulty_nightmare", prefix="4. ")
+        self.renderer.print()
 
         while True:
-            choice = safe_input(f"{self.lang.get_text('enter_choice')} (2): ", valid_options=["", "1", "2", "3", "4"], allow_empty=True)
+            choice = safe_input(f"{self.lang.get_text('enter_choice')} (2): ", valid_options=["", "1", "2", "3", "4"], allow_empty=True, renderer=self.renderer)
             if choice is None:
                 # 用户中断，退出游戏
                 sys.exit(0)
@@ -237,23 +419,23 @@ class HeroGame:
                 break
 
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('select_map_type')}")
-        print(self.lang.get_text("block_separator"))
-        print()
-
-        print(self.lang.get_text("select_map_type"))
-        print(f"1. {self.lang.get_text('map_plains')} - {self.lang.get_text('plains_desc')}")
-        print(f"2. {self.lang.get_text('map_forest')} - {self.lang.get_text('forest_desc')}")
-        print(f"3. {self.lang.get_text('map_desert')} - {self.lang.get_text('desert_desc')}")
-        print(f"4. {self.lang.get_text('map_dungeon')} - {self.lang.get_text('dungeon_desc')}")
-        print(f"5. {self.lang.get_text('map_mountain')} - {self.lang.get_text('mountain_desc')}")
-        print(f"6. {self.lang.get_text('map_swamp')} - {self.lang.get_text('swamp_desc')}")
-        print(f"7. {self.lang.get_text('map_snowfield')} - {self.lang.get_text('snowfield_desc')}")
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("select_map_type", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
+
+        self.renderer.text("select_map_type")
+        self.renderer.print(f"1. {self.lang.get_text('map_plains')} - {self.lang.get_text('plains_desc')}")
+        self.renderer.print(f"2. {self.lang.get_text('map_forest')} - {self.lang.get_text('forest_desc')}")
+        self.renderer.print(f"3. {self.lang.get_text('map_desert')} - {self.lang.get_text('desert_desc')}")
+        self.renderer.print(f"4. {self.lang.get_text('map_dungeon')} - {self.lang.get_text('dungeon_desc')}")
+        self.renderer.print(f"5. {self.lang.get_text('map_mountain')} - {self.lang.get_text('mountain_desc')}")
+        self.renderer.print(f"6. {self.lang.get_text('map_swamp')} - {self.lang.get_text('swamp_desc')}")
+        self.renderer.print(f"7. {self.lang.get_text('map_snowfield')} - {self.lang.get_text('snowfield_desc')}")
+        self.renderer.print()
 
         while True:
-            choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=["", "1", "2", "3", "4", "5", "6", "7"], allow_empty=True)
+            choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=["", "1", "2", "3", "4", "5", "6", "7"], allow_empty=True, renderer=self.renderer)
             if choice is None:
                 # 用户中断，退出游戏
                 sys.exit(0)
@@ -280,6 +462,34 @@ class HeroGame:
                 break
 
         # 应用难度设置
+        self.setup_map_and_difficulty(self.difficulty, self.map_type)
+
+        self.clear_screen()
+        self.renderer.text("block_separator")
+        self.renderer.text("game_settings", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
+        self.renderer.print(f"{self.lang.get_text('difficulty')}: {self.lang.get_text('difficulty_' + self.difficulty)}")
+        self.renderer.print(f"{self.lang.get_text('map_type')}: {self.lang.get_text('map_' + self.map_type)}")
+        self.renderer.print(f"{self.lang.get_text('map_length')}: {self.map_length}")
+        self.renderer.print()
+        user_input = safe_input(self.lang.get_text("continue_prompt"), renderer=self.renderer)
+        if user_input is None:
+            # 用户中断，退出游戏
+            sys.exit(0)
+
+    def setup_map_and_difficulty(self, difficulty, map_type):
+        """设置地图类型和难度（不涉及交互），并应用难度对应的初始资源
+
+        Args:
+            difficulty: 难度键名（easy/normal/hard/nightmare）
+            map_type: 地图类型键名
+        """
+        self.difficulty_settings = DIFFICULTY_SETTINGS
+        self.map_types = MAP_TYPES
+        self.difficulty = difficulty
+        self.map_type = map_type
+
         settings = self.difficulty_settings[self.difficulty]
         self.map_length = settings["map_length"]
         self.hero_gold = settings["gold_start"]
@@ -288,38 +498,24 @@ class HeroGame:
         # 更新visited_positions数组大小
         self.visited_positions = [False] * self.map_length
 
-        self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('game_settings')}")
-        print(self.lang.get_text("block_separator"))
-        print()
-        print(f"{self.lang.get_text('difficulty')}: {self.lang.get_text('difficulty_' + self.difficulty)}")
-        print(f"{self.lang.get_text('map_type')}: {self.lang.get_text('map_' + self.map_type)}")
-        print(f"{self.lang.get_text('map_length')}: {self.map_length}")
-        print()
-        user_input = safe_input(self.lang.get_text("continue_prompt"))
-        if user_input is None:
-            # 用户中断，退出游戏
-            sys.exit(0)
-
     def clear_screen(self):
         """清屏函数"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.renderer.clear()
 
     def show_welcome(self):
         """显示欢迎界面"""
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('welcome_title')}")
-        print(self.lang.get_text("block_separator"))
-        print()
-        print(self.lang.get_text("welcome_desc1"))
-        print(self.lang.get_text("welcome_desc2"))
-        print(self.lang.get_text("welcome_desc3"))
-        print(self.lang.get_text("welcome_desc4"))
-        print(self.lang.get_text("welcome_desc5"))
-        print()
-        user_input = safe_input(self.lang.get_text("continue_prompt"))
+        self.renderer.text("block_separator")
+        self.renderer.text("welcome_title", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
+        self.renderer.text("welcome_desc1")
+        self.renderer.text("welcome_desc2")
+        self.renderer.text("welcome_desc3")
+        self.renderer.text("welcome_desc4")
+        self.renderer.text("welcome_desc5")
+        self.renderer.print()
+        user_input = safe_input(self.lang.get_text("continue_prompt"), renderer=self.renderer)
         if user_input is None:
             # 用户中断，退出游戏
             sys.exit(0)
@@ -327,13 +523,13 @@ class HeroGame:
     def get_hero_name(self):
         """获取英雄名字"""
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('hero_creation')}")
-        print(self.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("hero_creation", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
         while True:
-            name = safe_input(self.lang.get_text("enter_name"))
+            name = safe_input(self.lang.get_text("enter_name"), renderer=self.renderer)
             if name is None:
                 # 用户中断，退出游戏
                 sys.exit(0)
@@ -341,15 +537,15 @@ class HeroGame:
                 self.hero_name = name
                 break
             else:
-                print(self.lang.get_text("name_empty"))
+                self.renderer.text("name_empty")
     
     def select_hero_class(self):
         """选择英雄职业"""
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('class_selection')}")
-        print(self.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("class_selection", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
         
         # 显示三个职业选项
         class_options = {
@@ -360,13 +556,13 @@ class HeroGame:
         
         for num, class_key in class_options.items():
             class_info = CLASS_DEFINITIONS[class_key]
-            print(f"{num}. {self.lang.get_text(class_info['name_key'])}")
-            print(f"   {self.lang.get_text(class_info['description_key'])}")
-            print(f"   {self.lang.get_text('class_attributes')}: {self.lang.get_text('attack')}={class_info['base_attributes']['attack']}, {self.lang.get_text('defense')}={class_info['base_attributes']['defense']}, {self.lang.get_text('max_hp')}={class_info['base_attributes']['max_hp']}")
-            print()
+            self.renderer.print(f"{num}. {self.lang.get_text(class_info['name_key'])}")
+            self.renderer.print(f"   {self.lang.get_text(class_info['description_key'])}")
+            self.renderer.print(f"   {self.lang.get_text('class_attributes')}: {self.lang.get_text('attack')}={class_info['base_attributes']['attack']}, {self.lang.get_text('defense')}={class_info['base_attributes']['defense']}, {self.lang.get_text('max_hp')}={class_info['base_attributes']['max_hp']}")
+            self.renderer.print()
         
         while True:
-            choice = safe_input(self.lang.get_text("choose_your_class"), valid_options=list(class_options.keys()))
+            choice = safe_input(self.lang.get_text("choose_your_class"), valid_options=list(class_options.keys()), renderer=self.renderer)
             if choice is None:
                 # 用户中断，退出游戏
                 sys.exit(0)
@@ -375,49 +571,60 @@ class HeroGame:
                 class_info = CLASS_DEFINITIONS[selected_class]
                 
                 # 确认选择
-                print()
+                self.renderer.print()
                 class_name = self.lang.get_text(class_info['name_key'])
                 confirm_text = self.lang.get_text("confirm_class_selection").format(
                     hero_class=class_name
                 )
-                confirm = safe_input(confirm_text).strip().lower()
+                confirm = safe_input(confirm_text, renderer=self.renderer).strip().lower()
                 
                 if confirm is None:
                     # 用户中断，退出游戏
                     sys.exit(0)
                 elif confirm in self.lang.get_text("yes_options"):
-                    self.hero_class = selected_class
-                    print()
-                    print(self.lang.get_text("class_selected").format(
+                    self.renderer.print()
+                    self.renderer.print(self.lang.get_text("class_selected").format(
                         hero_class=class_name
                     ))
                     
-                    # 应用职业基础属性
-                    self.apply_class_attributes(selected_class)
-                    
-                    # 初始化技能树系统
-                    self.skill_tree = SkillTree(selected_class, self.lang)
-                    
-                    # 添加职业初始技能（使用 skill_id）
-                    for skill in class_info['starting_skills']:
-                        self.hero_skills.append(skill)  # 存储 skill_id 而不是技能名称
-                        # 学习初始技能
-                        if skill in self.skill_tree.skill_nodes:
-                            self.skill_tree.learned_skills[skill] = 1
-                            self.skill_tree.skill_nodes[skill].current_level = 1
-                    
-                    # 更新技能树可用性
-                    self.skill_tree._update_skill_availability()
+                    # 应用职业属性并初始化技能树
+                    self.setup_hero_class(selected_class)
                     
-                    print()
-                    user_input = safe_input(self.lang.get_text("continue_prompt"))
+                    self.renderer.print()
+                    user_input = safe_input(self.lang.get_text("continue_prompt"), renderer=self.renderer)
                     if user_input is None:
                         # 用户中断，退出游戏
                         sys.exit(0)
                     break
                 else:
-                    print(f"{self.lang.get_text('invalid_choice')} (1-3)")
+                    self.renderer.text("invalid_choice", suffix=" (1-3)")
     
+    def setup_hero_class(self, class_key):
+        """设置英雄职业（不涉及交互）：应用职业属性、初始化技能树并学习初始技能
+
+        Args:
+            class_key: 职业键名（warrior/mage/assassin）
+        """
+        class_info = CLASS_DEFINITIONS[class_key]
+        self.hero_class = class_key
+        
+        # 应用职业基础属性
+        self.apply_class_attributes(class_key)
+        
+        # 初始化技能树系统
+        from hero.skill_tree import SkillTree
+        self.skill_tree = SkillTree(class_key, self.lang)
+        
+        # 添加职业初始技能（使用 skill_id）
+        for skill in class_info['starting_skills']:
+            self.hero_skills.append(skill)  # 存储 skill_id 而不是技能名称
+            # 学习初始技能
+            if skill in self.skill_tree.skill_nodes:
+                self.skill_tree.set_skill_level(skill, 1)
+        
+        # 更新技能树可用性
+        self.skill_tree._update_skill_availability()
+
     def apply_class_attributes(self, class_key):
         """应用职业属性加成"""
         class_info = CLASS_DEFINITIONS[class_key]
@@ -449,44 +656,39 @@ class HeroGame:
         return growth_multipliers.get(attribute, 1.0)
 
     def show_hero_info(self):
-        """显示英雄信息"""
-        print(f"\n【{self.hero_name}】 Lv.{self.hero_level}")
+        """显示英雄信息（一帧输出；无人观看时跳过构建）"""
+        if not self.renderer.enabled:
+            return
+        with self.renderer.frame():
+            self._render_hero_info()
+
+    def _render_hero_info(self):
+        """输出英雄信息面板"""
+        self.renderer.print(f"\n【{self.hero_name}】 Lv.{self.hero_level}")
         if self.hero_class:
             class_name = self.lang.get_text(f"class_{self.hero_class}")
-            print(f"⚔️  {self.lang.get_text('class')}: {class_name}")
-        print(f"❤️  {self.lang.get_text('hp')}{self.lang.get_text('item_separator')}{self.hero_hp}/{self.hero_max_hp}")
-        print(f"⚔️  {self.lang.get_text('attack')}{self.lang.get_text('item_separator')}{self.hero_attack}")
-        print(f"🛡️  {self.lang.get_text('defense')}{self.lang.get_text('item_separator')}{self.hero_defense}")
-        print(f"💰  {self.lang.get_text('gold')}{self.lang.get_text('item_separator')}{self.hero_gold}")
-        print(f"⭐  {self.lang.get_text('exp')}{self.lang.get_text('item_separator')}{self.hero_exp}")
-        print(f"🧪  {self.lang.get_text('potions')}{self.lang.get_text('item_separator')}{self.hero_potions}")
+            self.renderer.line("hero_class", class_name=class_name)
+        self.renderer.line("hero_hp", hp=self.hero_hp, max_hp=self.hero_max_hp)
+        self.renderer.line("hero_attack", attack=self.hero_attack)
+        self.renderer.line("hero_defense", defense=self.hero_defense)
+        self.renderer.line("hero_gold", gold=self.hero_gold)
+        self.renderer.line("hero_exp", exp=self.hero_exp)
+        self.renderer.line("hero_potions", potions=self.hero_potions)
         
         # 如果是法师，显示法力值
         if self.hero_class == "mage" and hasattr(self, 'class_max_mana'):
-            print(f"💧  {self.lang.get_text('mana')}{self.lang.get_text('item_separator')}{self.class_mana}/{self.class_max_mana}")
+            self.renderer.line("hero_mana", mana=self.class_mana, max_mana=self.class_max_mana)
         
         # 显示技能点
         if self.skill_tree:
-            print(f"⭐  {self.lang.get_text('skill_points')}{self.lang.get_text('item_separator')}{self.skill_points}")
+            self.renderer.line("hero_skill_points", skill_points=self.skill_points)
         
         # 使用统一的多语言格式化函数处理位置显示
         position_text = self.lang.format_text("position_format", self.hero_position+1, self.map_length)
-        print(f"📍  {self.lang.get_text('position')}{self.lang.get_text('item_separator')}{position_text}")
+        self.renderer.line("hero_position", position=position_text)
 
         # 显示装备信息（包括属性和附魔）
-        from hero.equipment import EquipmentSystem
-        equip_system = EquipmentSystem(self)
-        
-        # 装备颜色代码
-        def get_rarity_color(rarity):
-            colors = {
-                "common": "\033[37m",      # 白色
-                "uncommon": "\033[32m",    # 绿色
-                "rare": "\033[34m",        # 蓝色
-                "epic": "\033[35m",        # 紫色
-                "legendary": "\033[33m"    # 金色
-            }
-            return colors.get(rarity, "\033[37m")
+        equip_system = self.equipment_system
         
         def get_equipment_display(item):
             if item is None:
@@ -494,7 +696,7 @@ class HeroGame:
                 
             # 获取稀有度名称和颜色
             rarity_name = self.lang.get_text(f"rarity_{item['rarity']}")
-            color = get_rarity_color(item["rarity"])
+            color = equip_system.get_rarity_color(item["rarity"])
             reset_color = "\033[0m"
             
             # 获取装备名称（包括强化和传说属性）
@@ -532,15 +734,15 @@ class HeroGame:
         
         # 显示武器
         weapon_display, _ = get_equipment_display(self.equipment["weapon"])
-        print(f"🗡️  {self.lang.get_text('weapon')}{self.lang.get_text('item_separator')}{weapon_display}")
+        self.renderer.print(f"🗡️  {self.lang.get_text('weapon')}{self.lang.get_text('item_separator')}{weapon_display}")
         
         # 显示护甲
         armor_display, _ = get_equipment_display(self.equipment["armor"])
-        print(f"🛡️  {self.lang.get_text('armor')}{self.lang.get_text('item_separator')}{armor_display}")
+        self.renderer.print(f"🛡️  {self.lang.get_text('armor')}{self.lang.get_text('item_separator')}{armor_display}")
         
         # 显示饰品
         accessory_display, _ = get_equipment_display(self.equipment["accessory"])
-        print(f"💍  {self.lang.get_text('accessory')}{self.lang.get_text('item_separator')}{accessory_display}")
+        self.renderer.print(f"💍  {self.lang.get_text('accessory')}{self.lang.get_text('item_separator')}{accessory_display}")
 
         # 显示技能（使用 skill_id 从 hero_skills 获取技能名称和等级）
         if self.hero_skills:
@@ -575,11 +777,13 @@ class HeroGame:
                 else:
                     skill_info.append(skill_name)
                 
-            print(f"🔥  {self.lang.get_text('skills')}{self.lang.get_text('item_separator')}{', '.join(skill_info)}")
-        print()
+            self.renderer.print(f"🔥  {self.lang.get_text('skills')}{self.lang.get_text('item_separator')}{', '.join(skill_info)}")
+        self.renderer.print()
 
     def draw_map(self):
         """绘制地图"""
+        if not self.renderer.enabled:
+            return
         map_visual = ""
         # 使用统一的多语言格式化函数获取英雄标记
         hero_marker = self.lang.format_text("hero_marker")
@@ -588,7 +792,7 @@ class HeroGame:
                 map_visual += f"[{hero_marker}]"
             else:
                 map_visual += "[__]"
-        print(f"\n{self.lang.get_text('map')}{self.lang.get_text('item_separator')}{map_visual}")
+        self.renderer.line("map_line", map_visual=map_visual)
 
     def start_game(self):
         """开始游戏"""
@@ -599,20 +803,20 @@ class HeroGame:
         """显示主菜单"""
         while True:
             self.clear_screen()
-            print(self.lang.get_text("block_separator"))
-            print(f"          {self.lang.get_text('main_menu')}")
-            print(self.lang.get_text("block_separator"))
-            print()
-            print(f"1. {self.lang.get_text('new_game')}")
-            print(f"2. {self.lang.get_text('load_game')}")
-            print(f"3. {self.lang.get_text('view_statistics')}")
-            print(f"4. {self.lang.get_text('achievements')}")
-            print(f"5. {self.lang.get_text('view_game_log')}")
-            print(f"6. {self.lang.get_text('settings')}")
-            print(f"7. {self.lang.get_text('exit_game')}")
-            print()
-
-            choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=["", "1", "2", "3", "4", "5", "6", "7"], allow_empty=True)
+            self.renderer.text("block_separator")
+            self.renderer.text("main_menu", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
+            self.renderer.text("new_game", prefix="1. ")
+            self.renderer.text("load_game", prefix="2. ")
+            self.renderer.text("view_statistics", prefix="3. ")
+            self.renderer.text("achievements", prefix="4. ")
+            self.renderer.text("view_game_log", prefix="5. ")
+            self.renderer.text("settings", prefix="6. ")
+            self.renderer.text("exit_game", prefix="7. ")
+            self.renderer.print()
+
+            choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=["", "1", "2", "3", "4", "5", "6", "7"], allow_empty=True, renderer=self.renderer)
             if choice is None:
                 return
 
@@ -626,10 +830,10 @@ class HeroGame:
                 self.newbie_village.newbie_village()
 
                 self.clear_screen()
-                print(self.lang.get_text("block_separator"))
-                print(f"          {self.lang.get_text('game_start')}, {self.hero_name}!")
-                print(self.lang.get_text("block_separator"))
-                time.sleep(1)
+                self.renderer.text("block_separator")
+                self.renderer.print(f"          {self.lang.get_text('game_start')}, {self.hero_name}!")
+                self.renderer.text("block_separator")
+                self.clock.pause(1)
 
                 self.game_loop()
                 self.restart_game()
@@ -640,10 +844,10 @@ class HeroGame:
                 if self.load_game_menu():
                     # 如果加载成功，进入游戏循环
                     self.clear_screen()
-                    print(self.lang.get_text("block_separator"))
-                    print(f"          {self.lang.get_text('load_success')}, {self.hero_name}!")
-                    print(self.lang.get_text("block_separator"))
-                    time.sleep(1)
+                    self.renderer.text("block_separator")
+                    self.renderer.print(f"          {self.lang.get_text('load_success')}, {self.hero_name}!")
+                    self.renderer.text("block_separator")
+                    self.clock.pause(1)
 
                     self.game_loop()
                     self.restart_game()
@@ -667,36 +871,36 @@ class HeroGame:
 
             elif choice == "7":
                 # 退出游戏
-                print("\n" + self.lang.get_text("goodbye"))
+                self.renderer.print("\n" + self.lang.get_text("goodbye"))
                 sys.exit(0)
 
             else:
-                print(self.lang.get_text("invalid_choice"))
-                time.sleep(1)
+                self.renderer.text("invalid_choice")
+                self.clock.pause(1)
 
     def show_game_log_menu(self):
         """显示游戏日志菜单"""
         while True:
             self.clear_screen()
-            print(self.lang.get_text("block_separator"))
-            print(f"          {self.lang.get_text('game_log_menu')}")
-            print(self.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("game_log_menu", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
             
             # 显示日志统计
             stats = self.game_log.get_statistics()
-            print(f"{self.lang.get_text('total_log_entries')}: {stats['total_entries']}")
+            self.renderer.print(f"{self.lang.get_text('total_log_entries')}: {stats['total_entries']}")
             
             # 显示选项
-            print(f"\n1. {self.lang.get_text('recent_logs')}")
-            print(f"2. {self.lang.get_text('all_logs')}")
-            print(f"3. {self.lang.get_text('filter_by_type')}")
-            print(f"4. {self.lang.get_text('log_statistics')}")
-            print(f"5. {self.lang.get_text('clear_log')}")
-            print(f"0. {self.lang.get_text('back_to_main')}")
-            print()
-
-            choice = safe_input(f"{self.lang.get_text('enter_choice')} (0): ", valid_options=["", "0", "1", "2", "3", "4", "5"], allow_empty=True)
+            self.renderer.text("recent_logs", prefix="\n1. ")
+            self.renderer.text("all_logs", prefix="2. ")
+            self.renderer.text("filter_by_type", prefix="3. ")
+            self.renderer.text("log_statistics", prefix="4. ")
+            self.renderer.text("clear_log", prefix="5. ")
+            self.renderer.text("back_to_main", prefix="0. ")
+            self.renderer.print()
+
+            choice = safe_input(f"{self.lang.get_text('enter_choice')} (0): ", valid_options=["", "0", "1", "2", "3", "4", "5"], allow_empty=True, renderer=self.renderer)
             if choice is None:
                 return
 
@@ -716,34 +920,34 @@ class HeroGame:
                 self.game_log.show_statistics()
             elif choice == "5":
                 # 清空日志
-                confirm = safe_input(f"{self.lang.get_text('clear_log')}? (y/n): ").strip().lower()
+                confirm = safe_input(f"{self.lang.get_text('clear_log')}? (y/n): ", renderer=self.renderer).strip().lower()
                 if confirm is not None and confirm in ['y', 'yes']:
                     self.game_log.clear_log()
-                    print(f"\n{self.lang.get_text('log_cleared')}")
-                    time.sleep(1)
+                    self.renderer.text("log_cleared", prefix="\n")
+                    self.clock.pause(1)
             else:
-                print(f"\n{self.lang.get_text('invalid_choice')}")
-                time.sleep(1)
+                self.renderer.text("invalid_choice", prefix="\n")
+                self.clock.pause(1)
 
     def show_log_filter_menu(self):
         """显示日志筛选菜单"""
         while True:
             self.clear_screen()
-            print(self.lang.get_text("block_separator"))
-            print(f"          {self.lang.get_text('filter_by_type')}")
-            print(self.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("filter_by_type", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
             
-            print(f"1. {self.lang.get_text('combat_logs')}")
-            print(f"2. {self.lang.get_text('event_logs')}")
-            print(f"3. {self.lang.get_text('item_logs')}")
-            print(f"4. {self.lang.get_text('level_logs')}")
-            print(f"5. {self.lang.get_text('movement_logs')}")
-            print(f"6. {self.lang.get_text('achievement_logs')}")
-            print(f"0. {self.lang.get_text('back')}")
-            print()
-
-            choice = safe_input(f"{self.lang.get_text('enter_choice')} (0): ", valid_options=["", "0", "1", "2", "3", "4", "5"], allow_empty=True)
+            self.renderer.text("combat_logs", prefix="1. ")
+            self.renderer.text("event_logs", prefix="2. ")
+            self.renderer.text("item_logs", prefix="3. ")
+            self.renderer.text("level_logs", prefix="4. ")
+            self.renderer.text("movement_logs", prefix="5. ")
+            self.renderer.text("achievement_logs", prefix="6. ")
+            self.renderer.text("back", prefix="0. ")
+            self.renderer.print()
+
+            choice = safe_input(f"{self.lang.get_text('enter_choice')} (0): ", valid_options=["", "0", "1", "2", "3", "4", "5"], allow_empty=True, renderer=self.renderer)
             if choice is None:
                 return
 
@@ -762,8 +966,8 @@ class HeroGame:
             elif choice == "6":
                 self.game_log.show_logs_by_type("achievement")
             else:
-                print(f"\n{self.lang.get_text('invalid_choice')}")
-                time.sleep(1)
+                self.renderer.text("invalid_choice", prefix="\n")
+                self.clock.pause(1)
 
     def show_settings_menu(self):
         """
@@ -771,20 +975,20 @@ class HeroGame:
         """
         while True:
             self.clear_screen()
-            print(self.lang.get_text("block_separator"))
-            print(f"          {self.lang.get_text('settings')}")
-            print(self.lang.get_text("block_separator"))
-            print()
-            print(f"1. {self.lang.get_text('text_speed')}: {self._get_speed_description()}")
-            print(f"2. {self.lang.get_text('auto_save')}: {self._get_auto_save_description()}")
-            print(f"3. {self.lang.get_text('event_detail')}: {self._get_event_detail_description()}")
-            print(f"4. {self.lang.get_text('combat_animations')}: {self.lang.get_text('on') if self.settings.combat_animations else self.lang.get_text('off')}")
-            print(f"5. {self.lang.get_text('combat_log_level')}: {self._get_combat_log_description()}")
-            print()
-            print(f"0. {self.lang.get_text('back_to_main')}")
-            print()
-
-            choice = safe_input(f"{self.lang.get_text('enter_choice')} (0): ", valid_options=["", "0", "1", "2", "3", "4", "5"], allow_empty=True)
+            self.renderer.text("block_separator")
+            self.renderer.text("settings", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
+            self.renderer.print(f"1. {self.lang.get_text('text_speed')}: {self._get_speed_description()}")
+            self.renderer.print(f"2. {self.lang.get_text('auto_save')}: {self._get_auto_save_description()}")
+            self.renderer.print(f"3. {self.lang.get_text('event_detail')}: {self._get_event_detail_description()}")
+            self.renderer.print(f"4. {self.lang.get_text('combat_animations')}: {self.lang.get_text('on') if self.settings.combat_animations else self.lang.get_text('off')}")
+            self.renderer.print(f"5. {self.lang.get_text('combat_log_level')}: {self._get_combat_log_description()}")
+            self.renderer.print()
+            self.renderer.text("back_to_main", prefix="0. ")
+            self.renderer.print()
+
+            choice = safe_input(f"{self.lang.get_text('enter_choice')} (0): ", valid_options=["", "0", "1", "2", "3", "4", "5"], allow_empty=True, renderer=self.renderer)
             if choice is None:
                 return
 
@@ -806,8 +1010,8 @@ class HeroGame:
                 # 修改战斗日志详细程度
                 self._change_combat_log()
             else:
-                print(f"\n{self.lang.get_text('invalid_choice')}")
-                time.sleep(1)
+                self.renderer.text("invalid_choice", prefix="\n")
+                self.clock.pause(1)
 
     def _get_speed_description(self):
         """获取文本速度描述"""
@@ -862,25 +1066,25 @@ class HeroGame:
         ]
         
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('text_speed')}")
-        print(self.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("text_speed", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
         
         for choice, description, value in options:
             selected = "✓ " if self.settings.text_speed == value else "  "
-            print(f"{choice}. [{selected}] {description}")
+            self.renderer.print(f"{choice}. [{selected}] {description}")
         
-        print()
-        choice = safe_input(f"{self.lang.get_text('enter_choice')} (2): ", valid_options=[option[0] for option in options], allow_empty=True)
+        self.renderer.print()
+        choice = safe_input(f"{self.lang.get_text('enter_choice')} (2): ", valid_options=[option[0] for option in options], allow_empty=True, renderer=self.renderer)
         if choice is None:
             return
         
         for option_choice, description, value in options:
             if choice == option_choice:
                 self.settings.text_speed = value
-                print(f"\n{self.lang.get_text('setting_updated')}")
-                time.sleep(1)
+                self.renderer.text("setting_updated", prefix="\n")
+                self.clock.pause(1)
                 break
 
     def _change_auto_save(self):
@@ -893,25 +1097,25 @@ class HeroGame:
         ]
         
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('auto_save')}")
-        print(self.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("auto_save", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
         
         for choice, description, value in options:
             selected = "✓ " if self.settings.auto_save_interval == value else "  "
-            print(f"{choice}. [{selected}] {description}")
+            self.renderer.print(f"{choice}. [{selected}] {description}")
         
-        print()
-        choice = safe_input(f"{self.lang.get_text('enter_choice')} (0): ", valid_options=[option[0] for option in options], allow_empty=True)
+        self.renderer.print()
+        choice = safe_input(f"{self.lang.get_text('enter_choice')} (0): ", valid_options=[option[0] for option in options], allow_empty=True, renderer=self.renderer)
         if choice is None:
             return
         
         for option_choice, description, value in options:
             if choice == option_choice:
                 self.settings.auto_save_interval = value
-                print(f"\n{self.lang.get_text('setting_updated')}")
-                time.sleep(1)
+                self.renderer.text("setting_updated", prefix="\n")
+                self.clock.pause(1)
                 break
 
     def _change_event_detail(self):
@@ -923,25 +1127,25 @@ class HeroGame:
         ]
         
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('event_detail')}")
-        print(self.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("event_detail", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
         
         for choice, description, value in options:
             selected = "✓ " if self.settings.event_detail_level == value else "  "
-            print(f"{choice}. [{selected}] {description}")
+            self.renderer.print(f"{choice}. [{selected}] {description}")
         
-        print()
-        choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=[option[0] for option in options], allow_empty=True)
+        self.renderer.print()
+        choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=[option[0] for option in options], allow_empty=True, renderer=self.renderer)
         if choice is None:
             return
         
         for option_choice, description, value in options:
             if choice == option_choice:
                 self.settings.event_detail_level = value
-                print(f"\n{self.lang.get_text('setting_updated')}")
-                time.sleep(1)
+                self.renderer.text("setting_updated", prefix="\n")
+                self.clock.pause(1)
                 break
 
     def _change_combat_log(self):
@@ -953,25 +1157,25 @@ class HeroGame:
         ]
         
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('combat_log_level')}")
-        print(self.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("combat_log_level", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
         
         for choice, description, value in options:
             selected = "✓ " if self.settings.combat_log_level == value else "  "
-            print(f"{choice}. [{selected}] {description}")
+            self.renderer.print(f"{choice}. [{selected}] {description}")
         
-        print()
-        choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=[option[0] for option in options], allow_empty=True)
+        self.renderer.print()
+        choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=[option[0] for option in options], allow_empty=True, renderer=self.renderer)
         if choice is None:
             return
         
         for option_choice, description, value in options:
             if choice == option_choice:
                 self.settings.combat_log_level = value
-                print(f"\n{self.lang.get_text('setting_updated')}")
-                time.sleep(1)
+                self.renderer.text("setting_updated", prefix="\n")
+                self.clock.pause(1)
                 break
 
     def load_game_menu(self):
@@ -981,36 +1185,37 @@ class HeroGame:
         Returns:
             bool: 是否成功加载存档
         """
-        save_manager = SaveManager()
+        from hero.save_data import SaveManager
+        save_manager = SaveManager(game=self)
 
         while True:
             self.clear_screen()
-            print(self.lang.get_text("block_separator"))
-            print(f"          {self.lang.get_text('load_game')}")
-            print(self.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("load_game", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
 
             # 列出所有存档槽位
             slots = save_manager.list_save_slots()
 
             for slot_info in slots:
                 if slot_info.get("empty"):
-                    print(f"{slot_info['slot']}. {self.lang.get_text('save_slot_empty')} {slot_info['slot']} - {self.lang.get_text('empty_slot')}")
+                    self.renderer.print(f"{slot_info['slot']}. {self.lang.get_text('save_slot_empty')} {slot_info['slot']} - {self.lang.get_text('empty_slot')}")
                 else:
                     position_text = self.lang.format_text("position_format",
                                                           slot_info['position'] + 1,
                                                           slot_info['map_length'])
-                    print(f"{slot_info['slot']}. {self.lang.get_text('save_slot_info')}: {slot_info['hero_name']} | "
+                    self.renderer.print(f"{slot_info['slot']}. {self.lang.get_text('save_slot_info')}: {slot_info['hero_name']} | "
                           f"{self.lang.get_text('save_slot_level')}: {slot_info['hero_level']} | "
                           f"{self.lang.get_text('map_type')}: {self.lang.get_text('map_' + slot_info['map_type'])} | "
                           f"{self.lang.get_text('difficulty')}: {self.lang.get_text('difficulty_' + slot_info['difficulty'])} | "
                           f"{self.lang.get_text('save_slot_position')}: {position_text}")
 
-            print()
-            print(f"0. {self.lang.get_text('return_to_main')}")
-            print()
+            self.renderer.print()
+            self.renderer.text("return_to_main", prefix="0. ")
+            self.renderer.print()
 
-            choice = safe_input(f"{self.lang.get_text('enter_choice')}: ", valid_options=["0", "1", "2", "3"])
+            choice = safe_input(f"{self.lang.get_text('enter_choice')}: ", valid_options=["0", "1", "2", "3"], renderer=self.renderer)
             if choice is None:
                 return False
 
@@ -1028,34 +1233,34 @@ class HeroGame:
                         self.load_from_save_data(save_data)
                         return True
                     else:
-                        print(f"\n{self.lang.get_text('no_save_slot')}")
+                        self.renderer.text("no_save_slot", prefix="\n")
                         try:
-                            input(f"{self.lang.get_text('continue_prompt')}")
+                            read_input(f"{self.lang.get_text('continue_prompt')}")
                         except (KeyboardInterrupt, EOFError):
-                            print("\n操作被用户中断。")
+                            self.renderer.print("\n操作被用户中断。")
                             return False
                 else:
-                    print(self.lang.get_text("invalid_choice"))
+                    self.renderer.text("invalid_choice")
                     try:
-                        input(f"{self.lang.get_text('continue_prompt')}")
+                        read_input(f"{self.lang.get_text('continue_prompt')}")
                     except (KeyboardInterrupt, EOFError):
-                        print("\n操作被用户中断。")
+                        self.renderer.print("\n操作被用户中断。")
                         return False
             except ValueError:
-                print(self.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
                 try:
-                    input(f"{self.lang.get_text('continue_prompt')}")
+                    read_input(f"{self.lang.get_text('continue_prompt')}")
                 except (KeyboardInterrupt, EOFError):
-                    print("\n操作被用户中断。")
+                    self.renderer.print("\n操作被用户中断。")
                     return False
     def show_statistics(self):
         """显示统计数据"""
         self.clear_screen()
-        print(self.statistics.format_summary(self.lang))
+        self.renderer.print(self.statistics.format_summary(self.lang))
         try:
-            input(f"\n{self.lang.get_text('continue_prompt')}")
+            read_input(f"\n{self.lang.get_text('continue_prompt')}")
         except (KeyboardInterrupt, EOFError):
-            print("\n操作被用户中断。")
+            self.renderer.print("\n操作被用户中断。")
 
     def show_statistics_menu(self):
         """显示统计菜单"""
@@ -1064,42 +1269,43 @@ class HeroGame:
         temp_stats = GameStatistics()
 
         self.clear_screen()
-        print(temp_stats.format_summary(self.lang))
+        self.renderer.print(temp_stats.format_summary(self.lang))
         try:
-            input(f"\n{self.lang.get_text('continue_prompt')}")
+            read_input(f"\n{self.lang.get_text('continue_prompt')}")
         except (KeyboardInterrupt, EOFError):
-            print("\n操作被用户中断。")
+            self.renderer.print("\n操作被用户中断。")
 
     def save_game_menu(self):
         """保存游戏菜单"""
-        save_manager = SaveManager()
+        from hero.save_data import SaveManager
+        save_manager = SaveManager(game=self)
 
         while True:
             self.clear_screen()
-            print(self.lang.get_text("block_separator"))
-            print(f"          {self.lang.get_text('save_game')}")
-            print(self.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("save_game", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
 
             # 列出所有存档槽位
             slots = save_manager.list_save_slots()
 
             for slot_info in slots:
                 if slot_info.get("empty"):
-                    print(f"{slot_info['slot']}. {self.lang.get_text('save_slot_empty')} {slot_info['slot']} - {self.lang.get_text('empty_slot')}")
+                    self.renderer.print(f"{slot_info['slot']}. {self.lang.get_text('save_slot_empty')} {slot_info['slot']} - {self.lang.get_text('empty_slot')}")
                 else:
                     position_text = self.lang.format_text("position_format",
                                                           slot_info['position'] + 1,
                                                           slot_info['map_length'])
-                    print(f"{slot_info['slot']}. {self.lang.get_text('save_slot_info')}: {slot_info['hero_name']} | "
+                    self.renderer.print(f"{slot_info['slot']}. {self.lang.get_text('save_slot_info')}: {slot_info['hero_name']} | "
                           f"{self.lang.get_text('save_slot_level')}: {slot_info['hero_level']} | "
                           f"{self.lang.get_text('save_slot_time')}: {slot_info['save_time']}")
 
-            print()
-            print(f"0. {self.lang.get_text('return_to_game')}")
-            print()
+            self.renderer.print()
+            self.renderer.text("return_to_game", prefix="0. ")
+            self.renderer.print()
 
-            choice = safe_input(f"{self.lang.get_text('enter_choice')}: ", valid_options=["0", "1", "2", "3", "4", "5"])
+            choice = safe_input(f"{self.lang.get_text('enter_choice')}: ", valid_options=["1", "2", "3", "4", "5", "0"], decision="save_menu", renderer=self.renderer)
             if choice is None:
                 return
 
@@ -1111,25 +1317,25 @@ class HeroGame:
                 if 1 <= slot_num <= 5:
                     # 确认覆盖
                     if not slots[slot_num - 1].get("empty"):
-                        confirm = input(f"{self.lang.get_text('overwrite_save')}? (y/n): ").strip().lower()
+                        confirm = read_input(f"{self.lang.get_text('overwrite_save')}? (y/n): ", decision="confirm").strip().lower()
                         if confirm not in self.lang.get_text("yes_options"):
                             continue
 
                     # 保存游戏
                     save_data = self.get_save_data()
                     if save_manager.save_game(save_data, slot_num):
-                        print(f"\n{self.lang.get_text('save_success')} {slot_num}!")
-                        input(f"{self.lang.get_text('continue_prompt')}")
+                        self.renderer.print(f"\n{self.lang.get_text('save_success')} {slot_num}!")
+                        read_input(f"{self.lang.get_text('continue_prompt')}")
                         return
                     else:
-                        print(f"\n{self.lang.get_text('save_failed')}")
-                        input(f"{self.lang.get_text('continue_prompt')}")
+                        self.renderer.text("save_failed", prefix="\n")
+                        read_input(f"{self.lang.get_text('continue_prompt')}")
                 else:
-                    print(self.lang.get_text("invalid_choice"))
-                    input(f"{self.lang.get_text('continue_prompt')}")
+                    self.renderer.text("invalid_choice")
+                    read_input(f"{self.lang.get_text('continue_prompt')}")
             except ValueError:
-                print(self.lang.get_text("invalid_choice"))
-                input(f"{self.lang.get_text('continue_prompt')}")
+                self.renderer.text("invalid_choice")
+                read_input(f"{self.lang.get_text('continue_prompt')}")
 
     def game_loop(self):
         """游戏主循环"""
@@ -1148,7 +1354,7 @@ class HeroGame:
             # 检查成就
             self.achievements.check_achievements()
 
-            user_input = safe_input(f"\n{self.lang.get_text('continue_prompt')}")
+            user_input = safe_input(f"\n{self.lang.get_text('continue_prompt')}", decision="continue", renderer=self.renderer)
             if user_input is None:
                 # 用户中断，退出游戏
                 sys.exit(0)
@@ -1157,22 +1363,22 @@ class HeroGame:
     def check_game_status(self):
         """检查游戏状态"""
         if self.hero_hp <= 0:
-            input(f"\n{self.lang.get_text('continue_prompt')}")
+            read_input(f"\n{self.lang.get_text('continue_prompt')}")
             self.game_over = True
             
             # 记录游戏失败日志
             self.game_log.add_log("event", self.lang.get_text("game_over"))
             
             self.clear_screen()
-            print(self.lang.get_text("block_separator"))
-            print(f"          {self.lang.get_text('game_over')}")
-            print(self.lang.get_text("block_separator"))
-            print(f"{self.hero_name} {self.lang.get_text('game_over_msg')}")
-            print(self.lang.get_text("try_again"))
+            self.renderer.text("block_separator")
+            self.renderer.text("game_over", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.line("game_over_line", hero_name=self.hero_name)
+            self.renderer.text("try_again")
             return True
 
         if self.hero_position >= self.map_length - 1:
-            input(f"\n{self.lang.get_text('continue_prompt')}")
+            read_input(f"\n{self.lang.get_text('continue_prompt')}")
             self.victory = True
             self.game_over = True
             
@@ -1180,41 +1386,42 @@ class HeroGame:
             self.game_log.add_log("event", self.lang.get_text("victory"))
             
             self.clear_screen()
-            print(self.lang.get_text("block_separator"))
-            print(f"          {self.lang.get_text('victory')}")
-            print(self.lang.get_text("block_separator"))
-            print(f"{self.hero_name} {self.lang.get_text('victory_msg')}!")
-            print(f"{self.lang.get_text('final_status')} - {self.lang.get_text('hp')}{self.lang.get_text('item_separator')}{self.hero_hp}, {self.lang.get_text('attack')}{self.lang.get_text('item_separator')}{self.hero_attack}")
-            print(self.lang.get_text("real_hero"))
+            self.renderer.text("block_separator")
+            self.renderer.text("victory", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.line("game_victory_line", hero_name=self.hero_name)
+            self.renderer.line("final_status_line", hero_hp=self.hero_hp, hero_attack=self.hero_attack)
+            self.renderer.text("real_hero")
             return True
 
         return False
 
     def move_hero(self):
         """移动英雄"""
-        print(f"\n{self.lang.get_text('choose_action')}")
-        print(f"1. {self.lang.get_text('forward')}")
-        print(f"2. {self.lang.get_text('view_status')}")
-        print(f"3. {self.lang.get_text('view_history')}")
+        self.renderer.text("choose_action", prefix="\n")
+        self.renderer.text("forward", prefix="1. ")
+        self.renderer.text("view_status", prefix="2. ")
+        self.renderer.text("view_history", prefix="3. ")
         if self.hero_potions > 0:
-            print(f"4. {self.lang.get_text('use_potion')}")
-        print(f"5. {self.lang.get_text('shop')}")
-        print(f"6. {self.lang.get_text('equipment_management')}")
-        print(f"7. {self.lang.get_text('save_game')}")
-        print(f"8. {self.lang.get_text('view_statistics')}")
-        print(f"9. {self.lang.get_text('view_quests')}")
+            self.renderer.text("use_potion", prefix="4. ")
+        self.renderer.text("shop", prefix="5. ")
+        self.renderer.text("equipment_management", prefix="6. ")
+        self.renderer.text("save_game", prefix="7. ")
+        self.renderer.text("view_statistics", prefix="8. ")
+        self.renderer.text("view_quests", prefix="9. ")
         if self.skill_tree:
-            print(f"10. {self.lang.get_text('skill_tree_title')}")
-        print(f"11. {self.lang.get_text('exit_game')}")
+            self.renderer.text("skill_tree_title", prefix="10. ")
+        self.renderer.text("exit_game", prefix="11. ")
 
-        valid_choices = ["1", "2", "3", "5", "6", "7", "8", "9", "11"]
-        if self.hero_potions > 0:
-            valid_choices.append("4")
-        if self.skill_tree:
-            valid_choices.append("10")
-            
         while True:
-            choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=valid_choices, allow_empty=True)
+            # 每次输入前重新计算可选项（用完最后一瓶药剂后不再提供选项 4）
+            valid_choices = ["1", "2", "3", "5", "6", "7", "8", "9", "11"]
+            if self.hero_potions > 0:
+                valid_choices.append("4")
+            if self.skill_tree:
+                valid_choices.append("10")
+            
+            choice = safe_input(f"{self.lang.get_text('enter_choice')} (1): ", valid_options=valid_choices, allow_empty=True, decision="move", renderer=self.renderer)
             
             if choice is None:
                 # 用户中断，退出游戏
@@ -1240,7 +1447,7 @@ class HeroGame:
                     self.random_event()
                     return True
                 else:
-                    print(self.lang.get_text("already_at_end"))
+                    self.renderer.text("already_at_end")
                     return False
             elif choice == "2":
                 self.show_hero_info()
@@ -1270,47 +1477,44 @@ class HeroGame:
                 self.game_over = True
                 return False
             else:
-                print(self.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
 
     def show_skill_tree_menu(self):
         """显示技能树菜单"""
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('skill_tree_title')}")
-        print(self.lang.get_text("block_separator"))
+        self.renderer.text("block_separator")
+        self.renderer.text("skill_tree_title", prefix="          ")
+        self.renderer.text("block_separator")
         
         show_all = False
         while True:
             self.clear_screen()
             
             # 显示技能树
-            print(self.skill_tree.format_tree(show_all))
-            print(f"\n{self.lang.get_text('skill_points')}: {self.skill_points}")
-            print()
+            self.renderer.print(self.skill_tree.format_tree(show_all))
+            self.renderer.print(f"\n{self.lang.get_text('skill_points')}: {self.skill_points}")
+            self.renderer.print()
             
             # 显示选项
-            print(f"1. {self.lang.get_text('select_skill_to_upgrade')}")
+            self.renderer.text("select_skill_to_upgrade", prefix="1. ")
             if show_all:
-                print(f"2. {self.lang.get_text('show_available_skills')}")
+                self.renderer.text("show_available_skills", prefix="2. ")
             else:
-                print(f"2. {self.lang.get_text('show_all_skills')}")
-            print(f"3. {self.lang.get_text('back_to_game')}")
+                self.renderer.text("show_all_skills", prefix="2. ")
+            self.renderer.text("back_to_game", prefix="3. ")
             
-            choice = input(f"{self.lang.get_text('enter_choice')} (1): ").strip()
+            choice = read_input(f"{self.lang.get_text('enter_choice')} (1): ", decision="skill_menu", options=["1", "2", "3"]).strip()
             
             if choice == "" or choice == "1":
                 # 获取可升级的技能列表
-                upgradeable_skills = [
-                    skill_id for skill_id in self.skill_tree.skill_nodes
-                    if self.skill_tree.can_upgrade_skill(skill_id, self.skill_points)
-                ]
+                upgradeable_skills = self.get_upgradeable_skills()
                 
                 if not upgradeable_skills:
-                    input(self.lang.get_text("not_enough_skill_points"))
+                    read_input(self.lang.get_text("not_enough_skill_points"))
                     continue
                 
                 # 显示可升级的技能
-                print(f"\n{self.lang.get_text('select_skill_to_upgrade')}:")
+                self.renderer.text("select_skill_to_upgrade", prefix="\n", suffix=":")
                 for i, skill_id in enumerate(upgradeable_skills, 1):
                     skill_node = self.skill_tree.skill_nodes[skill_id]
                     # 检查技能ID是否已经包含"_skill"后缀
@@ -1320,31 +1524,26 @@ class HeroGame:
                         skill_name_key = f"skill_{skill_id}"
                     skill_name = self.lang.get_text(skill_name_key)
                     cost = skill_node.cost_per_level
-                    print(f"{i}. {skill_name} (Lv.{skill_node.current_level}/{skill_node.max_level}) - {self.lang.get_text('skill_points')}: {cost}")
+                    self.renderer.print(f"{i}. {skill_name} (Lv.{skill_node.current_level}/{skill_node.max_level}) - {self.lang.get_text('skill_points')}: {cost}")
                 
-                skill_choice = input(f"{self.lang.get_text('enter_choice')}: ").strip()
+                skill_choice = read_input(f"{self.lang.get_text('enter_choice')}: ", decision="skill_upgrade", options=[str(i) for i in range(1, len(upgradeable_skills) + 1)]).strip()
                 
                 if skill_choice.isdigit() and 1 <= int(skill_choice) <= len(upgradeable_skills):
                     selected_skill_id = upgradeable_skills[int(skill_choice) - 1]
-                    success, remaining_points = self.skill_tree.upgrade_skill(selected_skill_id, self.skill_points)
                     
-                    if success:
-                        self.skill_points = remaining_points
-                        # 如果技能不在hero_skills列表中，则添加
-                        if selected_skill_id not in self.hero_skills:
-                            self.hero_skills.append(selected_skill_id)
+                    if self.upgrade_skill(selected_skill_id):
                         # 检查技能ID是否已经包含"_skill"后缀
                         if selected_skill_id.endswith("_skill"):
                             skill_name_key = selected_skill_id
                         else:
                             skill_name_key = f"skill_{selected_skill_id}"
                         skill_name = self.lang.get_text(skill_name_key)
-                        print(f"\n{self.lang.get_text('skill_upgrade_success')} - {skill_name}")
-                        input(self.lang.get_text('continue_prompt'))
+                        self.renderer.print(f"\n{self.lang.get_text('skill_upgrade_success')} - {skill_name}")
+                        read_input(self.lang.get_text('continue_prompt'))
                     else:
-                        input(self.lang.get_text("skill_upgrade_failed"))
+                        read_input(self.lang.get_text("skill_upgrade_failed"))
                 else:
-                    input(self.lang.get_text("invalid_choice"))
+                    read_input(self.lang.get_text("invalid_choice"))
             
             elif choice == "2":
                 show_all = not show_all
@@ -1353,669 +1552,127 @@ class HeroGame:
                 break
             
             else:
-                input(self.lang.get_text("invalid_choice"))
+                read_input(self.lang.get_text("invalid_choice"))
+
+    def get_upgradeable_skills(self):
+        """获取以当前技能点可以升级的技能ID列表"""
+        if not self.skill_tree:
+            return []
+        return [
+            skill_id for skill_id in self.skill_tree.skill_nodes
+            if self.skill_tree.can_upgrade_skill(skill_id, self.skill_points)
+        ]
 
-    def random_event(self):
-        """随机事件处理（根据地图类型和难度调整）"""
-        # 根据难度获取设置
-        settings = self.difficulty_settings[self.difficulty]
-        enemy_multiplier = settings["enemy_multiplier"]
-        gold_multiplier = settings["gold_multiplier"]
+    def upgrade_skill(self, skill_id):
+        """升级技能并同步技能点和英雄技能列表
 
-        # 根据地图类型调整事件
-        map_info = self.map_types[self.map_type]
+        Args:
+            skill_id: 技能ID
 
-        # 性能优化：使用预计算的索引范围代替多次随机调用
-        event_num = random.randint(1, 35)
-        print(f"\n{self.lang.get_text('step_forward')}")
-        time.sleep(1)
+        Returns:
+            bool: 是否升级成功
+        """
+        success, remaining_points = self.skill_tree.upgrade_skill(skill_id, self.skill_points)
+        if success:
+            self.skill_points = remaining_points
+            # 如果技能不在hero_skills列表中，则添加
+            if skill_id not in self.hero_skills:
+                self.hero_skills.append(skill_id)
+        return success
+
+    def random_event(self):
+        """随机事件处理（事件表见 game_config.MAP_EVENT_TABLES）"""
+        # 事件随机数子流
+        rng = get_stream(self, "events")
+
+        # 先掷事件点数（与任务生成相互独立）
+        from hero.map_events import get_event_table, dispatch_map_event
+        table = get_event_table(self.map_type)
+        event_roll = rng.randint(1, table.total_weight) if table else None
+        self.renderer.text("step_forward", prefix="\n")
+        self.clock.pause(1)
         
         # 随机生成新任务（20%概率）
-        if random.random() < 0.2:
+        if rng.random() < 0.2:
             new_quest = self.quest_system.generate_random_quest(self.hero_level)
             if new_quest and self.quest_system.add_quest(new_quest):
-                quest_desc = self.lang.get_text(new_quest.description_key).format(
-                    target=new_quest.target_value,
-                    current=new_quest.current_value
-                )
-                print(f"📜 {self.lang.get_text('new_quest_received')}: {quest_desc}")
-                time.sleep(1)
-
-        # 平原地图事件
-        if self.map_type == "plains":
-            if event_num <= 3:  # 踩到地雷
-                damage = random.randint(10, 25)
-                actual_damage = max(1, int(damage * enemy_multiplier) - self.hero_defense)
-                self.hero_hp -= actual_damage
-                print(f"💥 {self.lang.get_text('mine_trap')}{actual_damage}{self.lang.get_text('actual_damage')}")
-                # 使用统一的多语言格式化函数处理地雷事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "mine_trap", actual_damage))
-                # 记录事件
-                self.statistics.record_event_triggered("mine_trap")
-                self.show_hero_info()
-            elif event_num <= 6:  # 吃到包子
-                heal = random.randint(15, 30)
-                self.hero_hp = min(self.hero_hp + heal, self.hero_max_hp)
-                print(f"🥢 {self.lang.get_text('find_bun')} {heal} {self.lang.get_text('point_hp')}")
-                # 使用统一的多语言格式化函数处理包子事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_bun", heal))
-                # 记录事件
-                self.statistics.record_event_triggered("find_bun")
-                self.show_hero_info()
-            elif event_num <= 9:  # 遇到怪物
-                print("👹 " + self.lang.get_text("encounter_monster"))
-                self.statistics.record_event_triggered("combat")
-                self.combat_system.combat(enemy_multiplier)
-                
-                # 更新击杀怪物任务进度
-                completed_quests = self.quest_system.update_quest_progress("kill_monster")
-                self.handle_quest_completions(completed_quests)
-            elif event_num <= 11:  # 发现宝箱
-                gold_found = int(random.randint(10, 30) * gold_multiplier)
-                self.hero_gold += gold_found
-                print(f"💎 {self.lang.get_text('find_chest')} {gold_found} {self.lang.get_text('coins')}")
-                # 使用统一的多语言格式化函数处理宝箱事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_chest", gold_found))
-                # 记录事件和金币
-                self.statistics.record_event_triggered("find_chest")
-                self.statistics.record_gold_earned(gold_found)
-                
-                # 更新收集金币任务进度
-                completed_quests = self.quest_system.update_quest_progress("collect_gold", gold_found)
-                self.handle_quest_completions(completed_quests)
-                
-                self.show_hero_info()
-            elif event_num <= 15:  # 遇到商人
-                self.statistics.record_event_triggered("merchant")
-                self.event_system.merchant_event(gold_multiplier)
-            elif event_num <= 17:  # 发现药剂
-                self.hero_potions += 1
-                print("🧪 " + self.lang.get_text("find_potion"))
-                # 使用统一的多语言格式化函数处理药剂事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_potion"))
-                # 记录事件和药剂
-                self.statistics.record_event_triggered("find_potion")
-                self.statistics.record_potion_found()
-                self.show_hero_info()
-            elif event_num <= 19:  # 发现装备
-                self.statistics.record_event_triggered("find_equipment")
-                self.equipment_system.find_equipment()
-            elif event_num <= 21:
-                print("🐉 " + self.lang.get_text("encounter_boss"))
-                self.statistics.record_event_triggered("boss_combat")
-                self.combat_system.boss_combat(enemy_multiplier * 1.5)
-            elif event_num <= 23:  # 神秘传送
-                self.statistics.record_event_triggered("mysterious_teleport")
-                self.event_system.mysterious_teleport()
-            elif event_num <= 25:  # 贤者指引
-                self.statistics.record_event_triggered("sage_guidance")
-                self.event_system.sage_guidance()
-            elif event_num <= 27:  # 遭遇强盗
-                self.statistics.record_event_triggered("robber_encounter")
-                self.event_system.robber_encounter()
-            elif event_num <= 29:  # 神秘祭坛
-                self.statistics.record_event_triggered("mysterious_altar")
-                self.event_system.mysterious_altar()
-            elif event_num <= 31:  # 路边营地
-                self.statistics.record_event_triggered("roadside_camp")
-                self.event_system.roadside_camp()
-            else:
-                print("✨ " + self.lang.get_text("safe_move"))
-                # 使用统一的多语言格式化函数处理平安移动事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "safe_move"))
-                self.statistics.record_event_triggered("safe_move")
-
-        # 森林地图事件
-        elif self.map_type == "forest":
-            if event_num <= 3:
-                damage = random.randint(8, 20)
-                actual_damage = max(1, int(damage * enemy_multiplier) - self.hero_defense // 2)
-                self.hero_hp -= actual_damage
-                print(f"🌿 {self.lang.get_text('thorns_damage')}{actual_damage}{self.lang.get_text('point_damage')}")
-                # 使用统一的多语言格式化函数处理荆棘伤害事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "thorns_damage", actual_damage))
-                self.statistics.record_event_triggered("thorns_damage")
-                self.show_hero_info()
-            elif event_num <= 6:
-                heal = random.randint(20, 35)
-                self.hero_hp = min(self.hero_hp + heal, self.hero_max_hp)
-                print(f"🌱 {self.lang.get_text('find_herbs')}{heal}{self.lang.get_text('point_hp')}")
-                # 使用统一的多语言格式化函数处理草药事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_herbs", heal))
-                self.statistics.record_event_triggered("find_herbs")
-                self.show_hero_info()
-            elif event_num <= 9:
-                print("🐺 " + self.lang.get_text("encounter_monster"))
-                self.statistics.record_event_triggered("combat")
-                self.combat_system.combat(enemy_multiplier)
-            elif event_num <= 11:
-                gold_found = int(random.randint(15, 35) * gold_multiplier)
-                self.hero_gold += gold_found
-                print(f"💎 {self.lang.get_text('find_chest')} {gold_found} {self.lang.get_text('coins')}")
-                # 使用统一的多语言格式化函数处理宝箱事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_chest", gold_found))
-                self.statistics.record_event_triggered("find_chest")
-                self.statistics.record_gold_earned(gold_found)
-                self.show_hero_info()
-            elif event_num <= 13:
-                self.statistics.record_event_triggered("merchant")
-                self.event_system.merchant_event(gold_multiplier)
-            elif event_num <= 15:
-                self.statistics.record_event_triggered("find_equipment")
-                self.equipment_system.find_equipment()
-            elif event_num <= 17:
-                print("🐉 " + self.lang.get_text("encounter_boss"))
-                self.statistics.record_event_triggered("boss_combat")
-                self.combat_system.boss_combat(enemy_multiplier * 1.5)
-            elif event_num <= 19:
-                self.hero_potions += 1
-                print("🧪 " + self.lang.get_text("find_potion"))
-                # 使用统一的多语言格式化函数处理药剂事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_potion"))
-                self.statistics.record_event_triggered("find_potion")
-                self.statistics.record_potion_found()
-                self.show_hero_info()
-            elif event_num <= 21:  # 神秘传送
-                self.statistics.record_event_triggered("mysterious_teleport")
-                self.event_system.mysterious_teleport()
-            elif event_num <= 23:  # 贤者指引
-                self.statistics.record_event_triggered("sage_guidance")
-                self.event_system.sage_guidance()
-            elif event_num <= 25:  # 遭遇强盗
-                self.statistics.record_event_triggered("robber_encounter")
-                self.event_system.robber_encounter()
-            elif event_num <= 27:  # 路边营地
-                self.statistics.record_event_triggered("roadside_camp")
-                self.event_system.roadside_camp()
-            else:
-                print("✨ " + self.lang.get_text("safe_move"))
-                # 使用统一的多语言格式化函数处理平安移动事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "safe_move"))
-                self.statistics.record_event_triggered("safe_move")
-
-        # 沙漠地图事件
-        elif self.map_type == "desert":
-            if event_num <= 3:
-                damage = random.randint(12, 28)
-                actual_damage = max(1, int(damage * enemy_multiplier * 1.2))
-                self.hero_hp -= actual_damage
-                print(f"☀️ {self.lang.get_text('dehydration')}{actual_damage}{self.lang.get_text('point_damage')}")
-                # 使用统一的多语言格式化函数处理脱水事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "dehydration", actual_damage))
-                self.statistics.record_event_triggered("dehydration")
-                self.show_hero_info()
-            elif event_num <= 6:
-                heal = random.randint(25, 40)
-                self.hero_hp = min(self.hero_hp + heal, self.hero_max_hp)
-                print(f"💧 {self.lang.get_text('find_oasis')}{heal}{self.lang.get_text('point_hp')}")
-                # 使用统一的多语言格式化函数处理绿洲事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_oasis", heal))
-                self.statistics.record_event_triggered("find_oasis")
-                self.show_hero_info()
-            elif event_num <= 9:
-                print("🦂 " + self.lang.get_text("encounter_monster"))
-                self.statistics.record_event_triggered("combat")
-                self.combat_system.combat(enemy_multiplier * 1.1)
-            elif event_num <= 11:
-                gold_found = int(random.randint(20, 40) * gold_multiplier)
-                self.hero_gold += gold_found
-                print(f"💎 {self.lang.get_text('find_chest')} {gold_found} {self.lang.get_text('coins')}")
-                # 使用统一的多语言格式化函数处理宝箱事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_chest", gold_found))
-                self.statistics.record_event_triggered("find_chest")
-                self.statistics.record_gold_earned(gold_found)
-                self.show_hero_info()
-            elif event_num <= 13:
-                self.statistics.record_event_triggered("merchant")
-                self.event_system.merchant_event(gold_multiplier)
-            elif event_num <= 15:
-                self.statistics.record_event_triggered("find_equipment")
-                self.equipment_system.find_equipment()
-            elif event_num <= 17:
-                print("🐉 " + self.lang.get_text("encounter_boss"))
-                self.statistics.record_event_triggered("boss_combat")
-                self.combat_system.boss_combat(enemy_multiplier * 1.6)
-            elif event_num <= 19:
-                self.hero_potions += 1
-                print("🧪 " + self.lang.get_text("find_potion"))
-                # 使用统一的多语言格式化函数处理药剂事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_potion"))
-                self.statistics.record_event_triggered("find_potion")
-                self.statistics.record_potion_found()
-                self.show_hero_info()
-            elif event_num <= 21:  # 神秘传送
-                self.statistics.record_event_triggered("mysterious_teleport")
-                self.event_system.mysterious_teleport()
-            elif event_num <= 23:  # 贤者指引
-                self.statistics.record_event_triggered("sage_guidance")
-                self.event_system.sage_guidance()
-            elif event_num <= 25:  # 遭遇强盗
-                self.statistics.record_event_triggered("robber_encounter")
-                self.event_system.robber_encounter()
-            elif event_num <= 27:  # 路边营地
-                self.statistics.record_event_triggered("roadside_camp")
-                self.event_system.roadside_camp()
-            else:
-                print("✨ " + self.lang.get_text("safe_move"))
-                # 使用统一的多语言格式化函数处理平安移动事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "safe_move"))
-                self.statistics.record_event_triggered("safe_move")
-
-        # 地牢地图事件
-        elif self.map_type == "dungeon":
-            if event_num <= 3:
-                damage = random.randint(15, 30)
-                actual_damage = max(1, int(damage * enemy_multiplier * 1.3) - self.hero_defense // 2)
-                self.hero_hp -= actual_damage
-                print(f"🕳️ {self.lang.get_text('dungeon_trap')}{actual_damage}{self.lang.get_text('point_damage')}")
-                # 使用统一的多语言格式化函数处理地牢陷阱事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "dungeon_trap", actual_damage))
-                self.statistics.record_event_triggered("dungeon_trap")
-                self.show_hero_info()
-            elif event_num <= 5:
-                print("👻 " + self.lang.get_text("encounter_ghost"))
-                self.statistics.record_event_triggered("ghost_combat")
-                self.combat_system.ghost_combat(enemy_multiplier)
-            elif event_num <= 8:
-                print("💀 " + self.lang.get_text("encounter_monster"))
-                self.statistics.record_event_triggered("combat")
-                self.combat_system.combat(enemy_multiplier * 1.2)
-            elif event_num <= 11:
-                gold_found = int(random.randint(25, 50) * gold_multiplier)
-                self.hero_gold += gold_found
-                print(f"💎 {self.lang.get_text('find_chest')} {gold_found} {self.lang.get_text('coins')}")
-                # 使用统一的多语言格式化函数处理宝箱事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_chest", gold_found))
-                self.statistics.record_event_triggered("find_chest")
-                self.statistics.record_gold_earned(gold_found)
-                self.show_hero_info()
-            elif event_num <= 13:
-                self.statistics.record_event_triggered("find_equipment")
-                self.equipment_system.find_equipment()
-            elif event_num <= 15:
-                self.statistics.record_event_triggered("mysterious_merchant")
-                self.event_system.mysterious_merchant(gold_multiplier)
-            elif event_num <= 17:
-                print("🐉 " + self.lang.get_text("encounter_boss"))
-                self.statistics.record_event_triggered("boss_combat")
-                self.combat_system.boss_combat(enemy_multiplier * 1.7)
-            elif event_num <= 19:  # 神秘传送
-                self.statistics.record_event_triggered("mysterious_teleport")
-                self.event_system.mysterious_teleport()
-            elif event_num <= 21:  # 贤者指引
-                self.statistics.record_event_triggered("sage_guidance")
-                self.event_system.sage_guidance()
-            elif event_num <= 23:  # 遭遇强盗
-                self.statistics.record_event_triggered("robber_encounter")
-                self.event_system.robber_encounter()
-            elif event_num <= 25:  # 路边营地
-                self.statistics.record_event_triggered("roadside_camp")
-                self.event_system.roadside_camp()
-            else:
-                print("✨ " + self.lang.get_text("safe_move"))
-                # 使用统一的多语言格式化函数处理平安移动事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "safe_move"))
-                self.statistics.record_event_triggered("safe_move")
-
-        # 山脉地图事件
-        elif self.map_type == "mountain":
-            if event_num <= 3:
-                damage = random.randint(18, 35)
-                actual_damage = max(1, int(damage * enemy_multiplier * 1.4) - self.hero_defense)
-                self.hero_hp -= actual_damage
-                print(f"🪨 {self.lang.get_text('mountain_hazard')}{actual_damage}{self.lang.get_text('point_damage')}")
-                # 使用统一的多语言格式化函数处理山体危险事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "mountain_hazard", actual_damage))
-                self.statistics.record_event_triggered("mountain_hazard")
-                self.show_hero_info()
-            elif event_num <= 6:
-                gold_found = int(random.randint(40, 80) * gold_multiplier)
-                self.hero_gold += gold_found
-                print(f"💎 {self.lang.get_text('find_gem')}{gold_found}{self.lang.get_text('gold_coins')}")
-                # 使用统一的多语言格式化函数处理宝石事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "find_gem", gold_found))
-                self.statistics.record_event_triggered("find_gem")
-                self.statistics.record_gold_earned(gold_found)
-                self.show_hero_info()
-            elif event_num <= 9:
-                print("🐲 " + self.lang.get_text("encounter_monster"))
-                self.statistics.record_event_triggered("combat")
-                self.combat_system.combat(enemy_multiplier * 1.3)
-            elif event_num <= 11:
-                print("🐲 " + self.lang.get_text("encounter_boss"))
-                self.statistics.record_event_triggered("boss_combat")
-                self.combat_system.boss_combat(enemy_multiplier * 1.8)
-            elif event_num <= 13:
-                self.statistics.record_event_triggered("find_equipment")
-                self.equipment_system.find_equipment()
-            elif event_num <= 15:
-                self.statistics.record_event_triggered("mysterious_merchant")
-                self.event_system.mysterious_merchant(gold_multiplier)
-            elif event_num <= 17:  # 神秘传送
-                self.statistics.record_event_triggered("mysterious_teleport")
-                self.event_system.mysterious_teleport()
-            elif event_num <= 19:  # 贤者指引
-                self.statistics.record_event_triggered("sage_guidance")
-                self.event_system.sage_guidance()
-            elif event_num <= 21:  # 遭遇强盗
-                self.statistics.record_event_triggered("robber_encounter")
-                self.event_system.robber_encounter()
-            elif event_num <= 23:  # 路边营地
-                self.statistics.record_event_triggered("roadside_camp")
-                self.event_system.roadside_camp()
-            else:
-                print("✨ " + self.lang.get_text("safe_move"))
-                # 使用统一的多语言格式化函数处理平安移动事件文本
-                self.events_encountered.append(self.lang.format_text("event_text", "safe_move"))
-                self.statistics.record_event_triggered("safe_move")
-
-        # 沼泽地图事件
-        elif self.map_type == "swamp":
-            if event_num <= 3:  # 中毒云
-                damage = random.randint(10, 20)
-                actual_damage = max(1, int(damage * enemy_multiplier * 1.2))
-                self.hero_hp -= actual_damage
-                print(f"☠️ {self.lang.get_text('poison_cloud')}{actual_damage}{self.lang.get_text('point_damage')}")
-                # 添加中毒状态效果，持续3回合
-                self.add_status_effect("poison", 3)
-                self.events_encountered.append(self.lang.format_text("event_text", "poison_cloud", actual_damage))
-                self.statistics.record_event_triggered("poison_cloud")
-                self.show_hero_info()
-            elif event_num <= 6:  # 流沙
-                damage = int(self.hero_hp * 0.15)  # 当前血量的15%
-                actual_damage = max(5, damage)  # 最少损失5点
-                self.hero_hp -= actual_damage
-                print(f"🏖️ {self.lang.get_text('quicksand')}{actual_damage}{self.lang.get_text('point_damage')}")
-                self.events_encountered.append(self.lang.format_text("event_text", "quicksand", actual_damage))
-                self.statistics.record_event_triggered("quicksand")
-                self.show_hero_info()
-            elif event_num <= 9:
-                print("🐊 " + self.lang.get_text("encounter_monster"))
-                self.statistics.record_event_triggered("combat")
-                self.combat_system.combat(enemy_multiplier * 1.1)
-            elif event_num <= 11:
-                heal = random.randint(30, 50)
-                self.hero_hp = min(self.hero_hp + heal, self.hero_max_hp)
-                print(f"🌿 {self.lang.get_text('rare_herbs')}{heal}{self.lang.get_text('point_hp')}")
-                self.events_encountered.append(self.lang.format_text("event_text", "rare_herbs", heal))
-                self.statistics.record_event_triggered("rare_herbs")
-                self.show_hero_info()
-            elif event_num <= 13:
-                gold_found = int(random.randint(15, 35) * gold_multiplier)
-                self.hero_gold += gold_found
-                print(f"💎 {self.lang.get_text('find_chest')} {gold_found} {self.lang.get_text('coins')}")
-                self.events_encountered.append(self.lang.format_text("event_text", "find_chest", gold_found))
-                self.statistics.record_event_triggered("find_chest")
-                self.statistics.record_gold_earned(gold_found)
-                self.show_hero_info()
-            elif event_num <= 15:
-                self.statistics.record_event_triggered("swamp_merchant")
-                self.event_system.swamp_merchant_event(gold_multiplier)
-            elif event_num <= 17:
-                print("🐲 " + self.lang.get_text("encounter_boss"))
-                self.statistics.record_event_triggered("boss_combat")
-                self.combat_system.boss_combat(enemy_multiplier * 1.6)
-            elif event_num <= 19:  # 贤者指引
-                self.statistics.record_event_triggered("sage_guidance")
-                self.event_system.sage_guidance()
-            elif event_num <= 21:  # 神秘祭坛
-                self.statistics.record_event_triggered("mysterious_altar")
-                self.event_system.mysterious_altar()
-            elif event_num <= 23:  # 路边营地
-                self.statistics.record_event_triggered("roadside_camp")
-                self.event_system.roadside_camp()
-            else:
-                print("✨ " + self.lang.get_text("safe_move"))
-                self.events_encountered.append(self.lang.format_text("event_text", "safe_move"))
-                self.statistics.record_event_triggered("safe_move")
-
-        # 雪地地图事件
-        elif self.map_type == "snowfield":
-            if event_num <= 3:  # 冻伤
-                print(f"❄️ {self.lang.get_text('frostbite')}")
-                # 添加冻伤状态效果，持续3回合
-                self.add_status_effect("frostbite", 3)
-                self.events_encountered.append(self.lang.format_text("event_text", "frostbite"))
-                self.statistics.record_event_triggered("frostbite")
-                self.show_hero_info()
-            elif event_num <= 6:  # 雪崩
-                damage = random.randint(20, 40)
-                actual_damage = max(1, int(damage * enemy_multiplier * 1.3))
-                self.hero_hp -= actual_damage
-                print(f"🏔️ {self.lang.get_text('avalanche')}{actual_damage}{self.lang.get_text('point_damage')}")
-                
-                # 有概率发现稀有装备
-                if random.random() < 0.3:  # 30%概率
-                    print(f"🎁 {self.lang.get_text('avalanche_loot')}")
-                    self.equipment_system.find_equipment(rarity_bonus=1)  # 提升稀有度
-                
-                self.events_encountered.append(self.lang.format_text("event_text", "avalanche", actual_damage))
-                self.statistics.record_event_triggered("avalanche")
-                self.show_hero_info()
-            elif event_num <= 9:
-                print("🐺 " + self.lang.get_text("encounter_monster"))
-                self.statistics.record_event_triggered("combat")
-                self.combat_system.combat(enemy_multiplier * 1.15)
-            elif event_num <= 11:
-                heal = random.randint(40, 60)
-                self.hero_hp = min(self.hero_hp + heal, self.hero_max_hp)
-                print(f"🧊 {self.lang.get_text('ice_cave')}{heal}{self.lang.get_text('point_hp')}")
-                self.events_encountered.append(self.lang.format_text("event_text", "ice_cave", heal))
-                self.statistics.record_event_triggered("ice_cave")
-                self.show_hero_info()
-            elif event_num <= 13:
-                gold_found = int(random.randint(20, 40) * gold_multiplier)
-                self.hero_gold += gold_found
-                print(f"💎 {self.lang.get_text('find_chest')} {gold_found} {self.lang.get_text('coins')}")
-                self.events_encountered.append(self.lang.format_text("event_text", "find_chest", gold_found))
-                self.statistics.record_event_triggered("find_chest")
-                self.statistics.record_gold_earned(gold_found)
-                self.show_hero_info()
-            elif event_num <= 15:
-                print(f"❄️ {self.lang.get_text('frost_effect')}")
-                # 添加冰霜状态效果，持续3回合
-                self.add_status_effect("frost", 3)
-                self.events_encountered.append(self.lang.format_text("event_text", "frost_effect"))
-                self.statistics.record_event_triggered("frost_effect")
-                self.show_hero_info()
-            elif event_num <= 17:
-                print("🐲 " + self.lang.get_text("encounter_boss"))
-                self.statistics.record_event_triggered("boss_combat")
-                self.combat_system.boss_combat(enemy_multiplier * 1.65)
-            elif event_num <= 19:  # 神秘传送
-                self.statistics.record_event_triggered("mysterious_teleport")
-                self.event_system.mysterious_teleport()
-            elif event_num <= 21:  # 贤者指引
-                self.statistics.record_event_triggered("sage_guidance")
-                self.event_system.sage_guidance()
-            elif event_num <= 23:  # 神秘祭坛
-                self.statistics.record_event_triggered("mysterious_altar")
-                self.event_system.mysterious_altar()
-            else:
-                print("✨ " + self.lang.get_text("safe_move"))
-                self.events_encountered.append(self.lang.format_text("event_text", "safe_move"))
-                self.statistics.record_event_triggered("safe_move")
+                if self.renderer.enabled:
+                    quest_desc = self.lang.render(new_quest.description_key,
+                                                  target=new_quest.target_value,
+                                                  current=new_quest.current_value)
+                    self.renderer.line("new_quest", quest=quest_desc)
+                self.clock.pause(1)
+
+        # 按地图事件表分派事件
+        if table:
+            dispatch_map_event(self, table.event_for_roll(event_roll), rng)
 
     def update_attributes(self):
-        """更新英雄属性（基础属性 + 装备加成 + 特殊效果）"""
-        # 性能优化：使用缓存机制减少重复计算
-        if self._attributes_cached:
-            self.hero_attack = self._cached_attributes['attack']
-            self.hero_defense = self._cached_attributes['defense']
-            self.hero_max_hp = self._cached_attributes['max_hp']
-            self.special_effects = self._cached_attributes['special_effects'].copy()
-            return
-        
-        self.hero_attack = self.base_attack
-        self.hero_defense = self.base_defense
-        self.hero_max_hp = self.base_max_hp
-        
-        # 重置特殊效果属性
-        self.special_effects = {
-            "crit_rate": 0.0,      # 暴击率
-            "lifesteal": 0.0,     # 吸血率
-            "dodge": 0.0,          # 闪避率
-            "counter_attack": 0.0,   # 反击率
-            "ice_damage": 0,       # 冰霜伤害
-            "fire_damage": 0,      # 火焰伤害
-            "healing_rate": 0.0,   # 治疗效果
-            "mana_boost": 0,       # 法力提升
-            "backstab": 0.0,        # 背刺伤害
-            "luck_bonus": 0.0,     # 幸运加成
-            "wisdom_bonus": 0.0,   # 智慧加成
-            "immortality_chance": 0.0, # 不死概率
-            "health_regeneration": 0, # 生命恢复
-            "mana_regeneration": 0,   # 法力恢复
-            "holy_resistance": 0.0,   # 神圣抗性
-            "fire_resistance": 0.0,   # 火焰抗性
-            "stealth_chance": 0.0,    # 潜行概率
-            "evasion_rate": 0.0,      # 闪避率
-            "spell_power": 0.0,       # 法术强度
-            "crit_damage": 0.0        # 暴击伤害
-        }
+        """更新英雄属性（基础属性 + 装备加成 + 特殊效果）
 
-        # 添加装备加成和特殊效果
-        equipped_items = []
-        for item in self.equipment.values():
-            if item:
-                equipped_items.append(item)
-                self.hero_attack += item.get("attack", 0)
-                self.hero_defense += item.get("defense", 0)
-                self.hero_max_hp += item.get("hp", 0)
-                
-                # 处理特殊效果
-                special_effects = item.get("special_effects", [])
-                special_effects_values = item.get("special_effects_values", {})
-                
-                for effect in special_effects:
-                    if effect in special_effects_values:
-                        self.special_effects[effect] += special_effects_values[effect]
-                    elif effect in self.special_effects:
-                        # 默认效果值
-                        default_values = {
-                            "crit_rate": 0.05,
-                            "lifesteal": 0.1,
-                            "dodge": 0.05,
-                            "counter_attack": 0.1,
-                            "ice_damage": 5,
-                            "fire_damage": 5,
-                            "light_damage": 5,
-                            "poison": 3,
-                            "shadow_power": 0.1,
-                            "fire_resistance": 0.1,
-                            "holy_resistance": 0.1,
-                            "stealth": 0.1,
-                            "evasion": 0.05,
-                            "wisdom": 0.05,
-                            "mana_regeneration": 2,
-                            "luck": 0.05,
-                            "crit_damage": 0.2,
-                            "immortality": 0.02,
-                            "health_regeneration": 2,
-                            "healing": 0.02,
-                            "mana_boost": 10,
-                            "backstab": 0.2
-                        }
-                        if effect in default_values:
-                            self.special_effects[effect] += default_values[effect]
-
-        # 应用套装效果
-        self.apply_set_bonuses(equipped_items)
+        属性引擎只重新计算发生变化的来源（基础属性、某个装备栏、套装），
+        战斗中叠加的临时效果（职业被动、技能、状态效果）在此时清除。
+        """
+        engine = self.stat_engine
+        # 显示套装激活信息（只在套装从未激活变为激活、或达到更高档位时显示）
+        for set_info, effect, _ in engine.sync(self):
+            self.renderer.print(f"✨ {self.lang.get_text('set_bonus_activated')} {self.lang.get_text(set_info['name_key'])}: {self.lang.get_text(effect['name_key'])}")
+
+        stats = engine.stats
+        self.hero_attack = stats["attack"]
+        self.hero_defense = stats["defense"]
+        self.hero_max_hp = stats["max_hp"]
+        self.special_effects = engine.effects.copy()
 
         # 确保HP不超过最大值
         if self.hero_hp > self.hero_max_hp:
             self.hero_hp = self.hero_max_hp
-        
-        # 性能优化：缓存计算结果
-        self._cached_attributes = {
-            'attack': self.hero_attack,
-            'defense': self.hero_defense,
-            'max_hp': self.hero_max_hp,
-            'special_effects': self.special_effects.copy()
-        }
-        self._attributes_cached = True
-    
-    def invalidate_attributes_cache(self):
-        """清除属性缓存，强制下次计算时重新计算"""
-        self._attributes_cached = False
-        self._cached_attributes = {}
-    
-    def apply_set_bonuses(self, equipped_items):
-        """应用套装效果"""
-        from hero.game_config import EQUIPMENT_SETS
-        
-        for set_name, set_info in EQUIPMENT_SETS.items():
-            required_pieces = set_info["pieces"]
-            equipped_pieces = []
-            
-            # 检查是否装备了该套装的所有部件
-            for item in equipped_items:
-                if item["type"] in required_pieces and item.get("set_bonus") == set_name:
-                    equipped_pieces.append(item["type"])
-            
-            # 检查是否满足套装要求（必须装备该套装的所有部件）
-            if len(equipped_pieces) == len(required_pieces):
-                # 应用2件套效果
-                if "2_piece" in set_info["effects"]:
-                    effect = set_info["effects"]["2_piece"]
-                    
-                    # 应用属性加成
-                    if "attack_bonus" in effect:
-                        self.hero_attack += effect["attack_bonus"]
-                    if "defense_bonus" in effect:
-                        self.hero_defense += effect["defense_bonus"]
-                    if "hp_bonus" in effect:
-                        self.hero_max_hp += effect.get("hp_bonus", 0)
-                    if "mana_bonus" in effect:
-                        self.special_effects["mana_boost"] += effect.get("mana_bonus", 0)
-                    if "spell_power" in effect:
-                        self.special_effects["spell_power"] += effect.get("spell_power", 0)
-                    if "crit_rate" in effect:
-                        self.special_effects["crit_rate"] += effect.get("crit_rate", 0)
-                    if "dodge" in effect:
-                        self.special_effects["dodge"] += effect.get("dodge", 0)
-                    
-                    # 显示套装激活信息
-                    set_name_key = set_info["name_key"]
-                    bonus_name_key = effect["name_key"]
-                    print(f"✨ {self.lang.get_text('set_bonus_activated')} {self.lang.get_text(set_name_key)}: {self.lang.get_text(bonus_name_key)}")
-                    
-                    # 标记套装效果已激活
-                    for item in equipped_items:
-                        if item["type"] in required_pieces and item.get("set_bonus") == set_name:
-                            item["set_bonus_active"] = True
-    
+
+    def invalidate_attributes_cache(self, source=None):
+        """强制下次更新属性时重新计算某个来源
+
+        基础属性和装备栏的变化会自动检测，只有在原地修改了检测不到的内容时才需要调用。
+
+        Args:
+            source: 来源名（"base"、装备栏名或 "set_bonus"），None 表示全部重新计算
+        """
+        self.stat_engine.invalidate(source)
+
     def apply_status_effects(self):
-        """应用状态效果对属性的影响"""
+        """应用状态效果对属性的影响（记录为临时来源，下次更新属性时清除）"""
         # 冻伤效果：攻击力降低10%
         if self.status_effects["frostbite"] > 0:
-            self.hero_attack = int(self.hero_attack * 0.9)
-        
+            attack = int(self.hero_attack * 0.9)
+            self.stat_engine.record("status_effects", "attack", attack - self.hero_attack)
+            self.hero_attack = attack
+
         # 冰霜效果：防御力降低10%
         if self.status_effects["frost"] > 0:
-            self.hero_defense = int(self.hero_defense * 0.9)
-    
+            defense = int(self.hero_defense * 0.9)
+            self.stat_engine.record("status_effects", "defense", defense - self.hero_defense)
+            self.hero_defense = defense
+
     def update_status_effects(self):
         """更新状态效果（每回合结束时调用）"""
         # 中毒效果：每回合损失5点血量
         if self.status_effects["poison"] > 0:
             poison_damage = 5
             self.hero_hp -= poison_damage
-            print(f"☠️ {self.lang.get_text('poison_damage')} {poison_damage}{self.lang.get_text('point_damage')}")
+            self.renderer.line("hero_poison_damage", poison_damage=poison_damage)
             self.status_effects["poison"] -= 1
             if self.status_effects["poison"] <= 0:
-                print(f"✅ {self.lang.get_text('poison_cured')}")
+                self.renderer.text("poison_cured", prefix="✅ ")
         
         # 减少状态效果回合数
         if self.status_effects["frostbite"] > 0:
             self.status_effects["frostbite"] -= 1
             if self.status_effects["frostbite"] <= 0:
-                print(f"✅ {self.lang.get_text('poison_cured')}")
+                self.renderer.text("poison_cured", prefix="✅ ")
         
         if self.status_effects["frost"] > 0:
             self.status_effects["frost"] -= 1
             if self.status_effects["frost"] <= 0:
-                print(f"✅ {self.lang.get_text('poison_cured')}")
+                self.renderer.text("poison_cured", prefix="✅ ")
     
     def add_status_effect(self, effect_type, duration):
         """添加状态效果
@@ -2026,7 +1683,7 @@ class HeroGame:
         """
         if effect_type in self.status_effects:
             self.status_effects[effect_type] = duration
-            print(f"⚠️ {self.lang.get_text(f'status_{effect_type}')}! {self.lang.get_text('status_duration')}: {duration}")
+            self.renderer.print(f"⚠️ {self.lang.get_text(f'status_{effect_type}')}! {self.lang.get_text('status_duration')}: {duration}")
     
     def get_active_status_effects(self):
         """获取当前活跃的状态效果
@@ -2047,8 +1704,8 @@ class HeroGame:
             self.hero_gold += reward_gold
             self.hero_exp += reward_exp
             
-            print(f"🎉 {self.lang.get_text('quest_completed')}")
-            print(f"💰 {self.lang.get_text('quest_reward_received').format(gold=reward_gold, exp=reward_exp)}")
+            self.renderer.text("quest_completed", prefix="🎉 ")
+            self.renderer.print(f"💰 {self.lang.get_text('quest_reward_received').format(gold=reward_gold, exp=reward_exp)}")
             
             # 检查是否升级
             self.combat_system.check_level_up()
@@ -2060,6 +1717,7 @@ class HeroGame:
         Returns:
             SaveData: 包含所有游戏状态的存档数据实例
         """
+        from hero.save_data import SaveData
         return SaveData(self)
 
     def load_from_save_data(self, save_data):
@@ -2098,14 +1756,15 @@ class HeroGame:
         # 技能系统
         self.skill_points = getattr(save_data, 'skill_points', 0)
         
-        # 装备和背包
-        self.equipment = save_data.equipment
-        self.inventory = save_data.inventory
+        # 装备和背包（存档中的装备字典转换为 Item）
+        self.equipment = {slot: as_item(item) for slot, item in save_data.equipment.items()}
+        self.inventory = Inventory(as_item(item) for item in save_data.inventory)
 
         # 技能
         self.hero_skills = getattr(save_data, 'hero_skills', [])
         
         # 恢复技能树
+        from hero.skill_tree import SkillTree
         skill_tree_data = getattr(save_data, 'skill_tree_data', None)
         if skill_tree_data:
             self.skill_tree = SkillTree.from_dict(skill_tree_data, self.lang)
@@ -2123,7 +1782,7 @@ class HeroGame:
         self.map_types = MAP_TYPES
 
         # 更新语言设置
-        self.lang.set_language(self.language)
+        self.set_language(self.language)
     
     def print_with_speed(self, text, end_char='\n'):
         """
@@ -2133,15 +1792,8 @@ class HeroGame:
             text (str): 要打印的文本
             end_char (str): 行尾字符
         """
-        if self.settings.text_speed == 0:
-            # 即时显示
-            print(text, end=end_char)
-        else:
-            # 逐字显示
-            for char in text:
-                print(char, end='', flush=True)
-                time.sleep(self.settings.get_text_delay())
-            print(end=end_char)
+        delay = self.clock.typing_delay(self.settings.get_text_delay(), len(text))
+        self.renderer.typewrite(text, delay, end=end_char)
 
         # 统计数据
         self.monsters_defeated = save_data.monsters_defeated
@@ -2149,10 +1801,7 @@ class HeroGame:
         self.visited_positions = save_data.visited_positions
 
         # 重新初始化子系统（确保它们引用正确的游戏实例）
-        self.combat_system = CombatSystem(self)
-        self.equipment_system = EquipmentSystem(self)
-        self.event_system = EventSystem(self)
-        self.newbie_village = NewbieVillage(self)
+        self.reset_subsystems("combat_system", "equipment_system", "event_system", "newbie_village")
 
         # 加载技能状态
         self.shield_active = getattr(save_data, 'shield_active', False)
@@ -2188,7 +1837,7 @@ class HeroGame:
         if hasattr(save_data, 'quest_data') and save_data.quest_data:
             self.quest_system.from_dict(save_data.quest_data)
         else:
-            self.quest_system = QuestSystem()
+            self.reset_subsystems("quest_system")
             
         # 加载游戏日志
         if hasattr(save_data, 'game_log_data') and save_data.game_log_data:
@@ -2197,38 +1846,38 @@ class HeroGame:
             # 确保游戏日志系统存在
             if not hasattr(self, 'game_log') or self.game_log is None:
                 from .game_log import GameLog
-                self.game_log = GameLog(self.language)
+                self.game_log = GameLog(self.language, self)
 
     def show_quests(self):
         """显示当前任务列表"""
         self.clear_screen()
-        print(self.lang.get_text("block_separator"))
-        print(f"          {self.lang.get_text('quests_menu')}")
-        print(self.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("quests_menu", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
         
         # 显示当前任务
         quests_list = self.quest_system.format_quests_list(self.lang)
-        print(quests_list)
+        self.renderer.print(quests_list)
         
         # 显示已完成任务数量
         completed_count = len(self.quest_system.completed_quests)
-        print(f"\n{self.lang.get_text('completed_quests')}: {completed_count}")
+        self.renderer.print(f"\n{self.lang.get_text('completed_quests')}: {completed_count}")
         
-        input(f"\n{self.lang.get_text('continue_prompt')}")
+        read_input(f"\n{self.lang.get_text('continue_prompt')}")
 
     def restart_game(self):
         """重新开始游戏"""
-        print()
-        choice = input(self.lang.get_text("restart_prompt") + " (y/n): ").strip().lower()
+        self.renderer.print()
+        choice = read_input(self.lang.get_text("restart_prompt") + " (y/n): ", decision="confirm").strip().lower()
         confirm = choice in self.lang.get_text("yes_options")
 
         if confirm:
-            # 重新初始化游戏
-            self.__init__()
+            # 只重置英雄状态，复用已加载的数据和子系统
+            self.reset()
             self.start_game()
         else:
-            print("\n" + self.lang.get_text("goodbye"))
+            self.renderer.print("\n" + self.lang.get_text("goodbye"))
             sys.exit(0)
 
 
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+地图事件模块 - 由 game_config.MAP_EVENT_TABLES 驱动的随机事件分派
+
+导入时把每张地图的事件表编译为累积权重和 "点数 -> 事件" 查找表，
+每步只需掷一次 randint(1, 总权重) 并查表（O(1)），再交给注册的处理器执行。
+新增地图或调整事件概率只需修改配置；新增事件类型用 register_event_handler 注册处理器。
+"""
+
+from .game_config import MAP_EVENT_TABLES
+from .renderer import get_renderer
+
+
+# 事件处理器注册表 {处理器名称: 函数(game, event, rng, settings)}
+EVENT_HANDLERS = {}
+
+
+def register_event_handler(name):
+    """注册事件处理器的装饰器
+
+    Args:
+        name: 处理器名称（事件表中的 handler 字段）
+    """
+    def decorator(func):
+        EVENT_HANDLERS[name] = func
+        return func
+    return decorator
+
+
+class EventTable:
+    """编译后的地图事件表"""
+
+    def __init__(self, events):
+        """
+        Args:
+            events: 事件配置列表（weight 为正整数）
+        """
+        cumulative = []
+        roll_table = []
+        total = 0
+        for index, event in enumerate(events):
+            total += event["weight"]
+            cumulative.append(total)
+            roll_table.extend([index] * event["weight"])
+        self.events = tuple(events)
+        self.event_ids = tuple(event["id"] for event in events)
+        self.cumulative_weights = tuple(cumulative)
+        self.roll_table = tuple(roll_table)
+        self.total_weight = total
+
+    def event_for_roll(self, roll):
+        """根据 1..total_weight 的点数查找事件（O(1)）"""
+        return self.events[self.roll_table[roll - 1]]
+
+    def roll(self, rng):
+        """掷点并返回事件"""
+        return self.event_for_roll(rng.randint(1, self.total_weight))
+
+    def find(self, event_id):
+        """按事件ID查找事件配置，不存在时返回 None"""
+        for event in self.events:
+            if event["id"] == event_id:
+                return event
+        return None
+
+    def probabilities(self):
+        """每个事件的出现概率 {事件ID: 概率}"""
+        return {event["id"]: event["weight"] / self.total_weight for event in self.events}
+
+    def sample(self, count, rng):
+        """一次采样 count 个事件ID（用于模拟整张地图的事件序列）
+
+        Args:
+            count: 采样数量
+            rng: random 模块、random.Random 或 numpy.random.Generator
+
+        Returns:
+            list: 事件ID列表
+        """
+        if hasattr(rng, "integers"):
+            rolls = rng.integers(0, self.total_weight, size=count).tolist()
+        else:
+            rolls = [rng.randrange(self.total_weight) for _ in range(count)]
+        roll_table = self.roll_table
+        event_ids = self.event_ids
+        return [event_ids[roll_table[roll]] for roll in rolls]
+
+
+def compile_event_tables(map_event_tables=None):
+    """编译所有地图的事件表
+
+    Args:
+        map_event_tables: 事件配置，None 表示 MAP_EVENT_TABLES
+
+    Returns:
+        dict: {地图: EventTable}
+    """
+    map_event_tables = MAP_EVENT_TABLES if map_event_tables is None else map_event_tables
+    tables = {}
+    for map_type, events in map_event_tables.items():
+        for event in events:
+            if event["handler"] not in EVENT_HANDLERS:
+                raise ValueError(f"未知的事件处理器: {event['handler']} ({map_type}.{event['id']})")
+            if not isinstance(event["weight"], int) or event["weight"] < 0:
+                raise ValueError(f"事件权重必须是非负整数: {map_type}.{event['id']}")
+        tables[map_type] = EventTable(events)
+    return tables
+
+
+def get_event_table(map_type):
+    """获取地图的事件表，不存在时返回 None"""
+    return EVENT_TABLES.get(map_type)
+
+
+def reload_event_tables():
+    """配置修改后重新编译事件表"""
+    global EVENT_TABLES
+    EVENT_TABLES = compile_event_tables()
+
+
+def dispatch_map_event(game, event, rng):
+    """把事件交给注册的处理器执行
+
+    Args:
+        game: 游戏对象
+        event: 事件配置
+        rng: 事件随机数子流
+    """
+    settings = game.difficulty_settings[game.difficulty]
+    EVENT_HANDLERS[event["handler"]](game, event, rng, settings)
+
+
+def _show_value_message(game, event, value, suffix_key):
+    """打印 "图标 事件文本 数值 后缀" 格式的事件消息"""
+    renderer = get_renderer(game)
+    if not renderer.enabled:
+        return
+    separator = " " if event.get("spaced") else ""
+    renderer.print(f"{event['icon']} {game.lang.get_text(event['id'])}{separator}{value}{separator}{game.lang.get_text(suffix_key)}")
+
+
+@register_event_handler("damage")
+def handle_damage(game, event, rng, settings):
+    """陷阱类伤害事件"""
+    damage = rng.randint(*event["damage"])
+    actual_damage = int(damage * settings["enemy_multiplier"] * event["multiplier"])
+    defense_divisor = event.get("defense_divisor", 0)
+    if defense_divisor:
+        actual_damage -= game.hero_defense // defense_divisor
+    actual_damage = max(1, actual_damage)
+    game.hero_hp -= actual_damage
+    _show_value_message(game, event, actual_damage, event.get("suffix_key", "point_damage"))
+
+    if event.get("status_effect"):
+        game.add_status_effect(event["status_effect"], event.get("duration", 3))
+
+    # 有概率发现提升稀有度的装备
+    if event.get("loot_chance") and rng.random() < event["loot_chance"]:
+        get_renderer(game).text(event["id"] + "_loot", prefix="🎁 ")
+        game.equipment_system.find_equipment(rarity_bonus=1)
+
+    game.events_encountered.append(game.lang.format_text("event_text", event["id"], actual_damage))
+    game.statistics.record_event_triggered(event["id"])
+    game.show_hero_info()
+
+
+@register_event_handler("percent_damage")
+def handle_percent_damage(game, event, rng, settings):
+    """按当前生命值百分比扣血的事件"""
+    actual_damage = max(event["minimum"], int(game.hero_hp * event["percent"]))
+    game.hero_hp -= actual_damage
+    _show_value_message(game, event, actual_damage, "point_damage")
+    game.events_encountered.append(game.lang.format_text("event_text", event["id"], actual_damage))
+    game.statistics.record_event_triggered(event["id"])
+    game.show_hero_info()
+
+
+@register_event_handler("heal")
+def handle_heal(game, event, rng, settings):
+    """恢复生命值的事件"""
+    heal = rng.randint(*event["heal"])
+    game.hero_hp = min(game.hero_hp + heal, game.hero_max_hp)
+    _show_value_message(game, event, heal, "point_hp")
+    game.events_encountered.append(game.lang.format_text("event_text", event["id"], heal))
+    game.statistics.record_event_triggered(event["id"])
+    game.show_hero_info()
+
+
+@register_event_handler("gold")
+def handle_gold(game, event, rng, settings):
+    """获得金币的事件（宝箱、宝石）"""
+    gold_found = int(rng.randint(*event["gold"]) * settings["gold_multiplier"])
+    game.hero_gold += gold_found
+    _show_value_message(game, event, gold_found, event.get("suffix_key", "coins"))
+    game.events_encountered.append(game.lang.format_text("event_text", event["id"], gold_found))
+    game.statistics.record_event_triggered(event["id"])
+    game.statistics.record_gold_earned(gold_found)
+
+    # 更新收集金币任务进度
+    if event.get("update_quest"):
+        completed_quests = game.quest_system.update_quest_progress("collect_gold", gold_found)
+        game.handle_quest_completions(completed_quests)
+
+    game.show_hero_info()
+
+
+@register_event_handler("status")
+def handle_status(game, event, rng, settings):
+    """施加状态效果的事件"""
+    get_renderer(game).text(event["id"], prefix=f"{event['icon']} ")
+    game.add_status_effect(event["status_effect"], event.get("duration", 3))
+    game.events_encountered.append(game.lang.format_text("event_text", event["id"]))
+    game.statistics.record_event_triggered(event["id"])
+    game.show_hero_info()
+
+
+@register_event_handler("potion")
+def handle_potion(game, event, rng, settings):
+    """发现药剂"""
+    game.hero_potions += 1
+    get_renderer(game).text("find_potion", prefix="🧪 ")
+    game.events_encountered.append(game.lang.format_text("event_text", "find_potion"))
+    game.statistics.record_event_triggered(event["id"])
+    game.statistics.record_potion_found()
+    game.show_hero_info()
+
+
+@register_event_handler("equipment")
+def handle_equipment(game, event, rng, settings):
+    """发现装备"""
+    game.statistics.record_event_triggered(event["id"])
+    game.equipment_system.find_equipment()
+
+
+@register_event_handler("combat")
+def handle_combat(game, event, rng, settings):
+    """遭遇普通怪物"""
+    get_renderer(game).text("encounter_monster", prefix=f"{event['icon']} ")
+    game.statistics.record_event_triggered(event["id"])
+    game.combat_system.combat(settings["enemy_multiplier"] * event["multiplier"])
+
+    # 更新击杀怪物任务进度
+    if event.get("update_quest"):
+        completed_quests = game.quest_system.update_quest_progress("kill_monster")
+        game.handle_quest_completions(completed_quests)
+
+
+@register_event_handler("boss")
+def handle_boss(game, event, rng, settings):
+    """遭遇Boss"""
+    get_renderer(game).text("encounter_boss", prefix=f"{event['icon']} ")
+    game.statistics.record_event_triggered(event["id"])
+    game.combat_system.boss_combat(settings["enemy_multiplier"] * event["multiplier"])
+
+
+@register_event_handler("ghost")
+def handle_ghost(game, event, rng, settings):
+    """遭遇鬼魂"""
+    get_renderer(game).text("encounter_ghost", prefix=f"{event['icon']} ")
+    game.statistics.record_event_triggered(event["id"])
+    game.combat_system.ghost_combat(settings["enemy_multiplier"] * event["multiplier"])
+
+
+@register_event_handler("event_system")
+def handle_event_system(game, event, rng, settings):
+    """调用 EventSystem 中的事件方法（商人、传送、贤者等）"""
+    game.statistics.record_event_triggered(event["id"])
+    method = getattr(game.event_system, event["method"])
+    if event.get("gold_multiplier"):
+        method(settings["gold_multiplier"])
+    else:
+        method()
+
+
+@register_event_handler("safe_move")
+def handle_safe_move(game, event, rng, settings):
+    """平安移动"""
+    get_renderer(game).text("safe_move", prefix="✨ ")
+    game.events_encountered.append(game.lang.format_text("event_text", "safe_move"))
+    game.statistics.record_event_triggered(event["id"])
+
+
+EVENT_TABLES = compile_event_tables()
@@ -3,9 +3,11 @@
 新手村模块 - 处理新手村相关功能
 """
 
-import random
-import time
 from .safe_input import safe_input
+from .renderer import get_renderer
+from .clock import get_clock
+from .rng import get_stream
+from .combat_menu import get_combat_menu
 
 
 class NewbieVillage:
@@ -13,33 +15,45 @@ class NewbieVillage:
 
     def __init__(self, game):
         self.game = game
+        # 练习战斗和长老建议使用游戏的战斗随机数子流（指定种子时可复现）
+        self.random = get_stream(game, "combat")
+
+    @property
+    def renderer(self):
+        """游戏的输出渲染器"""
+        return get_renderer(self.game)
+
+    @property
+    def clock(self):
+        """游戏时钟"""
+        return get_clock(self.game)
 
     def newbie_village(self):
         """新手村主界面"""
         while True:
             self.game.clear_screen()
-            print(self.game.lang.get_text("block_separator"))
-            print(f"          {self.game.lang.get_text('newbie_village')}")
-            print(self.game.lang.get_text("block_separator"))
-            print()
+            self.renderer.text("block_separator")
+            self.renderer.text("newbie_village", prefix="          ")
+            self.renderer.text("block_separator")
+            self.renderer.print()
 
-            print(f"{self.game.lang.get_text('village_desc')}")
-            print()
+            self.renderer.text("village_desc")
+            self.renderer.print()
 
-            print(f"1. {self.game.lang.get_text('training_ground')}")
-            print(f"2. {self.game.lang.get_text('village_shop')}")
-            print(f"3. {self.game.lang.get_text('village_clinic')}")
-            print(f"4. {self.game.lang.get_text('elder_advice_short')}")
-            print(f"5. {self.game.lang.get_text('start_adventure')}")
+            self.renderer.text("training_ground", prefix="1. ")
+            self.renderer.text("village_shop", prefix="2. ")
+            self.renderer.text("village_clinic", prefix="3. ")
+            self.renderer.text("elder_advice_short", prefix="4. ")
+            self.renderer.text("start_adventure", prefix="5. ")
 
-            choice = safe_input(f"{self.game.lang.get_text('enter_choice')} (5): ", valid_options=["", "1", "2", "3", "4", "5"], allow_empty=True)
+            choice = safe_input(f"{self.game.lang.get_text('enter_choice')} (5): ", valid_options=["", "1", "2", "3", "4", "5"], allow_empty=True, renderer=self.renderer)
             if choice is None:
                 return
 
             if choice == "" or choice == "5":
                 self.game.hero_hp = self.game.hero_max_hp
-                print(f"\n{self.game.lang.get_text('hp_recovered')}")
-                time.sleep(1)
+                self.renderer.text("hp_recovered", prefix="\n")
+                self.clock.pause(1)
                 break
             elif choice == "1":
                 self.training_ground()
@@ -50,24 +64,24 @@ class NewbieVillage:
             elif choice == "4":
                 self.elder_advice()
             else:
-                print(self.game.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
 
     def training_ground(self):
         """训练场"""
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('training_ground')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("training_ground", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
-        print(f"{self.game.lang.get_text('training_desc')}")
-        print()
+        self.renderer.text("training_desc")
+        self.renderer.print()
 
-        print(f"1. {self.game.lang.get_text('practice_combat')}")
-        print(f"2. {self.game.lang.get_text('return_to_village')}")
+        self.renderer.text("practice_combat", prefix="1. ")
+        self.renderer.text("return_to_village", prefix="2. ")
 
         while True:
-            choice = safe_input(f"{self.game.lang.get_text('enter_choice')}: ", valid_options=["1", "2"])
+            choice = safe_input(f"{self.game.lang.get_text('enter_choice')}: ", valid_options=["1", "2"], renderer=self.renderer)
             if choice is None:
                 return
 
@@ -77,7 +91,7 @@ class NewbieVillage:
             elif choice == "2":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
 
     def practice_combat(self):
         """练习战斗"""
@@ -85,89 +99,81 @@ class NewbieVillage:
         opponent_hp = 50
         opponent_attack = 5
 
-        print(f"\n{self.game.lang.get_text('practice_start')} {opponent_name}!")
-        print(f"{opponent_name} - {self.game.lang.get_text('hp')}: {opponent_hp}, {self.game.lang.get_text('attack')}: {opponent_attack}")
-        time.sleep(1)
+        self.renderer.print(f"\n{self.game.lang.get_text('practice_start')} {opponent_name}!")
+        self.renderer.print(f"{opponent_name} - {self.game.lang.get_text('hp')}: {opponent_hp}, {self.game.lang.get_text('attack')}: {opponent_attack}")
+        self.clock.pause(1)
 
         while opponent_hp > 0:
             action = self.get_combat_action()
 
             if action == "1" or action == "":
-                damage = max(1, random.randint(self.game.hero_attack // 2, self.game.hero_attack))
+                damage = max(1, self.random.randint(self.game.hero_attack // 2, self.game.hero_attack))
                 opponent_hp -= damage
-                print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                self.renderer.print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
 
             elif action == "2" and self.game.hero_potions > 0:
-                heal_amount = random.randint(20, 40)
+                heal_amount = self.random.randint(20, 40)
                 self.game.hero_hp = min(self.game.hero_hp + heal_amount, self.game.hero_max_hp)
                 self.game.hero_potions -= 1
-                print(f"🧪 {self.game.lang.get_text('poison')} {heal_amount}{self.game.lang.get_text('point_hp')}")
+                self.renderer.print(f"🧪 {self.game.lang.get_text('poison')} {heal_amount}{self.game.lang.get_text('point_hp')}")
 
             # 处理技能选择
             elif action.isdigit() and int(action) > 2:
-                # 获取已学习的技能
+                # 按菜单编号获取已学习的技能（与显示的菜单一致）
                 if self.game.skill_tree:
-                    learned_skills = []
-                    for skill_id, level in self.game.skill_tree.learned_skills.items():
-                        if level > 0:
-                            learned_skills.append(skill_id)
+                    skill_id = get_combat_menu(self.game).skill_for(str(int(action)))
                     
-                    # 计算技能选项的索引
-                    skill_index = int(action) - 3  # 减去普通攻击和药剂选项
-                    
-                    if 0 <= skill_index < len(learned_skills):
-                        skill_id = learned_skills[skill_index]
-                        
+                    if skill_id is not None:
                         # 处理技能效果
                         if skill_id == "fireball":
-                            damage = random.randint(self.game.hero_attack, int(self.game.hero_attack * 1.5))
+                            damage = self.random.randint(self.game.hero_attack, int(self.game.hero_attack * 1.5))
                             opponent_hp -= damage
-                            print(f"🔥 {self.game.lang.get_text('fireball_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                            self.renderer.print(f"🔥 {self.game.lang.get_text('fireball_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                         
                         elif skill_id == "healing":
                             if self.game.hero_hp >= self.game.hero_max_hp:
-                                print("✨ " + self.game.lang.get_text("full_hp_no_heal"))
+                                self.renderer.print("✨ " + self.game.lang.get_text("full_hp_no_heal"))
                             else:
-                                heal_amount = random.randint(25, 40)
+                                heal_amount = self.random.randint(25, 40)
                                 self.game.hero_hp = min(self.game.hero_hp + heal_amount, self.game.hero_max_hp)
-                                print(f"✨ {self.game.lang.get_text('healing_skill')}{heal_amount}{self.game.lang.get_text('point_hp')}")
+                                self.renderer.print(f"✨ {self.game.lang.get_text('healing_skill')}{heal_amount}{self.game.lang.get_text('point_hp')}")
                         
                         elif skill_id == "power_strike":
-                            damage = random.randint(self.game.hero_attack, int(self.game.hero_attack * 1.4))
+                            damage = self.random.randint(self.game.hero_attack, int(self.game.hero_attack * 1.4))
                             opponent_hp -= damage
-                            print(f"⚔️ {self.game.lang.get_text('power_strike_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                            self.renderer.print(f"⚔️ {self.game.lang.get_text('power_strike_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                         
                         elif skill_id == "shield_bash":
-                            damage = random.randint(int(self.game.hero_attack * 0.8), self.game.hero_attack)
+                            damage = self.random.randint(int(self.game.hero_attack * 0.8), self.game.hero_attack)
                             opponent_hp -= damage
-                            print(f"🛡️ {self.game.lang.get_text('shield_bash_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                            self.renderer.print(f"🛡️ {self.game.lang.get_text('shield_bash_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                         
                         elif skill_id == "battle_cry":
-                            print(f"📣 {self.game.lang.get_text('battle_cry_skill')}!")
-                            damage = random.randint(int(self.game.hero_attack * 0.9), int(self.game.hero_attack * 1.1))
+                            self.renderer.text("battle_cry_skill", prefix="📣 ", suffix="!")
+                            damage = self.random.randint(int(self.game.hero_attack * 0.9), int(self.game.hero_attack * 1.1))
                             opponent_hp -= damage
-                            print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                            self.renderer.print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                         
                         elif skill_id == "backstab":
-                            damage = random.randint(int(self.game.hero_attack * 1.2), int(self.game.hero_attack * 1.5))
+                            damage = self.random.randint(int(self.game.hero_attack * 1.2), int(self.game.hero_attack * 1.5))
                             opponent_hp -= damage
-                            print(f"🗡️ {self.game.lang.get_text('backstab_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                            self.renderer.print(f"🗡️ {self.game.lang.get_text('backstab_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                         
                         elif skill_id == "shadow_strike":
-                            damage = random.randint(self.game.hero_attack, int(self.game.hero_attack * 1.3))
+                            damage = self.random.randint(self.game.hero_attack, int(self.game.hero_attack * 1.3))
                             opponent_hp -= damage
-                            print(f"🌑 {self.game.lang.get_text('shadow_strike_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                            self.renderer.print(f"🌑 {self.game.lang.get_text('shadow_strike_skill')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                         
                         elif skill_id == "frost_armor":
-                            print(f"❄️ {self.game.lang.get_text('frost_armor_skill')}!")
-                            damage = random.randint(int(self.game.hero_attack * 0.7), int(self.game.hero_attack * 0.9))
+                            self.renderer.text("frost_armor_skill", prefix="❄️ ", suffix="!")
+                            damage = self.random.randint(int(self.game.hero_attack * 0.7), int(self.game.hero_attack * 0.9))
                             opponent_hp -= damage
-                            print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                            self.renderer.print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                         
                         # 其他技能可以在这里添加
                         else:
                             # 默认技能处理
-                            damage = random.randint(self.game.hero_attack, int(self.game.hero_attack * 1.2))
+                            damage = self.random.randint(self.game.hero_attack, int(self.game.hero_attack * 1.2))
                             opponent_hp -= damage
                             # 检查技能ID是否已经包含"_skill"后缀
                             if skill_id.endswith("_skill"):
@@ -175,32 +181,32 @@ class NewbieVillage:
                             else:
                                 skill_name_key = f"{skill_id}_skill"
                             skill_name = self.game.lang.get_text(skill_name_key)
-                            print(f"⚔️ {skill_name} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                            self.renderer.print(f"⚔️ {skill_name} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                     else:
                         # 无效技能选择
-                        damage = max(1, random.randint(self.game.hero_attack // 2, self.game.hero_attack))
+                        damage = max(1, self.random.randint(self.game.hero_attack // 2, self.game.hero_attack))
                         opponent_hp -= damage
-                        print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                        self.renderer.print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
                 else:
                     # 没有技能树，使用普通攻击
-                    damage = max(1, random.randint(self.game.hero_attack // 2, self.game.hero_attack))
+                    damage = max(1, self.random.randint(self.game.hero_attack // 2, self.game.hero_attack))
                     opponent_hp -= damage
-                    print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                    self.renderer.print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
 
             else:
-                print(self.game.lang.get_text("invalid_action"))
-                damage = max(1, random.randint(self.game.hero_attack // 2, self.game.hero_attack))
+                self.renderer.text("invalid_action")
+                damage = max(1, self.random.randint(self.game.hero_attack // 2, self.game.hero_attack))
                 opponent_hp -= damage
-                print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
+                self.renderer.print(f"🗡️ {self.game.lang.get_text('you_attack')} {opponent_name}{self.game.lang.get_text('caused_damage')} {damage}{self.game.lang.get_text('point_damage')}")
 
             if opponent_hp <= 0:
-                print(f"\n🎉 {self.game.lang.get_text('practice_victory')} {opponent_name}!")
-                print(f"{self.game.lang.get_text('practice_reward')}")
+                self.renderer.print(f"\n🎉 {self.game.lang.get_text('practice_victory')} {opponent_name}!")
+                self.renderer.text("practice_reward")
                 exp_gain = 200000
                 gold_gain = 100000
                 self.game.hero_exp += exp_gain
                 self.game.hero_gold += gold_gain
-                print(f"{self.game.lang.get_text('got_exp')} {exp_gain} {self.game.lang.get_text('exp_points')} {self.game.lang.get_text('gold_coins')} {gold_gain}!")
+                self.renderer.line("battle_rewards", exp=exp_gain, gold=gold_gain)
 
                 # 检查升级
                 from .combat import CombatSystem
@@ -210,144 +216,90 @@ class NewbieVillage:
                 try:
                     input(f"\n{self.game.lang.get_text('continue_prompt')}")
                 except (KeyboardInterrupt, EOFError):
-                    print("\n操作被用户中断。")
+                    self.renderer.print("\n操作被用户中断。")
                     return
                 break
 
             self.game.show_hero_info()
-            time.sleep(1)
+            self.clock.pause(1)
 
     def get_combat_action(self):
         """获取战斗动作（简化版）"""
-        print(f"\n{self.game.lang.get_text('choose_action')}")
-        print(f"1. {self.game.lang.get_text('normal_attack')}")
-        
-        option_index = 2
-        
-        # 药剂选项
-        if self.game.hero_potions > 0:
-            print(f"{option_index}. {self.game.lang.get_text('use_potion_short')}")
-        else:
-            print(f"{option_index}. {self.game.lang.get_text('no_potion')}")
-        option_index += 1
-        
-        # 显示已学习的技能
-        if self.game.skill_tree:
-            # 获取已学习的技能
-            learned_skills = []
-            for skill_id, level in self.game.skill_tree.learned_skills.items():
-                if level > 0:
-                    learned_skills.append(skill_id)
-            
-            # 显示技能（按技能类别排序）
-            def get_skill_priority(skill_id):
-                from .game_config import SKILL_TREES
-                skill_data = SKILL_TREES.get(self.game.hero_class, {}).get(skill_id, {})
-                category = skill_data.get("category", "core")
-                
-                if category == "core":
-                    return 0
-                elif category == "combat":
-                    return 1
-                elif category == "passive":
-                    return 2
-                else:  # ultimate
-                    return 3
-            
-            learned_skills.sort(key=get_skill_priority)
-            
-            # 显示技能
-            for skill_id in learned_skills:
-                # 获取技能名称
-                # 检查技能ID是否已经包含"_skill"后缀
-                if skill_id.endswith("_skill"):
-                    skill_name_key = skill_id
-                else:
-                    skill_name_key = f"{skill_id}_skill"
-                skill_name = self.game.lang.get_text(skill_name_key)
-                
-                # 获取技能等级
-                skill_level = self.game.skill_tree.learned_skills.get(skill_id, 0)
-                
-                # 显示技能名称和等级
-                if skill_level > 0:
-                    print(f"{option_index}. {skill_name} (Lv.{skill_level})")
-                else:
-                    print(f"{option_index}. {skill_name}")
-                option_index += 1
+        menu = get_combat_menu(self.game)
+        menu.render(self.renderer, self.game.hero_potions)
 
-        choice = safe_input(f"{self.game.lang.get_text('enter_choice')} (1): ", allow_empty=True)
+        choice = safe_input(menu.prompt, allow_empty=True, renderer=self.renderer)
         return choice if choice is not None else "1"
 
     def village_shop(self):
         """村庄商店"""
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('village_shop')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("village_shop", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
-        print(f"{self.game.lang.get_text('shopkeeper_greeting')}")
-        print()
+        self.renderer.text("shopkeeper_greeting")
+        self.renderer.print()
 
-        print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
-        print()
+        self.renderer.print(f"{self.game.lang.get_text('your_gold')}: {self.game.hero_gold}")
+        self.renderer.print()
 
-        print(f"1. {self.game.lang.get_text('buy_potion')} - 10 {self.game.lang.get_text('gold')}")
-        print(f"2. {self.game.lang.get_text('exit_shop')}")
+        self.renderer.print(f"1. {self.game.lang.get_text('buy_potion')} - 10 {self.game.lang.get_text('gold')}")
+        self.renderer.text("exit_shop", prefix="2. ")
 
         while True:
-            choice = safe_input(f"{self.game.lang.get_text('enter_choice')}: ", valid_options=["1", "2"])
+            choice = safe_input(f"{self.game.lang.get_text('enter_choice')}: ", valid_options=["1", "2"], renderer=self.renderer)
             if choice is None:
                 return
 
             if choice == "1":
                 if self.game.hero_gold >= 10:
-                    num = safe_input(f"{self.game.lang.get_text('how_many')}: ")
+                    num = safe_input(f"{self.game.lang.get_text('how_many')}: ", renderer=self.renderer)
                     try:
                         if num is not None:
                             num = int(num)
                             if num > 0 and num * 10 <= self.game.hero_gold:
                                 self.game.hero_gold -= num * 10
                                 self.game.hero_potions += num
-                                print(f"{self.game.lang.get_text('buy_success')} {num} {self.game.lang.get_text('potions')}!")
+                                self.renderer.print(f"{self.game.lang.get_text('buy_success')} {num} {self.game.lang.get_text('potions')}!")
                             else:
-                                print(self.game.lang.get_text("not_enough_gold"))
+                                self.renderer.text("not_enough_gold")
                     except Exception as e:
                         from hero.error_handler import handle_error
                         error_msg = handle_error(e, "购买药剂", "购买药剂时发生错误。")
-                        print(error_msg)
+                        self.renderer.print(error_msg)
                 else:
-                    print(self.game.lang.get_text("not_enough_gold"))
+                    self.renderer.text("not_enough_gold")
                 try:
                     input(f"{self.game.lang.get_text('continue_prompt')}")
                 except (KeyboardInterrupt, EOFError):
-                    print("\n操作被用户中断。")
+                    self.renderer.print("\n操作被用户中断。")
                     return
                 break
             elif choice == "2":
                 break
             else:
-                print(self.game.lang.get_text("invalid_choice"))
+                self.renderer.text("invalid_choice")
 
     def village_clinic(self):
         """村庄诊所"""
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('village_clinic')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("village_clinic", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
         if self.game.hero_hp >= self.game.hero_max_hp:
-            print(f"{self.game.lang.get_text('hp_full')}")
+            self.renderer.text("hp_full")
         else:
             cost = 15
             heal_amount = self.game.hero_max_hp - self.game.hero_hp
-            print(f"{self.game.lang.get_text('clinic_offer')} {heal_amount} {self.game.lang.get_text('hp')}")
-            print(f"{self.game.lang.get_text('clinic_cost')} {cost} {self.game.lang.get_text('gold')}")
+            self.renderer.print(f"{self.game.lang.get_text('clinic_offer')} {heal_amount} {self.game.lang.get_text('hp')}")
+            self.renderer.print(f"{self.game.lang.get_text('clinic_cost')} {cost} {self.game.lang.get_text('gold')}")
 
             if self.game.hero_gold >= cost:
-                choice = safe_input(f"{self.game.lang.get_text('confirm_treatment')}: ")
+                choice = safe_input(f"{self.game.lang.get_text('confirm_treatment')}: ", renderer=self.renderer)
                 if choice is None:
                     return
                 # 使用统一的多语言确认选项
@@ -357,28 +309,28 @@ class NewbieVillage:
                 if confirm:
                     self.game.hero_gold -= cost
                     self.game.hero_hp = self.game.hero_max_hp
-                    print(f"\n{self.game.lang.get_text('treatment_success')}")
+                    self.renderer.text("treatment_success", prefix="\n")
                 else:
-                    print(f"{self.game.lang.get_text('cancel_treatment')}")
+                    self.renderer.text("cancel_treatment")
             else:
-                print(self.game.lang.get_text("not_enough_gold"))
+                self.renderer.text("not_enough_gold")
 
         try:
             input(f"\n{self.game.lang.get_text('continue_prompt')}")
         except (KeyboardInterrupt, EOFError):
-            print("\n操作被用户中断。")
+            self.renderer.print("\n操作被用户中断。")
             return
 
     def elder_advice(self):
         """长老建议"""
         self.game.clear_screen()
-        print(self.game.lang.get_text("block_separator"))
-        print(f"          {self.game.lang.get_text('elder_advice_title')}")
-        print(self.game.lang.get_text("block_separator"))
-        print()
+        self.renderer.text("block_separator")
+        self.renderer.text("elder_advice_title", prefix="          ")
+        self.renderer.text("block_separator")
+        self.renderer.print()
 
-        print(f"{self.game.lang.get_text('elder_desc')}")
-        print()
+        self.renderer.text("elder_desc")
+        self.renderer.print()
 
         # 使用统一的多语言建议列表
         advices = [
@@ -391,11 +343,11 @@ class NewbieVillage:
         ]
 
         # 随机显示3条建议
-        selected_advices = random.sample(advices, min(3, len(advices)))
+        selected_advices = self.random.sample(advices, min(3, len(advices)))
         for i, advice in enumerate(selected_advices, 1):
-            print(f"{i}. {advice}")
+            self.renderer.print(f"{i}. {advice}")
 
         try:
             input(f"\n{self.game.lang.get_text('continue_prompt')}")
         except (KeyboardInterrupt, EOFError):
-            print("\n操作被用户中断。")
+            self.renderer.print("\n操作被用户中断。")
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+预派生多进程服务器 - 主进程预加载只读数据后派生工作进程
+
+主进程导入游戏配置和会话用到的全部模块、构建文本表、编译遭遇表和事件表，然后 gc.freeze()
+并 fork 出 N 个工作进程，这些只读数据的内存页在写时复制下由所有工作进程共享，
+每个会话只需要分配英雄状态。主进程负责 accept，把连接的文件描述符通过
+Unix 套接字（SCM_RIGHTS）转交给当前会话数最少且未满的工作进程（所有工作进程
+都已满或通道都无法写入时直接断开连接）；
+工作进程用 server.GameServer 在自己的事件循环中运行会话，并在会话结束时回报。
+
+仅支持提供 os.fork 的平台。
+"""
+
+import array
+import asyncio
+import gc
+import importlib
+import os
+import selectors
+import signal
+import socket
+
+from . import game_config
+from . import encounters
+from . import map_events
+from .language import preload_texts
+from .server import GameServer, DEFAULT_BACKLOG, DEFAULT_MAX_SESSIONS, SERVER_FULL_MESSAGE
+
+
+# 游戏按需导入的模块（fork 之前导入，模块对象和常量表由所有工作进程共享）
+PRELOAD_MODULES = ("hero.items", "hero.effects", "hero.equipment", "hero.combat", "hero.skill_tree",
+                   "hero.events", "hero.newbie_village", "hero.achievements", "hero.quest",
+                   "hero.save_data")
+
+# 工作进程回报会话结束的消息
+SESSION_DONE = b"-"
+
+# 转交连接时随文件描述符发送的消息
+NEW_CONNECTION = b"c"
+
+# 主进程与工作进程之间的通道类型（保留消息边界，SEQPACKET 还能在对端关闭时收到 EOF）
+CHANNEL_TYPE = getattr(socket, "SOCK_SEQPACKET", socket.SOCK_DGRAM)
+
+
+def preload_shared_data(languages=("zh", "en")):
+    """在 fork 之前构建所有只读共享数据
+
+    Args:
+        languages: 预加载的语言
+
+    Returns:
+        dict: 预加载的数据概况
+    """
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
+    texts = preload_texts(languages)
+    summary = {
+        "modules": len(PRELOAD_MODULES),
+        "texts": texts,
+        "skill_trees": len(game_config.SKILL_TREES),
+        "monster_templates": len(game_config.MONSTER_TEMPLATES),
+        "boss_templates": len(game_config.BOSS_TEMPLATES),
+        "legendary_equipment": len(game_config.LEGENDARY_EQUIPMENT),
+        "encounter_tables": len(encounters.ENCOUNTER_TABLES),
+        "event_tables": len(map_events.EVENT_TABLES)
+    }
+    # 把预加载的对象移出垃圾回收跟踪，避免子进程中的回收扫描触发写时复制
+    gc.collect()
+    gc.freeze()
+    return summary
+
+
+def send_fd(channel, fd, message=NEW_CONNECTION):
+    """通过 Unix 套接字发送文件描述符"""
+    channel.sendmsg([message], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", [fd]))])
+
+
+def receive_fd(channel):
+    """从 Unix 套接字接收文件描述符
+
+    Returns:
+        tuple: (消息, 文件描述符或 None)
+    """
+    fds = array.array("i")
+    message, ancillary, _, _ = channel.recvmsg(16, socket.CMSG_LEN(fds.itemsize))
+    for level, kind, data in ancillary:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(data[:len(data) - (len(data) % fds.itemsize)])
+    return message, (fds[0] if fds else None)
+
+
+class WorkerHandle:
+    """主进程中的工作进程记录"""
+
+    def __init__(self, index, pid, channel):
+        self.index = index
+        self.pid = pid
+        self.channel = channel
+        self.load = 0
+        self.alive = True  # 通道已关闭（工作进程退出）后不再分配连接
+
+
+class PreforkSupervisor:
+    """预派生服务器主进程"""
+
+    def __init__(self, host="0.0.0.0", port=4000, workers=None, max_sessions=DEFAULT_MAX_SESSIONS,
+                 pool_size=0):
+        """
+        Args:
+            host: 监听地址
+            port: 监听端口（0 表示随机端口）
+            workers: 工作进程数，None 表示 CPU 核心数
+            max_sessions: 每个工作进程的最大并发会话数
+            pool_size: 每个工作进程预热的游戏实例数
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("预派生服务器需要支持 os.fork 的平台")
+        self.host = host
+        self.port = port
+        self.worker_count = workers or os.cpu_count() or 1
+        self.max_sessions = max_sessions
+        self.pool_size = pool_size
+        self.workers = {}
+        self.listener = None
+        self.selector = None
+        self.preloaded = None
+        self.running = False
+
+    def start(self):
+        """预加载共享数据、开始监听并派生工作进程"""
+        self.preloaded = preload_shared_data()
+        self.listener = socket.create_server((self.host, self.port), backlog=DEFAULT_BACKLOG)
+        self.listener.setblocking(False)
+        self.port = self.listener.getsockname()[1]
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ, None)
+        for index in range(self.worker_count):
+            self._spawn_worker(index)
+        self.running = True
+
+    def _spawn_worker(self, index):
+        """派生一个工作进程"""
+        parent_channel, child_channel = socket.socketpair(socket.AF_UNIX, CHANNEL_TYPE)
+        pid = os.fork()
+        if pid == 0:
+            # 子进程：只保留自己的通道
+            exit_code = 0
+            try:
+                self.selector.close()
+                self.listener.close()
+                parent_channel.close()
+                for worker in self.workers.values():
+                    worker.channel.close()
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                run_worker(child_channel, self.max_sessions, self.pool_size)
+            except BaseException:
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        child_channel.close()
+        parent_channel.setblocking(False)
+        worker = WorkerHandle(index, pid, parent_channel)
+        self.workers[pid] = worker
+        self.selector.register(parent_channel, selectors.EVENT_READ, worker)
+        return worker
+
+    def available_workers(self):
+        """可以接收新连接的工作进程（通道可用且会话数未满），按会话数从少到多排列"""
+        workers = [worker for worker in self.workers.values()
+                   if worker.alive and worker.load < self.max_sessions]
+        workers.sort(key=lambda worker: (worker.load, worker.index))
+        return workers
+
+    def least_loaded(self):
+        """当前会话数最少且未满的工作进程，没有时为 None"""
+        workers = self.available_workers()
+        return workers[0] if workers else None
+
+    def dispatch(self, connection):
+        """把新连接转交给最空闲的工作进程
+
+        通道缓冲区已满（BlockingIOError）或工作进程已退出时依次尝试下一个工作进程；
+        所有工作进程都已满或都无法转交时通知客户端并断开连接。
+
+        Args:
+            connection: 已接受的客户端连接（转交后在主进程中关闭）
+
+        Returns:
+            WorkerHandle: 接收连接的工作进程，断开连接时为 None
+        """
+        try:
+            for worker in self.available_workers():
+                try:
+                    send_fd(worker.channel, connection.fileno())
+                except (BlockingIOError, InterruptedError):
+                    continue
+                except OSError:
+                    # 工作进程已退出，等待 _reap_workers 回收并重新派生
+                    self._close_channel(worker)
+                    continue
+                worker.load += 1
+                return worker
+            self._reject(connection)
+            return None
+        finally:
+            connection.close()
+
+    def _reject(self, connection):
+        """通知客户端服务器已满（尽力发送，不等待）"""
+        try:
+            connection.setblocking(False)
+            connection.send(SERVER_FULL_MESSAGE)
+        except OSError:
+            pass
+
+    def _close_channel(self, worker):
+        """注销并关闭工作进程的通道"""
+        if not worker.alive:
+            return
+        worker.alive = False
+        self.selector.unregister(worker.channel)
+        worker.channel.close()
+
+    def _accept(self):
+        """接受所有等待中的连接"""
+        while True:
+            try:
+                connection, _ = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            self.dispatch(connection)
+
+    def _read_reports(self, worker):
+        """读取工作进程的会话结束回报"""
+        while True:
+            try:
+                message = worker.channel.recv(16)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                message = b""
+            if not message:
+                # 工作进程已退出：注销通道，否则 select 会一直报告可读
+                self._close_channel(worker)
+                return
+            if message == SESSION_DONE:
+                worker.load = max(0, worker.load - 1)
+            else:
+                return
+
+    def _reap_workers(self):
+        """回收退出的工作进程并重新派生"""
+        for pid in list(self.workers):
+            try:
+                finished, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                finished = pid
+            if finished == 0:
+                continue
+            worker = self.workers.pop(pid)
+            self._close_channel(worker)
+            if self.running:
+                self._spawn_worker(worker.index)
+
+    def poll(self, timeout=1.0):
+        """处理一轮监听和回报事件"""
+        for key, _ in self.selector.select(timeout):
+            if key.data is None:
+                self._accept()
+            else:
+                self._read_reports(key.data)
+        self._reap_workers()
+
+    def serve_forever(self):
+        """启动并一直运行"""
+        if not self.running:
+            self.start()
+        while self.running:
+            self.poll()
+
+    def stop(self):
+        """停止监听并结束所有工作进程"""
+        self.running = False
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid, worker in list(self.workers.items()):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+            worker.channel.close()
+        self.workers.clear()
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+
+
+def run_worker(channel, max_sessions=DEFAULT_MAX_SESSIONS, pool_size=0):
+    """工作进程入口：接收主进程转交的连接并运行会话"""
+    asyncio.run(_serve_worker(channel, max_sessions, pool_size))
+
+
+async def _serve_worker(channel, max_sessions, pool_size=0):
+    """工作进程的事件循环（预热池的补充线程在 fork 之后各自启动）"""
+    loop = asyncio.get_running_loop()
+    server = GameServer(max_sessions=max_sessions, pool_size=pool_size)
+    if server.pool is not None:
+        server.pool.start()
+    stopped = loop.create_future()
+    channel.setblocking(False)
+
+    async def serve(sock):
+        try:
+            await server.accept_socket(sock)
+        finally:
+            try:
+                channel.send(SESSION_DONE)
+            except OSError:
+                pass
+
+    def on_readable():
+        while True:
+            try:
+                message, fd = receive_fd(channel)
+            except (BlockingIOError, InterruptedError):
+                return
+            if not message:
+                # 主进程已关闭通道
+                if not stopped.done():
+                    stopped.set_result(None)
+                return
+            if fd is not None:
+                sock = socket.socket(fileno=fd)
+                sock.setblocking(False)
+                loop.create_task(serve(sock))
+
+    loop.add_reader(channel.fileno(), on_readable)
+    try:
+        await stopped
+    finally:
+        loop.remove_reader(channel.fileno())
+        await server.close()
@@ -79,8 +79,13 @@ class Quest:
 class QuestSystem:
     """任务系统类"""
     
-    def __init__(self):
-        """初始化任务系统"""
+    def __init__(self, rng=None):
+        """初始化任务系统
+
+        Args:
+            rng: 任务随机数源（random.Random 实例），None 表示使用全局 random 模块
+        """
+        self.random = rng if rng is not None else random
         self.active_quests = []  # 当前活动任务（最多3个）
         self.completed_quests = []  # 已完成任务
         self.quest_counter = 0  # 任务计数器（用于生成唯一ID）
@@ -106,11 +111,11 @@ class QuestSystem:
         if len(self.active_quests) >= 3:
             return None
         
-        quest_type, description_key, min_target, max_target = random.choice(self.quest_types)
+        quest_type, description_key, min_target, max_target = self.random.choice(self.quest_types)
         
         # 根据英雄等级调整目标值
         level_multiplier = 1 + (hero_level - 1) * 0.2
-        target_value = int(random.randint(min_target, max_target) * level_multiplier)
+        target_value = int(self.random.randint(min_target, max_target) * level_multiplier)
         
         # 根据目标值计算奖励
         reward_multiplier = 1 + (hero_level - 1) * 0.3
@@ -157,15 +162,11 @@ class QuestSystem:
         
         result = []
         for i, quest in enumerate(self.active_quests, 1):
-            description = lang.get_text(quest.description_key).format(
-                target=quest.target_value,
-                current=quest.current_value
-            )
+            description = lang.render(quest.description_key,
+                                      target=quest.target_value,
+                                      current=quest.current_value)
             progress = f"({quest.get_progress_percentage()}%)"
-            reward = lang.get_text("quest_reward").format(
-                gold=quest.reward_gold,
-                exp=quest.reward_exp
-            )
+            reward = lang.render("quest_reward", gold=quest.reward_gold, exp=quest.reward_exp)
             result.append(f"{i}. {description} {progress}\n   {reward}")
         
         return "\n".join(result)
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+输出渲染模块 - 游戏的所有输出都经由 HeroGame.renderer
+
+- TerminalRenderer: 交互终端，frame() 范围内的输出合并为一次写入
+- NullRenderer: 无人观看时丢弃输出，text() 和 line() 不做任何文本查找和格式化
+- RecordingRenderer: 记录结构化消息（文本键 + 参数），用于测试和回放
+
+子系统通过 get_renderer(game) 获取渲染器；游戏对象没有渲染器
+（如测试中的模拟对象）时使用直接写标准输出的终端渲染器。
+"""
+
+import os
+import sys
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from .language import LanguageSupport, format_line
+
+
+# 记录的消息：key 为文本键或整行模板名（普通输出为 None），
+# params 为格式化参数（位置参数元组或命名参数字典），text 为最终文本
+RenderedMessage = namedtuple("RenderedMessage", ["key", "params", "text"])
+
+
+class Renderer:
+    """渲染器基类"""
+
+    # 是否有人观看；为 False 时调用方可以跳过整段界面的构建
+    enabled = True
+
+    def __init__(self, game=None):
+        """
+        Args:
+            game: 游戏对象（用于 text() 的多语言文本查找）
+        """
+        self.game = game
+
+    def write(self, text):
+        """写入已格式化的文本（子类实现）"""
+        raise NotImplementedError
+
+    def print(self, *values, sep=" ", end="\n", flush=False):
+        """与内置 print 参数一致的输出"""
+        self.write(sep.join(str(value) for value in values) + end)
+
+    def format(self, key, params=(), fields=None):
+        """把文本键和参数格式化为当前语言的文本
+
+        Args:
+            key: 文本键，或 LanguageSupport.FORMAT_FUNCTIONS 中的格式化类型
+            params: 格式化类型的位置参数（如 text("event_text", "find_potion")）
+            fields: 文本模板的命名参数（如 text("gained_exp", exp=10)）
+
+        Returns:
+            str: 格式化后的文本
+        """
+        lang = self.game.lang
+        if key in LanguageSupport.FORMAT_FUNCTIONS:
+            return lang.format_text(key, *params, **(fields or {}))
+        if params:
+            raise TypeError(f"文本 {key} 只接受命名参数")
+        if fields:
+            return lang.get_text(key, **fields)
+        return lang.get_text(key)
+
+    def text(self, key, /, *params, prefix="", suffix="", end="\n", **fields):
+        """输出一条多语言文本
+
+        Args:
+            key: 文本键
+            *params: 格式化类型（见 format）的位置参数
+            prefix: 前缀（如图标）
+            suffix: 后缀
+            end: 行尾字符
+            **fields: 文本模板的命名参数（为空时直接取文本）
+        """
+        self.write(f"{prefix}{self.format(key, params, fields)}{suffix}{end}")
+
+    def line(self, name, /, prefix="", suffix="", end="\n", **params):
+        """输出一条整行模板（见 language.LINE_TEMPLATES）
+
+        Args:
+            name: 整行模板名
+            **params: 模板参数
+        """
+        self.write(f"{prefix}{format_line(self.game.lang, name, params)}{suffix}{end}")
+
+    def typewrite(self, text, delay, end="\n"):
+        """逐字显示文本"""
+        self.write(text + end)
+
+    def clear(self):
+        """清屏"""
+
+    def flush(self):
+        """把缓冲的输出写出"""
+
+    @contextmanager
+    def frame(self):
+        """一帧界面的输出范围（终端渲染器在范围结束时一次写出）"""
+        yield self
+
+
+class TerminalRenderer(Renderer):
+    """交互终端渲染器"""
+
+    def __init__(self, game=None, stream=None):
+        """
+        Args:
+            game: 游戏对象
+            stream: 输出流，None 表示写入时的 sys.stdout
+        """
+        super().__init__(game)
+        self.stream = stream
+        self._buffer = []
+        self._frame_depth = 0
+
+    def _stream(self):
+        return self.stream if self.stream is not None else sys.stdout
+
+    def write(self, text):
+        if self._frame_depth:
+            self._buffer.append(text)
+        else:
+            self._stream().write(text)
+
+    def print(self, *values, sep=" ", end="\n", flush=False):
+        super().print(*values, sep=sep, end=end)
+        if flush:
+            self.flush()
+
+    def typewrite(self, text, delay, end="\n"):
+        if not delay:
+            self.write(text + end)
+            return
+        self.flush()
+        stream = self._stream()
+        for char in text:
+            stream.write(char)
+            stream.flush()
+            time.sleep(delay)
+        stream.write(end)
+
+    def clear(self):
+        self.flush()
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+    def flush(self):
+        if self._buffer:
+            self._stream().write("".join(self._buffer))
+            self._buffer.clear()
+        self._stream().flush()
+
+    @contextmanager
+    def frame(self):
+        self._frame_depth += 1
+        try:
+            yield self
+        finally:
+            self._frame_depth -= 1
+            if not self._frame_depth:
+                self.flush()
+
+
+class NullRenderer(Renderer):
+    """丢弃所有输出的渲染器"""
+
+    enabled = False
+
+    def write(self, text):
+        pass
+
+    def print(self, *values, sep=" ", end="\n", flush=False):
+        pass
+
+    def text(self, key, /, *params, prefix="", suffix="", end="\n", **fields):
+        pass
+
+    def line(self, name, /, prefix="", suffix="", end="\n", **params):
+        pass
+
+    def typewrite(self, text, delay, end="\n"):
+        pass
+
+
+class RecordingRenderer(Renderer):
+    """记录结构化消息的渲染器"""
+
+    def __init__(self, game=None, echo=None):
+        """
+        Args:
+            game: 游戏对象
+            echo: 同时输出到的渲染器（None 表示只记录）
+        """
+        super().__init__(game)
+        self.echo = echo
+        self.messages = []
+
+    def write(self, text):
+        self.messages.append(RenderedMessage(None, (), text))
+        if self.echo is not None:
+            self.echo.write(text)
+
+    def text(self, key, /, *params, prefix="", suffix="", end="\n", **fields):
+        text = f"{prefix}{self.format(key, params, fields)}{suffix}{end}"
+        self.messages.append(RenderedMessage(key, fields or params, text))
+        if self.echo is not None:
+            self.echo.write(text)
+
+    def line(self, name, /, prefix="", suffix="", end="\n", **params):
+        text = f"{prefix}{format_line(self.game.lang, name, params)}{suffix}{end}"
+        self.messages.append(RenderedMessage(name, params, text))
+        if self.echo is not None:
+            self.echo.write(text)
+
+    def keys(self):
+        """按顺序返回记录的文本键"""
+        return [message.key for message in self.messages if message.key is not None]
+
+    def output(self):
+        """返回记录的全部文本"""
+        return "".join(message.text for message in self.messages)
+
+    def clear_messages(self):
+        """清空记录"""
+        self.messages.clear()
+
+    def replay(self, renderer):
+        """把记录的消息按原文本重放到另一个渲染器"""
+        for message in self.messages:
+            renderer.write(message.text)
+
+
+def get_renderer(game):
+    """获取游戏对象的渲染器
+
+    游戏对象没有渲染器（如测试中的模拟对象）时返回写标准输出的终端渲染器。
+    """
+    renderer = getattr(game, "renderer", None)
+    if isinstance(renderer, Renderer):
+        return renderer
+    return TerminalRenderer(game)
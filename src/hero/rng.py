@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+随机数模块 - 为每个游戏会话提供可注入、可复现的随机数子流
+
+每个 HeroGame 拥有一个 GameRandom，其中战斗、战利品、事件、任务各自使用
+独立的子流，互不扰动。指定种子（或注入 random.Random）时，相同种子加相同输入
+得到完全相同的游戏；都不指定时各子流直接使用全局 random 模块（与旧行为一致）。
+"""
+
+import random
+
+
+# 子流名称（派生顺序固定，保证可复现）
+STREAM_NAMES = ("combat", "loot", "events", "quests")
+
+
+class GameRandom:
+    """游戏会话随机数源"""
+
+    def __init__(self, seed=None, rng=None):
+        """
+        Args:
+            seed: 随机种子
+            rng: 注入的 random.Random 实例，各子流由它派生（优先于 seed）
+        """
+        if rng is None and seed is not None:
+            rng = random.Random(seed)
+        self.seed = seed
+        self.isolated = rng is not None
+
+        for name in STREAM_NAMES:
+            stream = random.Random(rng.getrandbits(64)) if rng is not None else random
+            setattr(self, name, stream)
+
+    def stream(self, name):
+        """按名称获取子流"""
+        return getattr(self, name)
+
+    def renew(self, seed=None):
+        """为新的一局创建随机数源
+
+        Args:
+            seed: 新的随机种子；为 None 时保持原有方式（隔离的会话使用新的独立随机数源）
+
+        Returns:
+            GameRandom: 新的随机数源
+        """
+        if seed is not None:
+            return GameRandom(seed=seed)
+        return GameRandom(rng=random.Random() if self.isolated else None)
+
+
+def get_stream(game, name):
+    """获取游戏对象的随机数子流
+
+    游戏对象没有 GameRandom（如测试中的模拟对象）时返回全局 random 模块。
+
+    Args:
+        game: 游戏对象
+        name: 子流名称
+
+    Returns:
+        random.Random 实例或 random 模块
+    """
+    streams = getattr(game, "rng", None)
+    if isinstance(streams, GameRandom):
+        return streams.stream(name)
+    return random
@@ -1,26 +1,99 @@
 # -*- coding: utf-8 -*-
 """
 安全的用户输入模块 - 提供统一的输入验证和错误处理
+
+所有输入都可以被"输入提供者"接管（例如无头模拟驱动的决策策略）。
+输入提供者是一个可调用对象 provider(decision, prompt, options) -> str，
+其中 decision 为决策点类型（如 "move"、"combat_action"、"continue"），
+options 为该决策点的有效选项列表（可能为 None）。约定选项列表的最后一项为
+离开/返回选项。提供者按上下文（线程/协程）生效，互不干扰。
 """
 
-from typing import Optional
+import contextvars
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+
+# 当前上下文的输入提供者，None 表示使用标准输入
+_input_provider: contextvars.ContextVar = contextvars.ContextVar("hero_input_provider", default=None)
+
+
+def get_input_provider() -> Optional[Callable]:
+    """获取当前上下文的输入提供者"""
+    return _input_provider.get()
+
+
+def set_input_provider(provider: Optional[Callable]):
+    """设置当前上下文的输入提供者
+
+    Args:
+        provider: 输入提供者，None 表示恢复标准输入
+
+    Returns:
+        用于 reset_input_provider 的令牌
+    """
+    return _input_provider.set(provider)
+
+
+def reset_input_provider(token) -> None:
+    """恢复设置输入提供者之前的状态"""
+    _input_provider.reset(token)
+
 
+@contextmanager
+def input_provider(provider: Optional[Callable]):
+    """在上下文范围内临时使用指定的输入提供者"""
+    token = _input_provider.set(provider)
+    try:
+        yield provider
+    finally:
+        _input_provider.reset(token)
 
-def safe_input(prompt: str, valid_options: list = None, allow_empty: bool = False) -> Optional[str]:
+
+def read_input(prompt: str = "", decision: str = "continue", options: list = None) -> str:
+    """与内置 input() 行为一致的输入函数，可被输入提供者接管
+
+    Args:
+        prompt: 输入提示信息
+        decision: 决策点类型
+        options: 有效选项列表
+
+    Returns:
+        用户输入的内容（未经处理）
+    """
+    provider = _input_provider.get()
+    if provider is not None:
+        return provider(decision, prompt, options)
+    return input(prompt)
+
+
+def safe_input(prompt: str, valid_options: list = None, allow_empty: bool = False,
+               decision: str = "prompt", renderer=None) -> Optional[str]:
     """安全的用户输入函数，支持参数验证和错误处理
-    
+
     Args:
         prompt: 输入提示信息
         valid_options: 有效选项列表
         allow_empty: 是否允许空输入
-        
+        decision: 决策点类型（供输入提供者使用）
+        renderer: 输出提示信息的渲染器，None 表示写标准输出
+
     Returns:
         用户输入的内容，None 表示输入被中断或出错
     """
+    provider = _input_provider.get()
+    if provider is not None:
+        answer = provider(decision, prompt, valid_options)
+        if valid_options is None or answer in valid_options or (allow_empty and answer == ""):
+            return answer
+        # 提供者给出无效选项时退回默认选项，避免无限循环
+        return "" if allow_empty else valid_options[0]
+
+    output = renderer.print if renderer is not None else print
     while True:
         try:
             user_input = input(prompt)
-            
+
             # 验证输入
             if valid_options is not None:
                 if allow_empty and (user_input == "" or user_input in valid_options):
@@ -28,15 +101,15 @@ def safe_input(prompt: str, valid_options: list = None, allow_empty: bool = Fals
                 elif user_input in valid_options:
                     return user_input
                 else:
-                    print("无效输入，请重新选择。")
+                    output("无效输入，请重新选择。")
                     continue
-            
+
             return user_input
         except (KeyboardInterrupt, EOFError):
             # 用户中断输入（Ctrl+C）或文件结束
-            print("\n操作被用户中断。")
+            output("\n操作被用户中断。")
             return None
         except Exception as e:
             # 处理其他可能的输入异常
-            print(f"输入过程中发生错误：{e}")
-            return None
\ No newline at end of file
+            output(f"输入过程中发生错误：{e}")
+            return None
@@ -7,6 +7,8 @@ import json
 import os
 from datetime import datetime
 from .statistics import GameStatistics
+from .items import item_to_dict
+from .renderer import get_renderer
 
 
 class SaveData:
@@ -164,9 +166,9 @@ class SaveData:
             "skill_points": self.skill_points,
             "skill_tree_data": self.skill_tree_data,
 
-            # 装备和背包
-            "equipment": self.equipment,
-            "inventory": self.inventory,
+            # 装备和背包（Item 转换为原来的装备字典格式）
+            "equipment": {slot: item_to_dict(item) for slot, item in self.equipment.items()},
+            "inventory": [item_to_dict(item) for item in self.inventory],
 
             # 技能
             "hero_skills": self.hero_skills,
@@ -309,20 +311,27 @@ class SaveData:
 class SaveManager:
     """存档管理器 - 处理存档的保存和加载"""
 
-    def __init__(self, save_dir="saves"):
+    def __init__(self, save_dir="saves", game=None):
         """
         初始化存档管理器
 
         Args:
             save_dir: 存档目录路径
+            game: 游戏对象（错误信息经由它的渲染器输出）
         """
         self.save_dir = save_dir
+        self.game = game
         self.max_slots = 5  # 最多5个存档槽位
 
         # 确保存档目录存在
         if not os.path.exists(self.save_dir):
             os.makedirs(self.save_dir)
 
+    @property
+    def renderer(self):
+        """游戏的输出渲染器"""
+        return get_renderer(self.game)
+
     def get_save_path(self, slot_number):
         """
         获取存档文件路径
@@ -369,14 +378,14 @@ class SaveManager:
             # 使用错误处理模块
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(e, "保存存档", "没有权限写入存档文件。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             log_debug(f"保存存档权限错误: {str(e)}")
             return False
         except Exception as e:
             # 使用错误处理模块
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(e, "保存存档", "保存存档时发生未知错误。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             log_debug(f"保存存档未知错误: {str(e)}")
             return False
 
@@ -412,23 +421,23 @@ class SaveManager:
             # 使用错误处理模块
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(e, "加载存档", "存档文件已损坏，无法加载。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             log_debug(f"存档文件JSON解析错误: {str(e)}")
             return None
         except FileNotFoundError:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(FileNotFoundError(), "加载存档", "存档文件不存在。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             return None
         except PermissionError:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(PermissionError(), "加载存档", "没有权限读取存档文件。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             return None
         except Exception as e:
             from hero.error_handler import handle_error, log_debug
             error_msg = handle_error(e, "加载存档", "加载存档时发生未知错误。")
-            print(error_msg)
+            self.renderer.print(error_msg)
             log_debug(f"加载存档未知错误: {str(e)}")
             return None
 
@@ -513,5 +522,5 @@ class SaveManager:
                 return False
 
         except Exception as e:
-            print(f"Error deleting save: {e}")
+            self.renderer.print(f"Error deleting save: {e}")
             return False
@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+"""
+多会话游戏服务器 - asyncio TCP 行协议（兼容 telnet）
+
+单个事件循环负责所有连接的读写：输入行进入每个连接的 asyncio.Queue，
+输出经由每个连接的缓冲写入器批量发送，并通过 drain() 实现背压。
+游戏逻辑沿用现有的 HeroGame 及其子系统，每个会话的游戏在线程池中运行，
+等待输入和停顿时只挂起本会话的线程（停顿在事件循环中 await asyncio.sleep），
+不会阻塞事件循环或其他会话。
+启用会话预热池（--pool-size）时，新会话直接取用预先构建好的游戏实例。
+
+注意：这不是纯协程的设计。游戏代码在各层菜单和战斗中同步调用 safe_input
+（输入不是 awaitable），改为协程需要把整个调用链改写为 async，因此每个会话
+占用一个线程，只有网络读写和停顿在事件循环中进行。每个会话的线程和游戏实例
+约占 70KB 常驻内存，单个进程可以支撑数百个并发会话（见 tests/test_server.py
+的负载测试和 performance_test.py 的 test_server_load）。
+
+用法: python -m hero.server --port 4000
+"""
+
+import argparse
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from .main import HeroGame
+from .renderer import TerminalRenderer
+from .clock import GameClock
+from .safe_input import input_provider
+from .session_pool import SessionPool
+
+
+# telnet 协议字节
+IAC = 255
+SB = 250
+SE = 240
+NEGOTIATION_COMMANDS = (251, 252, 253, 254)  # WILL, WONT, DO, DONT
+
+# ANSI 清屏序列
+CLEAR_SCREEN = "\033[2J\033[H"
+
+# 每个进程默认的最大并发会话数。
+# 每个会话在整个连接期间独占线程池中的一个系统线程（等待玩家输入时也不释放），
+# 每个线程保留一个线程栈（Linux 默认 8MB 虚拟地址空间，实际驻留很少），会话的
+# 线程和游戏实例合计约 70KB 常驻内存；1000 个同时连接的会话实测仍可正常响应。
+DEFAULT_MAX_SESSIONS = 256
+
+# 监听队列长度（asyncio 默认 100，大量玩家同时连接时超出的连接会卡在握手阶段）
+DEFAULT_BACKLOG = 1024
+
+# 会话数已满时发送给客户端的消息
+SERVER_FULL_MESSAGE = b"Server is full, please try again later.\r\n"
+
+
+class SessionClosed(BaseException):
+    """连接已关闭（继承 BaseException，避免被游戏中的 except Exception 吞掉）"""
+
+
+def strip_telnet(data):
+    """去掉 telnet 协商序列
+
+    Args:
+        data: 原始字节
+
+    Returns:
+        bytes: 纯文本字节
+    """
+    if IAC not in data:
+        return data
+    result = bytearray()
+    index = 0
+    length = len(data)
+    while index < length:
+        byte = data[index]
+        if byte != IAC:
+            result.append(byte)
+            index += 1
+            continue
+        command = data[index + 1] if index + 1 < length else None
+        if command == IAC:
+            result.append(IAC)
+            index += 2
+        elif command == SB:
+            end = data.find(bytes((IAC, SE)), index + 2)
+            index = length if end < 0 else end + 2
+        elif command in NEGOTIATION_COMMANDS:
+            index += 3
+        else:
+            index += 2
+    return bytes(result)
+
+
+class SessionConnection:
+    """一个客户端连接：事件循环侧负责读写，游戏线程侧提供阻塞式的输入、输出和停顿"""
+
+    def __init__(self, reader, writer, loop, high_water=64 * 1024):
+        """
+        Args:
+            reader: asyncio.StreamReader
+            writer: asyncio.StreamWriter
+            loop: 事件循环
+            high_water: 输出缓冲达到该字节数时立即发送
+        """
+        self.reader = reader
+        self.writer = writer
+        self.loop = loop
+        self.high_water = high_water
+        self.lines = asyncio.Queue()
+        self.closed = False
+        self._buffer = []
+        self._buffered = 0
+        self._sending = None
+
+    # ---- 事件循环侧 ----
+
+    async def read_lines(self):
+        """读取客户端输入行直到连接关闭"""
+        try:
+            while True:
+                data = await self.reader.readline()
+                if not data:
+                    break
+                line = strip_telnet(data).decode("utf-8", errors="replace").strip("\r\n")
+                await self.lines.put(line)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.close()
+
+    async def next_line(self):
+        """等待下一行输入，连接关闭时返回 None"""
+        if self.closed and self.lines.empty():
+            return None
+        return await self.lines.get()
+
+    async def send(self, data):
+        """发送数据并等待写缓冲排空（背压）"""
+        self.writer.write(data)
+        await self.writer.drain()
+
+    def close(self):
+        """标记连接关闭并唤醒等待输入的游戏线程"""
+        if not self.closed:
+            self.closed = True
+            self.lines.put_nowait(None)
+
+    # ---- 游戏线程侧 ----
+
+    def _wait(self, coroutine):
+        """在事件循环中运行协程并阻塞当前游戏线程直到完成"""
+        try:
+            return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+        except (ConnectionError, RuntimeError) as error:
+            raise SessionClosed() from error
+
+    def write(self, text):
+        """写入输出缓冲"""
+        if self.closed:
+            raise SessionClosed()
+        text = text.replace("\n", "\r\n")
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.high_water:
+            self.flush()
+
+    def _finish_sending(self):
+        """等待在途的输出块发送完成"""
+        if self._sending is not None:
+            try:
+                self._sending.result()
+            except (ConnectionError, RuntimeError) as error:
+                raise SessionClosed() from error
+            finally:
+                self._sending = None
+
+    def flush(self, wait=False):
+        """发送缓冲的输出（上一块尚未发送完时先等待，最多一块在途）
+
+        Args:
+            wait: 是否等待本次输出发送完成
+        """
+        self._finish_sending()
+        if self._buffer:
+            data = "".join(self._buffer).encode("utf-8")
+            self._buffer.clear()
+            self._buffered = 0
+            self._sending = asyncio.run_coroutine_threadsafe(self.send(data), self.loop)
+        if wait:
+            self._finish_sending()
+
+    def read_line(self, prompt=""):
+        """输出提示并等待一行输入"""
+        if prompt:
+            self.write(prompt)
+        self.flush()
+        line = self._wait(self.next_line())
+        if line is None:
+            raise SessionClosed()
+        return line
+
+    def sleep(self, seconds):
+        """停顿（在事件循环中 await asyncio.sleep，只挂起本会话）"""
+        self.flush()
+        self._wait(asyncio.sleep(seconds))
+
+
+class SocketRenderer(TerminalRenderer):
+    """把输出写入客户端连接的渲染器"""
+
+    def __init__(self, connection, game=None):
+        super().__init__(game, stream=connection)
+
+    def typewrite(self, text, delay, end="\n"):
+        # 网络会话不做逐字显示
+        self.write(text + end)
+
+    def clear(self):
+        self.write(CLEAR_SCREEN)
+
+
+class GameSession:
+    """一个玩家会话"""
+
+    def __init__(self, connection, game_factory=None, pool=None):
+        """
+        Args:
+            connection: SessionConnection
+            game_factory: 创建游戏的函数 (renderer, clock) -> HeroGame
+            pool: SessionPool，指定时从预热池取用游戏实例（优先于 game_factory）
+        """
+        self.connection = connection
+        self.game_factory = game_factory or create_session_game
+        self.pool = pool
+        self.game = None
+
+    def provide(self, decision, prompt, options):
+        """输入提供者：从连接读取玩家输入，无效选项时重新提示"""
+        while True:
+            answer = self.connection.read_line(prompt).strip()
+            if not options or answer == "" or answer in options:
+                return answer
+            message = self.game.lang.get_text("invalid_choice") if self.game else "?"
+            self.connection.write(f"{message}\n")
+
+    def run(self):
+        """在游戏线程中运行完整会话"""
+        renderer = SocketRenderer(self.connection)
+        clock = GameClock(sleep=self.connection.sleep)
+        try:
+            with input_provider(self.provide):
+                if self.pool is not None:
+                    self.game = self.pool.acquire()
+                    self.game.attach(renderer, clock)
+                    self.game.select_language()
+                else:
+                    self.game = self.game_factory(renderer, clock)
+                self.game.start_game()
+        except (SessionClosed, SystemExit):
+            pass
+        finally:
+            if self.pool is not None and self.game is not None:
+                self.pool.release(self.game)
+            try:
+                self.connection.flush(wait=True)
+            except SessionClosed:
+                pass
+
+
+def create_session_game(renderer, clock):
+    """创建会话游戏（每个会话独立的随机数源，语言由玩家选择）"""
+    return HeroGame(rng=random.Random(), renderer=renderer, clock=clock)
+
+
+class GameServer:
+    """asyncio 多会话游戏服务器"""
+
+    def __init__(self, host="0.0.0.0", port=4000, max_sessions=DEFAULT_MAX_SESSIONS, game_factory=None,
+                 pool_size=0, backlog=DEFAULT_BACKLOG):
+        """
+        Args:
+            host: 监听地址
+            port: 监听端口（0 表示随机端口）
+            max_sessions: 最大并发会话数（每个会话占用一个线程，见 DEFAULT_MAX_SESSIONS）
+            game_factory: 创建游戏的函数 (renderer, clock) -> HeroGame
+            pool_size: 预热的游戏实例数，0 表示不使用预热池（每个会话现场构建游戏）
+            backlog: 监听队列长度
+        """
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.backlog = backlog
+        self.game_factory = game_factory
+        self.pool = SessionPool(pool_size) if pool_size > 0 else None
+        self.sessions = set()
+        self.server = None
+        self._handlers = set()
+        self.executor = ThreadPoolExecutor(max_workers=max_sessions, thread_name_prefix="hero-session")
+
+    @property
+    def session_count(self):
+        """当前会话数"""
+        return len(self.sessions)
+
+    async def start(self):
+        """开始监听（启用预热池时同时启动后台补充）"""
+        if self.pool is not None:
+            self.pool.start()
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                                 backlog=self.backlog)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        """开始监听并一直运行"""
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def accept_socket(self, sock):
+        """处理已接受的连接套接字（如预派生服务器从主进程转交的连接）"""
+        reader, writer = await asyncio.open_connection(sock=sock)
+        await self.handle_connection(reader, writer)
+
+    async def handle_connection(self, reader, writer):
+        """处理一个客户端连接"""
+        loop = asyncio.get_running_loop()
+        connection = SessionConnection(reader, writer, loop)
+        if self.session_count >= self.max_sessions:
+            await connection.send(SERVER_FULL_MESSAGE)
+            writer.close()
+            return
+
+        session = GameSession(connection, self.game_factory, self.pool)
+        self.sessions.add(session)
+        self._handlers.add(asyncio.current_task())
+        reading = asyncio.ensure_future(connection.read_lines())
+        try:
+            await loop.run_in_executor(self.executor, session.run)
+        finally:
+            self.sessions.discard(session)
+            self._handlers.discard(asyncio.current_task())
+            connection.close()
+            reading.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def close(self):
+        """停止监听并结束所有会话"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for session in list(self.sessions):
+            session.connection.close()
+        # 等待会话线程收到关闭信号后退出
+        if self._handlers:
+            await asyncio.wait(list(self._handlers), timeout=5)
+        self.executor.shutdown(wait=False)
+        if self.pool is not None:
+            self.pool.close()
+
+    def stats(self):
+        """服务器指标（会话数和预热池指标）
+
+        Returns:
+            dict: 指标
+        """
+        return {
+            "sessions": self.session_count,
+            "max_sessions": self.max_sessions,
+            "pool": self.pool.stats() if self.pool is not None else None
+        }
+
+
+def parse_arguments():
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='英雄无敌 - 多会话游戏服务器')
+    parser.add_argument('--host', default='0.0.0.0', help='监听地址')
+    parser.add_argument('--port', type=int, default=4000, help='监听端口')
+    parser.add_argument('--max-sessions', type=int, default=DEFAULT_MAX_SESSIONS,
+                        help='每个进程的最大并发会话数（每个会话占用一个线程）')
+    parser.add_argument('--workers', type=int, default=1, help='工作进程数（大于1时使用预派生多进程服务器）')
+    parser.add_argument('--pool-size', type=int, default=0, help='每个进程预热的游戏实例数（0 表示不预热）')
+    return parser.parse_args()
+
+
+def main():
+    """服务器入口"""
+    args = parse_arguments()
+    print(f"英雄无敌服务器监听 {args.host}:{args.port}")
+    if args.workers > 1:
+        from .prefork import PreforkSupervisor
+        supervisor = PreforkSupervisor(args.host, args.port, args.workers, args.max_sessions,
+                                       pool_size=args.pool_size)
+        try:
+            supervisor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            supervisor.stop()
+        return
+
+    server = GameServer(args.host, args.port, args.max_sessions, pool_size=args.pool_size)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
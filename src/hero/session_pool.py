@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+会话预热池 - 预先构建好的游戏实例，新会话连接时直接取用
+
+池中保持 K 个已构建完成但尚未分配的 HeroGame（文本表、模板和全部子系统都已就绪），
+会话开始时取出一个并绑定该连接的渲染器和时钟，省去游戏构建的延迟。
+后台补充线程在池不满时构建新实例；会话结束归还的实例切换回池的语言并经由
+HeroGame.reset(new_player=True) 重置英雄状态和游戏设置后放回池中，而不是重新调用 __init__。
+池为空时当场构建（计为未命中）。
+"""
+
+import random
+import threading
+import time
+from collections import deque
+
+from .main import HeroGame
+from .renderer import NullRenderer
+from .clock import GameClock
+
+
+# 默认预热的实例数
+DEFAULT_POOL_SIZE = 4
+
+# 池中实例的语言（会话开始时玩家重新选择）
+POOL_LANGUAGE = "zh"
+
+
+def create_pooled_game():
+    """构建一个预热的游戏实例（不输出、不停顿，语言在会话开始时由玩家选择）
+
+    Returns:
+        HeroGame: 所有延迟构建的子系统都已构建的游戏
+    """
+    game = HeroGame(language=POOL_LANGUAGE, rng=random.Random(), renderer=NullRenderer(), clock=GameClock(mode="skip"))
+    for name in HeroGame.LAZY_SUBSYSTEMS:
+        getattr(game, name)
+    return game
+
+
+class SessionPool:
+    """预热的游戏实例池"""
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, factory=None):
+        """
+        Args:
+            size: 保持预热的实例数
+            factory: 构建实例的函数 () -> HeroGame
+        """
+        if size < 0:
+            raise ValueError(f"预热池大小不能为负数: {size}")
+        self.size = size
+        self.factory = factory or create_pooled_game
+        self._games = deque()
+        self._returned = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.built = 0
+        self.recycled = 0
+        self.discarded = 0
+        self.refill_seconds = 0.0
+        self.last_refill_seconds = 0.0
+
+    @property
+    def available(self):
+        """当前可直接取用的实例数"""
+        return len(self._games)
+
+    def start(self):
+        """启动后台补充线程"""
+        if self._thread is None and self.size > 0:
+            self._thread = threading.Thread(target=self._refill_loop, name="hero-pool", daemon=True)
+            self._thread.start()
+
+    def fill(self):
+        """在当前线程中重置归还的实例并把池补满（如启动时预先填充）"""
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                if self._returned:
+                    game = self._returned.popleft()
+                elif len(self._games) < self.size:
+                    game = None
+                else:
+                    return
+            self._refill(game)
+
+    def acquire(self):
+        """取出一个预热的实例，池为空时当场构建
+
+        Returns:
+            HeroGame: 未绑定会话的游戏实例（渲染器和时钟需由调用方绑定）
+        """
+        with self._condition:
+            if self._games:
+                self.hits += 1
+                game = self._games.popleft()
+                self._condition.notify()
+                return game
+            self.misses += 1
+            self._condition.notify()
+        return self.factory()
+
+    def release(self, game):
+        """归还会话结束的实例，由后台线程（或 fill()）重置后放回池中
+
+        池中实例已足够时直接丢弃。
+
+        Args:
+            game: 会话使用过的游戏实例
+        """
+        # 先解除与会话连接的绑定，避免池中实例继续引用已关闭的连接
+        game.attach(NullRenderer(), GameClock(mode="skip"))
+        with self._condition:
+            if self._closed or len(self._games) + len(self._returned) >= self.size:
+                self.discarded += 1
+                return
+            self._returned.append(game)
+            self._condition.notify()
+
+    def _needs_work(self):
+        return self._closed or bool(self._returned) or len(self._games) < self.size
+
+    def _refill_loop(self):
+        """后台补充线程：优先重置归还的实例，不足时构建新实例"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._needs_work)
+                if self._closed:
+                    return
+                game = self._returned.popleft() if self._returned else None
+            self._refill(game)
+
+    def _refill(self, game):
+        """重置或构建一个实例并放入池中
+
+        Args:
+            game: 归还的实例，None 表示构建新实例
+        """
+        start = time.perf_counter()
+        if game is None:
+            game = self.factory()
+            recycled = False
+        else:
+            # 上一个玩家的语言和游戏设置不能带给下一个玩家
+            game.set_language(POOL_LANGUAGE)
+            game.reset(rng=random.Random(), new_player=True)
+            recycled = True
+        elapsed = time.perf_counter() - start
+        with self._condition:
+            if recycled:
+                self.recycled += 1
+            else:
+                self.built += 1
+            self.refill_seconds += elapsed
+            self.last_refill_seconds = elapsed
+            if self._closed or len(self._games) >= self.size:
+                self.discarded += 1
+            else:
+                self._games.append(game)
+            self._condition.notify_all()
+
+    def wait_until_full(self, timeout=None):
+        """等待后台线程把池补满
+
+        Returns:
+            bool: 是否已补满
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._closed or (len(self._games) >= self.size and not self._returned), timeout)
+
+    def close(self):
+        """停止后台补充线程并丢弃池中实例"""
+        with self._condition:
+            self._closed = True
+            self._games.clear()
+            self._returned.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self):
+        """预热池指标
+
+        Returns:
+            dict: 池大小、可用实例数、命中率和补充耗时
+        """
+        with self._condition:
+            requests = self.hits + self.misses
+            refills = self.built + self.recycled
+            return {
+                "size": self.size,
+                "available": len(self._games),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "built": self.built,
+                "recycled": self.recycled,
+                "discarded": self.discarded,
+                "average_refill_ms": self.refill_seconds * 1000 / refills if refills else 0.0,
+                "last_refill_ms": self.last_refill_seconds * 1000
+            }
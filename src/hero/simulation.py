@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+无头模拟模块 - 在没有终端交互的情况下运行完整游戏
+
+SimulationDriver 通过输入提供者接管游戏中的所有输入，把每个决策点
+（移动菜单、战斗行动、商店购买、装备、技能升级、附魔/强化确认等）
+交给策略对象回答，同时屏蔽输出、清屏和等待，用于平衡性测试等批量运行场景。
+"""
+
+import random
+from contextlib import contextmanager, redirect_stdout
+
+from hero.main import HeroGame, GameConfig
+from hero.renderer import NullRenderer
+from hero.clock import GameClock
+from hero.safe_input import input_provider
+from hero.inventory import inventory_view, item_power
+
+
+# 商店相关决策点
+PURCHASE_DECISIONS = ("merchant", "mysterious_merchant", "equipment_shop", "shop_item", "quantity")
+
+# 附魔/强化确认决策点
+CONFIRM_UPGRADE_DECISIONS = ("enchant_confirm", "enhance_confirm")
+
+
+class SimulationStalled(RuntimeError):
+    """策略在单局游戏中做出的决策次数超过上限（通常是策略陷入菜单循环）"""
+
+
+class _NullWriter:
+    """丢弃所有写入内容的输出流"""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+@contextmanager
+def headless():
+    """在上下文范围内屏蔽标准输出（停顿由游戏时钟控制）"""
+    with redirect_stdout(_NullWriter()):
+        yield
+
+
+def item_score(item):
+    """装备评分（用于策略比较装备优劣，与背包按战力排序一致）"""
+    return item_power(item)
+
+
+class SimulationPolicy:
+    """模拟决策策略基类
+
+    默认行为较为保守：一直前进，血量低时使用药剂，战斗中普通攻击，
+    商人处补充药剂，自动装备评分更高的物品，有技能点时升级第一个可升级技能，
+    拒绝附魔、强化和其他确认，其余菜单选择离开/返回（选项列表的最后一项）。
+    """
+
+    # 血量低于此比例时使用药剂
+    potion_threshold = 0.4
+    # 在商人处希望补足的药剂数量
+    potion_target = 3
+
+    def choose_move(self, game, options):
+        """主菜单（移动）决策，返回菜单选项"""
+        if ("4" in options and game.hero_potions > 0
+                and game.hero_hp < game.hero_max_hp * self.potion_threshold):
+            return "4"
+        return "1"
+
+    def choose_combat_action(self, game, options):
+        """战斗行动决策，返回战斗菜单选项"""
+        if game.hero_potions > 0 and game.hero_hp < game.hero_max_hp * self.potion_threshold:
+            return "2"
+        return "1"
+
+    def choose_purchase(self, game, decision, options):
+        """商店决策（商人菜单、装备商店、购买数量等）"""
+        if decision == "merchant":
+            return "1" if game.hero_potions < self.potion_target else options[-1]
+        if decision == "quantity":
+            return str(max(1, self.potion_target - game.hero_potions))
+        if options:
+            return options[-1]
+        return ""
+
+    def choose_equip(self, game):
+        """装备决策，返回要装备的背包物品索引，None 表示不装备"""
+        # 每种类型只需比较背包中战力最高的一件（相同时取最先获得的）
+        inventory = inventory_view(game.inventory)
+        best_index = None
+        best_gain = 0
+        for item_type in inventory.types():
+            item = inventory.best(item_type)
+            gain = item_score(item) - item_score(game.equipment.get(item_type))
+            if gain > 0:
+                index = inventory.position(item)
+                if gain > best_gain or (gain == best_gain and index < best_index):
+                    best_index, best_gain = index, gain
+        return best_index
+
+    def choose_skill_upgrade(self, game, upgradeable):
+        """技能升级决策，返回要升级的技能ID，None 表示不升级"""
+        return upgradeable[0] if upgradeable else None
+
+    def confirm_enchant(self, game, decision):
+        """附魔/强化确认决策"""
+        return False
+
+    def choose_event_option(self, game, options):
+        """事件选项决策（强盗、祭坛等）"""
+        return options[-1]
+
+    def answer(self, game, decision, prompt, options):
+        """其他决策点（继续提示、确认、其他菜单）的默认回答"""
+        if decision in ("confirm", "continue"):
+            return "n" if decision == "confirm" else ""
+        if options:
+            return options[-1]
+        return ""
+
+
+class RandomPolicy(SimulationPolicy):
+    """随机策略：在前进、药剂和战斗行动之间随机选择，用于探索性测试"""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def choose_move(self, game, options):
+        return self.rng.choice([option for option in options if option in ("1", "4")])
+
+    def choose_combat_action(self, game, options):
+        return self.rng.choice(options)
+
+    def choose_skill_upgrade(self, game, upgradeable):
+        return self.rng.choice(upgradeable) if upgradeable else None
+
+
+class SimulationDriver:
+    """无头模拟驱动器"""
+
+    def __init__(self, policy=None, difficulty="normal", map_type="plains", hero_class="warrior",
+                 language="zh", hero_name="SimHero", max_steps=10000, max_decisions=100000, seed=None,
+                 reuse_game=False):
+        """
+        Args:
+            policy: 决策策略对象，默认使用 SimulationPolicy
+            difficulty: 难度键名
+            map_type: 地图类型键名
+            hero_class: 职业键名
+            language: 游戏语言
+            hero_name: 英雄名称
+            max_steps: 单局最大前进步数
+            max_decisions: 单局最大决策次数（防止策略陷入菜单循环）
+            seed: 随机种子，指定后每局游戏使用独立的可复现随机数流
+            reuse_game: 连续运行时用 HeroGame.reset 复用上一局的游戏实例（结果与新建实例相同）
+        """
+        self.policy = policy if policy is not None else SimulationPolicy()
+        self.difficulty = difficulty
+        self.map_type = map_type
+        self.hero_class = hero_class
+        self.language = language
+        self.hero_name = hero_name
+        self.max_steps = max_steps
+        self.max_decisions = max_decisions
+        self.seed = seed
+        self.reuse_game = reuse_game
+        self.game = None
+        self.decisions = 0
+
+    def create_game(self, seed=None):
+        """创建无需交互的新游戏实例
+
+        Args:
+            seed: 本局随机种子，None 时使用驱动器的种子
+        """
+        return HeroGame.from_config(self.config(seed), renderer=NullRenderer(), clock=GameClock(mode="virtual"))
+
+    def config(self, seed=None):
+        """本驱动器的新游戏配置
+
+        Args:
+            seed: 本局随机种子，None 时使用驱动器的种子
+        """
+        return GameConfig(language=self.language, hero_class=self.hero_class, map_type=self.map_type,
+                          difficulty=self.difficulty, hero_name=self.hero_name,
+                          seed=seed if seed is not None else self.seed)
+
+    def provide(self, decision, prompt, options):
+        """输入提供者：把决策点分派给策略对象"""
+        self.decisions += 1
+        if self.decisions > self.max_decisions:
+            raise SimulationStalled(f"决策次数超过上限: {self.max_decisions}")
+
+        game = self.game
+        policy = self.policy
+        if decision == "move":
+            return policy.choose_move(game, options)
+        if decision == "combat_action":
+            return policy.choose_combat_action(game, options)
+        if decision in PURCHASE_DECISIONS:
+            return policy.choose_purchase(game, decision, options)
+        if decision in CONFIRM_UPGRADE_DECISIONS:
+            return "y" if policy.confirm_enchant(game, decision) else "n"
+        if decision == "event_choice":
+            return policy.choose_event_option(game, options)
+        return policy.answer(game, decision, prompt, options)
+
+    def manage_hero(self):
+        """回合间整理：按策略装备物品、升级技能"""
+        game = self.game
+        item_index = self.policy.choose_equip(game)
+        if item_index is not None:
+            game.equipment_system.equip_item(item_index)
+
+        skill_id = self.policy.choose_skill_upgrade(game, game.get_upgradeable_skills())
+        if skill_id is not None:
+            game.upgrade_skill(skill_id)
+
+    def run(self, game=None, seed=None):
+        """运行一局完整游戏
+
+        Args:
+            game: 已创建的游戏实例，None 时自动创建
+            seed: 自动创建游戏时使用的随机种子
+
+        Returns:
+            dict: 游戏结果
+        """
+        if game is not None:
+            self.game = game
+        elif self.reuse_game and self.game is not None:
+            self.game.reset(self.config(seed))
+        else:
+            self.game = self.create_game(seed)
+        self.decisions = 0
+        game = self.game
+        steps = 0
+        stalled = False
+
+        with headless(), input_provider(self.provide):
+            try:
+                while not game.game_over and steps < self.max_steps:
+                    if game.check_game_status():
+                        break
+                    self.manage_hero()
+                    if game.move_hero():
+                        steps += 1
+            except SimulationStalled:
+                stalled = True
+
+        return {
+            "steps": steps,
+            "victory": game.victory,
+            "gold_earned": game.hero_gold,
+            "exp_earned": game.hero_exp,
+            "monsters_defeated": game.monsters_defeated,
+            "events_encountered": len(game.events_encountered),
+            "final_hp": game.hero_hp,
+            "final_level": game.hero_level,
+            "difficulty": self.difficulty,
+            "map_type": self.map_type,
+            "hero_class": self.hero_class,
+            "decisions": self.decisions,
+            "perceived_seconds": game.clock.elapsed,
+            "stalled": stalled
+        }
@@ -145,6 +145,8 @@ class SkillTree:
         self.lang = lang
         self.skill_nodes: Dict[str, SkillNode] = {}
         self.learned_skills: Dict[str, int] = {}  # 技能ID -> 等级
+        self.version = 0  # 技能等级每次变化时递增
+        self.menu_cache = None  # 当前版本的战斗菜单（见 combat_menu.get_combat_menu）
         
         # 从配置加载技能树
         self._load_skill_tree()
@@ -219,6 +221,7 @@ class SkillTree:
         if skill_node.upgrade():
             # 更新学习技能列表
             self.learned_skills[skill_id] = skill_node.current_level
+            self.version += 1
             
             # 更新技能可用性
             self._update_skill_availability()
@@ -228,6 +231,20 @@ class SkillTree:
         
         return (False, skill_points)
     
+    def set_skill_level(self, skill_id: str, level: int):
+        """
+        直接设置技能等级（初始技能、读档），不检查前置技能和技能点
+        
+        Args:
+            skill_id: 技能ID
+            level: 技能等级
+        """
+        skill_node = self.skill_nodes[skill_id]
+        skill_node.current_level = level
+        skill_node._update_status()
+        self.learned_skills[skill_id] = level
+        self.version += 1
+    
     def get_skill_effect(self, skill_id: str, effect_index: int) -> float:
         """
         获取指定技能的效果值
@@ -371,8 +388,7 @@ class SkillTree:
         # 恢复学习技能
         for skill_id, skill_data in data.get("learned_skills", {}).items():
             if skill_id in skill_tree.skill_nodes:
-                skill_tree.skill_nodes[skill_id].current_level = skill_data["current_level"]
-                skill_tree.learned_skills[skill_id] = skill_data["current_level"]
+                skill_tree.set_skill_level(skill_id, skill_data["current_level"])
         
         # 更新技能可用性
         skill_tree._update_skill_availability()
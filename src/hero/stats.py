@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+属性模块 - 按来源增量累计的英雄属性
+
+英雄的攻击、防御、最大生命和特殊效果由多个来源叠加而成：
+- 持久来源：基础属性、每个装备栏、套装效果，由 StatEngine.sync() 维护
+- 临时来源：职业被动、技能树、状态效果，在战斗中通过 add_effect()/set_effect() 叠加，
+  战斗结束时由 expire_effects() 撤销，下次同步属性时也会清除
+
+同步时只比较基础属性和每个装备栏的签名，重新计算发生变化的来源，
+并只对这些来源涉及的属性重新求和（按来源顺序累加，结果与完整重新计算完全相同）。
+
+套装使用预先计算的索引（套装名 -> 部件类型和各档效果）和每个套装的已装备部件计数：
+换装时只更新换下、换上装备所属套装的计数，计数跨过档位（2/3/4 件套等）时才重新计算套装来源，
+并只对新激活的档位显示激活信息。换下的部件和失去全部档位的套装部件清除 set_bonus_active 标记。
+"""
+
+from .game_config import EQUIPMENT_SETS
+from .items import Item, as_item
+from .effects import EffectVector, EFFECT_DEFAULTS
+
+
+# 基础属性
+CORE_STATS = ("attack", "defense", "max_hp")
+
+# 装备特殊效果的默认数值（装备没有指定数值时使用）
+DEFAULT_EFFECT_VALUES = {
+    "crit_rate": 0.05,
+    "lifesteal": 0.1,
+    "dodge": 0.05,
+    "counter_attack": 0.1,
+    "ice_damage": 5,
+    "fire_damage": 5,
+    "light_damage": 5,
+    "poison": 3,
+    "shadow_power": 0.1,
+    "fire_resistance": 0.1,
+    "holy_resistance": 0.1,
+    "stealth": 0.1,
+    "evasion": 0.05,
+    "wisdom": 0.05,
+    "mana_regeneration": 2,
+    "luck": 0.05,
+    "crit_damage": 0.2,
+    "immortality": 0.02,
+    "health_regeneration": 2,
+    "healing": 0.02,
+    "mana_boost": 10,
+    "backstab": 0.2
+}
+
+# 套装效果中的键 -> 属性
+SET_BONUS_STATS = (
+    ("attack_bonus", "attack"),
+    ("defense_bonus", "defense"),
+    ("hp_bonus", "max_hp"),
+    ("mana_bonus", "mana_boost"),
+    ("spell_power", "spell_power"),
+    ("crit_rate", "crit_rate"),
+    ("dodge", "dodge")
+)
+
+
+
+def build_set_index(equipment_sets):
+    """预先计算套装索引（套装名 -> 部件和各档效果）
+
+    套装效果的键为 "N_piece"，装备该套装的 N 件部件时激活（档位可以有多个，如 2/3/4 件套）。
+
+    Args:
+        equipment_sets: 套装配置（格式同 EQUIPMENT_SETS）
+
+    Returns:
+        dict: 套装名 -> {"order": 配置中的顺序, "info": 套装配置,
+                          "pieces": 部件类型集合, "tiers": [(件数, 效果)]（按件数排序）}
+    """
+    index = {}
+    for order, (set_name, set_info) in enumerate(equipment_sets.items()):
+        tiers = [(int(key.split("_", 1)[0]), effect) for key, effect in set_info["effects"].items()
+                 if key.endswith("_piece")]
+        tiers.sort(key=lambda tier: tier[0])
+        index[set_name] = {"order": order, "info": set_info, "pieces": frozenset(set_info["pieces"]),
+                           "tiers": tiers}
+    return index
+
+
+SET_INDEX = build_set_index(EQUIPMENT_SETS)
+
+# 临时来源（战斗中叠加，战斗结束或同步属性时清除）
+TRANSIENT_SOURCES = ("class_passive", "skill_tree", "status_effects")
+
+
+def item_signature(item):
+    """装备中影响属性的数值（用于判断装备栏是否变化）
+
+    Args:
+        item: 装备（Item 或装备字典）
+
+    Returns:
+        tuple: 签名，没有装备时为 None
+    """
+    if item.__class__ is Item:
+        return (item.template, item.attack, item.defense, item.hp, item.special_effects, item.set_bonus)
+    if not item:
+        return None
+    values = item.get("special_effects_values")
+    return (item.get("type"), item.get("attack", 0), item.get("defense", 0), item.get("hp", 0),
+            tuple(item.get("special_effects") or ()), tuple(values.items()) if values else None,
+            item.get("set_bonus"))
+
+
+def item_contribution(item):
+    """一件装备提供的属性加成
+
+    Args:
+        item: 装备
+
+    Returns:
+        tuple: (属性, 数值) 序列，按原来的累加顺序排列
+    """
+    if item is None or (item.__class__ is not Item and not item):
+        return ()
+    stats = as_item(item)
+    contribution = [("attack", stats.attack), ("defense", stats.defense), ("max_hp", stats.hp)]
+    special_effects_values = stats.special_effects_values or {}
+    for effect in stats.special_effects:
+        if effect in special_effects_values:
+            contribution.append((effect, special_effects_values[effect]))
+        elif effect in EFFECT_DEFAULTS and effect in DEFAULT_EFFECT_VALUES:
+            contribution.append((effect, DEFAULT_EFFECT_VALUES[effect]))
+    return tuple(contribution)
+
+
+class StatEngine:
+    """按来源保存属性加成，只重新计算变化的来源"""
+
+    def __init__(self, set_index=None):
+        """
+        Args:
+            set_index: 套装索引（见 build_set_index），None 表示使用 EQUIPMENT_SETS
+        """
+        self.set_index = SET_INDEX if set_index is None else set_index
+        self.stats = dict.fromkeys(CORE_STATS, 0)
+        self.effects = EffectVector()
+        # 持久来源 -> (属性, 数值) 序列；顺序即累加顺序（基础属性、各装备栏、套装）
+        self.contributions = {"base": ()}
+        self.transient = {}
+        self._slots = {}
+        self._dirty = set()
+        # 套装 -> 已装备的部件数 / 已激活的档位数
+        self.set_counts = {}
+        self.set_tiers = {}
+        # 最近一次同步重新计算的来源
+        self.recomputed = []
+
+    def invalidate(self, source=None):
+        """标记来源需要重新计算（装备在原地修改了签名以外的内容时使用）
+
+        Args:
+            source: 来源名（"base"、装备栏名或 "set_bonus"），None 表示全部
+        """
+        if source is None:
+            self._dirty.update(self.contributions)
+            self._dirty.add("set_bonus")
+        else:
+            self._dirty.add(source)
+
+    def set_membership(self, item):
+        """装备计入的套装（属于套装且类型是该套装的部件），不计入时为 None"""
+        if not item:
+            return None
+        entry = self.set_index.get(item.get("set_bonus"))
+        if entry is None or item.get("type") not in entry["pieces"]:
+            return None
+        return item.get("set_bonus")
+
+    def sync(self, game):
+        """按游戏当前的基础属性和装备同步属性
+
+        Args:
+            game: 游戏实例（读取 base_attack/base_defense/base_max_hp 和 equipment）
+
+        Returns:
+            list: 本次新激活的套装档位 [(套装配置, 该档效果, 该套装的装备列表)]
+        """
+        dirty = self._dirty
+        self.recomputed = []
+        self.clear_transient()
+
+        base = (("attack", game.base_attack), ("defense", game.base_defense), ("max_hp", game.base_max_hp))
+        if "base" in dirty or base != self.contributions["base"]:
+            self._set_source("base", base)
+
+        # 换装时更新套装部件计数，记录计数变化的套装
+        counts = self.set_counts
+        touched = set()
+        equipment = game.equipment
+        slots = self._slots
+        for slot, item in equipment.items():
+            signature = item_signature(item)
+            previous = slots.get(slot)
+            if slot in dirty or previous is None or previous[0] is not item or previous[1] != signature:
+                membership = self.set_membership(item)
+                slots[slot] = (item, signature, membership)
+                self._set_source(slot, item_contribution(item))
+                if previous is not None and previous[2] is not None:
+                    counts[previous[2]] -= 1
+                    touched.add(previous[2])
+                    _deactivate(previous[0])
+                if membership is not None:
+                    counts[membership] = counts.get(membership, 0) + 1
+                    touched.add(membership)
+        for slot in [slot for slot in slots if slot not in equipment]:
+            previous = slots.pop(slot)
+            self._set_source(slot, ())
+            if previous[2] is not None:
+                counts[previous[2]] -= 1
+                touched.add(previous[2])
+                _deactivate(previous[0])
+
+        if "set_bonus" in dirty:
+            counts.clear()
+            for _, _, membership in slots.values():
+                if membership is not None:
+                    counts[membership] = counts.get(membership, 0) + 1
+            touched.update(counts)
+            touched.update(self.set_tiers)
+        activated = self._update_sets(touched, equipment) if touched else []
+        if "set_bonus" in dirty and "set_bonus" not in self.recomputed:
+            self._set_set_bonus()
+        dirty.clear()
+        return activated
+
+    def _update_sets(self, set_names, equipment):
+        """检查部件计数变化的套装是否跨过档位，只在档位变化时重新计算套装来源
+
+        Returns:
+            list: 新激活的套装档位
+        """
+        activated = []
+        changed = False
+        index = self.set_index
+        for set_name in sorted(set_names, key=lambda name: index[name]["order"]):
+            entry = index[set_name]
+            count = self.set_counts.get(set_name, 0)
+            tiers = entry["tiers"]
+            tier = 0
+            while tier < len(tiers) and tiers[tier][0] <= count:
+                tier += 1
+            previous = self.set_tiers.get(set_name, 0)
+            pieces = [item for item in equipment.values() if item and self.set_membership(item) == set_name]
+            if not tier:
+                if previous:
+                    del self.set_tiers[set_name]
+                    changed = True
+                    for item in pieces:
+                        _deactivate(item)
+                continue
+            # 标记套装效果已激活
+            for item in pieces:
+                item["set_bonus_active"] = True
+            if tier != previous:
+                self.set_tiers[set_name] = tier
+                changed = True
+                activated.extend((entry["info"], effect, pieces) for _, effect in tiers[previous:tier])
+        if changed:
+            self._set_set_bonus()
+        return activated
+
+    def _set_set_bonus(self):
+        """按已激活的档位重新计算套装来源"""
+        index = self.set_index
+        bonus = []
+        for set_name in sorted(self.set_tiers, key=lambda name: index[name]["order"]):
+            for _, effect in index[set_name]["tiers"][:self.set_tiers[set_name]]:
+                bonus.extend((stat, effect[key]) for key, stat in SET_BONUS_STATS if key in effect)
+        self._set_source("set_bonus", tuple(bonus))
+
+    def _set_source(self, source, contribution):
+        """替换一个持久来源的加成，并重新求和受影响的属性"""
+        self.recomputed.append(source)
+        contributions = self.contributions
+        previous = contributions.get(source, ())
+        if source not in contributions and source != "set_bonus":
+            # 新的装备栏排在套装之前
+            bonus = contributions.pop("set_bonus", None)
+            contributions[source] = contribution
+            if bonus is not None:
+                contributions["set_bonus"] = bonus
+        else:
+            contributions[source] = contribution
+        if contribution == previous:
+            return
+        keys = {key for key, _ in previous}
+        keys.update(key for key, _ in contribution)
+        self._resum(keys)
+
+    def _resum(self, keys):
+        """按来源顺序重新累加指定属性"""
+        totals = {key: EFFECT_DEFAULTS.get(key, 0) for key in keys}
+        for contribution in self.contributions.values():
+            for key, value in contribution:
+                if key in totals:
+                    totals[key] += value
+        for key, value in totals.items():
+            if key in self.stats:
+                self.stats[key] = value
+            else:
+                self.effects[key] = value
+
+    def record(self, source, key, amount):
+        """记录临时来源的加成（由 add_effect/set_effect 调用）"""
+        contribution = self.transient.setdefault(source, {})
+        contribution[key] = contribution.get(key, 0) + amount
+
+    def clear_transient(self):
+        """清除全部临时来源"""
+        self.transient.clear()
+
+    def breakdown(self, key):
+        """某属性在各来源中的加成
+
+        Args:
+            key: 属性名（CORE_STATS 或特殊效果）
+
+        Returns:
+            dict: 来源 -> 加成
+        """
+        result = {}
+        for source, contribution in self.contributions.items():
+            for stat, value in contribution:
+                if stat == key:
+                    result[source] = result.get(source, 0) + value
+        for source, contribution in self.transient.items():
+            if key in contribution:
+                result[source] = contribution[key]
+        return result
+
+
+def _deactivate(item):
+    """清除装备的套装激活标记"""
+    if item and "set_bonus_active" in item:
+        del item["set_bonus_active"]
+
+
+def _engine(game):
+    engine = getattr(game, "stat_engine", None)
+    return engine if isinstance(engine, StatEngine) else None
+
+
+def add_effect(game, source, key, amount):
+    """在战斗中叠加临时特殊效果
+
+    Args:
+        game: 游戏实例
+        source: 临时来源（见 TRANSIENT_SOURCES）
+        key: 特殊效果
+        amount: 增加的数值
+    """
+    game.special_effects[key] += amount
+    engine = _engine(game)
+    if engine is not None:
+        engine.record(source, key, amount)
+
+
+def set_effect(game, source, key, value):
+    """在战斗中设置临时特殊效果
+
+    Args:
+        game: 游戏实例
+        source: 临时来源（见 TRANSIENT_SOURCES）
+        key: 特殊效果
+        value: 新的数值
+    """
+    engine = _engine(game)
+    if engine is not None:
+        engine.record(source, key, value - game.special_effects.get(key, 0))
+    game.special_effects[key] = value
+
+
+def expire_effects(game):
+    """战斗结束时撤销临时来源的加成（职业被动、技能树和状态效果不延续到下一场战斗）
+
+    Args:
+        game: 游戏实例
+    """
+    engine = _engine(game)
+    if engine is None:
+        return
+    for contribution in engine.transient.values():
+        for key, amount in contribution.items():
+            if key == "attack":
+                game.hero_attack -= amount
+            elif key == "defense":
+                game.hero_defense -= amount
+            else:
+                game.special_effects[key] = engine.effects[key]
+    engine.clear_transient()
@@ -2,3 +2,8 @@
 """
 英雄无敌游戏 - 测试模块
 """
+
+import os
+
+# 测试中的停顿不做真实等待（见 hero.clock）
+os.environ.setdefault("HERO_CLOCK", "skip")
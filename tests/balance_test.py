@@ -25,8 +25,8 @@ if hero_path not in sys.path:
     sys.path.insert(0, hero_path)
 
 # 导入游戏模块
-from hero.main import HeroGame
-from hero.language import LanguageSupport
+from hero.simulation import SimulationDriver
+from hero.balance import BalanceRunner
 
 
 class BalanceTestResult:
@@ -166,7 +166,7 @@ class BalanceTestResult:
 
 
 class GameRunner:
-    """游戏运行器类"""
+    """游戏运行器类（使用无头模拟驱动运行真实游戏）"""
     
     def __init__(self, fast_mode=True, max_steps=1000):
         self.fast_mode = fast_mode
@@ -175,139 +175,9 @@ class GameRunner:
     def run_game(self, difficulty='normal', map_type='plains', hero_class='warrior'):
         """运行单次游戏"""
         try:
-            # 导入语言支持
-            from hero.language import LanguageSupport
-            from hero.game_config import MAP_TYPES, DIFFICULTY_SETTINGS
-            from hero.combat import CombatSystem
-            from hero.equipment import EquipmentSystem
-            from hero.events import EventSystem
-            from hero.newbie_village import NewbieVillage
-            from hero.statistics import GameStatistics
-            from hero.settings import GameSettings
-            
-            # 手动创建游戏实例（不触发语言选择）
-            game = object.__new__(HeroGame)
-            
-            # 初始化所有子系统
-            game.lang = LanguageSupport()
-            game.combat_system = CombatSystem(game)
-            game.equipment_system = EquipmentSystem(game)
-            game.event_system = EventSystem(game)
-            game.newbie_village = NewbieVillage(game)
-            game.statistics = GameStatistics()
-            game.settings = GameSettings()
-            
-            # 设置游戏参数（跳过语言选择）
-            game.language = 'zh'
-            game.lang.set_language(game.language)
-            game.difficulty = difficulty
-            game.map_type = map_type
-            game.hero_class = hero_class
-            
-            # 应用难度系数
-            difficulty_settings = DIFFICULTY_SETTINGS[difficulty]
-            map_config = MAP_TYPES[map_type]
-            map_length_range = [difficulty_settings["map_length"], difficulty_settings["map_length"]]
-            
-            # 设置地图长度（随机）
-            import random
-            map_length = random.randint(map_length_range[0], map_length_range[1])
-            
-            # 设置英雄名称
-            game.hero_name = f"TestHero_{int(time.time())}"
-            
-            # 初始化游戏（跳过新手村）
-            game.hero_level = 1
-            game.hero_exp = 0
-            game.hero_max_hp = 100
-            game.hero_hp = 100
-            game.hero_attack = 20
-            game.hero_defense = 10
-            game.base_attack = 20
-            game.base_defense = 10
-            game.base_max_hp = 100
-            game.hero_position = 0
-            game.hero_gold = 0
-            game.hero_potions = 0
-            game.hero_skills = []
-            game.equipment = {}
-            game.inventory = []
-            game.monsters_defeated = 0
-            game.events_encountered = 0
-            game.visited_positions = []
-            game.map_length = map_length
-            game.game_over = False
-            game.victory = False
-            game.inventory = []
-            game.monsters_defeated = 0
-            game.events_encountered = 0
-            game.visited_positions = []
-            game.map_length = 30
-            game.game_over = False
-            game.victory = False
-            
-            # 初始化统计系统
-            game.statistics.start_time = time.time()
-            
-            # 初始化游戏日志系统
-            from hero.game_log import GameLog
-            game.game_log = GameLog()
-            
-            # 初始化任务系统
-            from hero.quest import QuestSystem
-            game.quest_system = QuestSystem()
-            
-            # 初始化技能树
-            from hero.skill_tree import SkillTree
-            game.skill_tree = SkillTree(hero_class, game.language)
-            
-            # 初始化状态效果变量
-            game.status_effects = {}
-            game.shield_active = False
-            game.berserk_turns = 0
-            game.focus_active = False
-            
-            # 运行游戏主循环
-            steps = 0
-            while not game.game_over and steps < self.max_steps:
-                steps += 1
-                
-                # 随机移动（简化版）
-                game.hero_position += 1
-                
-                # 检查是否到达终点
-                if game.hero_position >= game.map_length:
-                    game.victory = True
-                    game.game_over = True
-                    break
-                
-                # 随机事件（简化版）
-                if steps % 3 == 0:  # 每3步触发一次事件
-                    event_result = self._simplified_random_event(game)
-                    if event_result == 'game_over':
-                        game.game_over = True
-                        break
-                
-                # 战斗（简化版）
-                if steps % 5 == 0:  # 每5步触发一次战斗
-                    battle_result = self._simplified_combat(game)
-                    if battle_result == 'game_over':
-                        game.game_over = True
-                        break
-            
-            # 收集结果数据
-            result_data = {
-                'steps': steps,
-                'victory': game.victory,
-                'gold_earned': game.hero_gold,
-                'exp_earned': game.hero_exp,
-                'monsters_defeated': game.monsters_defeated,
-                'events_encountered': game.events_encountered,
-                'final_hp': game.hero_hp,
-                'final_level': game.hero_level
-            }
-            
-            return result_data
+            driver = SimulationDriver(difficulty=difficulty, map_type=map_type,
+                                      hero_class=hero_class, max_steps=self.max_steps)
+            return driver.run()
             
         except Exception as e:
             # 如果出现异常，返回错误结果
@@ -323,101 +193,19 @@ class GameRunner:
                 'final_level': 1,
                 'error': str(e)
             }
-    
-    def _simplified_random_event(self, game):
-        """简化版随机事件"""
-        import random
-        
-        event_types = ['gold', 'potion', 'trap', 'nothing']
-        event_type = random.choice(event_types)
-        
-        if event_type == 'gold':
-            gold_amount = random.randint(5, 20)
-            game.hero_gold += gold_amount
-            game.statistics.record_gold_earned(gold_amount)
-            
-        elif event_type == 'potion':
-            game.hero_potions += 1
-            game.statistics.record_potion_found()
-            
-        elif event_type == 'trap':
-            damage = random.randint(5, 15)
-            game.hero_hp = max(0, game.hero_hp - damage)
-            if game.hero_hp <= 0:
-                return 'game_over'
-        
-        # 记录事件
-        game.events_encountered += 1
-        try:
-            game.statistics.record_event_triggered(event_type)
-        except:
-            pass  # 忽略统计错误
-        
-        return 'continue'
-    
-    def _simplified_combat(self, game):
-        """简化版战斗"""
-        import random
-        
-        # 生成怪物
-        monster_hp = random.randint(20, 40)
-        monster_attack = random.randint(8, 15)
-        monster_defense = random.randint(3, 8)
-        
-        # 战斗逻辑
-        while monster_hp > 0 and game.hero_hp > 0:
-            # 英雄攻击
-            hero_damage = max(1, game.hero_attack - monster_defense)
-            monster_hp = max(0, monster_hp - hero_damage)
-            
-            if monster_hp <= 0:
-                break
-                
-            # 怪物攻击
-            monster_damage = max(1, monster_attack - game.hero_defense)
-            game.hero_hp = max(0, game.hero_hp - monster_damage)
-            
-            if game.hero_hp <= 0:
-                return 'game_over'
-        
-        # 战斗胜利
-        if monster_hp <= 0:
-            gold_reward = random.randint(10, 25)
-            exp_reward = random.randint(5, 15)
-            
-            game.hero_gold += gold_reward
-            game.hero_exp += exp_reward
-            game.monsters_defeated += 1
-            
-            # 记录统计
-            try:
-                game.statistics.record_battle_victory("test_monster", False)
-                game.statistics.record_gold_earned(gold_reward)
-                game.statistics.record_exp_earned(exp_reward)
-            except:
-                pass  # 忽略统计错误
-            
-            # 检查升级
-            if game.hero_exp >= 100:
-                game.hero_level += 1
-                game.hero_exp = 0
-                game.hero_max_hp += 10
-                game.hero_hp = game.hero_max_hp
-                game.hero_attack += 2
-                game.hero_defense += 1
-        
-        return 'continue'
 
 
 class BalanceTester:
     """平衡测试器主类"""
     
-    def __init__(self, fast_mode=True, max_steps=1000):
+    def __init__(self, fast_mode=True, max_steps=1000, workers=None, seed=None, chunk_size=50):
         self.game_runner = GameRunner(fast_mode, max_steps)
+        self.balance_runner = BalanceRunner(workers=workers, chunk_size=chunk_size,
+                                            max_steps=max_steps, seed=seed)
         
     def run_balance_test(self, test_name, num_runs=1000, difficulty='normal', 
                         map_type='plains', hero_class='warrior'):
-        """运行平衡测试"""
+        """运行平衡测试（进程池并行运行真实游戏）"""
         
         result = BalanceTestResult(test_name, num_runs)
         result.start_test()
@@ -425,22 +213,17 @@ class BalanceTester:
         print(f"开始平衡测试: {test_name}")
         print(f"计划运行 {num_runs} 次游戏...")
         
-        completed_count = 0
+        def report_progress(done, total):
+            print(f"进度: {done}/{total} ({(done / total) * 100:.1f}%)")
         
-        for i in range(num_runs):
-            if (i + 1) % 100 == 0:
-                print(f"进度: {i + 1}/{num_runs} ({((i + 1) / num_runs) * 100:.1f}%)")
-            
-            # 运行单次游戏
-            game_result = self.game_runner.run_game(difficulty, map_type, hero_class)
-            
-            # 添加结果
+        config = (difficulty, map_type, hero_class)
+        games = self.balance_runner.run([config], num_runs, progress=report_progress)[config]
+        for game_result in games:
             result.add_result(game_result)
-            completed_count += 1
         
         result.end_test()
         
-        print(f"测试完成! 实际运行 {completed_count} 次游戏")
+        print(f"测试完成! 实际运行 {len(games)} 次游戏")
         print(f"总耗时: {result.get_duration():.2f} 秒")
         
         return result
@@ -589,6 +372,8 @@ def run_balance_test_cli():
     parser.add_argument('--class', '-c', dest='hero_class', default='warrior', help='英雄职业')
     parser.add_argument('--fast', '-f', action='store_true', help='快速模式')
     parser.add_argument('--max-steps', type=int, default=1000, help='最大步数')
+    parser.add_argument('--workers', '-w', type=int, default=None, help='工作进程数（默认CPU核心数）')
+    parser.add_argument('--seed', type=int, default=None, help='随机种子')
     parser.add_argument('--compare-difficulty', action='store_true', help='对比不同难度')
     parser.add_argument('--compare-maps', action='store_true', help='对比不同地图')
     parser.add_argument('--compare-classes', action='store_true', help='对比不同职业')
@@ -597,7 +382,8 @@ def run_balance_test_cli():
     
     args = parser.parse_args()
     
-    tester = BalanceTester(fast_mode=args.fast, max_steps=args.max_steps)
+    tester = BalanceTester(fast_mode=args.fast, max_steps=args.max_steps,
+                           workers=args.workers, seed=args.seed)
     
     if args.compare_difficulty:
         print("运行难度对比测试...")
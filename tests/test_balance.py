@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+进程池平衡性运行器测试
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.balance import BalanceRunner, summarize_results
+
+
+class TestBalanceRunner(unittest.TestCase):
+    """测试平衡性运行器"""
+
+    def test_make_tasks_chunks(self):
+        """测试任务按块拆分并分配种子"""
+        runner = BalanceRunner(workers=1, chunk_size=4, seed=1)
+        tasks = runner.make_tasks([("easy", "plains", "mage")], 10)
+        self.assertEqual([count for _, count, _ in tasks], [4, 4, 2])
+        self.assertEqual(len({seed for _, _, seed in tasks}), 3)
+        # 相同基础种子产生相同任务
+        self.assertEqual(tasks, BalanceRunner(workers=1, chunk_size=4, seed=1).make_tasks([("easy", "plains", "mage")], 10))
+
+    def test_serial_run(self):
+        """测试在当前进程内运行"""
+        progress = []
+        runner = BalanceRunner(workers=1, chunk_size=3, max_steps=30, seed=3)
+        config = ("normal", "forest", "warrior")
+        results = runner.run([config], 5, progress=lambda done, total: progress.append((done, total)))
+        self.assertEqual(len(results[config]), 5)
+        self.assertEqual(progress[-1], (5, 5))
+
+    def test_pool_matches_serial(self):
+        """测试进程池结果与串行结果一致（结果与调度无关）"""
+        configs = [("easy", "plains", "assassin"), ("hard", "swamp", "mage")]
+        serial = BalanceRunner(workers=1, chunk_size=2, max_steps=30, seed=5).run(configs, 4)
+        pooled = BalanceRunner(workers=2, chunk_size=2, max_steps=30, seed=5).run(configs, 4)
+        self.assertEqual(serial, pooled)
+
+    def test_summarize_results(self):
+        """测试结果汇总"""
+        results = [
+            {"steps": 10, "victory": True, "gold_earned": 100, "exp_earned": 50, "final_level": 2, "monsters_defeated": 1},
+            {"steps": 20, "victory": False, "gold_earned": 0, "exp_earned": 10, "final_level": 1, "monsters_defeated": 3, "stalled": True}
+        ]
+        summary = summarize_results(results)
+        self.assertEqual(summary["games"], 2)
+        self.assertEqual(summary["victory_rate"], 50.0)
+        self.assertEqual(summary["stalled"], 1)
+        self.assertEqual(summary["average_steps"], 15)
+        self.assertEqual(summarize_results([])["games"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
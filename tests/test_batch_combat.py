@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+批量战斗结算测试
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero import batch_combat
+from hero.batch_combat import BatchCombatResolver, hero_stats_from_game, hero_stats_from_games, summarize_batch
+from hero.simulation import SimulationDriver
+
+np = batch_combat.np
+
+
+class TestWithoutNumpy(unittest.TestCase):
+    """测试未安装NumPy时的行为"""
+
+    def test_resolver_requires_numpy(self):
+        """测试缺少NumPy时给出明确的ImportError"""
+        with patch.object(batch_combat, "np", None):
+            with self.assertRaises(ImportError):
+                BatchCombatResolver()
+
+    def test_hero_stats_from_game(self):
+        """测试从游戏对象读取职业被动"""
+        warrior = hero_stats_from_game(SimulationDriver(hero_class="warrior").create_game())
+        self.assertGreater(warrior["hp_regen_percent"], 0)
+        assassin = hero_stats_from_game(SimulationDriver(hero_class="assassin").create_game())
+        self.assertGreater(assassin["dodge_per_round"], 0)
+        self.assertGreater(assassin["first_turn_damage"], 0)
+
+
+@unittest.skipIf(np is None, "需要安装NumPy")
+class TestBatchCombatResolver(unittest.TestCase):
+    """测试向量化战斗结算"""
+
+    def setUp(self):
+        self.hero = hero_stats_from_game(SimulationDriver(hero_class="warrior").create_game())
+
+    def test_seed_reproducible(self):
+        """测试相同种子得到相同结果"""
+        first = BatchCombatResolver(seed=3).simulate(self.hero, "goblin", 1000, 3)
+        second = BatchCombatResolver(seed=3).simulate(self.hero, "goblin", 1000, 3)
+        for key in first:
+            self.assertTrue(np.array_equal(first[key], second[key]))
+
+    def test_roll_monsters_ranges(self):
+        """测试怪物属性范围和精英倍率"""
+        monsters = BatchCombatResolver(seed=1).roll_monsters("goblin", 5000, 1, difficulty="normal", enemy_multiplier=1.0)
+        normal = ~monsters["elite"]
+        self.assertTrue(((monsters["hp"][normal] >= 20) & (monsters["hp"][normal] <= 35)).all())
+        self.assertTrue((monsters["hp"][monsters["elite"]] >= 30).all())
+        self.assertTrue(0.05 < monsters["elite"].mean() < 0.15)
+
+    def test_resolve_outcomes(self):
+        """测试结果字段和奖励只在击败怪物时发放"""
+        results = BatchCombatResolver(seed=5).simulate(self.hero, ["goblin", "wolf"], 2000, 1, difficulty="hard")
+        self.assertEqual(len(results["rounds"]), 2000)
+        self.assertTrue((results["rounds"] >= 1).all())
+        self.assertTrue((results["gold"][~results["rewarded"]] == 0).all())
+        self.assertTrue((results["monster_hp"][results["victory"]] <= 0).all())
+        summary = summarize_batch(results)
+        self.assertEqual(summary["fights"], 2000)
+        self.assertGreater(summary["win_rate"], 0)
+
+    def test_weak_hero_loses(self):
+        """测试弱小英雄输掉战斗"""
+        hero = dict(self.hero, hp=1, max_hp=1, attack=1, defense=0, hp_regen_percent=0)
+        results = BatchCombatResolver(seed=2).simulate(hero, "giant", 500, 5)
+        self.assertFalse(results["victory"].any())
+        self.assertTrue((results["hero_hp"] <= 0).all())
+
+    def test_max_rounds(self):
+        """测试达到最大回合数时停止"""
+        hero = dict(self.hero, attack=0, dodge=1.0)
+        results = BatchCombatResolver(seed=2, max_rounds=7).simulate(hero, "slime", 100, 1)
+        self.assertTrue((results["rounds"] == 7).all())
+        self.assertFalse(results["victory"].any())
+
+    def test_hero_stats_from_games(self):
+        """测试从多个英雄的效果向量读取每场战斗的英雄属性"""
+        games = [SimulationDriver(hero_class=hero_class).create_game() for hero_class in ("warrior", "assassin")]
+        games[1].special_effects["crit_rate"] += 0.25
+        games[1].special_effects["fire_damage"] += 5
+        stats = hero_stats_from_games(games)
+        for index, game in enumerate(games):
+            single = hero_stats_from_game(game)
+            for key, value in single.items():
+                self.assertAlmostEqual(stats[key][index], value, msg=key)
+        results = BatchCombatResolver(seed=4).resolve(stats, BatchCombatResolver(seed=4).roll_monsters("goblin", 2, 1))
+        self.assertEqual(len(results["victory"]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
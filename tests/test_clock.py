@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+游戏时钟测试
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.main import HeroGame
+from hero.clock import GameClock, get_clock
+from hero.renderer import NullRenderer
+from hero.safe_input import input_provider
+
+
+class TestGameClock(unittest.TestCase):
+    """测试游戏时钟"""
+
+    def test_real_mode_sleeps(self):
+        """测试真实模式等待并计时"""
+        sleep = Mock()
+        clock = GameClock(mode="real", sleep=sleep)
+        clock.pause(1)
+        clock.pause(2)
+        sleep.assert_any_call(2)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(clock.elapsed, 3)
+        self.assertEqual(clock.pause_count, 2)
+
+    def test_skip_mode(self):
+        """测试跳过模式既不等待也不计时"""
+        sleep = Mock()
+        clock = GameClock(mode="skip", sleep=sleep)
+        clock.pause(5)
+        sleep.assert_not_called()
+        self.assertEqual(clock.elapsed, 0)
+        self.assertEqual(clock.typing_delay(0.03, 10), 0)
+
+    def test_virtual_mode(self):
+        """测试虚拟模式只累计感知时长"""
+        sleep = Mock()
+        clock = GameClock(mode="virtual", sleep=sleep)
+        clock.pause(1)
+        clock.pause(2, kind="combat")
+        self.assertEqual(clock.typing_delay(0.5, 4), 0)
+        sleep.assert_not_called()
+        self.assertEqual(clock.elapsed, 5)
+        clock.reset()
+        self.assertEqual(clock.elapsed, 0)
+
+    def test_combat_animations_setting(self):
+        """测试关闭战斗动画时跳过战斗停顿"""
+        game = Mock()
+        game.settings.combat_animations = False
+        sleep = Mock()
+        clock = GameClock(game, mode="real", sleep=sleep)
+        clock.pause(1, kind="combat")
+        sleep.assert_not_called()
+        clock.pause(1)
+        sleep.assert_called_once_with(1)
+
+    def test_mode_from_environment(self):
+        """测试从环境变量读取模式"""
+        with patch.dict(os.environ, {"HERO_CLOCK": "virtual"}):
+            self.assertEqual(GameClock().mode, "virtual")
+        with self.assertRaises(ValueError):
+            GameClock(mode="slow")
+
+    def test_game_uses_clock(self):
+        """测试游戏的停顿经由时钟"""
+        clock = GameClock(mode="virtual")
+        game = HeroGame(language="zh", seed=1, renderer=NullRenderer(), clock=clock)
+        self.assertIs(get_clock(game), clock)
+        self.assertIs(game.combat_system.clock, clock)
+        game.setup_hero_class("warrior")
+        game.setup_map_and_difficulty("normal", "plains")
+        with patch("time.sleep") as mock_sleep, input_provider(lambda decision, prompt, options: ""):
+            game.random_event()
+        mock_sleep.assert_not_called()
+        self.assertGreaterEqual(clock.elapsed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
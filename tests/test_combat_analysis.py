@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+马尔可夫链战斗分析测试
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.combat_analysis import CombatAnalyzer, WinProbabilityTable, create_leveled_game
+from hero.batch_combat import HERO_STAT_DEFAULTS, hero_stats_from_game
+
+
+class TestCombatAnalyzer(unittest.TestCase):
+    """测试精确战斗分析"""
+
+    def setUp(self):
+        self.analyzer = CombatAnalyzer()
+        self.hero = {"hp": 100, "max_hp": 100, "attack": 20, "defense": 3, "crit_rate": 0.1}
+
+    def test_certain_win(self):
+        """测试一击必杀的战斗"""
+        result = self.analyzer.analyze_fight(self.hero, 5, 10)
+        self.assertAlmostEqual(result["win_probability"], 1.0)
+        self.assertAlmostEqual(result["expected_rounds"], 1.0)
+        self.assertAlmostEqual(result["expected_hp_loss"], 0.0)
+
+    def test_certain_loss(self):
+        """测试必败的战斗"""
+        hero = dict(self.hero, hp=1, attack=1)
+        result = self.analyzer.analyze_fight(hero, 50, 10)
+        self.assertAlmostEqual(result["win_probability"], 0.0)
+        self.assertAlmostEqual(result["expected_rounds"], 1.0)
+
+    def test_two_round_fight(self):
+        """测试手算的两回合战斗"""
+        # 英雄伤害 randint(1, 2)，无暴击；怪物生命 3；怪物伤害固定 1
+        hero = dict(self.hero, attack=2, crit_rate=0, defense=0, hp=10, max_hp=10)
+        result = self.analyzer.analyze_fight(hero, 3, 1)
+        self.assertAlmostEqual(result["win_probability"], 1.0)
+        # 两回合都打出1点时需要第三回合：P = 1/4
+        self.assertAlmostEqual(result["expected_rounds"], 2.25)
+        self.assertAlmostEqual(result["expected_hp_loss"], 1.25)
+
+    def test_probabilities_sum(self):
+        """测试概率守恒"""
+        result = self.analyzer.analyze_monster(self.hero, "wolf", 2, "hard")
+        self.assertGreaterEqual(result["win_probability"], 0)
+        self.assertLessEqual(result["win_probability"], 1 + 1e-9)
+        self.assertLessEqual(result["reward_probability"], result["win_probability"] + 1e-9)
+
+    def test_joint_matches_independent(self):
+        """测试联合状态动态规划与独立分解一致"""
+        stats = dict(HERO_STAT_DEFAULTS)
+        stats.update(self.hero, dodge=0.2, hp_regen_percent=0.05, hp=60)
+        table = self.analyzer.monster_attack_table(stats, 18)
+        joint = self.analyzer._analyze_joint(stats, {40: 0.5, 55: 0.5}, table, 5)
+        independent = self.analyzer._analyze_independent(stats, {40: 0.5, 55: 0.5}, table)
+        for key in joint:
+            self.assertAlmostEqual(joint[key], independent[key])
+
+    def test_counter_attack_and_lifesteal(self):
+        """测试反击和吸血提高胜率"""
+        weak = dict(self.hero, hp=40, max_hp=40, attack=12)
+        base = self.analyzer.analyze_monster(weak, "beast", 3)
+        boosted = self.analyzer.analyze_monster(dict(weak, counter_attack=0.5, lifesteal=0.3), "beast", 3)
+        self.assertGreater(boosted["win_probability"], base["win_probability"])
+
+    def test_elite_is_harder(self):
+        """测试精英怪物更难"""
+        hero = dict(self.hero, hp=50, max_hp=50)
+        normal = self.analyzer.analyze_monster(hero, "skeleton", 3, elite=False)
+        elite = self.analyzer.analyze_monster(hero, "skeleton", 3, elite=True)
+        self.assertLess(elite["win_probability"], normal["win_probability"])
+        self.assertGreater(elite["expected_exp"] / elite["reward_probability"],
+                           normal["expected_exp"] / normal["reward_probability"])
+
+
+class TestWinProbabilityTable(unittest.TestCase):
+    """测试胜率查询表"""
+
+    def test_leveled_game(self):
+        """测试创建指定等级的游戏"""
+        game = create_leveled_game("mage", 4, "hard")
+        self.assertEqual(game.hero_level, 4)
+        self.assertGreater(hero_stats_from_game(game)["attack"],
+                           hero_stats_from_game(create_leveled_game("mage", 1))["attack"])
+
+    def test_build_lookup_and_save(self):
+        """测试构建、查询、保存和加载"""
+        table = WinProbabilityTable.build(map_types=["plains", "desert"], difficulties=["hard"],
+                                          hero_classes=["warrior"], levels=[1, 2])
+        self.assertEqual(len(table.entries), 4)
+        entry = table.lookup("desert", "hard", "warrior", 2)
+        self.assertGreater(entry["win_probability"], 0)
+        self.assertIsNone(table.lookup("desert", "easy", "warrior", 2))
+
+        game = create_leveled_game("warrior", 2, "hard", "desert")
+        self.assertEqual(table.win_probability(game), entry["win_probability"])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "table.json")
+            table.save(path)
+            loaded = WinProbabilityTable.load(path)
+        self.assertEqual(loaded.lookup("desert", "hard", "warrior", 2), entry)
+
+
+if __name__ == '__main__':
+    unittest.main()
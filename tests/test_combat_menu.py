@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+战斗菜单和技能分派测试
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.combat import SKILL_HANDLERS
+from hero.combat_analysis import create_leveled_game
+from hero.combat_menu import get_combat_menu
+from hero.game_config import SKILL_TREES
+from hero.renderer import RecordingRenderer
+from hero.safe_input import input_provider
+from hero.skill_tree import SkillTree
+
+
+class TestCombatMenu(unittest.TestCase):
+    """测试按技能树版本缓存的战斗菜单"""
+
+    def setUp(self):
+        self.game = create_leveled_game("mage", 5, "normal", "plains")
+        self.game.renderer = RecordingRenderer(self.game)
+        self.game.skill_points = 20
+
+    def test_cached_until_upgrade(self):
+        """测试技能等级不变时复用菜单"""
+        menu = get_combat_menu(self.game)
+        self.assertIs(get_combat_menu(self.game), menu)
+
+        # 升级失败不重新编译
+        self.assertFalse(self.game.upgrade_skill("meteor"))
+        self.assertIs(get_combat_menu(self.game), menu)
+
+        self.assertTrue(self.game.upgrade_skill("fireball"))
+        rebuilt = get_combat_menu(self.game)
+        self.assertIsNot(rebuilt, menu)
+        self.assertIn("(Lv.2)", rebuilt.labels)
+
+    def test_options_sorted_by_category(self):
+        """测试技能按类别排序并从 3 开始编号"""
+        self.game.upgrade_skill("fireball")
+        self.game.upgrade_skill("fireball")
+        self.game.upgrade_skill("meditation")
+        self.game.upgrade_skill("frost_armor")
+        menu = get_combat_menu(self.game)
+        self.assertEqual(menu.skills, ("fireball", "frost_armor", "meditation"))
+        self.assertEqual(menu.skill_for("2"), "use_potion")
+        self.assertEqual(menu.skill_for("4"), "frost_armor")
+        self.assertIsNone(menu.skill_for("6"))
+        self.assertEqual(menu.choices, ["1", "2", "3", "4", "5"])
+        self.assertTrue(menu.labels.startswith(f"3. {self.game.lang.get_text('fireball_skill')} (Lv.3)\n"))
+
+    def test_language_change(self):
+        """测试切换语言后重新渲染菜单"""
+        menu = get_combat_menu(self.game)
+        self.game.set_language("en")
+        try:
+            rebuilt = get_combat_menu(self.game)
+            self.assertIsNot(rebuilt, menu)
+            self.assertIn(self.game.lang.get_text("fireball_skill"), rebuilt.labels)
+        finally:
+            self.game.set_language("zh")
+
+    def test_render(self):
+        """测试菜单输出和药剂行"""
+        renderer = self.game.renderer
+        get_combat_menu(self.game).render(renderer, 0)
+        self.assertIn(f"2. {self.game.lang.get_text('no_potion')}", renderer.output())
+        self.assertIn("3. ", renderer.output())
+
+        renderer.clear_messages()
+        get_combat_menu(self.game).render(renderer, 2)
+        self.assertIn(f"2. {self.game.lang.get_text('use_potion_short')}", renderer.output())
+
+    def test_version(self):
+        """测试直接设置等级和读档会更新版本"""
+        tree = self.game.skill_tree
+        version = tree.version
+        tree.set_skill_level("meteor", 1)
+        self.assertEqual(tree.version, version + 1)
+        self.assertEqual(tree.learned_skills["meteor"], 1)
+
+        tree.set_skill_level("fireball", tree.skill_nodes["fireball"].max_level)
+        restored = SkillTree.from_dict(tree.to_dict(), self.game.lang)
+        self.assertTrue(restored.skill_nodes["fireball"].is_maxed)
+        self.assertEqual(get_combat_menu(self.game).skills[-1], "meteor")
+
+
+class TestSkillDispatch(unittest.TestCase):
+    """测试技能分派表"""
+
+    def test_handlers_registered(self):
+        """测试有专门效果的技能都已注册"""
+        for hero_class, skills in SKILL_TREES.items():
+            for skill_id in skills:
+                if skill_id != "battle_cry":
+                    self.assertIn(skill_id, SKILL_HANDLERS, f"{hero_class}: {skill_id}")
+
+    def test_skill_action_by_option(self):
+        """测试按菜单编号使用技能"""
+        game = create_leveled_game("warrior", 5, "normal", "plains")
+        game.renderer = RecordingRenderer(game)
+        game.skill_points = 20
+        for skill_id in ("power_strike", "power_strike", "iron_will"):
+            self.assertTrue(game.upgrade_skill(skill_id))
+        combat = game.combat_system
+
+        base_defense = game.base_defense
+        combat.handle_skill_action("4", "史莱姆", 50, 1)
+        self.assertEqual(game.base_defense, base_defense + 2)
+        self.assertIn(game.lang.get_text("passive_skill_activated"), game.renderer.output())
+
+        # 无效编号改为普通攻击
+        game.renderer.clear_messages()
+        self.assertLess(combat.handle_skill_action("9", "史莱姆", 50, 1), 50)
+        self.assertIn(game.lang.get_text("invalid_action"), game.renderer.output())
+
+    def test_boss_potion_option(self):
+        """测试 Boss 战使用药剂选项"""
+        game = create_leveled_game("assassin", 5, "normal", "plains")
+        game.renderer = RecordingRenderer(game)
+        game.hero_potions = 1
+        game.hero_hp = 10
+        self.assertEqual(game.combat_system.handle_boss_skill_attack("2", "巨龙", 200, 1, 5), 200)
+        self.assertEqual(game.hero_potions, 0)
+        self.assertGreater(game.hero_hp, 10)
+
+    def test_get_combat_action(self):
+        """测试战斗动作的输入选项来自菜单"""
+        game = create_leveled_game("warrior", 5, "normal", "plains")
+        game.renderer = RecordingRenderer(game)
+        seen = []
+
+        def provider(decision, prompt, options):
+            seen.append(list(options))
+            return "3"
+
+        with input_provider(provider):
+            self.assertEqual(game.combat_system.get_combat_action(), "3")
+        self.assertEqual(seen, [get_combat_menu(game).choices])
+
+
+if __name__ == '__main__':
+    unittest.main()
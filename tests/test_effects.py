@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+特殊效果向量测试
+"""
+
+import sys
+import os
+import copy
+import pickle
+import unittest
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.effects import (EffectVector, EFFECT_REGISTRY, EFFECT_INDEX, EFFECT_COUNT, EFFECT_DEFAULTS,
+                          effect_matrix)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestEffectVector(unittest.TestCase):
+    """测试固定索引的特殊效果向量"""
+
+    def test_registry(self):
+        """测试注册表的索引和初始值"""
+        self.assertEqual(len(EFFECT_INDEX), EFFECT_COUNT)
+        self.assertEqual(EFFECT_INDEX["crit_rate"], 0)
+        vector = EffectVector()
+        self.assertEqual(len(vector.values), EFFECT_COUNT)
+        self.assertEqual(vector, EFFECT_DEFAULTS)
+        self.assertEqual(list(vector), [name for name, _ in EFFECT_REGISTRY])
+
+    def test_mapping_interface(self):
+        """测试与原特殊效果字典相同的读写方式"""
+        vector = EffectVector()
+        vector["crit_rate"] += 0.15
+        vector["ice_damage"] += 5
+        self.assertEqual(vector["crit_rate"], 0.15)
+        self.assertEqual(vector.get("dodge", 1), 0.0)
+        self.assertIn("first_turn_damage", vector)
+        with self.assertRaises(KeyError):
+            vector["unknown"]
+
+        # 整数效果读取时仍是 int
+        self.assertIsInstance(vector["ice_damage"], int)
+        self.assertEqual(f"+{vector['ice_damage']}", "+5")
+        vector["mana_regeneration"] += 2.5
+        self.assertEqual(vector["mana_regeneration"], 2.5)
+
+        # 注册表以外的键
+        vector["shadow_power"] = 0.1
+        self.assertEqual(vector.get("shadow_power"), 0.1)
+        self.assertEqual(len(vector), EFFECT_COUNT + 1)
+        del vector["shadow_power"]
+        self.assertNotIn("shadow_power", vector)
+
+    def test_named_accessors(self):
+        """测试按名称属性读写"""
+        vector = EffectVector()
+        vector.dodge = 0.2
+        self.assertEqual(vector["dodge"], 0.2)
+        self.assertEqual(vector.values[EFFECT_INDEX["dodge"]], 0.2)
+        vector["fire_damage"] = 7
+        self.assertEqual(vector.fire_damage, 7)
+
+    def test_copy_and_add(self):
+        """测试复制和逐项相加"""
+        vector = EffectVector.from_mapping({"crit_rate": 0.1, "lifesteal": 0.2})
+        for clone in (vector.copy(), copy.copy(vector), copy.deepcopy(vector), pickle.loads(pickle.dumps(vector))):
+            self.assertEqual(clone, vector)
+            clone["crit_rate"] = 0.5
+            self.assertEqual(vector["crit_rate"], 0.1)
+
+        total = EffectVector()
+        total += vector
+        total += vector
+        self.assertAlmostEqual(total["lifesteal"], 0.4)
+        total.reset()
+        self.assertEqual(total, EffectVector())
+
+    @unittest.skipIf(np is None, "需要安装NumPy")
+    def test_numpy_views(self):
+        """测试 NumPy 视图和效果矩阵"""
+        first = EffectVector.from_mapping({"crit_rate": 0.1})
+        second = EffectVector.from_mapping({"crit_rate": 0.3, "backstab": 0.2})
+        self.assertEqual(first.as_array()[EFFECT_INDEX["crit_rate"]], 0.1)
+        matrix = effect_matrix([first, second])
+        self.assertEqual(matrix.shape, (2, EFFECT_COUNT))
+        self.assertEqual(list(matrix[:, EFFECT_INDEX["crit_rate"]]), [0.1, 0.3])
+        self.assertEqual(list(matrix[:, EFFECT_INDEX["backstab"]]), [0.0, 0.2])
+
+
+if __name__ == '__main__':
+    unittest.main()
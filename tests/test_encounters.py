@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+遭遇表测试
+"""
+
+import sys
+import os
+import random
+import unittest
+from unittest.mock import patch
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero import encounters
+from hero.encounters import (EncounterTable, compile_encounter_tables, get_encounter_table,
+                             get_boss_template, level_band, reload_encounter_tables)
+from hero.game_config import MAP_TYPES, MONSTER_TEMPLATES, BOSS_TEMPLATES
+
+
+class TestEncounterTables(unittest.TestCase):
+    """测试遭遇表"""
+
+    def test_level_band(self):
+        """测试等级段划分"""
+        self.assertEqual([level_band(level) for level in range(1, 9)], [0, 0, 1, 1, 1, 2, 2, 2])
+
+    def test_tables_match_map_monsters(self):
+        """测试遭遇表包含地图怪物和通用怪物（去重、过滤不存在的模板）"""
+        table = get_encounter_table("plains", 1)
+        self.assertEqual(table.monster_keys, ("goblin", "slime", "wolf"))
+        table = get_encounter_table("forest", 4)
+        self.assertEqual(table.monster_keys, ("wolf", "beast", "spider", "skeleton"))
+        for (map_type, _), table in encounters.ENCOUNTER_TABLES.items():
+            self.assertIn(map_type, MAP_TYPES)
+            for key, template in zip(table.monster_keys, table.templates):
+                self.assertIs(template, MONSTER_TEMPLATES[key])
+            self.assertEqual(len(set(table.monster_keys)), len(table))
+
+    def test_uniform_by_default(self):
+        """测试默认权重为均匀分布"""
+        probabilities = get_encounter_table("desert", 7).probabilities()
+        for probability in probabilities.values():
+            self.assertAlmostEqual(probability, 1 / len(probabilities))
+
+    def test_weighted_pick(self):
+        """测试按权重选择"""
+        table = EncounterTable(["a", "b", "c"], [{}, {}, {}], [1, 0, 3])
+        rng = random.Random(1)
+        picks = [table.pick(rng)[0] for _ in range(4000)]
+        self.assertNotIn("b", picks)
+        self.assertAlmostEqual(picks.count("c") / len(picks), 0.75, delta=0.03)
+        self.assertEqual(table.probabilities(), {"a": 0.25, "b": 0.0, "c": 0.75})
+
+    def test_monster_weights_config(self):
+        """测试地图配置中的怪物权重"""
+        map_types = {"test": {"monsters": ["goblin", "wolf"], "monster_weights": {"wolf": 4}}}
+        table = compile_encounter_tables(map_types)[("test", 0)]
+        self.assertEqual(table.monster_keys, ("goblin", "wolf", "slime"))
+        self.assertAlmostEqual(table.probabilities()["wolf"], 4 / 6)
+
+    def test_reload(self):
+        """测试配置修改后重新编译"""
+        with patch.dict(MAP_TYPES["plains"], {"monster_weights": {"goblin": 0}}):
+            reload_encounter_tables()
+            self.assertEqual(get_encounter_table("plains", 1).probabilities()["goblin"], 0)
+        reload_encounter_tables()
+        self.assertGreater(get_encounter_table("plains", 1).probabilities()["goblin"], 0)
+
+    def test_boss_table(self):
+        """测试Boss表及默认Boss"""
+        for map_type in MAP_TYPES:
+            self.assertIs(get_boss_template(map_type), BOSS_TEMPLATES.get(map_type, BOSS_TEMPLATES["plains"]))
+        self.assertIs(get_boss_template("unknown"), BOSS_TEMPLATES["plains"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,7 +16,7 @@ hero_path = os.path.join(src_path, 'hero')
 sys.path.insert(0, hero_path)
 sys.path.insert(0, src_path)
 
-from hero.equipment import EquipmentSystem
+from hero.equipment import EquipmentSystem, EQUIPMENT_NAMES, SPECIAL_EFFECTS
 
 
 class TestEquipmentSystem(unittest.TestCase):
@@ -298,5 +298,27 @@ class TestEquipmentSystem(unittest.TestCase):
                 self.assertIsInstance(color, str)
 
 
+    def test_shared_database(self):
+        """测试装备名称库和特殊效果在所有装备系统之间共享且只读"""
+        other = EquipmentSystem(Mock())
+        self.assertIs(self.equipment_system.equipment_database, EQUIPMENT_NAMES)
+        self.assertIs(other.equipment_database, EQUIPMENT_NAMES)
+        with self.assertRaises(TypeError):
+            EQUIPMENT_NAMES["weapon"]["zh"]["common"] = ["test"]
+        with self.assertRaises(TypeError):
+            SPECIAL_EFFECTS["crit_rate"] = {}
+        self.assertIsInstance(EQUIPMENT_NAMES["weapon"]["en"]["rare"], tuple)
+
+    def test_loot_batch_isolates_cache(self):
+        """测试一批战利品使用单独的基础装备缓存，结束后恢复原有缓存"""
+        self.equipment_system.create_random_equipment()
+        saved_cache = dict(self.equipment_system._equipment_cache)
+        with self.equipment_system.loot_batch() as equip_system:
+            self.assertIs(equip_system, self.equipment_system)
+            self.assertEqual(equip_system._equipment_cache, {})
+            equip_system.create_random_equipment(rarity_bonus=2)
+        self.assertEqual(self.equipment_system._equipment_cache, saved_cache)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+背包容器测试
+"""
+
+import sys
+import os
+import pickle
+import unittest
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.inventory import Inventory, PAGE_SIZE, item_power
+from hero.main import HeroGame
+from hero.combat_analysis import create_leveled_game
+from hero.renderer import RecordingRenderer
+from hero.save_data import SaveData
+from hero.safe_input import input_provider
+
+
+def make_item(name, item_type="weapon", rarity="common", attack=0, defense=0, hp=0, enhancement_level=0):
+    """创建测试装备"""
+    return {"name": name, "type": item_type, "rarity": rarity, "attack": attack, "defense": defense,
+            "hp": hp, "special_effects": [], "set_bonus": None, "enhancement_level": enhancement_level}
+
+
+class TestInventory(unittest.TestCase):
+    """测试带索引的背包"""
+
+    def setUp(self):
+        self.sword = make_item("剑", "weapon", "rare", attack=10)
+        self.axe = make_item("斧", "weapon", "common", attack=12)
+        self.mail = make_item("铠甲", "armor", "epic", defense=4, enhancement_level=3)
+        self.ring = make_item("戒指", "accessory", "rare", hp=30)
+        self.inventory = Inventory([self.sword, self.axe, self.mail, self.ring])
+
+    def test_list_compatible(self):
+        """测试与列表相同的顺序和增删操作"""
+        self.assertIsInstance(self.inventory, list)
+        self.assertEqual(self.inventory, [self.sword, self.axe, self.mail, self.ring])
+        self.assertIs(self.inventory.pop(1), self.axe)
+        self.inventory.append(self.axe)
+        self.inventory.remove(self.mail)
+        self.assertEqual(self.inventory, [self.sword, self.ring, self.axe])
+        self.assertEqual(self.inventory.of_type("weapon"), [self.sword, self.axe])
+        self.assertEqual(self.inventory.count_items(item_type="armor"), 0)
+        self.assertEqual(self.inventory.count(self.axe), 1)
+        self.assertEqual(self.inventory.count(self.mail), 0)
+
+    def test_buckets(self):
+        """测试按类型和稀有度分桶"""
+        self.assertEqual(self.inventory.of_type("weapon"), [self.sword, self.axe])
+        self.assertEqual(self.inventory.of_rarity("rare"), [self.sword, self.ring])
+        self.assertEqual(self.inventory.count_items("weapon"), 2)
+        self.assertEqual(self.inventory.count_items("weapon", "rare"), 1)
+        self.assertEqual(list(self.inventory.view(item_type="weapon", rarity="common")), [self.axe])
+        self.assertEqual(sorted(self.inventory.types()), ["accessory", "armor", "weapon"])
+
+    def test_sorted_views(self):
+        """测试按战力、稀有度和强化等级排序"""
+        self.assertEqual(list(self.inventory.view("power")), [self.ring, self.axe, self.sword, self.mail])
+        self.assertEqual(list(self.inventory.view("rarity")), [self.mail, self.ring, self.sword, self.axe])
+        self.assertEqual(list(self.inventory.view("enhancement"))[0], self.mail)
+        self.assertIs(self.inventory.best("weapon"), self.axe)
+
+        # 战力相同时按获得顺序
+        twin = make_item("剑", "weapon", "rare", attack=10)
+        self.inventory.append(twin)
+        self.assertEqual(list(self.inventory.view("power", "weapon")), [self.axe, self.sword, twin])
+
+    def test_remove_by_id(self):
+        """测试按物品 ID 删除后位置和索引保持一致"""
+        self.assertIs(self.inventory.remove_id(id(self.axe)), self.axe)
+        self.assertIsNone(self.inventory.remove_id(id(self.axe)))
+        self.assertEqual(self.inventory.position(self.ring), 2)
+        self.assertIsNone(self.inventory.position(self.axe))
+        self.assertIs(self.inventory.get_item(id(self.mail)), self.mail)
+        self.assertEqual(self.inventory.of_type("weapon"), [self.sword])
+        self.assertIs(self.inventory.best("weapon"), self.sword)
+
+    def test_refresh(self):
+        """测试物品修改后重新排序"""
+        self.sword["attack"] = 50
+        self.inventory.refresh(self.sword)
+        self.assertIs(self.inventory.best("weapon"), self.sword)
+        self.assertEqual(item_power(self.sword), 100)
+
+    def test_pages(self):
+        """测试分页读取"""
+        inventory = Inventory(make_item(f"剑{i}", attack=i) for i in range(25))
+        items, number, pages = inventory.page(1)
+        self.assertEqual((number, pages), (1, 3))
+        self.assertEqual([item["name"] for item in items], [f"剑{i}" for i in range(10, 20)])
+        items, number, _ = inventory.page(9, sort_key="power")
+        self.assertEqual(number, 2)
+        self.assertEqual([item["attack"] for item in items], [4, 3, 2, 1, 0])
+        self.assertEqual(inventory.page(0)[2], 3)
+        self.assertEqual(Inventory().page(0), ([], 0, 1))
+
+    def test_pickle(self):
+        """测试序列化后仍是带索引的背包"""
+        copy = pickle.loads(pickle.dumps(self.inventory))
+        self.assertIsInstance(copy, Inventory)
+        self.assertEqual(copy, self.inventory)
+        self.assertEqual(copy.count_items("weapon"), 2)
+
+
+class TestInventoryInGame(unittest.TestCase):
+    """测试游戏中的背包"""
+
+    def setUp(self):
+        self.game = HeroGame(language="zh", renderer=RecordingRenderer())
+        for i in range(PAGE_SIZE + 3):
+            self.game.inventory.append(make_item(f"剑{i}", attack=i + 1))
+
+    def test_save_round_trip(self):
+        """测试存档读档后背包仍是 Inventory"""
+        source = create_leveled_game("warrior", 3, "normal", "plains")
+        source.inventory.extend(self.game.inventory)
+        game = HeroGame(language="zh", renderer=RecordingRenderer())
+        game.load_from_save_data(SaveData.from_dict(SaveData(source).to_dict()))
+        self.assertIsInstance(game.inventory, Inventory)
+        self.assertEqual(game.inventory.count_items("weapon"), PAGE_SIZE + 3)
+
+    def test_show_inventory_pages(self):
+        """测试背包每次只显示一页"""
+        renderer = self.game.renderer
+        self.assertEqual(self.game.equipment_system.show_inventory(), 0)
+        output = renderer.output()
+        self.assertIn(f"{PAGE_SIZE}. ", output)
+        self.assertNotIn(f"{PAGE_SIZE + 1}. ", output)
+        self.assertIn("1/2", output)
+
+        renderer.clear_messages()
+        self.assertEqual(self.game.equipment_system.show_inventory(5, "power"), 1)
+        output = renderer.output()
+        self.assertIn("11. ", output)
+        self.assertIn("剑2", output)
+
+    def test_equip_from_sorted_page(self):
+        """测试在排序后的第二页按编号装备"""
+        answers = iter(["1", "s", "n", "11", "", "3"])
+        with input_provider(lambda decision, prompt, options: next(answers)):
+            self.game.equipment_system.equipment_management()
+        # 按战力排序的第 11 件是战力第 11 高的剑
+        self.assertEqual(self.game.equipment["weapon"]["name"], "剑2")
+        self.assertEqual(len(self.game.inventory), PAGE_SIZE + 2)
+        self.assertEqual(self.game.inventory.count_items("weapon"), PAGE_SIZE + 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
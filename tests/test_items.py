@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+装备物品（Item / ItemTemplate）测试
+"""
+
+import sys
+import os
+import copy
+import json
+import pickle
+import unittest
+from unittest.mock import Mock
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.items import Item, ItemTemplate, as_item, item_to_dict
+from hero.equipment import EquipmentSystem
+
+
+def make_item(**changes):
+    """创建一件普通装备"""
+    item = Item(ItemTemplate.get("weapon", "rare", "锋利的剑"), 12, 0, 5, ["critical_strike"], "warrior_set")
+    for key, value in changes.items():
+        item[key] = value
+    return item
+
+
+class TestItem(unittest.TestCase):
+    """测试装备对象"""
+
+    def test_template_is_interned(self):
+        """测试相同内容的模板只有一个实例"""
+        first = ItemTemplate.get("armor", "common", "皮甲")
+        self.assertIs(first, ItemTemplate.get("armor", "common", "皮甲"))
+        self.assertIsNot(first, ItemTemplate.get("armor", "rare", "皮甲"))
+        with self.assertRaises(AttributeError):
+            first.name = "布甲"
+        self.assertIs(make_item().special_effects, make_item().special_effects)
+
+    def test_mapping_view(self):
+        """测试与原装备字典一致的映射接口"""
+        item = make_item()
+        self.assertEqual(item["attack"], 12)
+        self.assertEqual(item.attack, 12)
+        self.assertEqual(item["base_attack"], 12)
+        self.assertEqual(item["special_effects"], ("critical_strike",))
+        self.assertNotIn("enchantment", item)
+        self.assertNotIn("special_effects_values", item)
+        self.assertIsNone(item.get("price"))
+        with self.assertRaises(KeyError):
+            item["legendary_attribute"]
+
+        item["price"] = 30
+        item["enchantment"] = "flame_enchantment"
+        item["fire_damage_percent"] = 0.1
+        self.assertEqual(item["price"], 30)
+        self.assertEqual(item.get("fire_damage_percent"), 0.1)
+        self.assertEqual(list(item)[-1], "fire_damage_percent")
+
+        del item["price"]
+        self.assertNotIn("price", item)
+        self.assertEqual(len(item), len(dict(item)))
+
+    def test_template_key_assignment(self):
+        """测试修改模板中的键换用另一个模板，不影响其他装备"""
+        item = make_item()
+        other = make_item()
+        item["name"] = "+1 锋利的剑"
+        self.assertEqual(item.name, "+1 锋利的剑")
+        self.assertEqual(other.name, "锋利的剑")
+        self.assertIs(item.template, ItemTemplate.get("weapon", "rare", "+1 锋利的剑"))
+
+    def test_dict_round_trip(self):
+        """测试字典与 Item 互相转换后内容不变"""
+        data = {
+            "name": "传奇之剑", "type": "weapon", "rarity": "legendary", "attack": 30, "defense": 0, "hp": 0,
+            "special_effects": ["flame"], "special_effects_values": {"flame_damage": 10}, "set_bonus": None,
+            "enhancement_level": 10, "base_attack": 25, "base_defense": 0, "base_hp": 0,
+            "is_legendary": True, "legendary_attribute": "flame_damage", "set_bonus_active": True
+        }
+        item = Item.from_dict(data)
+        self.assertEqual(item.to_dict(), data)
+        self.assertEqual(list(item.to_dict()), list(data))
+        self.assertEqual(item, data)
+        self.assertEqual(item.special_effects_values["flame_damage"], 10)
+
+        # 缺少键的旧存档数据也原样还原
+        partial = {"name": "旧剑", "type": "weapon", "attack": 3}
+        self.assertEqual(Item.from_dict(partial).to_dict(), partial)
+
+    def test_copy_and_pickle(self):
+        """测试拷贝和序列化保留共享模板"""
+        item = make_item(price=10)
+        for clone in (item.copy(), copy.deepcopy(item), pickle.loads(pickle.dumps(item))):
+            self.assertEqual(clone, item)
+            self.assertIsNot(clone, item)
+            self.assertIs(clone.template, item.template)
+        clone = item.copy()
+        clone["attack"] = 99
+        self.assertEqual(item["attack"], 12)
+
+    def test_conversion_helpers(self):
+        """测试 as_item / item_to_dict"""
+        item = make_item()
+        self.assertIs(as_item(item), item)
+        self.assertIsNone(as_item(None))
+        self.assertEqual(as_item(item.to_dict()), item)
+        self.assertEqual(item_to_dict(item), item.to_dict())
+        self.assertEqual(json.loads(json.dumps(item_to_dict(item)))["special_effects"], ["critical_strike"])
+
+    def test_generated_equipment(self):
+        """测试装备系统生成 Item"""
+        game = Mock()
+        game.language = "zh"
+        system = EquipmentSystem(game)
+        item = system.create_random_equipment("weapon")
+        self.assertIsInstance(item, Item)
+        self.assertEqual(item.type, "weapon")
+        self.assertNotIn("_cached_name", item)
+        self.assertEqual(item["base_attack"], item["attack"])
+
+        legendary = system.create_legendary_equipment("weapon")
+        self.assertTrue(legendary.is_legendary)
+        self.assertIn("special_effects_values", legendary)
+
+
+if __name__ == '__main__':
+    unittest.main()
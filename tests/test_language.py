@@ -5,12 +5,21 @@
 
 import sys
 import os
+import copy
+import json
+import pickle
+import shutil
+import tempfile
+import threading
+import time
 import unittest
+from unittest.mock import Mock, patch
 
 # 添加项目路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from hero.language import LanguageSupport
+from hero import language
+from hero.language import LanguageSupport, TextCache, TextTemplate, format_line, compile_catalog, load_texts, available_languages
 
 
 class TestLanguageSupport(unittest.TestCase):
@@ -128,5 +137,195 @@ class TestLanguageSupport(unittest.TestCase):
                 self.assertTrue(len(text) > 0)
 
 
+class TestTextCache(unittest.TestCase):
+    """测试格式化文本缓存"""
+
+    def test_lru_eviction(self):
+        """测试超过容量时淘汰最久未使用的条目"""
+        cache = TextCache(maxsize=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        self.assertEqual(cache.get("a"), "1")
+        cache.put("c", "3")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+        self.assertEqual(cache.stats(), {"size": 2, "maxsize": 2, "hits": 2, "misses": 1, "evictions": 1})
+
+    def test_get_text_is_bounded(self):
+        """测试参数化文本的缓存有上限且命中时结果正确"""
+        lang = LanguageSupport("zh", cache_size=4)
+        for gold in range(20):
+            self.assertIn(str(gold), lang.get_text("lost_gold", gold=gold))
+        stats = lang.cache_stats()
+        self.assertEqual(stats["size"], 4)
+        self.assertEqual(stats["evictions"], 16)
+
+        first = lang.get_text("lost_gold", gold=19)
+        self.assertEqual(lang.cache_stats()["hits"], 1)
+        self.assertEqual(first, lang.get_text("lost_gold", gold=19))
+
+    def test_uncached_keys(self):
+        """测试不缓存的文本键和静态文本不占用缓存"""
+        lang = LanguageSupport("en")
+        self.assertIn("gained_exp", language.UNCACHED_TEXT_KEYS)
+        for exp in range(10):
+            self.assertIn(str(exp), lang.get_text("gained_exp", exp=exp))
+        lang.get_text("victory")
+        self.assertEqual(lang.cache_stats()["size"], 0)
+        self.assertEqual(lang.cache_stats()["misses"], 0)
+
+    def test_language_switch_clears_cache(self):
+        """测试切换语言时清空缓存"""
+        lang = LanguageSupport("zh")
+        chinese = lang.get_text("lost_gold", gold=5)
+        lang.set_language("en")
+        self.assertNotEqual(lang.get_text("lost_gold", gold=5), chinese)
+
+class TestTextTemplates(unittest.TestCase):
+    """测试预解析的文本模板"""
+
+    def test_render_matches_str_format(self):
+        """测试模板渲染结果与 str.format 一致"""
+        params = {"position": 3, "exp": 15, "gold": 7, "target": 5, "current": 2, "heal": 9, "hp": 4}
+        for name in ("zh", "en"):
+            for key, text in load_texts(name).items():
+                if not isinstance(text, str):
+                    continue
+                with self.subTest(language=name, key=key):
+                    try:
+                        expected = text.format(**params)
+                    except (KeyError, ValueError):
+                        expected = text
+                    self.assertEqual(TextTemplate(text).render(params), expected)
+
+    def test_template_edge_cases(self):
+        """测试转义、百分号、缺少参数和格式说明"""
+        self.assertEqual(TextTemplate("{{x}} 100%").render({}), "{x} 100%")
+        self.assertEqual(TextTemplate("{a}% of {b!r}").render({"a": 5, "b": "x"}), "5% of 'x'")
+        self.assertEqual(TextTemplate("hp {hp}").render({}), "hp {hp}")
+        self.assertEqual(TextTemplate("{rate:.1f}").render({"rate": 0.25}), "0.2")
+        self.assertEqual(TextTemplate("{value}").render({"value": (1, 2)}), "(1, 2)")
+
+    def test_line_templates(self):
+        """测试整行模板与逐个拼接文本的结果一致"""
+        lang = LanguageSupport("en")
+        expected = f"\n--- {lang.get_text('round')} 3 ---"
+        self.assertEqual(lang.line("combat_round", round=3), expected)
+        self.assertEqual(lang.line("monster_stats", name="Slime", hp=10, attack=2, defense=1),
+                         f"Slime - {lang.get_text('hp')}{lang.get_text('item_separator')}10, "
+                         f"{lang.get_text('attack')}{lang.get_text('item_separator')}2, "
+                         f"{lang.get_text('defense')}{lang.get_text('item_separator')}1")
+        lang.set_language("zh")
+        self.assertIn(lang.get_text("round"), lang.line("combat_round", round=3))
+
+    def test_format_line_with_mock_language(self):
+        """测试非 LanguageSupport 的语言对象按其 get_text 渲染"""
+        lang = Mock()
+        lang.get_text.side_effect = lambda key: key.upper()
+        self.assertEqual(format_line(lang, "hero_gold", {"gold": 5}), "💰  GOLDITEM_SEPARATOR5")
+
+
+class TestLanguageCatalogs(unittest.TestCase):
+    """测试语言文件加载和缓存"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "__pycache__")
+        self.saved_catalogs = dict(language.CATALOGS._catalogs)
+
+    def tearDown(self):
+        language.CATALOGS.clear()
+        language.CATALOGS._catalogs.update(self.saved_catalogs)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_catalog(self, name, texts):
+        with open(os.path.join(self.temp_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(texts, f, ensure_ascii=False)
+
+    def test_shipped_languages(self):
+        """测试随游戏提供的语言文件"""
+        self.assertIn("zh", available_languages())
+        self.assertIn("en", available_languages())
+        self.assertEqual(load_texts("zh")["block_separator"], "=" * 50)
+
+    def test_marshal_cache(self):
+        """测试编译缓存的生成、复用和失效"""
+        self.write_catalog("xx", {"hello": "one"})
+        self.assertEqual(compile_catalog("xx", self.temp_dir, self.cache_dir), {"hello": "one"})
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, "xx.marshal")))
+
+        # 缓存有效时不再解析JSON
+        with patch("hero.language.json.load", side_effect=AssertionError("不应解析JSON")):
+            self.assertEqual(compile_catalog("xx", self.temp_dir, self.cache_dir), {"hello": "one"})
+
+        # 源文件变化后缓存失效
+        self.write_catalog("xx", {"hello": "two!"})
+        self.assertEqual(compile_catalog("xx", self.temp_dir, self.cache_dir), {"hello": "two!"})
+
+    def test_lazy_loading(self):
+        """测试只加载被选择的语言"""
+        language.CATALOGS.clear()
+        first = LanguageSupport("zh")
+        second = LanguageSupport("zh")
+        self.assertEqual(language.CATALOGS.loaded(), ["zh"])
+        self.assertIs(first.texts, second.texts)
+
+    def test_third_language_falls_back_to_english(self):
+        """测试新增语言缺失的条目回退到英文"""
+        for name in ("zh", "en"):
+            shutil.copy(os.path.join(language.LOCALES_DIR, f"{name}.json"), self.temp_dir)
+        self.write_catalog("ja", {"victory": "勝利"})
+        language.CATALOGS.clear()
+        with patch.object(language, "LOCALES_DIR", self.temp_dir), \
+                patch.object(language, "CATALOG_CACHE_DIR", self.cache_dir):
+            lang = LanguageSupport("ja")
+            self.assertEqual(lang.get_text("victory"), "勝利")
+            self.assertEqual(lang.get_text("game_over"), LanguageSupport("en").get_text("game_over"))
+            self.assertNotIn("zh", language.CATALOGS)
+            equipment_db = {"weapon": {"en": {"common": ["Sword"]}, "zh": {"common": ["剑"]}}}
+            self.assertEqual(lang.format_text("equipment_name", equipment_db, "weapon", "common"), "Sword")
+
+    def test_unknown_language_uses_default(self):
+        """测试没有语言文件的语言使用默认语言"""
+        self.assertEqual(LanguageSupport("fr").get_text("victory"), LanguageSupport("zh").get_text("victory"))
+
+    def test_catalogs_are_read_only(self):
+        """测试共享文本表只读，会话不复制文本"""
+        lang = LanguageSupport("zh")
+        with self.assertRaises(TypeError):
+            lang.texts["victory"] = "改动"
+        with self.assertRaises(TypeError):
+            lang.texts.update({"victory": "改动"})
+        self.assertIs(copy.deepcopy(lang.texts), lang.texts)
+        self.assertEqual(pickle.loads(pickle.dumps(lang.texts)), lang.texts)
+
+        lang.get_text("victory")
+        lang.get_text("game_start")
+        self.assertEqual(len(lang._text_cache), 0)
+
+    def test_concurrent_loading(self):
+        """测试多个线程同时首次加载时只加载一次"""
+        language.CATALOGS.clear()
+        calls = []
+        original = language.compile_catalog
+
+        def slow_compile(name, *args, **kwargs):
+            calls.append(name)
+            time.sleep(0.01)
+            return original(name, *args, **kwargs)
+
+        results = []
+        with patch.object(language, "compile_catalog", side_effect=slow_compile):
+            threads = [threading.Thread(target=lambda: results.append(LanguageSupport("en").texts))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(calls, ["en"])
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(texts is results[0] for texts in results))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
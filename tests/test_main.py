@@ -16,7 +16,7 @@ hero_path = os.path.join(src_path, 'hero')
 sys.path.insert(0, hero_path)
 sys.path.insert(0, src_path)
 
-from hero.main import HeroGame
+from hero.main import HeroGame, GameConfig
 
 
 class TestHeroGame(unittest.TestCase):
@@ -375,5 +375,124 @@ class TestHeroGame(unittest.TestCase):
         sys.stdout = sys.__stdout__
 
 
+class TestLazySubsystems(unittest.TestCase):
+    """测试子系统延迟构建"""
+
+    def setUp(self):
+        from hero.renderer import NullRenderer
+        self.game = HeroGame(language="zh", renderer=NullRenderer())
+
+    def test_built_on_first_use(self):
+        """测试子系统在首次访问时构建且只构建一次"""
+        for name in HeroGame.LAZY_SUBSYSTEMS:
+            self.assertNotIn(name, self.game.__dict__)
+        with patch("hero.achievements.AchievementSystem._load_unlocked_achievements") as mock_load:
+            achievements = self.game.achievements
+            self.assertIs(self.game.achievements, achievements)
+        mock_load.assert_called_once()
+        self.assertIs(self.game.combat_system.game, self.game)
+        self.assertIn("combat_system", self.game.__dict__)
+
+    def test_assign_and_reset(self):
+        """测试子系统可以直接替换，重置后重新构建"""
+        mock_combat = Mock()
+        self.game.combat_system = mock_combat
+        self.assertIs(self.game.combat_system, mock_combat)
+        self.game.reset_subsystems("combat_system")
+        self.assertIsNot(self.game.combat_system, mock_combat)
+
+        quest_system = self.game.quest_system
+        self.game.reset_subsystems()
+        self.assertNotIn("combat_system", self.game.__dict__)
+        self.assertIsNot(self.game.quest_system, quest_system)
+
+
+class TestGameFactory(unittest.TestCase):
+    """测试按配置创建游戏和快速重新开始"""
+
+    def make_game(self, config):
+        from hero.renderer import RecordingRenderer
+        return HeroGame.from_config(config, renderer=RecordingRenderer())
+
+    def play(self, game):
+        """运行若干随机事件（每个事件最多回答3次输入），返回输出和最终状态"""
+        from hero.safe_input import input_provider
+
+        class EventDone(Exception):
+            pass
+
+        answers = []
+
+        def provider(decision, prompt, options):
+            answers.append(decision)
+            if len(answers) > 3:
+                raise EventDone()
+            return options[-1] if options else "n"
+
+        with input_provider(provider):
+            for _ in range(20):
+                answers.clear()
+                game.hero_hp = game.hero_max_hp
+                try:
+                    game.random_event()
+                except EventDone:
+                    pass
+        return game.renderer.output(), game.hero_gold, game.hero_exp, len(game.inventory)
+
+    def test_from_config(self):
+        """测试按配置创建无需交互的游戏"""
+        config = GameConfig(language="en", hero_class="assassin", map_type="desert",
+                            difficulty="hard", hero_name="Ayla", seed=3)
+        game = self.make_game(config)
+        self.assertEqual(game.language, "en")
+        self.assertEqual(game.hero_name, "Ayla")
+        self.assertEqual(game.hero_class, "assassin")
+        self.assertEqual(game.map_type, "desert")
+        self.assertEqual(game.difficulty, "hard")
+        self.assertIsNotNone(game.skill_tree)
+        self.assertEqual(GameConfig.from_dict(config.to_dict()).to_dict(), config.to_dict())
+
+    def test_invalid_config(self):
+        """测试无效配置"""
+        with self.assertRaises(ValueError):
+            HeroGame.from_config(GameConfig(hero_class="bard"))
+        with self.assertRaises(ValueError):
+            HeroGame.from_config(GameConfig(map_type="moon"))
+
+    def test_reset_matches_new_game(self):
+        """测试重置后的游戏与新建的游戏表现一致，并复用已构建的子系统"""
+        config = GameConfig(hero_class="mage", map_type="forest", seed=11)
+        expected = self.play(self.make_game(config))
+
+        game = self.make_game(GameConfig(hero_class="warrior", map_type="plains", seed=5))
+        self.play(game)
+        achievements = game.achievements
+        equipment_system = game.equipment_system
+        lang_texts = game.lang.texts
+        game.reset(config)
+        game.renderer.clear_messages()
+
+        self.assertEqual(game.hero_class, "mage")
+        self.assertEqual(game.hero_position, 0)
+        self.assertEqual(game.statistics.total_steps, 0)
+        self.assertIs(game.achievements, achievements)
+        self.assertIs(game.equipment_system, equipment_system)
+        self.assertIs(game.lang.texts, lang_texts)
+        self.assertEqual(self.play(game), expected)
+
+    def test_restart_game_resets(self):
+        """测试重新开始游戏只重置状态"""
+        game = self.make_game(GameConfig(seed=1))
+        game.hero_gold = 999
+        with patch('builtins.input', return_value='y'), \
+                patch.object(game, 'start_game') as mock_start, \
+                patch.object(HeroGame, 'select_language') as mock_select:
+            game.restart_game()
+        mock_start.assert_called_once()
+        mock_select.assert_not_called()
+        self.assertEqual(game.hero_name, "")
+        self.assertEqual(game.hero_hp, 100)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+地图事件表测试
+"""
+
+import sys
+import os
+import random
+import unittest
+from unittest.mock import MagicMock
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero import map_events
+from hero.map_events import (EventTable, EVENT_HANDLERS, compile_event_tables, get_event_table,
+                             dispatch_map_event, register_event_handler)
+from hero.game_config import MAP_TYPES, MAP_EVENT_TABLES
+
+
+class TestEventTables(unittest.TestCase):
+    """测试地图事件表"""
+
+    def test_every_map_has_table(self):
+        """测试每张地图都有总权重为35的事件表"""
+        for map_type in MAP_TYPES:
+            table = get_event_table(map_type)
+            self.assertIsNotNone(table)
+            self.assertEqual(table.total_weight, 35)
+            self.assertEqual(len(table.roll_table), 35)
+        self.assertIsNone(get_event_table("unknown"))
+
+    def test_roll_thresholds(self):
+        """测试点数对应的事件与原先的条件分支一致"""
+        table = get_event_table("plains")
+        self.assertEqual(table.event_for_roll(1)["id"], "mine_trap")
+        self.assertEqual(table.event_for_roll(3)["id"], "mine_trap")
+        self.assertEqual(table.event_for_roll(4)["id"], "find_bun")
+        self.assertEqual(table.event_for_roll(10)["id"], "find_chest")
+        self.assertEqual(table.event_for_roll(12)["id"], "merchant")
+        self.assertEqual(table.event_for_roll(35)["id"], "safe_move")
+
+    def test_probabilities(self):
+        """测试事件概率之和为1"""
+        for table in map_events.EVENT_TABLES.values():
+            self.assertAlmostEqual(sum(table.probabilities().values()), 1.0)
+
+    def test_sample(self):
+        """测试批量采样的分布"""
+        table = EventTable([
+            {"id": "a", "weight": 1, "handler": "safe_move"},
+            {"id": "b", "weight": 3, "handler": "safe_move"}
+        ])
+        samples = table.sample(4000, random.Random(3))
+        self.assertEqual(len(samples), 4000)
+        self.assertAlmostEqual(samples.count("b") / len(samples), 0.75, delta=0.03)
+        self.assertEqual(table.find("b")["weight"], 3)
+        self.assertIsNone(table.find("c"))
+
+    def test_invalid_config(self):
+        """测试未知处理器和非整数权重"""
+        with self.assertRaises(ValueError):
+            compile_event_tables({"test": [{"id": "a", "weight": 1, "handler": "missing"}]})
+        with self.assertRaises(ValueError):
+            compile_event_tables({"test": [{"id": "a", "weight": 1.5, "handler": "safe_move"}]})
+
+    def test_custom_handler_dispatch(self):
+        """测试注册新的事件处理器并分派"""
+        calls = []
+
+        @register_event_handler("test_handler")
+        def handle_test(game, event, rng, settings):
+            calls.append((event["id"], settings["enemy_multiplier"]))
+
+        try:
+            table = compile_event_tables({"test": [{"id": "custom", "weight": 2, "handler": "test_handler"}]})["test"]
+            game = MagicMock()
+            game.difficulty = "normal"
+            game.difficulty_settings = {"normal": {"enemy_multiplier": 1.0}}
+            dispatch_map_event(game, table.roll(random.Random(1)), random.Random(1))
+            self.assertEqual(calls, [("custom", 1.0)])
+        finally:
+            del EVENT_HANDLERS["test_handler"]
+
+    def test_config_handlers_registered(self):
+        """测试配置中使用的处理器均已注册"""
+        for events in MAP_EVENT_TABLES.values():
+            for event in events:
+                self.assertIn(event["handler"], EVENT_HANDLERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
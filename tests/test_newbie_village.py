@@ -17,6 +17,9 @@ sys.path.insert(0, hero_path)
 sys.path.insert(0, src_path)
 
 from hero.newbie_village import NewbieVillage
+from hero.renderer import RecordingRenderer
+from hero.safe_input import input_provider
+from hero.simulation import SimulationDriver
 
 
 class TestNewbieVillage(unittest.TestCase):
@@ -312,5 +315,37 @@ class TestNewbieVillage(unittest.TestCase):
         self.assertEqual(self.mock_game.hero_hp, self.mock_game.hero_max_hp)
 
 
+class TestSeededNewbieVillage(unittest.TestCase):
+    """测试指定种子时新手村可复现"""
+
+    def play(self, seed):
+        """在新手村听建议、练习战斗（使用药剂）后出发，返回输出和英雄状态"""
+        game = SimulationDriver(hero_class="warrior").create_game(seed=seed)
+        game.attach(RecordingRenderer(game), game.clock)
+        game.hero_hp = 30
+        village_choices = iter(["4", "1", "5"])
+        combat_choices = iter(["2"])
+
+        def provider(decision, prompt, options):
+            if options and "5" in options:
+                return next(village_choices)
+            if options == ["1", "2"]:
+                return "1"
+            if options is None:
+                return next(combat_choices, "1")
+            return ""
+
+        with input_provider(provider), patch('builtins.input', return_value=""):
+            game.newbie_village.newbie_village()
+        return game.renderer.output(), game.hero_potions, game.hero_level
+
+    def test_same_seed_same_result(self):
+        """测试相同种子的新手村流程完全相同"""
+        first = self.play(5)
+        self.assertEqual(self.play(5), first)
+        self.assertIn("🧪", first[0])
+        self.assertNotEqual(self.play(6)[0], first[0])
+
+
 if __name__ == '__main__':
     unittest.main()
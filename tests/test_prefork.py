@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+预派生多进程服务器测试
+"""
+
+import sys
+import os
+import selectors
+import socket
+import subprocess
+import time
+import unittest
+from unittest.mock import patch
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero import language
+from hero.language import LanguageSupport
+from hero import prefork
+from hero.prefork import (PreforkSupervisor, WorkerHandle, preload_shared_data, send_fd, receive_fd,
+                          CHANNEL_TYPE, PRELOAD_MODULES, SESSION_DONE)
+
+# 在新进程中启动主进程并记录 fork 时已导入的模块（不真正派生工作进程）
+FORK_MODULES_SCRIPT = """
+import os, sys
+from unittest.mock import patch
+from hero.prefork import PreforkSupervisor
+
+def fork():
+    print(" ".join(sorted(name for name in sys.modules if name.startswith("hero."))))
+    raise SystemExit(0)
+
+with patch.object(os, "fork", fork):
+    PreforkSupervisor(host="127.0.0.1", port=0, workers=1).start()
+"""
+
+
+def read_until(sock, token, timeout=10):
+    """读取服务器输出直到出现 token"""
+    sock.settimeout(timeout)
+    data = b""
+    while token.encode("utf-8") not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data.decode("utf-8")
+
+
+class TestPreload(unittest.TestCase):
+    """测试预加载共享数据"""
+
+    def test_preload_shares_texts(self):
+        """测试预加载后各会话共享同一份文本表"""
+        summary = preload_shared_data()
+        self.assertGreater(summary["texts"]["zh"], 100)
+        self.assertGreater(summary["monster_templates"], 0)
+        first = LanguageSupport("en")
+        second = LanguageSupport("en")
+        self.assertIs(first.texts, second.texts)
+        self.assertIs(first.texts, language.CATALOGS.get("en"))
+
+    def test_modules_imported_before_fork(self):
+        """测试 fork 之前已导入会话按需使用的模块"""
+        env = dict(os.environ, PYTHONPATH=os.path.abspath(src_path))
+        result = subprocess.run([sys.executable, "-c", FORK_MODULES_SCRIPT], env=env,
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        modules = set(result.stdout.split())
+        for name in ("hero.equipment", "hero.combat", "hero.skill_tree", "hero.items", "hero.effects"):
+            self.assertIn(name, modules)
+        self.assertTrue(set(PRELOAD_MODULES) <= modules)
+
+    def test_fd_passing(self):
+        """测试通过 Unix 套接字转交文件描述符"""
+        parent, child = socket.socketpair(socket.AF_UNIX, CHANNEL_TYPE)
+        left, right = socket.socketpair()
+        try:
+            send_fd(parent, left.fileno())
+            message, fd = receive_fd(child)
+            self.assertEqual(message, b"c")
+            received = socket.socket(fileno=fd)
+            received.sendall(b"ping")
+            self.assertEqual(right.recv(4), b"ping")
+            received.close()
+        finally:
+            for sock in (parent, child, left, right):
+                sock.close()
+
+
+@unittest.skipIf(not hasattr(os, "fork"), "需要 os.fork")
+class TestDispatch(unittest.TestCase):
+    """测试连接分配（使用通道代替真实的工作进程）"""
+
+    def setUp(self):
+        self.supervisor = PreforkSupervisor("127.0.0.1", 0, workers=2, max_sessions=2)
+        self.supervisor.selector = selectors.DefaultSelector()
+        self.children = []
+        for index in range(2):
+            parent, child = socket.socketpair(socket.AF_UNIX, CHANNEL_TYPE)
+            parent.setblocking(False)
+            worker = WorkerHandle(index, -1 - index, parent)
+            self.supervisor.workers[worker.pid] = worker
+            self.supervisor.selector.register(parent, selectors.EVENT_READ, worker)
+            self.children.append(child)
+        self.first, self.second = self.supervisor.workers.values()
+
+    def tearDown(self):
+        for worker in self.supervisor.workers.values():
+            worker.channel.close()
+        for child in self.children:
+            child.close()
+        self.supervisor.selector.close()
+
+    def dispatch(self):
+        """转交一个新连接，返回 (接收的工作进程, 客户端一端)"""
+        connection, client = socket.socketpair()
+        self.addCleanup(client.close)
+        return self.supervisor.dispatch(connection), client
+
+    def test_skips_full_workers(self):
+        """测试已满的工作进程不再分配连接"""
+        self.first.load = 2
+        self.second.load = 2
+        worker, client = self.dispatch()
+        self.assertIsNone(worker)
+        self.assertIn(b"Server is full", client.recv(100))
+        self.assertEqual((self.first.load, self.second.load), (2, 2))
+
+        self.second.load = 1
+        worker, _ = self.dispatch()
+        self.assertIs(worker, self.second)
+        self.assertEqual(self.second.load, 2)
+        message, fd = receive_fd(self.children[1])
+        self.assertEqual(message, b"c")
+        os.close(fd)
+
+    def test_blocked_channel_tries_next(self):
+        """测试通道缓冲区已满时转交给下一个工作进程"""
+        def blocked_first(channel, fd):
+            if channel is self.first.channel:
+                raise BlockingIOError()
+            send_fd(channel, fd)
+
+        with patch.object(prefork, "send_fd", blocked_first):
+            worker, _ = self.dispatch()
+        self.assertIs(worker, self.second)
+        self.assertEqual((self.first.load, self.second.load), (0, 1))
+        self.assertTrue(self.first.alive)
+        os.close(receive_fd(self.children[1])[1])
+
+    def test_all_channels_blocked(self):
+        """测试所有通道都无法写入时断开连接，异常不会传出 _accept"""
+        listener = socket.create_server(("127.0.0.1", 0))
+        listener.setblocking(False)
+        self.supervisor.listener = listener
+        self.addCleanup(listener.close)
+        client = socket.create_connection(listener.getsockname())
+        self.addCleanup(client.close)
+        time.sleep(0.1)
+
+        with patch.object(prefork, "send_fd", side_effect=BlockingIOError()):
+            self.supervisor._accept()
+        self.assertIn(b"Server is full", read_until(client, "full").encode("utf-8"))
+        self.assertEqual(client.recv(100), b"")
+        self.assertEqual((self.first.load, self.second.load), (0, 0))
+
+    def test_exited_worker_skipped(self):
+        """测试工作进程退出后通道被注销，连接转交给其他工作进程"""
+        self.first.load = 1
+        self.children[0].send(SESSION_DONE)
+        self.children[0].close()
+        self.supervisor._read_reports(self.first)
+        self.assertEqual(self.first.load, 0)
+        self.assertFalse(self.first.alive)
+        registered = [key.data for key in self.supervisor.selector.get_map().values()]
+        self.assertEqual(registered, [self.second])
+
+        worker, _ = self.dispatch()
+        self.assertIs(worker, self.second)
+        os.close(receive_fd(self.children[1])[1])
+
+    def test_send_to_closed_channel(self):
+        """测试转交时发现对端已关闭则改用下一个工作进程"""
+        self.children[0].close()
+        worker, _ = self.dispatch()
+        self.assertIs(worker, self.second)
+        self.assertFalse(self.first.alive)
+        os.close(receive_fd(self.children[1])[1])
+
+
+@unittest.skipIf(not hasattr(os, "fork"), "需要 os.fork")
+class TestPreforkSupervisor(unittest.TestCase):
+    """测试预派生服务器"""
+
+    def setUp(self):
+        self.supervisor = PreforkSupervisor("127.0.0.1", 0, workers=2, max_sessions=8)
+        self.supervisor.start()
+
+    def tearDown(self):
+        self.supervisor.stop()
+
+    def connect(self):
+        client = socket.create_connection(("127.0.0.1", self.supervisor.port))
+        self.supervisor.poll(0.5)
+        return client
+
+    def test_least_loaded_routing(self):
+        """测试连接分配给会话最少的工作进程"""
+        clients = [self.connect() for _ in range(3)]
+        try:
+            for client in clients:
+                self.assertIn("Please select language", read_until(client, "(1)"))
+            loads = sorted(worker.load for worker in self.supervisor.workers.values())
+            self.assertEqual(loads, [1, 2])
+        finally:
+            for client in clients:
+                client.close()
+
+    def test_session_done_reported(self):
+        """测试会话结束后工作进程回报负载"""
+        client = self.connect()
+        read_until(client, "(1)")
+        client.close()
+        deadline = time.time() + 10
+        while time.time() < deadline:
+            self.supervisor.poll(0.2)
+            if all(worker.load == 0 for worker in self.supervisor.workers.values()):
+                break
+        self.assertTrue(all(worker.load == 0 for worker in self.supervisor.workers.values()))
+
+    def test_worker_respawn(self):
+        """测试工作进程退出后重新派生"""
+        old_pids = set(self.supervisor.workers)
+        victim = next(iter(old_pids))
+        os.kill(victim, 9)
+        deadline = time.time() + 10
+        while victim in self.supervisor.workers and time.time() < deadline:
+            self.supervisor.poll(0.1)
+        self.assertNotIn(victim, self.supervisor.workers)
+        self.assertEqual(len(self.supervisor.workers), 2)
+        client = self.connect()
+        try:
+            self.assertIn("Please select language", read_until(client, "(1)"))
+        finally:
+            client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
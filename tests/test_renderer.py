@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+输出渲染器测试
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import Mock, patch
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.clock import GameClock
+from hero.main import GameConfig, HeroGame
+from hero.renderer import TerminalRenderer, NullRenderer, RecordingRenderer, get_renderer
+from hero.safe_input import input_provider, safe_input
+from hero.save_data import SaveManager
+
+
+class TestTerminalRenderer(unittest.TestCase):
+    """测试终端渲染器"""
+
+    def test_print_compatible(self):
+        """测试与内置 print 一致的输出"""
+        stream = StringIO()
+        renderer = TerminalRenderer(stream=stream)
+        renderer.print("a", 1, sep="-", end="!")
+        renderer.print()
+        self.assertEqual(stream.getvalue(), "a-1!\n")
+
+    def test_frame_batches_writes(self):
+        """测试帧内输出在帧结束时一次写出"""
+        stream = StringIO()
+        renderer = TerminalRenderer(stream=stream)
+        with renderer.frame():
+            renderer.print("line 1")
+            with renderer.frame():
+                renderer.print("line 2")
+            self.assertEqual(stream.getvalue(), "")
+        self.assertEqual(stream.getvalue(), "line 1\nline 2\n")
+
+    def test_follows_stdout(self):
+        """测试未指定输出流时写入当前的 sys.stdout"""
+        renderer = TerminalRenderer()
+        captured_output = StringIO()
+        with patch('sys.stdout', captured_output):
+            renderer.print("hello")
+        self.assertEqual(captured_output.getvalue(), "hello\n")
+
+
+class TestRenderers(unittest.TestCase):
+    """测试无输出和记录渲染器"""
+
+    def test_null_renderer_skips_lookup(self):
+        """测试空渲染器不查找文本"""
+        game = Mock()
+        renderer = NullRenderer(game)
+        renderer.text("victory", 1, 2)
+        renderer.line("combat_round", round=1)
+        renderer.print("ignored")
+        game.lang.get_text.assert_not_called()
+        game.lang.line.assert_not_called()
+        game.lang.format_text.assert_not_called()
+        self.assertFalse(renderer.enabled)
+
+    def test_recording_renderer(self):
+        """测试记录文本键和参数"""
+        game = HeroGame(language="en", renderer=RecordingRenderer())
+        renderer = game.renderer
+        renderer.text("no_potion", prefix="🧪 ")
+        renderer.text("event_text", "find_potion")
+        renderer.print("plain")
+        self.assertEqual(renderer.keys(), ["no_potion", "event_text"])
+        self.assertEqual(renderer.messages[1].params, ("find_potion",))
+        self.assertTrue(renderer.messages[0].text.startswith("🧪 " + game.lang.get_text("no_potion")))
+        self.assertTrue(renderer.output().endswith("plain\n"))
+
+        renderer.line("monster_stats", name="Slime", hp=5, attack=2, defense=1)
+        self.assertEqual(renderer.messages[-1].key, "monster_stats")
+        self.assertEqual(renderer.messages[-1].params["name"], "Slime")
+        self.assertTrue(renderer.messages[-1].text.startswith("Slime - "))
+
+        stream = StringIO()
+        renderer.replay(TerminalRenderer(stream=stream))
+        self.assertEqual(stream.getvalue(), renderer.output())
+
+    def test_keyed_text_params(self):
+        """测试普通文本键的命名参数经由 get_text 填入"""
+        game = HeroGame(language="en", renderer=RecordingRenderer())
+        renderer = game.renderer
+        renderer.text("gained_exp", exp=10)
+        self.assertEqual(renderer.messages[-1].params, {"exp": 10})
+        self.assertEqual(renderer.messages[-1].text, game.lang.get_text("gained_exp", exp=10) + "\n")
+        with self.assertRaises(TypeError):
+            renderer.text("gained_exp", 10)
+
+    def test_get_renderer_fallback(self):
+        """测试模拟游戏对象使用终端渲染器"""
+        self.assertIsInstance(get_renderer(Mock()), TerminalRenderer)
+        game = HeroGame(language="zh", renderer=NullRenderer())
+        self.assertIs(get_renderer(game), game.renderer)
+        self.assertIs(game.renderer.game, game)
+
+
+class TestGameRendering(unittest.TestCase):
+    """测试游戏输出经由渲染器"""
+
+    def test_null_renderer_game_output(self):
+        """测试空渲染器下游戏不输出任何内容"""
+        game = HeroGame(language="zh", renderer=NullRenderer())
+        game.hero_gold = 0
+        game.hero_potions = 0
+        game.map_length = 10
+        captured_output = StringIO()
+        with patch('sys.stdout', captured_output), patch('os.system') as mock_system:
+            game.show_hero_info()
+            game.draw_map()
+            game.clear_screen()
+            game.combat_system.apply_class_passives()
+        self.assertEqual(captured_output.getvalue(), "")
+        mock_system.assert_not_called()
+
+    def test_subsystem_output_recorded(self):
+        """测试子系统输出被记录"""
+        game = HeroGame(language="zh", renderer=RecordingRenderer())
+        game.inventory = []
+        game.equipment_system.show_inventory()
+        self.assertIn("empty_inventory", game.renderer.keys())
+
+    def test_game_log_output_recorded(self):
+        """测试游戏日志显示经由渲染器"""
+        game = HeroGame(language="zh", renderer=RecordingRenderer())
+        captured_output = StringIO()
+        with patch('sys.stdout', captured_output):
+            game.game_log.show_all_logs()
+            game.game_log.log_event("combat", "击败史莱姆")
+            game.game_log.show_recent_logs()
+            game.game_log.show_logs_by_type("combat")
+            game.game_log.show_statistics()
+        output = game.renderer.output()
+        self.assertIn("暂无游戏日志记录", output)
+        self.assertEqual(output.count("击败史莱姆"), 2)
+        self.assertIn("日志总数: 1", output)
+        self.assertEqual(captured_output.getvalue(), "")
+
+    def _combat_game(self, renderer):
+        game = HeroGame.from_config(GameConfig(seed=7), renderer=renderer, clock=GameClock(mode="skip"))
+        game.hero_hp = game.hero_max_hp = 1000
+        return game
+
+    def test_combat_keys_recorded(self):
+        """测试战斗输出以文本键和模板名记录"""
+        game = self._combat_game(RecordingRenderer())
+        with input_provider(lambda decision, prompt, options: "1"):
+            game.combat_system.combat()
+        keys = game.renderer.keys()
+        self.assertIn("combat_round", keys)
+        self.assertIn("monster_encounter", keys)
+        self.assertTrue({"hero_hit", "hero_strike", "hero_critical_hit"} & set(keys))
+
+    def test_null_renderer_combat_skips_lookup(self):
+        """测试空渲染器下战斗不查找输出文本"""
+        game = self._combat_game(NullRenderer())
+        with input_provider(lambda decision, prompt, options: "1"):
+            game.combat_system.combat()
+            game.hero_hp = game.hero_max_hp
+            with patch.object(game.lang, "get_text", wraps=game.lang.get_text) as get_text:
+                game.combat_system.combat()
+        looked_up = {call.args[0] for call in get_text.call_args_list if call.args}
+        self.assertFalse(looked_up & {"encounter_monster", "you_attack", "caused_damage", "round"})
+
+    def test_safe_input_messages_rendered(self):
+        """测试输入提示信息经由渲染器"""
+        renderer = RecordingRenderer()
+        captured_output = StringIO()
+        with patch('builtins.input', side_effect=["x", "1"]), patch('sys.stdout', captured_output):
+            self.assertEqual(safe_input("> ", valid_options=["1"], renderer=renderer), "1")
+        self.assertIn("无效输入", renderer.output())
+        self.assertEqual(captured_output.getvalue(), "")
+
+    def test_save_error_recorded(self):
+        """测试存档错误信息经由渲染器"""
+        game = HeroGame(language="zh", renderer=RecordingRenderer())
+        save_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, save_dir)
+        manager = SaveManager(save_dir=save_dir, game=game)
+        with open(manager.get_save_path(1), "w", encoding="utf-8") as f:
+            f.write("{")
+        captured_output = StringIO()
+        with patch('sys.stdout', captured_output):
+            self.assertIsNone(manager.load_game(1))
+        self.assertNotEqual(game.renderer.output(), "")
+        self.assertEqual(captured_output.getvalue(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
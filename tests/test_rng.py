@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+会话随机数源测试
+"""
+
+import sys
+import os
+import random
+import unittest
+from unittest.mock import Mock
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.rng import GameRandom, get_stream, STREAM_NAMES
+from hero.quest import QuestSystem
+from hero.simulation import SimulationDriver
+
+
+class TestGameRandom(unittest.TestCase):
+    """测试游戏随机数源"""
+
+    def test_default_uses_global_random(self):
+        """测试未指定种子时使用全局random模块"""
+        streams = GameRandom()
+        self.assertFalse(streams.isolated)
+        for name in STREAM_NAMES:
+            self.assertIs(streams.stream(name), random)
+
+    def test_seeded_streams_reproducible(self):
+        """测试相同种子产生相同的子流"""
+        first = GameRandom(seed=7)
+        second = GameRandom(seed=7)
+        for name in STREAM_NAMES:
+            self.assertEqual([first.stream(name).random() for _ in range(5)],
+                             [second.stream(name).random() for _ in range(5)])
+
+    def test_streams_independent(self):
+        """测试子流之间互不扰动"""
+        first = GameRandom(seed=11)
+        second = GameRandom(seed=11)
+        # 只消耗第一个实例的战斗子流
+        for _ in range(100):
+            first.combat.random()
+        self.assertEqual(first.loot.random(), second.loot.random())
+        self.assertNotEqual(first.combat.random(), first.events.random())
+
+    def test_injected_rng(self):
+        """测试注入random.Random实例"""
+        first = GameRandom(rng=random.Random(3))
+        second = GameRandom(rng=random.Random(3))
+        self.assertTrue(first.isolated)
+        self.assertEqual(first.quests.randint(1, 1000), second.quests.randint(1, 1000))
+
+    def test_get_stream_fallback(self):
+        """测试没有随机数源的游戏对象退回全局random模块"""
+        self.assertIs(get_stream(Mock(), "combat"), random)
+        game = Mock()
+        game.rng = GameRandom(seed=1)
+        self.assertIs(get_stream(game, "combat"), game.rng.combat)
+
+    def test_quest_system_rng(self):
+        """测试任务系统使用注入的随机数源"""
+        first = QuestSystem(random.Random(5)).generate_random_quest(3)
+        second = QuestSystem(random.Random(5)).generate_random_quest(3)
+        self.assertEqual(first.quest_type, second.quest_type)
+        self.assertEqual(first.target_value, second.target_value)
+
+
+class TestReproducibleGame(unittest.TestCase):
+    """测试相同种子得到完全相同的游戏"""
+
+    def play(self, seed):
+        driver = SimulationDriver(difficulty="hard", map_type="dungeon", hero_class="assassin", seed=seed)
+        result = driver.run()
+        game = driver.game
+        return result, game.events_encountered, game.inventory, game.equipment, game.hero_hp
+
+    def test_same_seed_same_game(self):
+        """测试相同种子和输入得到相同的游戏（不受全局random影响）"""
+        first = self.play(2024)
+        random.seed(1)
+        random.random()
+        second = self.play(2024)
+        self.assertEqual(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
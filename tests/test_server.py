@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+多会话游戏服务器测试
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.server import GameServer, DEFAULT_MAX_SESSIONS, create_session_game, strip_telnet
+from hero.session_pool import SessionPool, create_pooled_game, POOL_LANGUAGE
+from hero.settings import GameSettings
+from hero.renderer import NullRenderer
+from hero.clock import GameClock
+
+
+async def read_until(reader, token, timeout=5):
+    """读取服务器输出直到出现 token"""
+    data = b""
+    while token.encode("utf-8") not in data:
+        chunk = await asyncio.wait_for(reader.read(4096), timeout)
+        if not chunk:
+            break
+        data += chunk
+    return data.decode("utf-8")
+
+
+async def send_line(writer, line):
+    """发送一行输入"""
+    writer.write(line.encode("utf-8") + b"\r\n")
+    await writer.drain()
+
+
+class TestTelnet(unittest.TestCase):
+    """测试 telnet 协商序列处理"""
+
+    def test_strip_telnet(self):
+        """测试去掉协商命令和子协商"""
+        self.assertEqual(strip_telnet(b"abc"), b"abc")
+        self.assertEqual(strip_telnet(bytes([255, 251, 1]) + b"1\r\n"), b"1\r\n")
+        self.assertEqual(strip_telnet(b"a" + bytes([255, 250, 24, 0, 255, 240]) + b"b"), b"ab")
+        self.assertEqual(strip_telnet(bytes([255, 255])), bytes([255]))
+
+
+class TestGameServer(unittest.TestCase):
+    """测试多会话服务器"""
+
+    def run_async(self, coroutine):
+        return asyncio.run(asyncio.wait_for(coroutine, 20))
+
+    def test_concurrent_sessions(self):
+        """测试多个会话互不阻塞"""
+        async def scenario():
+            server = GameServer("127.0.0.1", 0, max_sessions=8)
+            await server.start()
+            try:
+                first = await asyncio.open_connection("127.0.0.1", server.port)
+                second = await asyncio.open_connection("127.0.0.1", server.port)
+                self.assertIn("Please select language", await read_until(first[0], "(1)"))
+                self.assertIn("Please select language", await read_until(second[0], "(1)"))
+
+                # 第一个会话停在输入处时，第二个会话仍可继续
+                await send_line(second[1], "2")
+                self.assertIn("Press Enter", await read_until(second[0], "Press Enter"))
+                await send_line(first[1], "1")
+                self.assertIn("按回车", await read_until(first[0], "按回车"))
+                self.assertEqual(server.session_count, 2)
+
+                first[1].close()
+                second[1].close()
+                for _ in range(50):
+                    if server.session_count == 0:
+                        break
+                    await asyncio.sleep(0.05)
+                self.assertEqual(server.session_count, 0)
+            finally:
+                await server.close()
+
+        self.run_async(scenario())
+
+    def test_invalid_choice_reprompts(self):
+        """测试无效输入重新提示"""
+        async def scenario():
+            server = GameServer("127.0.0.1", 0, max_sessions=2)
+            await server.start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                await read_until(reader, "(1)")
+                await send_line(writer, "9")
+                output = await read_until(reader, "(1)")
+                self.assertIn("(1)", output)
+                await send_line(writer, "2")
+                self.assertIn("Press Enter", await read_until(reader, "Press Enter"))
+                writer.close()
+            finally:
+                await server.close()
+
+        self.run_async(scenario())
+
+    def test_server_full(self):
+        """测试超过最大会话数时拒绝连接"""
+        async def scenario():
+            server = GameServer("127.0.0.1", 0, max_sessions=1)
+            await server.start()
+            try:
+                first = await asyncio.open_connection("127.0.0.1", server.port)
+                await read_until(first[0], "(1)")
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                self.assertIn("Server is full", await read_until(reader, "full"))
+                writer.close()
+                first[1].close()
+            finally:
+                await server.close()
+
+        self.run_async(scenario())
+
+    def test_game_log_sent_to_client(self):
+        """测试游戏日志菜单的输出发送到客户端"""
+        def logged_game(renderer, clock):
+            game = create_session_game(renderer, clock)
+            game.game_log.log_event("combat", "Defeated the slime")
+            return game
+
+        async def scenario():
+            server = GameServer("127.0.0.1", 0, max_sessions=2, game_factory=logged_game)
+            await server.start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                await read_until(reader, "(1)")
+                await send_line(writer, "2")
+                await read_until(reader, "Press Enter")
+                await send_line(writer, "")
+                await read_until(reader, "(1)")
+
+                # 主菜单 5 进入游戏日志，1 显示最近日志，2 显示全部日志
+                await send_line(writer, "5")
+                await read_until(reader, "(0)")
+                await send_line(writer, "1")
+                self.assertIn("1. ", await read_until(reader, "Defeated the slime"))
+                await send_line(writer, "2")
+                self.assertIn("Defeated the slime", await read_until(reader, "Defeated the slime"))
+                writer.close()
+            finally:
+                await server.close()
+
+        self.run_async(scenario())
+
+    def test_hundreds_of_sessions(self):
+        """负载测试：数百个玩家同时连接，每个会话都能收到提示并继续"""
+        count = 300
+
+        async def play(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await read_until(reader, "(1)", timeout=15)
+            await send_line(writer, "2")
+            return reader, writer, await read_until(reader, "Press Enter", timeout=15)
+
+        async def scenario():
+            server = GameServer("127.0.0.1", 0, max_sessions=count)
+            await server.start()
+            try:
+                clients = await asyncio.gather(*(play(server.port) for _ in range(count)))
+                self.assertTrue(all("Press Enter" in output for _, _, output in clients))
+                self.assertEqual(server.session_count, count)
+
+                # 所有会话同时再输入一行
+                for _, writer, _ in clients:
+                    await send_line(writer, "")
+                outputs = await asyncio.gather(*(read_until(reader, "(1)", timeout=15)
+                                                 for reader, _, _ in clients))
+                self.assertTrue(all("(1)" in output for output in outputs))
+                for _, writer, _ in clients:
+                    writer.close()
+            finally:
+                await server.close()
+
+        self.run_async(scenario())
+
+    def test_default_max_sessions(self):
+        """测试默认会话上限即线程池大小"""
+        server = GameServer("127.0.0.1", 0)
+        try:
+            self.assertEqual(server.max_sessions, DEFAULT_MAX_SESSIONS)
+            self.assertEqual(server.executor._max_workers, DEFAULT_MAX_SESSIONS)
+        finally:
+            server.executor.shutdown(wait=False)
+
+    def test_pooled_sessions(self):
+        """测试从预热池取用游戏实例的会话"""
+        async def scenario():
+            server = GameServer("127.0.0.1", 0, max_sessions=2, pool_size=1)
+            await server.start()
+            try:
+                self.assertTrue(server.pool.wait_until_full(10))
+                for _ in range(2):
+                    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                    self.assertIn("Please select language", await read_until(reader, "(1)"))
+                    await send_line(writer, "2")
+                    self.assertIn("Press Enter", await read_until(reader, "Press Enter"))
+                    writer.close()
+                    for _ in range(50):
+                        if server.session_count == 0:
+                            break
+                        await asyncio.sleep(0.05)
+                    self.assertTrue(server.pool.wait_until_full(10))
+
+                stats = server.stats()["pool"]
+                self.assertEqual(stats["hits"], 2)
+                self.assertEqual(stats["misses"], 0)
+                self.assertEqual(stats["hit_rate"], 1.0)
+                self.assertEqual(stats["available"], 1)
+            finally:
+                await server.close()
+
+        self.run_async(scenario())
+
+
+class TestSessionPool(unittest.TestCase):
+    """测试会话预热池"""
+
+    def test_pooled_game_is_warm(self):
+        """测试预热的实例已构建所有子系统"""
+        game = create_pooled_game()
+        for name in game.LAZY_SUBSYSTEMS:
+            self.assertIn(name, game.__dict__)
+        self.assertEqual(game.language, "zh")
+
+    def test_acquire_hit_and_miss(self):
+        """测试命中、未命中和命中率"""
+        pool = SessionPool(1)
+        pool.fill()
+        self.assertEqual(pool.available, 1)
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertIsNot(first, second)
+        stats = pool.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["built"], 1)
+        self.assertGreater(stats["last_refill_ms"], 0)
+
+    def test_release_resets_game(self):
+        """测试归还的实例经由 reset 重置并放回池中"""
+        pool = SessionPool(1)
+        pool.fill()
+        game = pool.acquire()
+        game.attach(NullRenderer(), GameClock(mode="skip"))
+        game.set_language("en")
+        game.setup_hero_class("mage")
+        game.hero_hp = 1
+        pool.release(game)
+        pool.fill()
+
+        self.assertIs(pool.acquire(), game)
+        self.assertEqual(game.language, "zh")
+        self.assertEqual(game.hero_class, "")
+        self.assertEqual(game.hero_hp, 100)
+        self.assertIsInstance(game.renderer, NullRenderer)
+        stats = pool.stats()
+        self.assertEqual((stats["built"], stats["recycled"]), (1, 1))
+
+        # 池中实例已足够时归还的实例被丢弃
+        pool.fill()
+        pool.release(game)
+        self.assertEqual(pool.stats()["discarded"], 1)
+        pool.close()
+        self.assertEqual(pool.available, 0)
+
+    def test_release_restores_settings(self):
+        """测试归还的实例恢复默认设置，上一个玩家的设置不会带给下一个玩家"""
+        defaults = GameSettings(POOL_LANGUAGE).to_dict()
+        pool = SessionPool(1)
+        pool.fill()
+        game = pool.acquire()
+        game.attach(NullRenderer(), GameClock(mode="skip"))
+        game.set_language("en")
+        game.settings.text_speed = 100
+        game.settings.auto_save_interval = 5
+        game.settings.combat_animations = False
+        game.settings.combat_log_level = 2
+        self.assertEqual((game.settings.language, game.game_log.language), ("en", "en"))
+        pool.release(game)
+        pool.fill()
+
+        self.assertIs(pool.acquire(), game)
+        self.assertEqual(game.settings.to_dict(), defaults)
+        self.assertEqual(game.language, POOL_LANGUAGE)
+        self.assertEqual(game.lang.language, POOL_LANGUAGE)
+        self.assertEqual(game.game_log.language, POOL_LANGUAGE)
+        pool.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+无头模拟驱动测试
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.safe_input import safe_input, read_input, input_provider, get_input_provider
+from hero.simulation import SimulationDriver, SimulationPolicy, RandomPolicy
+
+
+class RecordingPolicy(SimulationPolicy):
+    """记录所有决策点的策略"""
+
+    def __init__(self):
+        self.decisions = []
+
+    def choose_move(self, game, options):
+        self.decisions.append("move")
+        return super().choose_move(game, options)
+
+    def choose_combat_action(self, game, options):
+        self.decisions.append("combat_action")
+        return super().choose_combat_action(game, options)
+
+
+class TestInputProvider(unittest.TestCase):
+    """测试输入提供者"""
+
+    def test_provider_answers_safe_input(self):
+        """测试提供者接管safe_input"""
+        calls = []
+
+        def provider(decision, prompt, options):
+            calls.append((decision, options))
+            return "2"
+
+        with patch('builtins.input', side_effect=AssertionError("不应读取标准输入")):
+            with input_provider(provider):
+                result = safe_input("提示", valid_options=["1", "2"], decision="move")
+        self.assertEqual(result, "2")
+        self.assertEqual(calls, [("move", ["1", "2"])])
+        self.assertIsNone(get_input_provider())
+
+    def test_invalid_answer_falls_back(self):
+        """测试提供者给出无效选项时退回默认选项"""
+        with input_provider(lambda decision, prompt, options: "9"):
+            self.assertEqual(safe_input("提示", valid_options=["1", "2"]), "1")
+            self.assertEqual(safe_input("提示", valid_options=["1", "2"], allow_empty=True), "")
+
+    def test_read_input_without_provider(self):
+        """测试没有提供者时read_input读取标准输入"""
+        with patch('builtins.input', return_value="abc"):
+            self.assertEqual(read_input("提示"), "abc")
+
+
+class TestSimulationDriver(unittest.TestCase):
+    """测试无头模拟驱动"""
+
+    def test_create_game_without_input(self):
+        """测试创建游戏不需要任何输入"""
+        driver = SimulationDriver(difficulty="hard", map_type="desert", hero_class="mage")
+        with patch('builtins.input', side_effect=AssertionError("不应读取标准输入")):
+            game = driver.create_game()
+        self.assertEqual(game.hero_class, "mage")
+        self.assertEqual(game.difficulty, "hard")
+        self.assertEqual(game.map_type, "desert")
+        self.assertIsNotNone(game.skill_tree)
+
+    def test_run_full_game(self):
+        """测试运行完整游戏"""
+        driver = SimulationDriver(difficulty="nightmare", hero_class="warrior")
+        with patch('builtins.input', side_effect=AssertionError("不应读取标准输入")), \
+                patch('os.system', side_effect=AssertionError("不应清屏")):
+            result = driver.run()
+        self.assertTrue(driver.game.game_over or result["steps"] == driver.max_steps or result["stalled"])
+        for key in ("steps", "victory", "gold_earned", "exp_earned", "monsters_defeated", "final_level"):
+            self.assertIn(key, result)
+        self.assertEqual(result["difficulty"], "nightmare")
+        # 模拟使用虚拟时钟：不真实等待，但记录感知时长
+        self.assertEqual(driver.game.clock.mode, "virtual")
+        self.assertGreater(result["perceived_seconds"], 0)
+
+    def test_policy_answers_decisions(self):
+        """测试策略回答决策点"""
+        policy = RecordingPolicy()
+        SimulationDriver(policy=policy, difficulty="easy").run()
+        self.assertIn("move", policy.decisions)
+
+    def test_max_steps(self):
+        """测试最大步数限制"""
+        driver = SimulationDriver(max_steps=3)
+        result = driver.run()
+        self.assertLessEqual(result["steps"], 3)
+
+    def test_random_policy(self):
+        """测试随机策略可以完成游戏"""
+        result = SimulationDriver(policy=RandomPolicy(seed=1), max_steps=20).run()
+        self.assertLessEqual(result["steps"], 20)
+
+    def test_last_potion_removes_option(self):
+        """测试用完最后一瓶药剂后主菜单不再提供药剂选项"""
+        game = SimulationDriver(hero_class="mage").create_game(seed=7)
+        game.hero_potions = 1
+        game.hero_hp = 1
+        seen = []
+
+        def provider(decision, prompt, options):
+            # 前进后可能触发事件或战斗，只记录主菜单的移动提示
+            if decision != "move":
+                return ""
+            seen.append((game.hero_potions, list(options)))
+            return "4" if len(seen) == 1 else "1"
+
+        with input_provider(provider):
+            game.move_hero()
+        self.assertGreaterEqual(len(seen), 2)
+        self.assertEqual((seen[0][0], seen[1][0]), (1, 0))
+        self.assertIn("4", seen[0][1])
+        self.assertNotIn("4", seen[1][1])
+
+        # 没有药剂时策略不选择药剂
+        game.hero_potions = 0
+        game.hero_hp = 1
+        self.assertEqual(SimulationPolicy().choose_move(game, ["1", "4"]), "1")
+
+    def test_reuse_game_matches_new_games(self):
+        """测试复用游戏实例与每局新建实例的结果相同"""
+        fresh = SimulationDriver(hero_class="mage", max_steps=30)
+        reused = SimulationDriver(hero_class="mage", max_steps=30, reuse_game=True)
+        first_game = None
+        for seed in (1, 2, 3):
+            self.assertEqual(reused.run(seed=seed), fresh.run(seed=seed))
+            first_game = first_game or reused.game
+            self.assertIs(reused.game, first_game)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+启动性能预算测试（profile_game.py 中的导入和冷启动预算）
+"""
+
+import sys
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+sys.path.insert(0, project_root)
+
+import profile_game
+
+
+class TestStartupBudget(unittest.TestCase):
+    """测试导入和冷启动时间不超过预算"""
+
+    def test_import_time_budget(self):
+        """测试导入 hero.main 不超过预算"""
+        with redirect_stdout(StringIO()):
+            import_time = profile_game.profile_import_time()
+        self.assertGreater(import_time, 0)
+        self.assertLessEqual(import_time, profile_game.IMPORT_TIME_BUDGET_MS)
+
+    def test_cold_start_budget(self):
+        """测试冷启动到第一个提示不超过预算"""
+        with redirect_stdout(StringIO()):
+            cold_start = profile_game.profile_cold_start(runs=3)
+        self.assertLessEqual(cold_start, profile_game.COLD_START_BUDGET_MS)
+
+    def test_no_optional_imports_at_startup(self):
+        """测试启动时不导入可选依赖（NumPy 只在批量战斗中按需导入）"""
+        _, stderr = profile_game._run_python(["-X", "importtime", "-c", "import hero.main"])
+        modules = {name.strip() for name, _, _ in profile_game.parse_importtime(stderr)}
+        self.assertIn("hero.main", modules)
+        self.assertNotIn("numpy", modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+增量属性引擎测试
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+src_path = os.path.join(project_root, 'src')
+hero_path = os.path.join(src_path, 'hero')
+sys.path.insert(0, hero_path)
+sys.path.insert(0, src_path)
+
+from hero.stats import StatEngine, build_set_index, SET_INDEX, add_effect, set_effect, expire_effects
+from hero.effects import EffectVector, EFFECT_DEFAULTS
+from hero.items import Item, ItemTemplate
+from hero.clock import GameClock
+from hero.main import GameConfig, HeroGame
+from hero.renderer import RecordingRenderer
+from hero.safe_input import input_provider
+
+
+def make_item(item_type, attack=0, defense=0, hp=0, special_effects=(), set_bonus=None):
+    """创建测试装备"""
+    return Item(ItemTemplate.get(item_type, "rare", "测试装备"), attack, defense, hp, special_effects, set_bonus)
+
+
+class TestStatEngine(unittest.TestCase):
+    """测试按来源增量计算属性"""
+
+    def setUp(self):
+        self.game = HeroGame(language="zh", renderer=RecordingRenderer())
+        self.engine = self.game.stat_engine
+
+    def test_initial_attributes(self):
+        """测试没有装备时属性等于基础属性"""
+        self.assertEqual((self.game.hero_attack, self.game.hero_defense, self.game.hero_max_hp), (20, 5, 100))
+        self.assertEqual(self.game.special_effects, EFFECT_DEFAULTS)
+        self.assertIsNot(self.game.special_effects, self.engine.effects)
+        self.assertIsInstance(self.game.special_effects, EffectVector)
+
+    def test_equip_recomputes_only_slot(self):
+        """测试换装只重新计算该装备栏"""
+        self.game.equipment["weapon"] = make_item("weapon", attack=12, special_effects=["crit_rate", "lifesteal"])
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, ["weapon"])
+        self.assertEqual(self.game.hero_attack, 32)
+        self.assertEqual(self.game.special_effects["crit_rate"], 0.05)
+        self.assertEqual(self.game.special_effects["lifesteal"], 0.1)
+
+        self.game.equipment["armor"] = make_item("armor", defense=7, hp=30)
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, ["armor"])
+        self.assertEqual((self.game.hero_defense, self.game.hero_max_hp), (12, 130))
+
+        # 没有变化时不重新计算任何来源
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, [])
+
+        self.game.equipment["weapon"] = None
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, ["weapon"])
+        self.assertEqual(self.game.hero_attack, 20)
+        self.assertEqual(self.game.special_effects["crit_rate"], 0.0)
+
+    def test_base_and_enhancement_changes(self):
+        """测试升级和强化（原地修改装备）只更新对应来源"""
+        weapon = make_item("weapon", attack=10)
+        self.game.equipment["weapon"] = weapon
+        self.game.update_attributes()
+
+        self.game.base_attack += 5
+        self.game.base_max_hp += 20
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, ["base"])
+        self.assertEqual((self.game.hero_attack, self.game.hero_max_hp), (35, 120))
+
+        weapon["attack"] = 15
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, ["weapon"])
+        self.assertEqual(self.game.hero_attack, 40)
+        self.assertEqual(self.engine.breakdown("attack"), {"base": 25, "weapon": 15})
+
+    def test_set_bonus(self):
+        """测试集齐套装时加入套装来源"""
+        self.game.equipment["weapon"] = make_item("weapon", attack=10, set_bonus="warrior_set")
+        self.game.update_attributes()
+        self.assertEqual(self.game.hero_attack, 30)
+        self.assertEqual(self.engine.breakdown("attack").get("set_bonus", 0), 0)
+
+        armor = make_item("armor", defense=3, set_bonus="warrior_set")
+        self.game.equipment["armor"] = armor
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, ["armor", "set_bonus"])
+        self.assertEqual((self.game.hero_attack, self.game.hero_defense), (40, 13))
+        self.assertTrue(armor.get("set_bonus_active"))
+        self.assertIn(self.game.lang.get_text("set_bonus_activated"), self.game.renderer.output())
+
+        # 不属于套装的装备栏变化不重新计算套装
+        self.game.equipment["accessory"] = make_item("accessory", hp=10)
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, ["accessory"])
+        self.assertEqual(self.game.hero_attack, 40)
+
+        self.game.equipment["armor"] = None
+        self.game.update_attributes()
+        self.assertEqual((self.game.hero_attack, self.game.hero_defense), (30, 5))
+
+    def test_set_bonus_deactivated(self):
+        """测试卸下套装部件后清除激活标记"""
+        weapon = make_item("weapon", attack=10, set_bonus="warrior_set")
+        armor = make_item("armor", defense=3, set_bonus="warrior_set")
+        self.game.equipment["weapon"] = weapon
+        self.game.equipment["armor"] = armor
+        self.game.update_attributes()
+        self.assertTrue(weapon.get("set_bonus_active"))
+        self.assertTrue(armor.get("set_bonus_active"))
+
+        self.game.equipment["armor"] = None
+        self.game.update_attributes()
+        self.assertNotIn("set_bonus_active", armor)
+        self.assertNotIn("set_bonus_active", weapon)
+        self.assertEqual(self.engine.set_tiers, {})
+
+        self.game.equipment["armor"] = armor
+        self.game.update_attributes()
+        self.assertTrue(weapon.get("set_bonus_active"))
+        self.assertTrue(armor.get("set_bonus_active"))
+
+    def test_dict_items(self):
+        """测试直接赋值的装备字典"""
+        self.game.equipment["weapon"] = {"name": "剑", "type": "weapon", "attack": 8, "defense": 0, "hp": 0,
+                                         "special_effects": ["fire_damage"]}
+        self.game.update_attributes()
+        self.assertEqual(self.game.hero_attack, 28)
+        self.assertEqual(self.game.special_effects["fire_damage"], 5)
+
+    def test_transient_sources(self):
+        """测试战斗中的临时加成在更新属性时清除"""
+        add_effect(self.game, "class_passive", "crit_rate", 0.1)
+        add_effect(self.game, "class_passive", "crit_rate", 0.1)
+        set_effect(self.game, "skill_tree", "berserk_attack", 0.5)
+        self.assertAlmostEqual(self.game.special_effects["crit_rate"], 0.2)
+        self.assertAlmostEqual(self.engine.breakdown("crit_rate")["class_passive"], 0.2)
+        self.assertEqual(self.engine.breakdown("berserk_attack"), {"skill_tree": 0.5})
+
+        self.game.update_attributes()
+        self.assertEqual(self.game.special_effects["crit_rate"], 0.0)
+        self.assertEqual(self.game.special_effects["berserk_attack"], 0.0)
+        self.assertEqual(self.engine.transient, {})
+
+    def test_expire_effects(self):
+        """测试战斗结束时撤销临时加成，持久来源不变"""
+        self.game.equipment["weapon"] = make_item("weapon", attack=10, special_effects=["crit_rate"])
+        self.game.update_attributes()
+        add_effect(self.game, "class_passive", "crit_rate", 0.1)
+        set_effect(self.game, "skill_tree", "berserk_attack", 0.5)
+        self.engine.record("status_effects", "attack", -3)
+        self.game.hero_attack -= 3
+
+        expire_effects(self.game)
+        self.assertEqual(self.game.special_effects["crit_rate"], 0.05)
+        self.assertEqual(self.game.special_effects["berserk_attack"], 0.0)
+        self.assertEqual(self.game.hero_attack, 30)
+        self.assertEqual(self.engine.transient, {})
+
+    def test_effects_expire_after_combat(self):
+        """测试职业被动不在多场战斗之间累积"""
+        game = HeroGame.from_config(GameConfig(hero_class="assassin", seed=3), renderer=RecordingRenderer(),
+                                    clock=GameClock(mode="skip"))
+        persistent = game.special_effects["crit_rate"]
+        with input_provider(lambda decision, prompt, options: "1"):
+            for _ in range(3):
+                game.hero_hp = game.hero_max_hp = 1000
+                game.combat_system.combat()
+                self.assertEqual(game.special_effects["crit_rate"], persistent)
+                self.assertEqual(game.stat_engine.transient, {})
+
+    def test_invalidate(self):
+        """测试强制重新计算全部来源"""
+        self.game.equipment["weapon"] = make_item("weapon", attack=10)
+        self.game.update_attributes()
+        self.game.invalidate_attributes_cache()
+        self.game.update_attributes()
+        self.assertEqual(self.engine.recomputed, ["base", "weapon", "armor", "accessory", "set_bonus"])
+        self.assertEqual(self.game.hero_attack, 30)
+
+    def test_helpers_without_engine(self):
+        """测试没有属性引擎的游戏对象直接修改特殊效果"""
+        game = Mock()
+        game.special_effects = {"dodge": 0.1}
+        add_effect(game, "class_passive", "dodge", 0.1)
+        set_effect(game, "class_passive", "damage_reduction", 0.2)
+        self.assertAlmostEqual(game.special_effects["dodge"], 0.2)
+        self.assertEqual(game.special_effects["damage_reduction"], 0.2)
+        expire_effects(game)
+        self.assertEqual(game.special_effects["damage_reduction"], 0.2)
+
+    def test_fresh_engine(self):
+        """测试独立使用属性引擎"""
+        engine = StatEngine()
+        game = Mock(base_attack=1, base_defense=2, base_max_hp=3, equipment={"weapon": make_item("weapon", attack=4)})
+        self.assertEqual(engine.sync(game), [])
+        self.assertEqual(engine.stats, {"attack": 5, "defense": 2, "max_hp": 3})
+
+
+class TestSetBonusIndex(unittest.TestCase):
+    """测试套装索引和档位变化"""
+
+    def setUp(self):
+        self.game = HeroGame(language="zh", renderer=RecordingRenderer())
+        self.engine = self.game.stat_engine
+        self.banner = self.game.lang.get_text("set_bonus_activated")
+
+    def banners(self):
+        """取出并清空套装激活信息的次数"""
+        count = self.game.renderer.output().count(self.banner)
+        self.game.renderer.clear_messages()
+        return count
+
+    def test_index(self):
+        """测试预先计算的部件和档位"""
+        entry = SET_INDEX["warrior_set"]
+        self.assertEqual(entry["pieces"], frozenset(["weapon", "armor"]))
+        self.assertEqual([count for count, _ in entry["tiers"]], [2])
+
+    def test_banner_only_on_transition(self):
+        """测试只在套装激活时显示一次激活信息"""
+        self.game.equipment["weapon"] = make_item("weapon", attack=10, set_bonus="warrior_set")
+        self.game.equipment["armor"] = make_item("armor", defense=3, set_bonus="warrior_set")
+        self.game.update_attributes()
+        self.assertEqual(self.banners(), 1)
+        self.assertEqual(self.engine.set_counts["warrior_set"], 2)
+
+        # 升级和换上同一套装的另一件武器不再显示
+        self.game.base_attack += 5
+        self.game.update_attributes()
+        new_weapon = make_item("weapon", attack=12, set_bonus="warrior_set")
+        self.game.equipment["weapon"] = new_weapon
+        self.game.update_attributes()
+        self.assertEqual(self.banners(), 0)
+        self.assertTrue(new_weapon.get("set_bonus_active"))
+        self.assertEqual(self.game.hero_attack, 25 + 12 + 10)
+
+        # 卸下后重新集齐再次显示
+        self.game.equipment["armor"] = None
+        self.game.update_attributes()
+        self.assertEqual(self.game.hero_attack, 37)
+        self.assertEqual(self.engine.set_tiers, {})
+        self.game.equipment["armor"] = make_item("armor", defense=3, set_bonus="warrior_set")
+        self.game.update_attributes()
+        self.assertEqual(self.banners(), 1)
+
+    def test_piece_type_must_match(self):
+        """测试类型不是套装部件的装备不计入"""
+        self.game.equipment["weapon"] = make_item("weapon", set_bonus="warrior_set")
+        self.game.equipment["accessory"] = make_item("accessory", set_bonus="warrior_set")
+        self.game.update_attributes()
+        self.assertEqual(self.engine.set_counts, {"warrior_set": 1})
+        self.assertEqual(self.engine.set_tiers, {})
+
+    def test_multiple_tiers(self):
+        """测试多档套装依次激活并叠加效果"""
+        index = build_set_index({
+            "test_set": {
+                "name_key": "test_set",
+                "pieces": ["weapon", "armor", "accessory"],
+                "effects": {
+                    "3_piece": {"name_key": "three", "defense_bonus": 4, "crit_rate": 0.1},
+                    "2_piece": {"name_key": "two", "attack_bonus": 5}
+                }
+            }
+        })
+        engine = StatEngine(index)
+        game = Mock(base_attack=10, base_defense=0, base_max_hp=100,
+                    equipment={"weapon": None, "armor": None, "accessory": None})
+
+        game.equipment["weapon"] = make_item("weapon", set_bonus="test_set")
+        self.assertEqual(engine.sync(game), [])
+        game.equipment["armor"] = make_item("armor", set_bonus="test_set")
+        self.assertEqual([effect["name_key"] for _, effect, _ in engine.sync(game)], ["two"])
+        self.assertEqual(engine.stats["attack"], 15)
+        game.equipment["accessory"] = make_item("accessory", set_bonus="test_set")
+        self.assertEqual([effect["name_key"] for _, effect, _ in engine.sync(game)], ["three"])
+        self.assertEqual((engine.stats["attack"], engine.stats["defense"]), (15, 4))
+        self.assertEqual(engine.effects["crit_rate"], 0.1)
+
+        # 降档不显示，只移除高档效果
+        game.equipment["weapon"] = None
+        self.assertEqual(engine.sync(game), [])
+        self.assertEqual((engine.stats["attack"], engine.stats["defense"]), (15, 0))
+        self.assertEqual(engine.set_tiers, {"test_set": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()